@@ -15,6 +15,10 @@ def create_app(config_name=None):
 
     app = Flask(__name__)
 
+    # Encodage JSON rapide (orjson) pour toutes les réponses
+    from app.utils.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+
     # Charger la config
     app.config.from_object(config[config_name])
 
@@ -46,6 +50,8 @@ def create_app(config_name=None):
     from app.routes.community_routes import community_bp
     from app.routes.masterclass_routes import masterclass_bp
     from app.routes.ai_routes import ai_bp
+    from app.routes.export_routes import export_bp
+    from app.routes.analytics_routes import analytics_bp
 
     app.register_blueprint(auth_bp)
     app.register_blueprint(trading_bp)
@@ -58,6 +64,8 @@ def create_app(config_name=None):
     app.register_blueprint(community_bp)
     app.register_blueprint(masterclass_bp)
     app.register_blueprint(ai_bp)
+    app.register_blueprint(export_bp)
+    app.register_blueprint(analytics_bp)
 
     # Route racine unique
     @app.route("/")
@@ -68,8 +76,38 @@ def create_app(config_name=None):
             "message": "TradeSense API online"
         }
 
-    # Création DB
+    # Création DB, puis mise à niveau des tables existantes (colonnes et index ajoutés)
+    from app.utils.schema import upgrade_schema
     with app.app_context():
         db.create_all()
+        upgrade_schema(db.engine, db.metadata)
+
+        # Index plein texte SQLite d'avant search_rowid : reconstruit sur des clés stables
+        from app.services.user_search import upgrade_search_index
+        upgrade_search_index()
+
+    # Agrégats mensuels du classement (backfill d'une base existante)
+    from app.services.leaderboard_service import init_leaderboard
+    init_leaderboard(app)
+
+    # Écritures groupées de la courbe d'équité
+    from app.services.equity_service import equity_writer
+    equity_writer.init_app(app)
+
+    # Journal d'audit des actions d'administration, écrit par lots
+    from app.services.audit_service import audit_writer
+    audit_writer.init_app(app)
+
+    # Moteur stop loss / take profit
+    from app.services.trigger_service import init_trigger_engine
+    init_trigger_engine(app)
+
+    # Carnet d'ordres limit / stop en attente
+    from app.services.order_book_service import init_order_book
+    init_order_book(app)
+
+    # Cotations des symboles suivis rafraîchies en tâche de fond (déclenchements hors requêtes)
+    from app.services.price_service import quote_refresher
+    quote_refresher.init_app(app)
 
     return app
\ No newline at end of file
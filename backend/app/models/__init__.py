@@ -6,13 +6,18 @@ from .original_trade import Trade as OriginalTrade
 # Models for TradeSense
 from .user import User
 from .challenge import Challenge, ChallengeStatus, PlanType
-from .trade import TsTrade as Trade
+from .trade import TsTrade as Trade, TradeAlreadyClosedError
 from .leaderboard import Leaderboard
+from .monthly_profit import MonthlyProfit, MonthlyAssetProfit
 from .payment import Payment
 from .system_setting import SystemSetting
 from .community import CommunityPost, CommunityLike
 from .masterclass import MasterClass
+from .equity_snapshot import EquitySnapshot
+from .pending_order import PendingOrder, OrderType, OrderStatus
+from .daily_rollup import DailyRollup
+from .audit_log import AuditLog
 
 # Exporter tous les modèles pour qu'ils soient facilement accessibles
 from .payment import PaymentStatus, PaymentMethod
-__all__ = ['User', 'Challenge', 'Trade', 'Leaderboard', 'Payment', 'TradingAccount', 'Asset', 'OriginalTrade', 'PaymentStatus', 'PaymentMethod', 'SystemSetting', 'CommunityPost', 'CommunityLike', 'MasterClass']
\ No newline at end of file
+__all__ = ['User', 'Challenge', 'Trade', 'TradeAlreadyClosedError', 'Leaderboard', 'MonthlyProfit', 'MonthlyAssetProfit', 'Payment', 'TradingAccount', 'Asset', 'OriginalTrade', 'PaymentStatus', 'PaymentMethod', 'SystemSetting', 'CommunityPost', 'CommunityLike', 'MasterClass', 'EquitySnapshot', 'PendingOrder', 'OrderType', 'OrderStatus', 'DailyRollup', 'AuditLog']
\ No newline at end of file
@@ -36,8 +36,8 @@ class Asset(db.Model):
             'min_lot_size': self.min_lot_size,
             'max_leverage': self.max_leverage,
             'spread': self.spread,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
     def __repr__(self):
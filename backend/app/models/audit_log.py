@@ -0,0 +1,44 @@
+from app import db
+from datetime import datetime
+
+
+class AuditLog(db.Model):
+    """
+    Journal d'audit des actions d'administration, en ajout seul (ni modification ni suppression).
+    Les lignes sont écrites par lots hors du chemin des requêtes (voir audit_service).
+    L'acteur et la cible ne sont pas des clés étrangères : l'historique survit aux suppressions.
+    """
+    __tablename__ = 'audit_logs'
+    __table_args__ = (
+        db.Index('idx_audit_created', 'created_at'),
+        db.Index('idx_audit_actor', 'actor_id', 'created_at'),
+        db.Index('idx_audit_target', 'target_type', 'target_id', 'created_at'),
+        db.Index('idx_audit_action', 'action', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)  # Heure de l'action, pas de l'écriture
+    actor_id = db.Column(db.String(36), nullable=True)  # Administrateur (null pour les commandes CLI)
+    action = db.Column(db.String(50), nullable=False)  # ex: challenge.status, user.delete, paypal.config
+    target_type = db.Column(db.String(30), nullable=False)  # challenge, user, setting
+    target_id = db.Column(db.String(36), nullable=True)  # Null pour les actions groupées (cible dans after)
+    before = db.Column(db.JSON, nullable=True)
+    after = db.Column(db.JSON, nullable=True)
+    ip = db.Column(db.String(45), nullable=True)
+
+    def to_dict(self):
+        """Convertir l'entrée en dictionnaire pour la sérialisation JSON"""
+        return {
+            'id': self.id,
+            'created_at': self.created_at,
+            'actor_id': self.actor_id,
+            'action': self.action,
+            'target_type': self.target_type,
+            'target_id': self.target_id,
+            'before': self.before,
+            'after': self.after,
+            'ip': self.ip
+        }
+
+    def __repr__(self):
+        return f'<AuditLog {self.action} {self.target_type}:{self.target_id} by {self.actor_id}>'
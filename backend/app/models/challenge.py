@@ -1,4 +1,6 @@
 from app import db
+from sqlalchemy import update, event, inspect
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime, timedelta
 from enum import Enum
 import uuid
@@ -34,6 +36,11 @@ class Challenge(db.Model):
     Modèle représentant un défi de trading pour un utilisateur
     """
     __tablename__ = 'challenges'
+    __table_args__ = (
+        db.Index('idx_challenge_user', 'user_id'),
+        db.Index('idx_challenge_status', 'status', 'created_at'),  # Balayage killer, classement, liste admin filtrée
+        db.Index('idx_challenge_created', 'created_at'),  # Liste admin paginée
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
@@ -57,8 +64,12 @@ class Challenge(db.Model):
     daily_start_balance = db.Column(db.Float, default=0.0)
     last_reset_date = db.Column(db.DateTime, default=datetime.utcnow)
     
+    version = db.Column(db.Integer, default=0, server_default='0', nullable=False)  # Incrémenté à chaque mouvement de solde
+    
     # Relations
     trades = db.relationship('TsTrade', backref='challenge', lazy=True, cascade='all, delete-orphan')
+    equity_snapshots = db.relationship('EquitySnapshot', backref='challenge', lazy='dynamic',
+                                       cascade='all, delete-orphan', passive_deletes=True)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -88,15 +99,16 @@ class Challenge(db.Model):
             'max_daily_loss_pct': self.max_daily_loss_pct,
             'max_total_loss_pct': self.max_total_loss_pct,
             'profit_target_pct': self.profit_target_pct,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
             'payment_status': self.payment_status,
             'payment_method': self.payment_method,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             'failed_reason': self.failed_reason,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'last_reset_date': self.last_reset_date.isoformat() if self.last_reset_date else None
+            'completed_at': self.completed_at,
+            'last_reset_date': self.last_reset_date,
+            'version': self.version
         }
 
     def check_and_reset_daily_balance(self):
@@ -108,6 +120,26 @@ class Challenge(db.Model):
             return True
         return False
 
+    def apply_pnl(self, amount):
+        """
+        Ajouter un P&L réalisé au solde de façon atomique, sans lecture-modification-écriture en Python :
+        UPDATE ... SET current_balance = current_balance + :pnl, version = version + 1 RETURNING ...
+        Deux clôtures concurrentes sur le même challenge ne perdent aucune mise à jour.
+        
+        Returns:
+            float: Nouveau solde
+        """
+        balance, version = db.session.execute(
+            update(Challenge)
+            .where(Challenge.id == self.id)
+            .values(current_balance=Challenge.current_balance + amount, version=Challenge.version + 1)
+            .returning(Challenge.current_balance, Challenge.version)
+            .execution_options(synchronize_session=False, admin_metrics_neutral=True)
+        ).one()
+        set_committed_value(self, 'current_balance', balance)
+        set_committed_value(self, 'version', version)
+        return balance
+
     def calculate_profit_percentage(self):
         """Calculer le pourcentage de profit par rapport au solde initial"""
         if self.initial_balance == 0:
@@ -147,26 +179,44 @@ class Challenge(db.Model):
         """Vérifier si le défi est échoué"""
         return self.check_total_loss_limit(current_equity) or self.check_daily_loss_limit(current_equity)
 
+    def to_rule_state(self, current_equity=None, **activity):
+        """
+        Construire la vue compacte utilisée par le moteur de règles
+        activity: open_positions, trading_days, best_day_profit (optionnels)
+        """
+        from app.services.rule_engine import ChallengeState
+
+        value_to_check = current_equity if current_equity is not None else self.current_balance
+        return ChallengeState(
+            id=self.id,
+            initial_balance=self.initial_balance,
+            daily_start_balance=self.daily_start_balance or self.initial_balance,
+            equity=value_to_check,
+            max_daily_loss_pct=self.max_daily_loss_pct,
+            max_total_loss_pct=self.max_total_loss_pct,
+            profit_target_pct=self.profit_target_pct,
+            plan_type=self.plan_type,
+            **activity
+        )
+
     def update_status(self, current_equity=None):
-        """Mettre à jour le statut du défi en fonction des règles"""
+        """Mettre à jour le statut du défi en fonction des règles du plan"""
+        from app.services.rule_engine import evaluate_state
+        from app.services.killer_service import load_activity_metrics
+        from app.models.trade import TsTrade
+
         if self.status != ChallengeStatus.ACTIVE.value:
             return
 
+        # Mêmes agrégats d'activité que les règles killer (jours de trading, meilleure journée)
+        activity = load_activity_metrics([self.id]).get(self.id, {})
+        open_positions = TsTrade.query.filter_by(challenge_id=self.id, is_closed=False).count()
+
         # On utilise l'équité si fournie, sinon le solde actuel
-        value_to_check = current_equity if current_equity is not None else self.current_balance
-        
-        # Vérifier d'abord les conditions d'échec
-        if self.check_total_loss_limit(value_to_check):
-            self.status = ChallengeStatus.FAILED.value
-            self.failed_reason = 'total_loss'
-            self.completed_at = datetime.utcnow()
-        elif self.check_daily_loss_limit(value_to_check):
-            self.status = ChallengeStatus.FAILED.value
-            self.failed_reason = 'daily_loss'
-            self.completed_at = datetime.utcnow()
-        # Ensuite vérifier la condition de réussite
-        elif self.is_passed(value_to_check):
-            self.status = ChallengeStatus.PASSED.value
+        decision = evaluate_state(self.to_rule_state(current_equity, open_positions=open_positions, **activity))
+        if decision.is_transition:
+            self.status = decision.status
+            self.failed_reason = decision.failed_reason
             self.completed_at = datetime.utcnow()
 
     def get_remaining_days(self):
@@ -178,3 +228,22 @@ class Challenge(db.Model):
 
     def __repr__(self):
         return f'<Challenge {self.plan_type} for User {self.user_id}>'
+
+
+@event.listens_for(Challenge, 'before_insert')
+@event.listens_for(Challenge, 'before_update')
+def _stamp_completed_at(mapper, connection, target):
+    """
+    Horodater la fin du challenge à chaque changement de statut, quel que soit le chemin
+    (update_status, routes d'administration) : completed_at est posé à l'entrée dans un statut
+    terminal, effacé au retour à actif. Une valeur fixée explicitement dans le même flush est gardée.
+    """
+    state = inspect(target)
+    if state.persistent and not state.attrs.status.history.has_changes():
+        return
+    if state.attrs.completed_at.history.has_changes():
+        return
+    if target.status == ChallengeStatus.ACTIVE.value:
+        target.completed_at = None
+    elif target.status in (ChallengeStatus.PASSED.value, ChallengeStatus.FAILED.value):
+        target.completed_at = datetime.utcnow()
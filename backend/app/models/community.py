@@ -7,6 +7,10 @@ class CommunityPost(db.Model):
     Modèle représentant une publication d'un utilisateur dans la zone communautaire
     """
     __tablename__ = 'community_posts'
+    __table_args__ = (
+        db.Index('idx_post_created', 'created_at'),
+        db.Index('idx_post_user', 'user_id'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
@@ -24,7 +28,7 @@ class CommunityPost(db.Model):
             'username': self.user.username if self.user else "Trader",
             'role': self.user.role if self.user else "user",
             'content': self.content,
-            'created_at': self.created_at.isoformat(),
+            'created_at': self.created_at,
             'likes_count': len(self.likes),
             'is_liked': any(like.user_id == current_user_id for like in self.likes) if current_user_id else False
         }
@@ -36,6 +40,7 @@ class CommunityLike(db.Model):
     __tablename__ = 'community_likes'
     __table_args__ = (
         db.UniqueConstraint('post_id', 'user_id', name='unique_user_post_like'),
+        db.Index('idx_like_user', 'user_id'),
     )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
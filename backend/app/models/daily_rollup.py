@@ -0,0 +1,35 @@
+from app import db
+from datetime import datetime
+
+
+class DailyRollup(db.Model):
+    """
+    Agrégat journalier pré-calculé pour les séries analytiques de l'administration.
+    Une ligne par (métrique, dimension, jour) : revenu par devise, inscriptions, challenges
+    démarrés / réussis / échoués, volume de trading par symbole.
+    Un graphique sur un an lit au plus 365 lignes par dimension.
+    """
+    __tablename__ = 'daily_rollups'
+    __table_args__ = (
+        db.Index('idx_rollup_metric_day', 'metric', 'day'),
+    )
+
+    metric = db.Column(db.String(30), primary_key=True)
+    dimension = db.Column(db.String(30), primary_key=True, default='')  # Devise, symbole ou '' (aucune)
+    day = db.Column(db.Date, primary_key=True)
+    count = db.Column(db.Integer, default=0, nullable=False)
+    total = db.Column(db.Float, default=0.0, nullable=False)  # Montant, notionnel (0 pour les simples comptages)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """Convertir l'agrégat en dictionnaire pour la sérialisation JSON"""
+        return {
+            'metric': self.metric,
+            'dimension': self.dimension,
+            'day': self.day,
+            'count': self.count,
+            'total': self.total
+        }
+
+    def __repr__(self):
+        return f'<DailyRollup {self.metric}/{self.dimension} {self.day}: {self.count} {self.total}>'
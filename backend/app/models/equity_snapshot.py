@@ -0,0 +1,30 @@
+from app import db
+
+
+class EquitySnapshot(db.Model):
+    """
+    Point de la courbe d'équité d'un challenge.
+    Lignes à largeur fixe (entier + flottants) pour garder la table compacte :
+    le timestamp est stocké en secondes epoch pour permettre le sous-échantillonnage par seau.
+    """
+    __tablename__ = 'equity_snapshots'
+    __table_args__ = (
+        db.Index('idx_equity_challenge_ts', 'challenge_id', 'ts'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    challenge_id = db.Column(db.String(36), db.ForeignKey('challenges.id', ondelete='CASCADE'), nullable=False)
+    ts = db.Column(db.Integer, nullable=False)  # Secondes epoch (UTC)
+    equity = db.Column(db.Float, nullable=False)  # Solde + P&L non réalisé
+    balance = db.Column(db.Float, nullable=False)  # Solde réalisé
+
+    def to_dict(self):
+        """Convertir le point en dictionnaire pour la sérialisation JSON"""
+        return {
+            't': self.ts,
+            'equity': self.equity,
+            'balance': self.balance
+        }
+
+    def __repr__(self):
+        return f'<EquitySnapshot {self.challenge_id} @ {self.ts}: {self.equity}>'
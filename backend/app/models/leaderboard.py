@@ -1,5 +1,7 @@
 from app import db
 from datetime import datetime
+from sqlalchemy import select, update, func
+import sqlite3
 import uuid
 
 
@@ -8,11 +10,19 @@ class Leaderboard(db.Model):
     Modèle représentant le classement des utilisateurs par mois
     """
     __tablename__ = 'leaderboards'
+    __table_args__ = (
+        db.Index('idx_leaderboard_month_profit', 'month', 'profit_percentage'),
+        db.Index('idx_leaderboard_month_rank', 'month', 'rank'),  # Classements archivés
+        db.Index('idx_leaderboard_user', 'user_id'),  # Suppression d'un utilisateur
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
     username = db.Column(db.String(80), nullable=False)
+    challenge_id = db.Column(db.String(36), nullable=True)  # Challenge classé (archives de fin de mois)
+    country = db.Column(db.String(100), nullable=True)
     profit_percentage = db.Column(db.Float, default=0.0, nullable=False)
+    profit_value = db.Column(db.Float, nullable=True)
     rank = db.Column(db.Integer, nullable=False)
     month = db.Column(db.String(7), nullable=False)  # Format: 'YYYY-MM'
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -26,10 +36,13 @@ class Leaderboard(db.Model):
             'id': self.id,
             'user_id': self.user_id,
             'username': self.username,
+            'challenge_id': self.challenge_id,
+            'country': self.country,
             'profit_percentage': self.profit_percentage,
+            'profit_value': self.profit_value,
             'rank': self.rank,
             'month': self.month,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
 
     @classmethod
@@ -97,23 +110,40 @@ class Leaderboard(db.Model):
     @classmethod
     def recalculate_monthly_rankings(cls, year, month):
         """
-        Recalculer les rangs pour un mois spécifique
+        Recalculer les rangs pour un mois spécifique en une seule requête
+        (UPDATE ensembliste avec ROW_NUMBER() OVER (ORDER BY profit_percentage DESC))
         Args:
             year (int): Année
             month (int): Mois (1-12)
         """
         month_str = f"{year}-{month:02d}"
         
-        # Récupérer toutes les entrées pour ce mois triées par profit_percentage décroissant
-        entries = cls.query.filter_by(month=month_str).order_by(
-            cls.profit_percentage.desc()
-        ).all()
+        # Rang de chaque entrée du mois (égalités départagées par id pour un rang stable)
+        ranked = select(
+            cls.id,
+            func.row_number().over(order_by=(cls.profit_percentage.desc(), cls.id)).label('new_rank')
+        ).where(cls.month == month_str).subquery()
         
-        # Mettre à jour les rangs
-        for i, entry in enumerate(entries, start=1):
-            entry.rank = i
-        
-        db.session.commit()
+        try:
+            if db.engine.dialect.name == 'sqlite' and sqlite3.sqlite_version_info < (3, 33, 0):
+                # SQLite sans UPDATE ... FROM : rangs calculés par la fenêtre puis écrits en un executemany
+                rows = db.session.execute(select(ranked.c.id, ranked.c.new_rank)).all()
+                if rows:
+                    db.session.execute(
+                        update(cls.__table__).where(cls.__table__.c.id == db.bindparam('entry_id')),
+                        [{'entry_id': entry_id, 'rank': rank} for entry_id, rank in rows]
+                    )
+            else:
+                db.session.execute(
+                    update(cls)
+                    .where(cls.id == ranked.c.id)
+                    .values(rank=ranked.c.new_rank)
+                    .execution_options(synchronize_session=False)
+                )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
 
     def __repr__(self):
         return f'<Leaderboard {self.rank} for {self.username} in {self.month}>'
\ No newline at end of file
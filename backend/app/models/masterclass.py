@@ -29,5 +29,5 @@ class MasterClass(db.Model):
             'duration': self.duration,
             'video_url': self.video_url,
             'video_type': self.video_type,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
@@ -0,0 +1,62 @@
+from app import db
+from datetime import datetime
+
+
+class MonthlyProfit(db.Model):
+    """
+    Agrégat matérialisé du classement : profit réalisé d'un challenge sur un mois,
+    mis à jour à chaque clôture de trade (mois du trade, comme le classement historique).
+    Le pourcentage est stocké pour que le top du mois soit une lecture d'index.
+    """
+    __tablename__ = 'monthly_profits'
+    __table_args__ = (
+        db.Index('idx_monthly_profit_rank', 'month', 'profit_pct'),
+    )
+
+    challenge_id = db.Column(db.String(36), db.ForeignKey('challenges.id', ondelete='CASCADE'), primary_key=True)
+    month = db.Column(db.String(7), primary_key=True)  # Format: 'YYYY-MM'
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    capital = db.Column(db.Float, nullable=False)  # Capital initial du challenge (1.0 si nul)
+    profit_value = db.Column(db.Float, default=0.0, nullable=False)
+    profit_pct = db.Column(db.Float, default=0.0, nullable=False)
+    trade_count = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """Convertir l'agrégat en dictionnaire pour la sérialisation JSON"""
+        return {
+            'challenge_id': self.challenge_id,
+            'month': self.month,
+            'user_id': self.user_id,
+            'profit_value': self.profit_value,
+            'profit_pct': self.profit_pct,
+            'trade_count': self.trade_count,
+            'updated_at': self.updated_at
+        }
+
+    def __repr__(self):
+        return f'<MonthlyProfit {self.challenge_id} {self.month}: {self.profit_pct}%>'
+
+
+class MonthlyAssetProfit(db.Model):
+    """
+    Agrégat mensuel d'un challenge ventilé par classe d'actif (classements segmentés),
+    mis à jour dans le même listener que MonthlyProfit
+    """
+    __tablename__ = 'monthly_asset_profits'
+    __table_args__ = (
+        db.Index('idx_monthly_asset_profit_rank', 'month', 'asset_class', 'profit_pct'),
+    )
+
+    challenge_id = db.Column(db.String(36), db.ForeignKey('challenges.id', ondelete='CASCADE'), primary_key=True)
+    month = db.Column(db.String(7), primary_key=True)  # Format: 'YYYY-MM'
+    asset_class = db.Column(db.String(20), primary_key=True)  # stock, forex, crypto, commodity
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    capital = db.Column(db.Float, nullable=False)
+    profit_value = db.Column(db.Float, default=0.0, nullable=False)
+    profit_pct = db.Column(db.Float, default=0.0, nullable=False)
+    trade_count = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<MonthlyAssetProfit {self.challenge_id} {self.month} {self.asset_class}: {self.profit_pct}%>'
@@ -8,6 +8,9 @@ class Trade(db.Model):
     Modèle représentant une transaction de trading
     """
     __tablename__ = 'trades'
+    __table_args__ = (
+        db.Index('idx_original_trade_user', 'user_id'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     trade_type = db.Column(db.String(10), nullable=False)  # buy, sell
@@ -36,8 +39,8 @@ class Trade(db.Model):
             'quantity': self.quantity,
             'entry_price': self.entry_price,
             'exit_price': self.exit_price,
-            'entry_time': self.entry_time.isoformat() if self.entry_time else None,
-            'exit_time': self.exit_time.isoformat() if self.exit_time else None,
+            'entry_time': self.entry_time,
+            'exit_time': self.exit_time,
             'pnl': self.pnl,
             'status': self.status,
             'stop_loss': self.stop_loss,
@@ -22,6 +22,11 @@ class Payment(db.Model):
     Modèle représentant un paiement effectué par un utilisateur
     """
     __tablename__ = 'payments'
+    __table_args__ = (
+        db.Index('idx_payment_user_ts', 'user_id', 'timestamp'),
+        db.Index('idx_payment_status', 'status'),
+        db.Index('idx_payment_ts_id', 'timestamp', 'id'),  # Export trié par (timestamp, id)
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
@@ -46,7 +51,7 @@ class Payment(db.Model):
             'method': self.method,
             'status': self.status,
             'transaction_id': self.transaction_id,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,
             'description': self.description
         }
 
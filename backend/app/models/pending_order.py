@@ -0,0 +1,69 @@
+from app import db
+from datetime import datetime
+from enum import Enum
+import uuid
+
+
+class OrderType(Enum):
+    LIMIT = "LIMIT"
+    STOP = "STOP"
+
+
+class OrderStatus(Enum):
+    PENDING = "pending"
+    FILLED = "filled"
+    CANCELLED = "cancelled"
+
+
+class PendingOrder(db.Model):
+    """
+    Modèle représentant un ordre d'entrée en attente (limit ou stop) dans un défi
+    """
+    __tablename__ = 'pending_orders'
+    __table_args__ = (
+        db.Index('idx_pending_order_status_symbol', 'status', 'symbol'),
+        db.Index('idx_pending_order_challenge', 'challenge_id'),
+    )
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    challenge_id = db.Column(db.String(36), db.ForeignKey('challenges.id', ondelete='CASCADE'), nullable=False)
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    symbol = db.Column(db.String(10), nullable=False)
+    side = db.Column(db.String(10), nullable=False)  # BUY, SELL
+    order_type = db.Column(db.String(10), nullable=False)  # LIMIT, STOP
+    quantity = db.Column(db.Integer, nullable=False)
+    price = db.Column(db.Float, nullable=False)  # Prix limite ou prix de déclenchement
+    stop_loss = db.Column(db.Float, nullable=True)
+    take_profit = db.Column(db.Float, nullable=True)
+    status = db.Column(db.String(20), default=OrderStatus.PENDING.value, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    filled_at = db.Column(db.DateTime, nullable=True)
+    filled_price = db.Column(db.Float, nullable=True)
+    trade_id = db.Column(db.String(36), db.ForeignKey('ts_trades.id'), nullable=True)  # Trade créé à l'exécution
+
+    def to_dict(self):
+        """Convertir l'objet ordre en dictionnaire pour la sérialisation JSON"""
+        return {
+            'id': self.id,
+            'challenge_id': self.challenge_id,
+            'user_id': self.user_id,
+            'symbol': self.symbol,
+            'side': self.side,
+            'order_type': self.order_type,
+            'quantity': self.quantity,
+            'price': self.price,
+            'stop_loss': self.stop_loss,
+            'take_profit': self.take_profit,
+            'status': self.status,
+            'created_at': self.created_at,
+            'filled_at': self.filled_at,
+            'filled_price': self.filled_price,
+            'trade_id': self.trade_id
+        }
+
+    def is_pending(self):
+        """Vérifier si l'ordre est toujours en attente"""
+        return self.status == OrderStatus.PENDING.value
+
+    def __repr__(self):
+        return f'<PendingOrder {self.side} {self.order_type} {self.quantity} {self.symbol} @ {self.price}>'
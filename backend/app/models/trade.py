@@ -1,13 +1,27 @@
 from app import db
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime
 import uuid
 
 
+class TradeAlreadyClosedError(Exception):
+    """Le trade a déjà été clôturé (par exemple par un stop loss et une clôture manuelle simultanés)"""
+    pass
+
+
 class TsTrade(db.Model):
     """
     Modèle représentant une transaction de trading dans un défi
     """
     __tablename__ = 'ts_trades'
+    __table_args__ = (
+        db.Index('idx_trade_challenge_closed', 'challenge_id', 'is_closed', 'timestamp'),  # Positions ouvertes, historique clôturé trié
+        db.Index('idx_trade_challenge_ts', 'challenge_id', 'timestamp'),  # Historique paginé d'un challenge
+        db.Index('idx_trade_user_ts', 'user_id', 'timestamp'),  # Historique paginé d'un utilisateur
+        db.Index('idx_trade_closed_ts', 'is_closed', 'timestamp'),  # Classement mensuel
+        db.Index('idx_trade_ts_id', 'timestamp', 'id'),  # Export trié par (timestamp, id)
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     challenge_id = db.Column(db.String(36), db.ForeignKey('challenges.id'), nullable=False)
@@ -22,6 +36,9 @@ class TsTrade(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_closed = db.Column(db.Boolean, default=False)
+    stop_loss = db.Column(db.Float, nullable=True)  # Prix de stop loss (ordre protecteur)
+    take_profit = db.Column(db.Float, nullable=True)  # Prix de take profit (ordre protecteur)
+    close_reason = db.Column(db.String(20), nullable=True)  # manual, stop_loss, take_profit
     
     # Relations
     # Note: user relation is available through challenge.user
@@ -38,10 +55,13 @@ class TsTrade(db.Model):
             'entry_price': self.entry_price,
             'exit_price': self.exit_price,
             'profit_loss': self.profit_loss,
-            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'is_closed': self.is_closed
+            'timestamp': self.timestamp,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'is_closed': self.is_closed,
+            'stop_loss': self.stop_loss,
+            'take_profit': self.take_profit,
+            'close_reason': self.close_reason
         }
         
         if not self.is_closed and current_price is not None:
@@ -73,17 +93,35 @@ class TsTrade(db.Model):
                 self.profit_loss = (self.entry_price - self.exit_price) * self.quantity
         return self.profit_loss
 
-    def close_trade(self, exit_price, challenge):
-        """Clôturer la transaction avec un prix de sortie et mettre à jour le challenge"""
-        self.exit_price = exit_price
-        self.is_closed = True
-        self.profit_loss = self.calculate_profit_loss()
+    def close_trade(self, exit_price, challenge, reason='manual'):
+        """
+        Clôturer la transaction avec un prix de sortie et mettre à jour le challenge
+        
+        Raises:
+            TradeAlreadyClosedError: Le trade a été clôturé par une autre requête
+        """
+        profit_loss = self.calculate_unrealized_pnl(exit_price)
+        
+        # Clôture conditionnelle : une seule requête concurrente peut clôturer le trade
+        values = {'exit_price': exit_price, 'is_closed': True, 'close_reason': reason, 'profit_loss': profit_loss}
+        result = db.session.execute(
+            update(TsTrade)
+            .where(TsTrade.id == self.id, TsTrade.is_closed == False)
+            .values(updated_at=datetime.utcnow(), **values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise TradeAlreadyClosedError(f'Trade {self.id} déjà clôturé')
+        for key, value in values.items():
+            set_committed_value(self, key, value)
         
-        # Mettre à jour le solde du challenge avec le profit/perte de la transaction
-        challenge.current_balance += self.profit_loss
+        # Mettre à jour le solde du challenge avec le profit/perte de la transaction (incrément atomique)
+        # Le statut est réévalué par l'appelant (evaluate_killer_rules, sur l'équité et l'activité)
+        challenge.apply_pnl(profit_loss)
         
-        # Mettre à jour le statut du challenge en fonction des règles
-        challenge.update_status()
+        # Agrégats et caches dépendant des trades clôturés (statistiques, classement)
+        from app.services.trade_events import notify_trade_closed
+        notify_trade_closed(self, challenge)
         
         return self.profit_loss
 
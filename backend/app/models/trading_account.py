@@ -8,6 +8,9 @@ class TradingAccount(db.Model):
     Modèle représentant un compte de trading pour un utilisateur
     """
     __tablename__ = 'trading_accounts'
+    __table_args__ = (
+        db.Index('idx_trading_account_user', 'user_id'),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     account_number = db.Column(db.String(20), unique=True, nullable=False)
@@ -35,8 +38,8 @@ class TradingAccount(db.Model):
             'leverage': self.leverage,
             'risk_level': self.risk_level,
             'status': self.status,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             'user_id': self.user_id
         }
 
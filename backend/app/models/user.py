@@ -20,6 +20,7 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_login = db.Column(db.DateTime, nullable=True)
     is_active = db.Column(db.Boolean, default=True)
+    search_rowid = db.Column(db.Integer, nullable=True)  # Clé stable de l'index plein texte SQLite (posée par trigger)
     
     # Relations
     challenges = db.relationship('Challenge', backref='user', lazy=True, cascade='all, delete-orphan')
@@ -44,10 +45,17 @@ class User(db.Model):
             'email': self.email,
             'role': self.role,
             'balance': self.balance,
-            'created_at': self.created_at.isoformat(),
-            'last_login': self.last_login.isoformat() if self.last_login else None,
+            'created_at': self.created_at,
+            'last_login': self.last_login,
             'is_active': self.is_active
         }
 
     def __repr__(self):
-        return f'<User {self.username}>'
\ No newline at end of file
+        return f'<User {self.username}>'
+
+
+# Recherche admin par préfixe insensible à la casse (lower(colonne) >= :terme AND < :terme_suivant)
+db.Index('idx_user_username_lower', db.func.lower(User.username))
+db.Index('idx_user_email_lower', db.func.lower(User.email))
+# Clé de l'index plein texte : entier stable, contrairement au rowid implicite (renuméroté par VACUUM)
+db.Index('idx_user_search_rowid', User.search_rowid, unique=True)
@@ -1,9 +1,19 @@
 from flask import request, jsonify, Blueprint
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import func
+from sqlalchemy import or_, select
 from app import db
-from app.models import User, Challenge, Payment
+from app.models import User, Challenge, Payment, AuditLog
+from app.utils.pagination import keyset_page, parse_limit
+from app.services.admin_metrics import get_admin_metrics
+from app.services.admin_actions import (
+    MAX_BULK_IDS, set_challenges_status, adjust_challenges_balance, set_users_active, adjust_users_balance,
+    delete_users
+)
+from app.services.rank_index import invalidate_rankings
+from app.services.user_search import prefix_condition, search_users, rebuild_search_index, MAX_SEARCH_OFFSET
+from app.services.audit_service import audit_writer, record_admin_action
 from datetime import datetime
+import math
 import uuid
 
 # Créer le blueprint pour l'administration
@@ -92,8 +102,8 @@ def get_all_users():
                 'email': user.email,
                 'role': user.role,
                 'balance': user.balance,
-                'created_at': user.created_at.isoformat(),
-                'last_login': user.last_login.isoformat() if user.last_login else None,
+                'created_at': user.created_at,
+                'last_login': user.last_login,
                 'is_active': user.is_active,
                 'challenges': [challenge.to_dict() for challenge in challenges]
             }
@@ -108,6 +118,37 @@ def get_all_users():
         return jsonify({'error': f'Erreur lors de la récupération des utilisateurs: {str(e)}'}), 500
 
 
+@admin_bp.route('/users/search', methods=['GET'])
+@admin_required
+def search_users_route():
+    """
+    Rechercher des utilisateurs par nom d'utilisateur ou email
+    - q : terme recherché (préfixe si moins de 3 caractères, sous-chaîne sinon)
+    - limit, offset : pagination des résultats classés (offset de next_offset)
+    - Return: utilisateurs classés, mode de recherche utilisé
+    """
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        try:
+            offset = int(request.args.get('offset') or 0)
+        except ValueError:
+            raise ValueError('offset doit être un entier')
+        
+        users, next_offset, mode = search_users(request.args.get('q'), limit=limit, offset=offset)
+        return jsonify({
+            'users': users,
+            'count': len(users),
+            'mode': mode,
+            'next_offset': next_offset,
+            'has_more': next_offset is not None and next_offset <= MAX_SEARCH_OFFSET
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Erreur lors de la recherche des utilisateurs: {str(e)}'}), 500
+
+
 @admin_bp.route('/challenge/<challenge_id>/status', methods=['PATCH'])
 @admin_required
 def update_challenge_status(challenge_id):
@@ -137,10 +178,13 @@ def update_challenge_status(challenge_id):
             return jsonify({'error': 'Challenge non trouvé'}), 404
         
         # Mettre à jour le statut
+        previous_status = challenge.status
         challenge.status = new_status
         challenge.updated_at = datetime.utcnow()
         
         db.session.commit()
+        record_admin_action('challenge.status', 'challenge', challenge_id,
+                            before={'status': previous_status}, after={'status': new_status})
         
         return jsonify({
             'message': 'Statut du challenge mis à jour avec succès',
@@ -152,38 +196,259 @@ def update_challenge_status(challenge_id):
         return jsonify({'error': f'Erreur lors de la mise à jour du statut du challenge: {str(e)}'}), 500
 
 
+# Colonnes de tri autorisées pour la liste des challenges ; created_at et updated_at sont nullables
+# (lignes anciennes) : keyset_page place les clés nulles en fin de liste et sait les paginer
+CHALLENGE_SORT_COLUMNS = {
+    'created_at': Challenge.created_at,
+    'updated_at': Challenge.updated_at,
+    'current_balance': Challenge.current_balance,
+    'initial_balance': Challenge.initial_balance,
+}
+
+# Colonnes projetées : pas d'objet ORM, une seule requête jointe sur users
+_CHALLENGE_LIST_COLUMNS = (
+    Challenge.id, Challenge.user_id, Challenge.plan_type, Challenge.initial_balance,
+    Challenge.current_balance, Challenge.daily_start_balance, Challenge.status,
+    Challenge.max_daily_loss_pct, Challenge.max_total_loss_pct, Challenge.profit_target_pct,
+    Challenge.start_date, Challenge.end_date, Challenge.payment_status, Challenge.payment_method,
+    Challenge.created_at, Challenge.updated_at, Challenge.failed_reason, Challenge.completed_at,
+    Challenge.last_reset_date, Challenge.version
+)
+
+
+def _filter_challenges(query, args):
+    """
+    Appliquer les filtres de la liste admin : status, plan, user_id, q (préfixe du nom
+    d'utilisateur ou de l'email), from, to (dates ISO de création)
+
+    Raises:
+        ValueError: Filtre invalide
+    """
+    if args.get('status'):
+        query = query.filter(Challenge.status == args['status'])
+    if args.get('plan'):
+        query = query.filter(Challenge.plan_type == args['plan'])
+    if args.get('user_id'):
+        query = query.filter(Challenge.user_id == args['user_id'])
+    
+    search = (args.get('q') or '').strip()
+    if search:
+        query = query.filter(or_(prefix_condition(User.username, search), prefix_condition(User.email, search)))
+    
+    try:
+        if args.get('from'):
+            query = query.filter(Challenge.created_at >= datetime.fromisoformat(args['from']))
+        if args.get('to'):
+            query = query.filter(Challenge.created_at <= datetime.fromisoformat(args['to']))
+    except ValueError:
+        raise ValueError('from / to doivent être des dates ISO')
+    return query
+
+
 @admin_bp.route('/challenges', methods=['GET'])
 @admin_required
 def get_all_challenges():
     """
-    Obtenir tous les challenges avec les informations utilisateur
-    - Return: tous les challenges avec leurs utilisateurs
+    Obtenir les challenges avec les informations utilisateur, page par page
+    - Une seule requête jointe challenges/users avec projection de colonnes
+    - Filtres : status, plan, user_id, q, from, to
+    - Tri : sort (created_at, updated_at, current_balance, initial_balance), order (asc/desc)
+    - Pagination par curseur : limit, cursor (next_cursor de la page précédente)
     """
     try:
-        # Récupérer tous les challenges, triés par les plus récents
-        challenges = Challenge.query.order_by(Challenge.created_at.desc()).all()
+        sort = request.args.get('sort', 'created_at')
+        if sort not in CHALLENGE_SORT_COLUMNS:
+            return jsonify({'error': f"sort doit être l'un de: {', '.join(CHALLENGE_SORT_COLUMNS)}"}), 400
+        order = request.args.get('order', 'desc')
+        if order not in ('asc', 'desc'):
+            return jsonify({'error': 'order doit être asc ou desc'}), 400
+        
+        query = db.session.query(
+            *_CHALLENGE_LIST_COLUMNS,
+            User.username.label('username'),
+            User.email.label('email')
+        ).join(User, User.id == Challenge.user_id)
+        
+        rows, next_cursor = keyset_page(
+            _filter_challenges(query, request.args), CHALLENGE_SORT_COLUMNS[sort], Challenge.id,
+            cursor=request.args.get('cursor'),
+            limit=parse_limit(request.args.get('limit')),
+            descending=order == 'desc'
+        )
         
         challenges_data = []
-        for challenge in challenges:
-            user = User.query.filter_by(id=challenge.user_id).first()
-            
-            challenge_data = challenge.to_dict()
+        for row in rows:
+            challenge_data = row._asdict()
+            username = challenge_data.pop('username')
+            email = challenge_data.pop('email')
             challenge_data['user'] = {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email
+                'id': row.user_id,
+                'username': username,
+                'email': email
             }
             challenges_data.append(challenge_data)
         
         return jsonify({
             'challenges': challenges_data,
-            'count': len(challenges_data)
+            'count': len(challenges_data),
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None
         }), 200
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'Erreur lors de la récupération des challenges: {str(e)}'}), 500
 
 
+def _filter_users(query, args):
+    """
+    Appliquer les filtres utilisateurs : q (préfixe du nom d'utilisateur ou de l'email), country, role
+    """
+    search = (args.get('q') or '').strip()
+    if search:
+        query = query.filter(or_(prefix_condition(User.username, search), prefix_condition(User.email, search)))
+    if args.get('country'):
+        query = query.filter(User.country == args['country'])
+    if args.get('role'):
+        query = query.filter(User.role == args['role'])
+    return query
+
+
+def _bulk_criteria(data, id_column, targets):
+    """
+    Condition SQL d'une action groupée : liste d'identifiants (ids) ou filtre (filter),
+    le filtre restant une sous-requête évaluée par la base
+
+    Args:
+        data (dict): Corps de la requête
+        id_column: Colonne identifiant de la table modifiée
+        targets (callable): filtre -> SELECT des identifiants ciblés
+
+    Raises:
+        ValueError: Cible absente, vide ou trop large
+    """
+    ids = data.get('ids')
+    filters = data.get('filter')
+    if ids is not None:
+        if not isinstance(ids, list) or not ids or not all(isinstance(i, str) for i in ids):
+            raise ValueError('ids doit être une liste non vide d\'identifiants')
+        if len(ids) > MAX_BULK_IDS:
+            raise ValueError(f'Au plus {MAX_BULK_IDS} identifiants par requête')
+        return id_column.in_(set(ids))
+    if isinstance(filters, dict) and any(filters.values()):
+        return id_column.in_(targets(filters).correlate(None))
+    raise ValueError('ids ou filter (au moins un critère) est requis')
+
+
+def _bulk_audit_params(data):
+    # Cible et paramètres d'une action groupée, tels que demandés
+    return {key: data[key] for key in ('ids', 'filter', 'status', 'reason', 'amount', 'fail_challenges') if key in data}
+
+
+def _parse_amount(data):
+    try:
+        amount = float(data['amount'])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError('amount doit être un nombre')
+    # float() accepte 'nan' et 'inf' : un seul appel écrirait NaN ou l'infini dans des milliers de soldes
+    if not math.isfinite(amount):
+        raise ValueError('amount doit être un nombre fini')
+    if amount == 0:
+        raise ValueError('amount doit être non nul')
+    return amount
+
+
+@admin_bp.route('/challenges/bulk', methods=['POST'])
+@admin_required
+def bulk_challenges():
+    """
+    Appliquer une action à un ensemble de challenges en une transaction (un UPDATE ensembliste)
+    - Input: {ids: [...]} ou {filter: {status, plan, user_id, q, from, to}}
+      action 'set_status' : {status, reason} / action 'adjust_balance' : {amount}
+    - Return: résumé (nombre de challenges modifiés)
+    """
+    try:
+        data = request.get_json() or {}
+        criteria = _bulk_criteria(
+            data, Challenge.id,
+            lambda filters: _filter_challenges(
+                select(Challenge.id).join(User, User.id == Challenge.user_id), filters
+            )
+        )
+        
+        action = data.get('action')
+        if action == 'set_status':
+            updated = set_challenges_status(criteria, data.get('status'), data.get('reason') or 'admin')
+        elif action == 'adjust_balance':
+            updated = adjust_challenges_balance(criteria, _parse_amount(data))
+        else:
+            return jsonify({'error': "action doit être set_status ou adjust_balance"}), 400
+        
+        db.session.commit()
+        if action == 'set_status' and updated:
+            invalidate_rankings()
+        
+        summary = {
+            'action': action,
+            'requested': len(set(data['ids'])) if data.get('ids') else None,
+            'updated': updated
+        }
+        record_admin_action(f'challenges.bulk.{action}', 'challenge', after=dict(_bulk_audit_params(data), **summary))
+        return jsonify(summary), 200
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Erreur lors de l\'action groupée sur les challenges: {str(e)}'}), 500
+
+
+@admin_bp.route('/users/bulk', methods=['POST'])
+@admin_required
+def bulk_users():
+    """
+    Appliquer une action à un ensemble d'utilisateurs en une transaction (UPDATE ensemblistes)
+    - Input: {ids: [...]} ou {filter: {q, country, role}}
+      action 'deactivate' : {fail_challenges, reason} / 'activate' / 'adjust_balance' : {amount}
+    - Return: résumé (utilisateurs modifiés, challenges échoués)
+    """
+    try:
+        data = request.get_json() or {}
+        criteria = _bulk_criteria(data, User.id, lambda filters: _filter_users(select(User.id), filters))
+        
+        action = data.get('action')
+        summary = {'users': 0, 'challenges_failed': 0}
+        if action == 'deactivate':
+            summary = set_users_active(
+                criteria, False,
+                fail_challenges=bool(data.get('fail_challenges')),
+                failed_reason=data.get('reason') or 'admin'
+            )
+        elif action == 'activate':
+            summary = set_users_active(criteria, True)
+        elif action == 'adjust_balance':
+            summary['users'] = adjust_users_balance(criteria, _parse_amount(data))
+        else:
+            return jsonify({'error': "action doit être deactivate, activate ou adjust_balance"}), 400
+        
+        db.session.commit()
+        if summary['challenges_failed']:
+            invalidate_rankings()
+        
+        summary = dict(summary, action=action, requested=len(set(data['ids'])) if data.get('ids') else None)
+        record_admin_action(f'users.bulk.{action}', 'user', after=dict(_bulk_audit_params(data), **summary))
+        return jsonify(summary), 200
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Erreur lors de l\'action groupée sur les utilisateurs: {str(e)}'}), 500
+
+
 @admin_bp.route('/challenge/<challenge_id>/pass', methods=['PUT'])
 @admin_required
 def pass_challenge(challenge_id):
@@ -199,10 +464,13 @@ def pass_challenge(challenge_id):
             return jsonify({'error': 'Challenge non trouvé'}), 404
         
         # Mettre à jour le statut
+        previous_status = challenge.status
         challenge.status = 'passed'
         challenge.updated_at = datetime.utcnow()
         
         db.session.commit()
+        record_admin_action('challenge.pass', 'challenge', challenge_id,
+                            before={'status': previous_status}, after={'status': 'passed'})
         
         return jsonify({
             'message': 'Challenge marqué comme réussi',
@@ -229,10 +497,13 @@ def fail_challenge(challenge_id):
             return jsonify({'error': 'Challenge non trouvé'}), 404
         
         # Mettre à jour le statut
+        previous_status = challenge.status
         challenge.status = 'failed'
         challenge.updated_at = datetime.utcnow()
         
         db.session.commit()
+        record_admin_action('challenge.fail', 'challenge', challenge_id,
+                            before={'status': previous_status}, after={'status': 'failed'})
         
         return jsonify({
             'message': 'Challenge marqué comme échoué',
@@ -252,40 +523,9 @@ def get_admin_stats():
     - Return: métriques (total users, active challenges, total revenue)
     """
     try:
-        # Calculer les métriques
-        total_users = db.session.query(func.count(User.id)).scalar()
-        active_challenges = db.session.query(func.count(Challenge.id)).filter(
-            Challenge.status == 'active'
-        ).scalar()
-        
-        # Calculer le revenu total (somme des paiements complétés)
-        total_revenue = db.session.query(func.sum(Payment.amount)).filter(
-            Payment.status == 'completed'
-        ).scalar() or 0.0
-        
-        # Autres métriques utiles
-        passed_challenges = db.session.query(func.count(Challenge.id)).filter(
-            Challenge.status == 'passed'
-        ).scalar()
-        
-        failed_challenges = db.session.query(func.count(Challenge.id)).filter(
-            Challenge.status == 'failed'
-        ).scalar()
-        
-        completed_payments = db.session.query(func.count(Payment.id)).filter(
-            Payment.status == 'completed'
-        ).scalar()
-        
-        return jsonify({
-            'metrics': {
-                'total_users': total_users,
-                'active_challenges': active_challenges,
-                'passed_challenges': passed_challenges,
-                'failed_challenges': failed_challenges,
-                'total_revenue': float(total_revenue),
-                'completed_payments': completed_payments
-            }
-        }), 200
+        # Une requête d'agrégation conditionnelle par table, mise en cache (TTL court,
+        # invalidée par les changements de statut des challenges et des paiements)
+        return jsonify({'metrics': get_admin_metrics()}), 200
         
     except Exception as e:
         return jsonify({'error': f'Erreur lors de la récupération des métriques: {str(e)}'}), 500
@@ -296,20 +536,25 @@ def get_admin_stats():
 def delete_user(user_id):
     """
     Supprimer un utilisateur (superadmin seulement)
-    - Suppression cascade
+    - Suppression en cascade par DELETE groupés, sans charger les challenges, trades, paiements, etc.
+    - Return: nombre de lignes supprimées par table
     """
     try:
-        # Récupérer l'utilisateur
-        user = User.query.filter_by(id=user_id).first()
-        if not user:
+        user = db.session.execute(
+            select(User.username, User.email, User.role).where(User.id == user_id)
+        ).first()
+        if user is None:
             return jsonify({'error': 'Utilisateur non trouvé'}), 404
+        username = user.username
         
-        # Supprimer l'utilisateur (suppression en cascade des challenges, trades, payments, etc.)
-        db.session.delete(user)
+        deleted = delete_users(User.id == user_id)
         db.session.commit()
+        invalidate_rankings()
+        record_admin_action('user.delete', 'user', user_id, before=user._asdict(), after={'deleted': deleted})
         
         return jsonify({
-            'message': f'Utilisateur {user.username} supprimé avec succès'
+            'message': f'Utilisateur {username} supprimé avec succès',
+            'deleted': deleted
         }), 200
         
     except Exception as e:
@@ -317,6 +562,59 @@ def delete_user(user_id):
         return jsonify({'error': f'Erreur lors de la suppression de l\'utilisateur: {str(e)}'}), 500
 
 
+@admin_bp.route('/audit', methods=['GET'])
+@admin_required
+def get_audit_log():
+    """
+    Consulter le journal d'audit des actions d'administration, du plus récent au plus ancien
+    - Filtres : actor_id, action, target_type, target_id, from, to (dates ISO)
+    - Pagination par curseur : limit, cursor (next_cursor de la page précédente)
+    """
+    try:
+        # Lire aussi les actions encore dans le tampon d'écriture
+        audit_writer.flush()
+        
+        query = AuditLog.query
+        for field in ('actor_id', 'action', 'target_type', 'target_id'):
+            if request.args.get(field):
+                query = query.filter(getattr(AuditLog, field) == request.args[field])
+        try:
+            if request.args.get('from'):
+                query = query.filter(AuditLog.created_at >= datetime.fromisoformat(request.args['from']))
+            if request.args.get('to'):
+                query = query.filter(AuditLog.created_at <= datetime.fromisoformat(request.args['to']))
+        except ValueError:
+            raise ValueError('from / to doivent être des dates ISO')
+        
+        entries, next_cursor = keyset_page(
+            query, AuditLog.created_at, AuditLog.id,
+            cursor=request.args.get('cursor'),
+            limit=parse_limit(request.args.get('limit'))
+        )
+        return jsonify({
+            'entries': [entry.to_dict() for entry in entries],
+            'count': len(entries),
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Erreur lors de la récupération du journal d\'audit: {str(e)}'}), 500
+
+
+def _paypal_config():
+    """Configuration PayPal visible (jamais le secret, juste un indicateur s'il est configuré)"""
+    from app.models import SystemSetting
+    
+    return {
+        'client_id': SystemSetting.get('paypal_client_id', ''),
+        'has_secret': bool(SystemSetting.get('paypal_client_secret', '')),
+        'mode': SystemSetting.get('paypal_mode', 'sandbox')
+    }
+
+
 @admin_bp.route('/paypal/config', methods=['GET'])
 @admin_required
 def get_paypal_config():
@@ -324,18 +622,7 @@ def get_paypal_config():
     Obtenir la configuration PayPal actuelle
     """
     try:
-        from app.models import SystemSetting
-        
-        client_id = SystemSetting.get('paypal_client_id', '')
-        # Ne jamais renvoyer le secret complet au frontend, juste un indicateur s'il est configuré
-        secret = SystemSetting.get('paypal_client_secret', '')
-        mode = SystemSetting.get('paypal_mode', 'sandbox')
-        
-        return jsonify({
-            'client_id': client_id,
-            'has_secret': bool(secret),
-            'mode': mode
-        }), 200
+        return jsonify(_paypal_config()), 200
         
     except Exception as e:
         return jsonify({'error': f'Erreur lors de la récupération de la config PayPal: {str(e)}'}), 500
@@ -353,6 +640,8 @@ def update_paypal_config():
         
         if not data:
             return jsonify({'error': 'Données manquantes'}), 400
+        
+        previous = _paypal_config()
             
         if 'client_id' in data:
             SystemSetting.set('paypal_client_id', data['client_id'], 'PayPal Client ID')
@@ -367,9 +656,39 @@ def update_paypal_config():
             SystemSetting.set('paypal_mode', data['mode'], 'PayPal Mode (sandbox/live)')
             
         db.session.commit()
+        # Le secret n'est jamais journalisé : seulement le fait qu'il ait changé
+        record_admin_action('paypal.config', 'setting', 'paypal', before=previous, after=dict(
+            _paypal_config(), secret_changed=bool(data.get('client_secret'))
+        ))
         
         return jsonify({'message': 'Configuration PayPal mise à jour avec succès'}), 200
         
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': f'Erreur lors de la mise à jour de la config PayPal: {str(e)}'}), 500
+
+
+@admin_bp.cli.command('check-query-plans')
+def check_query_plans_command():
+    """Vérifier que les requêtes critiques utilisent un index (code de sortie 1 sinon)"""
+    from app.services.query_plans import check_query_plans
+    
+    failures = 0
+    for name, scans in check_query_plans().items():
+        if scans:
+            failures += 1
+            print(f"[Plans] FULL SCAN {name}: {'; '.join(scans)}")
+        else:
+            print(f"[Plans] OK {name}")
+    if failures:
+        raise SystemExit(1)
+
+
+@admin_bp.cli.command('build-search-index')
+def build_search_index_command():
+    """Créer et alimenter l'index plein texte des utilisateurs d'une base existante"""
+    if rebuild_search_index():
+        print("[Search] Index plein texte des utilisateurs à jour")
+    else:
+        print("[Search] Index plein texte indisponible : recherche par préfixe uniquement")
+        raise SystemExit(1)
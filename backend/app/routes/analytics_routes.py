@@ -0,0 +1,121 @@
+from flask import request, jsonify, Blueprint
+from app.routes.admin_routes import admin_required
+from app.services import rollup_service
+from datetime import date, datetime, timedelta
+import click
+
+# Séries analytiques de l'administration, lues dans les agrégats journaliers (daily_rollups)
+analytics_bp = Blueprint('analytics', __name__, url_prefix='/api/admin/analytics')
+
+# Période par défaut des séries (jours)
+DEFAULT_RANGE_DAYS = 30
+
+
+def _parse_range(args):
+    """
+    Lire la période demandée : from / to (dates ISO, bornes incluses), 30 derniers jours par défaut
+
+    Raises:
+        ValueError: Date invalide ou période inversée
+    """
+    try:
+        end = date.fromisoformat(args['to']) if args.get('to') else datetime.utcnow().date()
+        start = date.fromisoformat(args['from']) if args.get('from') else end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    except ValueError:
+        raise ValueError('from / to doivent être des dates ISO (YYYY-MM-DD)')
+    if start > end:
+        raise ValueError('from doit précéder to')
+    return start, end
+
+
+@analytics_bp.route('/revenue', methods=['GET'])
+@admin_required
+def get_revenue_series():
+    """Revenu des paiements complétés par jour et par devise (?currency= pour filtrer)"""
+    try:
+        start, end = _parse_range(request.args)
+        rows = rollup_service.get_series(rollup_service.REVENUE, start, end, dimension=request.args.get('currency'))
+        return jsonify({
+            'from': start,
+            'to': end,
+            'series': [
+                {'day': row.day, 'currency': row.dimension, 'payments': row.count, 'revenue': round(row.total, 2)}
+                for row in rows
+            ]
+        }), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@analytics_bp.route('/signups', methods=['GET'])
+@admin_required
+def get_signup_series():
+    """Nouvelles inscriptions par jour"""
+    try:
+        start, end = _parse_range(request.args)
+        rows = rollup_service.get_series(rollup_service.SIGNUPS, start, end)
+        return jsonify({
+            'from': start,
+            'to': end,
+            'series': [{'day': row.day, 'signups': row.count} for row in rows]
+        }), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@analytics_bp.route('/challenge-outcomes', methods=['GET'])
+@admin_required
+def get_challenge_outcomes():
+    """Challenges démarrés, réussis, échoués et taux de réussite par semaine"""
+    try:
+        start, end = _parse_range(request.args)
+        return jsonify({
+            'from': start,
+            'to': end,
+            'series': rollup_service.weekly_outcomes(start, end)
+        }), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@analytics_bp.route('/trade-volume', methods=['GET'])
+@admin_required
+def get_trade_volume():
+    """Trades ouverts et volume notionnel par jour et par symbole (?symbol= pour filtrer)"""
+    try:
+        start, end = _parse_range(request.args)
+        symbol = request.args.get('symbol')
+        rows = rollup_service.get_series(
+            rollup_service.TRADE_VOLUME, start, end,
+            dimension=symbol.upper().strip() if symbol else None
+        )
+        return jsonify({
+            'from': start,
+            'to': end,
+            'series': [
+                {'day': row.day, 'symbol': row.dimension, 'trades': row.count, 'notional': round(row.total, 2)}
+                for row in rows
+            ]
+        }), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@analytics_bp.cli.command('backfill')
+@click.option('--from', 'start', default=None, help='Premier jour (YYYY-MM-DD), tout l\'historique par défaut')
+@click.option('--to', 'end', default=None, help='Dernier jour inclus (YYYY-MM-DD)')
+def backfill_command(start, end):
+    """Reconstruire les agrégats journaliers depuis les tables sources"""
+    count = rollup_service.backfill_rollups(
+        date.fromisoformat(start) if start else None,
+        date.fromisoformat(end) if end else None
+    )
+    print(f"[Analytics] {count} agrégats journaliers écrits")
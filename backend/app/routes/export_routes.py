@@ -0,0 +1,123 @@
+from flask import request, jsonify, Blueprint, Response, stream_with_context
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import select
+from app.models import Challenge
+from app.routes.admin_routes import admin_required
+from app.services.export_service import (
+    EXPORT_FORMATS, stream_export, trade_export_query, payment_export_query
+)
+from datetime import datetime
+
+# Exports en flux (CSV / NDJSON) de l'historique des trades et des paiements
+export_bp = Blueprint('export', __name__, url_prefix='/api/export')
+
+
+def _export_response(stmt, name):
+    """
+    Réponse en flux : les octets partent dès l'en-tête, sans charger l'export en mémoire
+    """
+    fmt = request.args.get('format', 'csv').lower()
+    filename = f"{name}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+    return Response(
+        stream_with_context(stream_export(stmt, fmt)),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+def _parse_filters():
+    """
+    Lire les filtres communs : format, from, to (dates ISO)
+
+    Raises:
+        ValueError: Format ou date invalide
+    """
+    fmt = request.args.get('format', 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format non supporté: {fmt} (csv ou ndjson)")
+    try:
+        return {
+            'date_from': datetime.fromisoformat(request.args['from']) if request.args.get('from') else None,
+            'date_to': datetime.fromisoformat(request.args['to']) if request.args.get('to') else None,
+        }
+    except ValueError:
+        raise ValueError('from / to doivent être des dates ISO')
+
+
+@export_bp.route('/trades', methods=['GET'])
+@jwt_required()
+def export_my_trades():
+    """
+    Exporter l'historique complet des trades de l'utilisateur
+    - Query: format (csv/ndjson), challenge_id, from, to
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        filters = _parse_filters()
+
+        # Trades des challenges de l'utilisateur (y compris les anciens trades sans user_id)
+        challenge_ids = select(Challenge.id).where(Challenge.user_id == current_user_id)
+        if request.args.get('challenge_id'):
+            challenge_ids = challenge_ids.where(Challenge.id == request.args['challenge_id'])
+
+        return _export_response(trade_export_query(challenge_ids=challenge_ids, **filters), 'trades')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@export_bp.route('/payments', methods=['GET'])
+@jwt_required()
+def export_my_payments():
+    """
+    Exporter l'historique des paiements de l'utilisateur
+    - Query: format (csv/ndjson), from, to
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        filters = _parse_filters()
+        return _export_response(payment_export_query(user_id=current_user_id, **filters), 'payments')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@export_bp.route('/admin/trades', methods=['GET'])
+@admin_required
+def export_all_trades():
+    """
+    Exporter tous les trades de la plateforme (administrateurs)
+    - Query: format (csv/ndjson), user_id, challenge_id, from, to
+    """
+    try:
+        filters = _parse_filters()
+        challenge_ids = [request.args['challenge_id']] if request.args.get('challenge_id') else None
+        stmt = trade_export_query(user_id=request.args.get('user_id'), challenge_ids=challenge_ids, **filters)
+        return _export_response(stmt, 'all_trades')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@export_bp.route('/admin/payments', methods=['GET'])
+@admin_required
+def export_all_payments():
+    """
+    Exporter tous les paiements de la plateforme (administrateurs)
+    - Query: format (csv/ndjson), user_id, status, from, to
+    """
+    try:
+        filters = _parse_filters()
+        stmt = payment_export_query(user_id=request.args.get('user_id'),
+                                    status=request.args.get('status'), **filters)
+        return _export_response(stmt, 'all_payments')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,9 +1,9 @@
 from flask import request, jsonify, Blueprint
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import func, desc, case
-from app import db
-from app.models import User, Challenge, Trade
+from app.services import leaderboard_service
+from app.services.rank_index import get_user_position, get_month_ranking, get_segment_top, SEGMENT_DIMENSIONS
 from datetime import datetime
+import click
 
 leaderboard_bp = Blueprint('leaderboard', __name__, url_prefix='/api/leaderboard')
 
@@ -16,66 +16,150 @@ def leaderboard_health():
 def get_top_traders():
     """
     Obtenir les meilleurs traders DU MOIS COURANT basés sur les trades réels fermés.
-    Optimisé avec les indexes idx_challenge_user, idx_trade_challenge, idx_trade_user.
+    Lecture de l'agrégat mensuel matérialisé (mis à jour à chaque clôture de trade).
     """
     try:
-        now = datetime.utcnow()
-        start_of_month = datetime(now.year, now.month, 1)
-        
-        # Le mois suivant pour la borne supérieure
-        if now.month == 12:
-            end_of_month = datetime(now.year + 1, 1, 1)
-        else:
-            end_of_month = datetime(now.year, now.month + 1, 1)
-
-        # 1. Requête optimisée : 
-        # - Jointure User -> Challenge -> Trade (TsTrade)
-        # - Filtre Challenges actifs
-        # - Filtre Trades fermés ce mois-ci
-        # - Groupement par challenge pour avoir le capital initial précis par trade set
-        stats_query = db.session.query(
-            User.username,
-            User.country,
-            func.sum(Trade.profit_loss).label('total_profit_val'),
-            Challenge.initial_balance
-        ).select_from(User)\
-         .join(Challenge, User.id == Challenge.user_id)\
-         .join(Trade, Challenge.id == Trade.challenge_id)\
-         .filter(Challenge.status == 'active')\
-         .filter(Trade.is_closed == True)\
-         .filter(Trade.timestamp >= start_of_month)\
-         .filter(Trade.timestamp < end_of_month)\
-         .group_by(User.id, User.username, User.country, Challenge.id, Challenge.initial_balance)
-
-        results = stats_query.all()
-
-        processed_list = []
-        for username, country, total_profit_val, initial_balance in results:
-            profit_val = float(total_profit_val or 0)
-            capital = float(initial_balance or 1.0)
-            if capital <= 0: capital = 1.0
-            
-            profit_pct = (profit_val / capital) * 100
-            
-            processed_list.append({
-                'username': username,
-                'country': country if country and country.strip() else "Inconnu",
-                'profit': round(profit_pct, 2),
-                'profit_val': round(profit_val, 2),
-                'payout': round(max(0, profit_val), 2)
-            })
-
-        # 2. Tri par profit % décroissant
-        processed_list.sort(key=lambda x: x['profit'], reverse=True)
-
-        # 3. Top 10 + Rang
-        final_top_10 = []
-        for i, trader in enumerate(processed_list[:10]):
-            trader['rank'] = i + 1
-            final_top_10.append(trader)
-
-        return jsonify(final_top_10), 200
+        return jsonify(leaderboard_service.get_top_traders()), 200
 
     except Exception as e:
         print(f"[ERROR] Leaderboard API error: {str(e)}")
         return jsonify({"error": "Erreur lors du calcul du classement", "details": str(e)}), 500
+
+
+def _parse_month(month):
+    """Valider un paramètre de mois 'YYYY-MM' (None accepté : mois courant)"""
+    if month:
+        datetime.strptime(month, '%Y-%m')
+    return month
+
+
+@leaderboard_bp.route('/segments', methods=['GET'])
+def get_leaderboard_segments():
+    """Lister les segments disponibles (pays, plan, classe d'actif) pour le mois"""
+    try:
+        try:
+            month = _parse_month(request.args.get('month'))
+        except ValueError:
+            return jsonify({'error': "Format de mois invalide (attendu: YYYY-MM)"}), 400
+
+        ranking = get_month_ranking(month)
+        return jsonify({'month': ranking.month, 'segments': ranking.segment_values()}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@leaderboard_bp.route('/segments/<dimension>/<value>', methods=['GET'])
+def get_segment_leaderboard(dimension, value):
+    """
+    Meilleurs traders d'un segment : /segments/country/MA, /segments/plan_type/pro,
+    /segments/asset_class/crypto (mois courant ou ?month=YYYY-MM)
+    """
+    try:
+        if dimension not in SEGMENT_DIMENSIONS:
+            return jsonify({'error': f"Segment inconnu (attendu: {', '.join(SEGMENT_DIMENSIONS)})"}), 400
+        try:
+            month = _parse_month(request.args.get('month'))
+        except ValueError:
+            return jsonify({'error': "Format de mois invalide (attendu: YYYY-MM)"}), 400
+
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
+        return jsonify(get_segment_top(dimension, value, month=month, limit=limit)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# Un mois clôturé ne change plus : les clients et proxies peuvent le garder longtemps
+HISTORY_CACHE_MAX_AGE = 86400
+
+
+@leaderboard_bp.route('/history', methods=['GET'])
+def get_leaderboard_months():
+    """Lister les mois dont le classement final est archivé"""
+    try:
+        response = jsonify({'months': leaderboard_service.archived_months()})
+        response.headers['Cache-Control'] = 'public, max-age=300'
+        return response, 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@leaderboard_bp.route('/history/<month>', methods=['GET'])
+def get_leaderboard_history(month):
+    """
+    Classement final d'un mois clôturé, servi depuis l'archive (jamais recalculé depuis les trades)
+    """
+    try:
+        try:
+            _parse_month(month)
+        except ValueError:
+            return jsonify({'error': "Format de mois invalide (attendu: YYYY-MM)"}), 400
+
+        limit = min(max(request.args.get('limit', 100, type=int), 1), 1000)
+        entries = leaderboard_service.get_archived_leaderboard(month, limit=limit)
+        if not entries:
+            return jsonify({'error': "Aucun classement archivé pour ce mois"}), 404
+
+        response = jsonify({'month': month, 'leaderboard': entries})
+        response.headers['Cache-Control'] = f'public, max-age={HISTORY_CACHE_MAX_AGE}, immutable'
+        return response, 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@leaderboard_bp.route('/me', methods=['GET'])
+@jwt_required()
+def get_my_rank():
+    """
+    Rang, percentile et voisins de l'utilisateur connecté (mois courant ou ?month=YYYY-MM)
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        try:
+            month = _parse_month(request.args.get('month'))
+        except ValueError:
+            return jsonify({'error': "Format de mois invalide (attendu: YYYY-MM)"}), 400
+
+        radius = min(max(request.args.get('radius', 2, type=int), 0), 10)
+        position = get_user_position(current_user_id, month=month, radius=radius)
+        if position is None:
+            return jsonify({'error': "Vous n'êtes pas classé ce mois-ci"}), 404
+
+        return jsonify(position), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@leaderboard_bp.cli.command('rebuild')
+@click.option('--month', default=None, help="Mois 'YYYY-MM' (tous les mois tradés par défaut)")
+def rebuild_command(month):
+    """Reconstruire l'agrégat mensuel du classement à partir des trades clôturés"""
+    for key in ([month] if month else leaderboard_service.traded_months()):
+        count = leaderboard_service.rebuild_monthly_profits(key)
+        print(f"[Leaderboard] {key}: {count} challenges")
+
+
+@leaderboard_bp.cli.command('close-month')
+@click.option('--month', default=None, help="Mois 'YYYY-MM' (mois précédent par défaut)")
+@click.option('--force', is_flag=True, help="Remplacer l'archive d'un mois déjà clôturé")
+def close_month_command(month, force):
+    """Archiver le classement final d'un mois terminé"""
+    try:
+        count = leaderboard_service.close_month(month, force=force)
+    except ValueError as e:
+        print(f"[Leaderboard] {str(e)}")
+        raise SystemExit(1)
+    print(f"[Leaderboard] {month or leaderboard_service.previous_month()}: {count} entrées archivées")
+
+
+@leaderboard_bp.cli.command('verify')
+@click.option('--month', default=None, help="Mois 'YYYY-MM' (mois courant par défaut)")
+def verify_command(month):
+    """Vérifier l'équivalence de l'agrégat mensuel avec un recalcul complet (code de sortie 1 sinon)"""
+    month = month or leaderboard_service.month_key(datetime.utcnow())
+    mismatches = leaderboard_service.verify_monthly_profits(month)
+    for mismatch in mismatches:
+        print(f"[Leaderboard] ECART {mismatch}")
+    print(f"[Leaderboard] {month}: {len(mismatches)} écarts")
+    if mismatches:
+        raise SystemExit(1)
@@ -194,7 +194,7 @@ def get_payment_history():
                 'currency': payment.currency,
                 'method': payment.method,
                 'status': payment.status,
-                'timestamp': payment.timestamp.isoformat(),
+                'timestamp': payment.timestamp,
                 'description': payment.description
             })
         
@@ -1,15 +1,48 @@
 from flask import request, jsonify, Blueprint
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app import db
-from app.models import Challenge, Trade, User, ChallengeStatus
+from app.models import Challenge, Trade, User, ChallengeStatus, PendingOrder, OrderType, OrderStatus, TradeAlreadyClosedError
 from app.utils.market_data import get_stock_quote
-from app.services.killer_service import evaluate_killer_rules
+from app.services.killer_service import evaluate_killer_rules, sweep_active_challenges
+from app.services.unit_of_work import commit_unit_of_work
 from app.services.bvc_scraper import get_moroccan_stock_price
+from app.services.equity_service import get_equity_curve, compact_equity_snapshots
+from app.services.trigger_service import protective_engine, validate_protective_levels
+from app.services.order_book_service import order_book, committed_positions, settle_order
+from app.services.stats_service import get_trade_stats
+from app.services.challenge_rules import get_rule_set
+from app.utils.pagination import keyset_page, parse_limit
 from datetime import datetime
+from sqlalchemy import func
+import click
 
 # Create blueprint
 trading_bp = Blueprint('trading', __name__, url_prefix='/api/trading')
 
+# Nombre maximal de jambes dans un ordre panier
+MAX_BATCH_LEGS = 50
+BATCH_MODES = ['all_or_nothing', 'best_effort']
+
+
+def _get_quote(symbol):
+    """Obtenir la cotation d'un symbole (Bourse de Casablanca ou international)"""
+    symbol_upper = symbol.upper().strip()
+    if symbol_upper.endswith('.CS'):
+        return get_moroccan_stock_price(symbol_upper)
+    return get_stock_quote(symbol_upper)
+
+
+def _parse_quantity(value):
+    """
+    Lire une quantité entière (entier JSON ou chaîne numérique, sans partie décimale)
+
+    Raises:
+        ValueError: Quantité non entière
+    """
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError('La quantité doit être un entier')
+    return int(value)
+
 
 @trading_bp.route('/', methods=['GET'])
 def trading_health():
@@ -78,11 +111,22 @@ def execute_trade():
         
         if not all([challenge_id, symbol, trade_type, quantity]):
             return jsonify({'error': 'Tous les champs sont requis'}), 400
+        if not isinstance(symbol, str) or not symbol.strip():
+            return jsonify({'error': 'symbol doit être une chaîne'}), 400
+        symbol = symbol.upper().strip()
             
         try:
             quantity = int(quantity)
         except:
             return jsonify({'error': 'La quantité doit être un entier'}), 400
+        if quantity <= 0:
+            return jsonify({'error': 'La quantité doit être positive'}), 400
+        
+        try:
+            stop_loss = float(data['stop_loss']) if data.get('stop_loss') is not None else None
+            take_profit = float(data['take_profit']) if data.get('take_profit') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Stop loss et take profit doivent être des nombres'}), 400
         
         challenge = Challenge.query.filter_by(id=challenge_id, user_id=current_user_id).first()
         if not challenge:
@@ -94,6 +138,11 @@ def execute_trade():
                 'error': f'Challenge {challenge.status} — trading désactivé',
                 'status': challenge.status
             }), 400
+        
+        # Limites d'ordre du plan (lots par trade, positions ouvertes) : l'ordre est refusé
+        order_error = get_rule_set(challenge.plan_type).check_order(symbol, quantity, committed_positions(challenge_id))
+        if order_error:
+            return jsonify({'error': order_error}), 400
             
         # Get Price
         if symbol.endswith('.CS'):
@@ -103,6 +152,10 @@ def execute_trade():
             
         if not quote or not quote.get('price'):
             return jsonify({'error': 'Prix non disponible'}), 400
+        
+        protection_error = validate_protective_levels(trade_type, quote['price'], stop_loss, take_profit)
+        if protection_error:
+            return jsonify({'error': protection_error}), 400
             
         trade = Trade(
             challenge_id=challenge_id,
@@ -110,17 +163,21 @@ def execute_trade():
             symbol=symbol,
             trade_type=trade_type,
             quantity=quantity,
-            entry_price=quote['price']
+            entry_price=quote['price'],
+            stop_loss=stop_loss,
+            take_profit=take_profit
         )
         
         db.session.add(trade)
-        db.session.commit()
         
         # Immediate evaluation of killer rules (spread/commissions might trigger daily loss)
         evaluate_killer_rules(challenge_id)
         
-        # Re-fetch challenge to get updated status
-        db.session.refresh(challenge)
+        # Trade et éventuel changement de statut dans le même commit
+        commit_unit_of_work()
+        
+        if stop_loss is not None or take_profit is not None:
+            protective_engine.register(trade)
         
         return jsonify({
             'trade': trade.to_dict(),
@@ -132,43 +189,217 @@ def execute_trade():
         return jsonify({'error': str(e)}), 500
 
 
-@trading_bp.route('/history', methods=['GET'])
+@trading_bp.route('/execute/batch', methods=['POST'])
 @jwt_required()
-def get_trade_history():
+def execute_batch():
     """
-    Obtenir l'historique complet de tous les trades de l'utilisateur
+    Exécuter un panier d'ordres au marché en une seule transaction
+    - Input: {challenge_id, mode ('all_or_nothing' | 'best_effort'), orders: [{symbol, type, quantity, stop_loss?, take_profit?}]}
+    - Toutes les jambes sont valorisées sur un même instantané de prix (une cotation par symbole)
+    - Un seul commit, puis une seule évaluation des règles killer
     """
     try:
         current_user_id = get_jwt_identity()
-        print(f"[Trading] Fetching full trade history for user: {current_user_id}")
+        data = request.get_json() or {}
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Corps JSON invalide'}), 400
         
-        # On récupère tous les trades liés à l'utilisateur
-        trades = Trade.query.filter((Trade.user_id == current_user_id)).order_by(Trade.timestamp.desc()).all()
+        challenge_id = data.get('challenge_id')
+        legs = data.get('orders')
+        mode = data.get('mode', 'all_or_nothing')
         
-        # Si certains trades n'ont pas de user_id (anciens), on peut les récupérer via les challenges
-        if not trades:
-            trades = Trade.query.join(Challenge).filter(Challenge.user_id == current_user_id).order_by(Trade.timestamp.desc()).all()
-
-        # Obtenir les prix actuels pour les trades ouverts dans l'historique
-        current_prices = {}
-        unique_symbols = {t.symbol for t in trades if not t.is_closed}
+        if not challenge_id or not isinstance(legs, list) or not legs:
+            return jsonify({'error': 'Les champs challenge_id et orders sont requis'}), 400
+        if len(legs) > MAX_BATCH_LEGS:
+            return jsonify({'error': f'Maximum {MAX_BATCH_LEGS} ordres par panier'}), 400
+        if mode not in BATCH_MODES:
+            return jsonify({'error': f'Mode invalide. Options valides: {BATCH_MODES}'}), 400
         
-        for symbol in unique_symbols:
-            symbol_upper = symbol.upper().strip()
-            if symbol_upper.endswith('.CS'):
-                quote = get_moroccan_stock_price(symbol_upper)
-            else:
-                quote = get_stock_quote(symbol_upper)
-            
+        challenge = Challenge.query.filter_by(id=challenge_id, user_id=current_user_id).first()
+        if not challenge:
+            return jsonify({'error': 'Challenge non trouvé'}), 404
+        if challenge.status != ChallengeStatus.ACTIVE.value:
+            return jsonify({
+                'error': f'Challenge {challenge.status} — trading désactivé',
+                'status': challenge.status
+            }), 400
+        
+        # Instantané de prix : une seule cotation par symbole
+        symbols = {leg['symbol'].upper().strip() for leg in legs
+                   if isinstance(leg, dict) and isinstance(leg.get('symbol'), str) and leg['symbol'].strip()}
+        snapshot = {}
+        for symbol in symbols:
+            quote = _get_quote(symbol)
             if quote and quote.get('price'):
-                current_prices[symbol] = quote.get('price')
-
-        print(f"[Trading] Found {len(trades)} historical trades. Unique open symbols: {len(unique_symbols)}")
+                snapshot[symbol] = quote['price']
+        
+        rule_set = get_rule_set(challenge.plan_type)
+        committed = committed_positions(challenge_id)
+        
+        trades = []
+        rejected = []
+        for index, leg in enumerate(legs):
+            if not isinstance(leg, dict):
+                rejected.append({'index': index, 'error': 'Ordre invalide'})
+                continue
+                
+            symbol = leg.get('symbol')
+            trade_type = leg.get('type')
+            if not symbol or not trade_type or not leg.get('quantity'):
+                rejected.append({'index': index, 'error': 'Tous les champs sont requis'})
+                continue
+            if not isinstance(symbol, str) or not isinstance(trade_type, str):
+                rejected.append({'index': index, 'error': 'symbol et type doivent être des chaînes'})
+                continue
+            symbol = symbol.upper().strip()
+            trade_type = trade_type.upper()
+            if trade_type not in ['BUY', 'SELL']:
+                rejected.append({'index': index, 'error': 'Type invalide. Options valides: BUY, SELL'})
+                continue
+                
+            try:
+                quantity = _parse_quantity(leg['quantity'])
+                stop_loss = float(leg['stop_loss']) if leg.get('stop_loss') is not None else None
+                take_profit = float(leg['take_profit']) if leg.get('take_profit') is not None else None
+            except (TypeError, ValueError):
+                rejected.append({'index': index, 'error': 'Quantité, stop loss et take profit doivent être numériques'})
+                continue
+            if quantity <= 0:
+                rejected.append({'index': index, 'error': 'La quantité doit être positive'})
+                continue
+            
+            # Limites d'ordre du plan, jambes déjà acceptées du panier comprises
+            order_error = rule_set.check_order(symbol, quantity, committed + len(trades))
+            if order_error:
+                rejected.append({'index': index, 'error': order_error})
+                continue
+                
+            price = snapshot.get(symbol)
+            if not price:
+                rejected.append({'index': index, 'error': 'Prix non disponible'})
+                continue
+                
+            protection_error = validate_protective_levels(trade_type, price, stop_loss, take_profit)
+            if protection_error:
+                rejected.append({'index': index, 'error': protection_error})
+                continue
+                
+            trades.append(Trade(
+                challenge_id=challenge_id,
+                user_id=current_user_id,
+                symbol=symbol,
+                trade_type=trade_type,
+                quantity=quantity,
+                entry_price=price,
+                stop_loss=stop_loss,
+                take_profit=take_profit
+            ))
+        
+        if rejected and mode == 'all_or_nothing':
+            return jsonify({'error': 'Panier rejeté', 'rejected': rejected}), 400
+        if not trades:
+            return jsonify({'error': 'Aucun ordre exécutable', 'rejected': rejected}), 400
+        
+        db.session.add_all(trades)
+        
+        # Une seule évaluation et un seul commit pour tout le panier
+        evaluate_killer_rules(challenge_id)
+        commit_unit_of_work()
+        
+        for trade in trades:
+            if trade.stop_loss is not None or trade.take_profit is not None:
+                protective_engine.register(trade)
         
         return jsonify({
-            'trades': [t.to_dict(current_price=current_prices.get(t.symbol)) for t in trades],
-            'count': len(trades)
-        }), 200
+            'trades': [t.to_dict() for t in trades],
+            'rejected': rejected,
+            'challenge': challenge.to_dict()
+        }), 201
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+def _filter_trades(query, args):
+    """
+    Appliquer les filtres de l'historique : status (open/closed), symbol, from, to (dates ISO)
+    
+    Raises:
+        ValueError: Filtre invalide
+    """
+    status = args.get('status')
+    if status == 'open':
+        query = query.filter(Trade.is_closed == False)
+    elif status == 'closed':
+        query = query.filter(Trade.is_closed == True)
+    elif status:
+        raise ValueError('status doit être open ou closed')
+    
+    if args.get('symbol'):
+        # Symboles normalisés à l'écriture ; upper() couvre les lignes antérieures saisies telles quelles
+        query = query.filter(func.upper(Trade.symbol) == args['symbol'].upper().strip())
+    
+    try:
+        if args.get('from'):
+            query = query.filter(Trade.timestamp >= datetime.fromisoformat(args['from']))
+        if args.get('to'):
+            query = query.filter(Trade.timestamp <= datetime.fromisoformat(args['to']))
+    except ValueError:
+        raise ValueError('from / to doivent être des dates ISO')
+    return query
+
+
+def _trade_page_response(query):
+    """
+    Page de trades (pagination par curseur sur (timestamp, id)) avec les prix actuels
+    des seuls trades ouverts de la page
+    """
+    trades, next_cursor = keyset_page(
+        _filter_trades(query, request.args), Trade.timestamp, Trade.id,
+        cursor=request.args.get('cursor'),
+        limit=parse_limit(request.args.get('limit'))
+    )
+    
+    current_prices = {}
+    for symbol in {t.symbol for t in trades if not t.is_closed}:
+        quote = _get_quote(symbol)
+        if quote and quote.get('price'):
+            current_prices[symbol] = quote.get('price')
+        else:
+            print(f"[Trading WARNING] No price found for {symbol}")
+    
+    return {
+        'trades': [t.to_dict(current_price=current_prices.get(t.symbol)) for t in trades],
+        'count': len(trades),
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
+    }
+
+
+@trading_bp.route('/history', methods=['GET'])
+@jwt_required()
+def get_trade_history():
+    """
+    Obtenir l'historique des trades de l'utilisateur, page par page
+    - Query: cursor, limit, status (open/closed), symbol, from, to
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        print(f"[Trading] Fetching trade history for user: {current_user_id}")
+        
+        # On récupère les trades liés à l'utilisateur
+        query = Trade.query.filter(Trade.user_id == current_user_id)
+        
+        # Si les trades n'ont pas de user_id (anciens), on peut les récupérer via les challenges
+        if not db.session.query(query.exists()).scalar():
+            query = Trade.query.join(Challenge).filter(Challenge.user_id == current_user_id)
+        
+        page = _trade_page_response(query)
+        print(f"[Trading] Returning {page['count']} historical trades (has_more={page['has_more']})")
+        return jsonify(page), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"[Trading ERROR] History fetch failed: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -177,6 +408,10 @@ def get_trade_history():
 @trading_bp.route('/challenge/<challenge_id>/trades', methods=['GET'])
 @jwt_required()
 def get_challenge_trades(challenge_id):
+    """
+    Obtenir les trades d'un challenge, page par page
+    - Query: cursor, limit, status (open/closed), symbol, from, to
+    """
     try:
         current_user_id = get_jwt_identity()
         print(f"[Trading] Fetching trades for challenge {challenge_id} and user {current_user_id}")
@@ -188,33 +423,49 @@ def get_challenge_trades(challenge_id):
             
         # Évaluation automatique des règles Killer lors du fetch
         evaluate_killer_rules(challenge_id)
-            
-        trades = Trade.query.filter_by(challenge_id=challenge_id).order_by(Trade.timestamp.desc()).all()
-        
-        # Obtenir les prix actuels pour les trades ouverts
-        current_prices = {}
-        unique_symbols = {t.symbol for t in trades if not t.is_closed}
+        commit_unit_of_work()
         
-        for symbol in unique_symbols:
-            symbol_upper = symbol.upper().strip()
-            if symbol_upper.endswith('.CS'):
-                quote = get_moroccan_stock_price(symbol_upper)
-            else:
-                quote = get_stock_quote(symbol_upper)
-            
-            if quote and quote.get('price'):
-                current_prices[symbol] = quote.get('price')
-                print(f"[Trading] Price found for {symbol}: {quote.get('price')}")
-            else:
-                print(f"[Trading WARNING] No price found for {symbol}")
-        
-        print(f"[Trading] Returning {len(trades)} trades for challenge {challenge_id}")
+        page = _trade_page_response(Trade.query.filter_by(challenge_id=challenge_id))
+        print(f"[Trading] Returning {page['count']} trades for challenge {challenge_id}")
+        return jsonify(page), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        print(f"[Trading ERROR] Challenge trades fetch failed: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
+@trading_bp.route('/challenge/<challenge_id>/stats', methods=['GET'])
+@jwt_required()
+def get_challenge_stats(challenge_id):
+    """
+    Statistiques de performance d'un challenge (win rate, profit factor, expectancy,
+    Sharpe, drawdown, détail par symbole)
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        challenge = Challenge.query.filter_by(id=challenge_id, user_id=current_user_id).first()
+        if not challenge:
+            return jsonify({'error': 'Non trouvé'}), 404
         
         return jsonify({
-            'trades': [t.to_dict(current_price=current_prices.get(t.symbol)) for t in trades]
+            'challenge_id': challenge_id,
+            'stats': get_trade_stats(challenge_id=challenge_id)
         }), 200
     except Exception as e:
-        print(f"[Trading ERROR] Challenge trades fetch failed: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
+@trading_bp.route('/stats', methods=['GET'])
+@jwt_required()
+def get_user_stats():
+    """
+    Statistiques de performance sur tous les challenges de l'utilisateur
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        return jsonify({'stats': get_trade_stats(user_id=current_user_id)}), 200
+    except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
@@ -244,7 +495,7 @@ def get_challenge_status(challenge_id):
         # Appel de la fonction centrale Killer
         evaluate_killer_rules(challenge_id)
         
-        db.session.commit()
+        commit_unit_of_work()
             
         return jsonify({
             'challenge': challenge.to_dict(),
@@ -258,6 +509,42 @@ def get_challenge_status(challenge_id):
         return jsonify({'error': str(e)}), 500
 
 
+@trading_bp.route('/challenge/<challenge_id>/equity', methods=['GET'])
+@jwt_required()
+def get_challenge_equity(challenge_id):
+    """
+    Obtenir la courbe d'équité d'un challenge avec le pic d'équité et le drawdown maximal
+    - Query: since (timestamp epoch, optionnel)
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        challenge = Challenge.query.filter_by(id=challenge_id, user_id=current_user_id).first()
+        if not challenge:
+            return jsonify({'error': 'Non trouvé'}), 404
+
+        since = request.args.get('since', type=int)
+
+        return jsonify(get_equity_curve(challenge, since=since)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@trading_bp.cli.command('compact-equity')
+def compact_equity_command():
+    """Sous-échantillonner les anciens points des courbes d'équité"""
+    removed = compact_equity_snapshots()
+    print(f"[Equity] {removed} points supprimés")
+
+
+@trading_bp.cli.command('sweep')
+@click.option('--workers', type=int, default=None, help='Nombre de processus pour l\'évaluation')
+@click.option('--batch-size', type=int, default=500, help='Challenges par UPDATE de statut')
+def sweep_command(workers, batch_size):
+    """Évaluer les règles killer sur tous les challenges actifs"""
+    decisions = sweep_active_challenges(workers=workers, batch_size=batch_size)
+    print(f"[Killer] {len(decisions)} challenges mis à jour")
+
+
 @trading_bp.route('/challenge/<challenge_id>/sync', methods=['POST'])
 @jwt_required()
 def sync_challenge(challenge_id):
@@ -277,18 +564,205 @@ def close_trade(trade_id):
         if not trade:
             return jsonify({'error': 'Trade non trouvé'}), 404
             
+        if trade.is_closed:
+            return jsonify({'error': 'Trade déjà clôturé'}), 400
+            
         challenge = trade.challenge
         trade.close_trade(exit_price, challenge)
+        protective_engine.unregister(trade)
         
-        # Évaluer les règles killer après clôture de trade
+        # Évaluer les règles killer après clôture de trade (un seul commit pour la requête)
         evaluate_killer_rules(challenge.id)
         
-        db.session.commit()
+        commit_unit_of_work()
         
         return jsonify({
             'trade': trade.to_dict(),
             'challenge': challenge.to_dict()
         }), 200
+    except TradeAlreadyClosedError:
+        db.session.rollback()
+        return jsonify({'error': 'Trade déjà clôturé'}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@trading_bp.route('/trade/<trade_id>/protection', methods=['PATCH'])
+@jwt_required()
+def update_trade_protection(trade_id):
+    """
+    Modifier le stop loss / take profit d'un trade ouvert
+    - Input: {stop_loss, take_profit} (null pour supprimer un niveau)
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        data = request.get_json() or {}
+        
+        trade = Trade.query.join(Challenge).filter(Trade.id == trade_id, Challenge.user_id == current_user_id).first()
+        if not trade:
+            return jsonify({'error': 'Trade non trouvé'}), 404
+        if trade.is_closed:
+            return jsonify({'error': 'Trade déjà clôturé'}), 400
+            
+        try:
+            stop_loss = float(data['stop_loss']) if data.get('stop_loss') is not None else None
+            take_profit = float(data['take_profit']) if data.get('take_profit') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Stop loss et take profit doivent être des nombres'}), 400
+        
+        stop_loss = stop_loss if 'stop_loss' in data else trade.stop_loss
+        take_profit = take_profit if 'take_profit' in data else trade.take_profit
+        
+        # Les niveaux sont validés par rapport au prix courant (un stop déjà franchi serait déclenché aussitôt)
+        quote = _get_quote(trade.symbol)
+        if not quote or not quote.get('price'):
+            return jsonify({'error': 'Prix non disponible'}), 400
+        protection_error = validate_protective_levels(trade.trade_type, quote['price'], stop_loss, take_profit)
+        if protection_error:
+            return jsonify({'error': protection_error}), 400
+            
+        trade.stop_loss = stop_loss
+        trade.take_profit = take_profit
+        db.session.commit()
+        
+        protective_engine.register(trade)
+        
+        return jsonify({'trade': trade.to_dict()}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@trading_bp.route('/orders', methods=['POST'])
+@jwt_required()
+def place_pending_order():
+    """
+    Placer un ordre d'entrée en attente (limit ou stop)
+    - Input: {challenge_id, symbol, type (BUY/SELL), order_type (LIMIT/STOP), quantity, price, stop_loss?, take_profit?}
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        data = request.get_json() or {}
+        
+        challenge_id = data.get('challenge_id')
+        symbol = data.get('symbol')
+        side = data.get('type', '').upper()
+        order_type = data.get('order_type', '').upper()
+        
+        if not all([challenge_id, symbol, side, order_type, data.get('quantity'), data.get('price')]):
+            return jsonify({'error': 'Tous les champs sont requis'}), 400
+        if not isinstance(symbol, str) or not symbol.strip():
+            return jsonify({'error': 'symbol doit être une chaîne'}), 400
+        symbol = symbol.upper().strip()
+        if side not in ['BUY', 'SELL']:
+            return jsonify({'error': 'Type invalide. Options valides: BUY, SELL'}), 400
+        if order_type not in [OrderType.LIMIT.value, OrderType.STOP.value]:
+            return jsonify({'error': 'Type d\'ordre invalide. Options valides: LIMIT, STOP'}), 400
+            
+        try:
+            quantity = int(data['quantity'])
+            price = float(data['price'])
+            stop_loss = float(data['stop_loss']) if data.get('stop_loss') is not None else None
+            take_profit = float(data['take_profit']) if data.get('take_profit') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Quantité, prix, stop loss et take profit doivent être numériques'}), 400
+        
+        if quantity <= 0 or price <= 0:
+            return jsonify({'error': 'La quantité et le prix doivent être positifs'}), 400
+        
+        challenge = Challenge.query.filter_by(id=challenge_id, user_id=current_user_id).first()
+        if not challenge:
+            return jsonify({'error': 'Challenge non trouvé'}), 404
+        if challenge.status != ChallengeStatus.ACTIVE.value:
+            return jsonify({
+                'error': f'Challenge {challenge.status} — trading désactivé',
+                'status': challenge.status
+            }), 400
+        
+        protection_error = validate_protective_levels(side, price, stop_loss, take_profit)
+        if protection_error:
+            return jsonify({'error': protection_error}), 400
+        
+        # Limites d'ordre du plan : un ordre en attente compte comme une position
+        order_error = get_rule_set(challenge.plan_type).check_order(symbol, quantity, committed_positions(challenge_id))
+        if order_error:
+            return jsonify({'error': order_error}), 400
+        
+        order = PendingOrder(
+            challenge_id=challenge_id,
+            user_id=current_user_id,
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            stop_loss=stop_loss,
+            take_profit=take_profit
+        )
+        db.session.add(order)
+        db.session.commit()
+        
+        order_book.add(order)
+        
+        return jsonify({'order': order.to_dict()}), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@trading_bp.route('/orders', methods=['GET'])
+@jwt_required()
+def get_pending_orders():
+    """
+    Lister les ordres de l'utilisateur
+    - Query: challenge_id (optionnel), status (pending par défaut, 'all' pour tout)
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        query = PendingOrder.query.filter_by(user_id=current_user_id)
+        
+        challenge_id = request.args.get('challenge_id')
+        if challenge_id:
+            query = query.filter_by(challenge_id=challenge_id)
+            
+        status = request.args.get('status', OrderStatus.PENDING.value)
+        if status != 'all':
+            query = query.filter_by(status=status)
+            
+        orders = query.order_by(PendingOrder.created_at.desc()).all()
+        
+        return jsonify({
+            'orders': [o.to_dict() for o in orders],
+            'count': len(orders)
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@trading_bp.route('/orders/<order_id>', methods=['DELETE'])
+@jwt_required()
+def cancel_pending_order(order_id):
+    """
+    Annuler un ordre en attente
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        order = PendingOrder.query.filter_by(id=order_id, user_id=current_user_id).first()
+        if not order:
+            return jsonify({'error': 'Ordre non trouvé'}), 404
+        if not order.is_pending():
+            return jsonify({'error': f'Ordre {order.status} — annulation impossible'}), 400
+            
+        # Annulation conditionnelle : perdue si l'ordre a été exécuté entre-temps
+        if not settle_order(order.id, OrderStatus.CANCELLED.value):
+            db.session.rollback()
+            return jsonify({'error': 'Ordre exécuté ou annulé entre-temps — annulation impossible'}), 409
+        db.session.commit()
+        
+        order_book.cancel(order)
+        
+        return jsonify({'order': order.to_dict()}), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
@@ -0,0 +1,204 @@
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import select, update, delete, event, or_
+from sqlalchemy.orm import Session
+from app import db
+from app.models import (
+    User, Challenge, Trade, Payment, EquitySnapshot, PendingOrder, MonthlyProfit, MonthlyAssetProfit,
+    Leaderboard, CommunityPost, CommunityLike, TradingAccount, OriginalTrade, ChallengeStatus, OrderStatus
+)
+from app.services.rollup_service import retract_outcomes, record_outcomes, retract_users
+from app.services.equity_service import forget_challenges
+from app.services.order_book_service import order_book
+from app.services.trigger_service import protective_engine
+
+# Nombre maximal d'identifiants explicites par action groupée
+MAX_BULK_IDS = 5000
+
+CHALLENGE_STATUSES = tuple(status.value for status in ChallengeStatus)
+
+
+def set_challenges_status(criteria, status: str, failed_reason: Optional[str] = None,
+                          now: Optional[datetime] = None) -> int:
+    """
+    Changer le statut des challenges ciblés par un seul UPDATE, sans commit.
+    Les challenges déjà dans ce statut ne sont pas touchés ; les agrégats journaliers
+    des résultats sont corrigés dans la même transaction.
+
+    Args:
+        criteria: Condition SQL sur challenges (ex: Challenge.id.in_(ids))
+        status (str): Nouveau statut
+        failed_reason (str): Raison de l'échec (statut failed uniquement)
+
+    Returns:
+        int: Nombre de challenges modifiés
+    """
+    if status not in CHALLENGE_STATUSES:
+        raise ValueError(f"Status invalide. Options valides: {list(CHALLENGE_STATUSES)}")
+    now = now or datetime.utcnow()
+    target = (criteria, Challenge.status != status)
+    terminal = status != ChallengeStatus.ACTIVE.value
+
+    retract_outcomes(*target)
+    result = db.session.execute(
+        update(Challenge)
+        .where(*target)
+        .values(
+            status=status,
+            failed_reason=failed_reason if status == ChallengeStatus.FAILED.value else None,
+            completed_at=now if terminal else None,
+            updated_at=now
+        )
+        .execution_options(synchronize_session=False)
+    )
+    record_outcomes(status, result.rowcount, now)
+    return result.rowcount
+
+
+def adjust_challenges_balance(criteria, amount: float, now: Optional[datetime] = None) -> int:
+    """
+    Ajouter un montant au solde des challenges ciblés (un UPDATE relatif, version incrémentée
+    comme pour apply_pnl), sans commit. Les règles sont réévaluées au prochain balayage killer.
+
+    Returns:
+        int: Nombre de challenges modifiés
+    """
+    result = db.session.execute(
+        update(Challenge)
+        .where(criteria)
+        .values(
+            current_balance=Challenge.current_balance + amount,
+            version=Challenge.version + 1,
+            updated_at=now or datetime.utcnow()
+        )
+        .execution_options(synchronize_session=False, admin_metrics_neutral=True)
+    )
+    return result.rowcount
+
+
+def set_users_active(criteria, active: bool, fail_challenges: bool = False,
+                     failed_reason: str = 'admin') -> Dict[str, int]:
+    """
+    Activer ou désactiver les utilisateurs ciblés par un seul UPDATE, sans commit ;
+    à la désactivation, leurs challenges actifs peuvent être échoués dans la même transaction.
+
+    Returns:
+        dict: users (utilisateurs modifiés), challenges_failed
+    """
+    result = db.session.execute(
+        update(User)
+        .where(criteria, User.is_active.isnot(active))
+        .values(is_active=active)
+        .execution_options(synchronize_session=False)
+    )
+    summary = {'users': result.rowcount, 'challenges_failed': 0}
+
+    if not active and fail_challenges:
+        # Tous les challenges actifs des utilisateurs ciblés, y compris ceux déjà désactivés
+        users = select(User.id).where(criteria).correlate(None)
+        summary['challenges_failed'] = set_challenges_status(
+            Challenge.user_id.in_(users) & (Challenge.status == ChallengeStatus.ACTIVE.value),
+            ChallengeStatus.FAILED.value, failed_reason
+        )
+    return summary
+
+
+def adjust_users_balance(criteria, amount: float) -> int:
+    """
+    Ajouter un montant au solde des utilisateurs ciblés (un UPDATE relatif), sans commit
+
+    Returns:
+        int: Nombre d'utilisateurs modifiés
+    """
+    result = db.session.execute(
+        update(User)
+        .where(criteria)
+        .values(balance=User.balance + amount)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def delete_users(criteria) -> Dict[str, int]:
+    """
+    Supprimer les utilisateurs ciblés et leurs données par des DELETE groupés, enfants d'abord,
+    sans charger d'objet ORM et sans commit : le coût suit le nombre de lignes supprimées.
+
+    Mêmes lignes que la cascade ORM de session.delete(user) : challenges avec leurs trades,
+    points d'équité, ordres en attente et agrégats du classement, paiements. S'y ajoutent les
+    données que la cascade ne couvrait pas et qui faisaient échouer la suppression (clé étrangère
+    non nulle) : publications et likes, comptes de trading et leurs trades, archives du classement.
+    L'état en mémoire des challenges supprimés (points d'équité en tampon, dernier échantillon,
+    ordres du carnet, niveaux SL/TP) est purgé au commit : leurs symboles ne sont plus surveillés.
+
+    Returns:
+        dict: Nombre de lignes supprimées par table
+    """
+    users = select(User.id).where(criteria).correlate(None)
+    challenges = select(Challenge.id).where(Challenge.user_id.in_(users))
+    posts = select(CommunityPost.id).where(CommunityPost.user_id.in_(users))
+    accounts = select(TradingAccount.id).where(TradingAccount.user_id.in_(users))
+
+    # Agrégats journaliers : retirer les contributions tant que les lignes existent
+    retract_users(users)
+    _forget_on_commit(challenges)
+
+    steps = (
+        (EquitySnapshot, EquitySnapshot.challenge_id.in_(challenges)),
+        (PendingOrder, PendingOrder.challenge_id.in_(challenges)),
+        (MonthlyAssetProfit, MonthlyAssetProfit.challenge_id.in_(challenges)),
+        (MonthlyProfit, MonthlyProfit.challenge_id.in_(challenges)),
+        (Trade, Trade.challenge_id.in_(challenges)),
+        (Challenge, Challenge.user_id.in_(users)),
+        (Payment, Payment.user_id.in_(users)),
+        (CommunityLike, or_(CommunityLike.user_id.in_(users), CommunityLike.post_id.in_(posts))),
+        (CommunityPost, CommunityPost.user_id.in_(users)),
+        (OriginalTrade, or_(OriginalTrade.user_id.in_(users), OriginalTrade.trading_account_id.in_(accounts))),
+        (TradingAccount, TradingAccount.user_id.in_(users)),
+        (Leaderboard, Leaderboard.user_id.in_(users)),
+        (User, criteria),
+    )
+    deleted = {}
+    for model, condition in steps:
+        result = db.session.execute(
+            delete(model).where(condition).execution_options(synchronize_session=False)
+        )
+        deleted[model.__tablename__] = result.rowcount
+    return deleted
+
+
+def _forget_on_commit(challenges):
+    # Identifiants relevés avant les DELETE ; lignes (id, symbol) comme attendu par le carnet et le moteur SL/TP
+    state = db.session.info.setdefault('deleted_challenges', {'challenges': set(), 'orders': [], 'trades': []})
+    state['challenges'].update(db.session.execute(challenges).scalars())
+    state['orders'] += db.session.execute(
+        select(PendingOrder.id, PendingOrder.symbol)
+        .where(PendingOrder.challenge_id.in_(challenges), PendingOrder.status == OrderStatus.PENDING.value)
+    ).all()
+    state['trades'] += db.session.execute(
+        select(Trade.id, Trade.symbol)
+        .where(Trade.challenge_id.in_(challenges), Trade.is_closed == False,
+               Trade.stop_loss.isnot(None) | Trade.take_profit.isnot(None))
+    ).all()
+
+
+@event.listens_for(Session, 'after_commit')
+def _forget_deleted_challenges(session):
+    # Libération d'un savepoint : attendre le commit de la transaction
+    if session.in_nested_transaction():
+        return
+    state = session.info.pop('deleted_challenges', None)
+    if not state:
+        return
+    forget_challenges(state['challenges'])
+    for order in state['orders']:
+        order_book.cancel(order)
+    for trade in state['trades']:
+        protective_engine.unregister(trade)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _keep_on_rollback(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop('deleted_challenges', None)
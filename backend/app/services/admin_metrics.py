@@ -0,0 +1,126 @@
+import threading
+import time
+from typing import Dict
+from sqlalchemy import select, func, case, event, inspect, true
+from sqlalchemy.orm import Session
+from app import db
+from app.models import User, Challenge, Payment, ChallengeStatus, PaymentStatus
+
+# Durée de vie des métriques du tableau de bord (invalidées plus tôt par les changements
+# de statut de challenge et les paiements validés dans ce processus)
+ADMIN_METRICS_TTL = 30
+
+_metrics_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
+# Incrémenté à chaque invalidation : un calcul commencé avant n'est pas remis en cache
+_cache_generation = 0
+
+# Modèles et colonnes dont une modification change les métriques
+_WATCHED = {User: None, Payment: ('status', 'amount'), Challenge: ('status',)}
+
+
+def compute_admin_metrics() -> Dict:
+    """
+    Métriques d'administration en un seul aller-retour : une agrégation conditionnelle par table
+    (users, challenges, payments), chacune parcourue une seule fois
+    """
+    completed = Payment.status == PaymentStatus.COMPLETED.value
+    users = select(func.count(User.id)).scalar_subquery()
+    challenges = select(
+        func.sum(case((Challenge.status == ChallengeStatus.ACTIVE.value, 1), else_=0)),
+        func.sum(case((Challenge.status == ChallengeStatus.PASSED.value, 1), else_=0)),
+        func.sum(case((Challenge.status == ChallengeStatus.FAILED.value, 1), else_=0))
+    ).subquery()
+    payments = select(
+        func.sum(case((completed, Payment.amount), else_=0.0)),
+        func.sum(case((completed, 1), else_=0))
+    ).subquery()
+
+    # Sous-requêtes d'une ligne chacune : jointure sans condition explicite
+    row = db.session.execute(
+        select(users, challenges, payments).select_from(challenges.join(payments, true()))
+    ).one()
+    total_users, active, passed, failed, revenue, completed_payments = row
+    return {
+        'total_users': total_users or 0,
+        'active_challenges': active or 0,
+        'passed_challenges': passed or 0,
+        'failed_challenges': failed or 0,
+        'total_revenue': float(revenue or 0.0),
+        'completed_payments': completed_payments or 0
+    }
+
+
+def get_admin_metrics() -> Dict:
+    """
+    Métriques en cache (recalculées après invalidation ou à expiration du TTL)
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _metrics_cache.get('metrics')
+        if cached and cached[0] > now:
+            return cached[1]
+        generation = _cache_generation
+
+    metrics = compute_admin_metrics()
+    with _cache_lock:
+        if generation == _cache_generation:
+            _metrics_cache['metrics'] = (now + ADMIN_METRICS_TTL, metrics)
+    return metrics
+
+
+def invalidate_admin_metrics():
+    """Vider le cache des métriques d'administration"""
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _metrics_cache.clear()
+
+
+def _changes_metrics(obj, created_or_deleted=False) -> bool:
+    for model, columns in _WATCHED.items():
+        if isinstance(obj, model):
+            if columns is None or created_or_deleted:
+                return True
+            state = inspect(obj)
+            return any(state.attrs[column].history.has_changes() for column in columns)
+    return False
+
+
+def _statement_changes_metrics(statement) -> bool:
+    # UPDATE/DELETE groupés sur un modèle suivi : invalidation par défaut, sauf pour les
+    # requêtes marquées .execution_options(admin_metrics_neutral=True) (ex: incréments de solde)
+    entity = (statement.entity_description or {}).get('entity')
+    if entity not in _WATCHED:
+        return False
+    return not statement.get_execution_options().get('admin_metrics_neutral', False)
+
+
+@event.listens_for(Session, 'before_flush')
+def _track_flush(session, flush_context, instances):
+    if any(_changes_metrics(obj, created_or_deleted=True) for obj in (*session.new, *session.deleted)) \
+            or any(_changes_metrics(obj) for obj in session.dirty):
+        session.info['admin_metrics_dirty'] = True
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _track_bulk_statement(orm_execute_state):
+    if (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert) \
+            and _statement_changes_metrics(orm_execute_state.statement):
+        orm_execute_state.session.info['admin_metrics_dirty'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_on_commit(session):
+    # Libération d'un savepoint : attendre le commit de la transaction
+    if session.in_nested_transaction():
+        return
+    if session.info.pop('admin_metrics_dirty', False):
+        invalidate_admin_metrics()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _reset_on_rollback(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop('admin_metrics_dirty', None)
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Dict, Optional
+import orjson
+from flask import request, has_request_context
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import text, event
+from app.models import AuditLog
+from app.services.batch_writer import BufferedWriter
+from app.utils.json_provider import _default
+
+# Writer global : une action admin n'ajoute qu'une ligne en mémoire, jamais un commit
+audit_writer = BufferedWriter(AuditLog, flush_size=200, flush_interval=2.0)
+
+# Ajout seul garanti par la base (en plus de l'absence de route de modification)
+_APPEND_ONLY_DDL = {
+    'sqlite': (
+        "CREATE TRIGGER IF NOT EXISTS audit_logs_no_update BEFORE UPDATE ON audit_logs "
+        "BEGIN SELECT RAISE(ABORT, 'audit_logs est en ajout seul'); END",
+        "CREATE TRIGGER IF NOT EXISTS audit_logs_no_delete BEFORE DELETE ON audit_logs "
+        "BEGIN SELECT RAISE(ABORT, 'audit_logs est en ajout seul'); END",
+    ),
+    'postgresql': (
+        "CREATE OR REPLACE FUNCTION audit_logs_append_only() RETURNS trigger AS $$ "
+        "BEGIN RAISE EXCEPTION 'audit_logs est en ajout seul'; END; $$ LANGUAGE plpgsql",
+        "DROP TRIGGER IF EXISTS audit_logs_append_only ON audit_logs",
+        "CREATE TRIGGER audit_logs_append_only BEFORE UPDATE OR DELETE ON audit_logs "
+        "FOR EACH ROW EXECUTE FUNCTION audit_logs_append_only()",
+    ),
+}
+
+
+@event.listens_for(AuditLog.__table__, 'after_create')
+def _install_append_only(target, connection, **kw):
+    for statement in _APPEND_ONLY_DDL.get(connection.dialect.name, ()):
+        connection.execute(text(statement))
+
+
+def _snapshot(value):
+    # Valeurs figées au moment de l'action et compatibles JSON (datetimes en ISO 8601)
+    if value is None:
+        return None
+    return orjson.loads(orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS))
+
+
+def record_admin_action(action: str, target_type: str, target_id: Optional[str] = None,
+                        before: Optional[Dict] = None, after: Optional[Dict] = None,
+                        actor_id: Optional[str] = None):
+    """
+    Mettre une action d'administration dans le tampon du journal d'audit (aucun accès base de données).
+    À appeler après le commit de l'action : une action annulée ne laisse pas de trace.
+
+    Args:
+        action (str): Nom de l'action (ex: 'challenge.status')
+        target_type (str): Type de la cible ('challenge', 'user', 'setting')
+        target_id (str): Identifiant de la cible (None pour une action groupée)
+        before (dict): Valeurs avant l'action
+        after (dict): Valeurs après l'action (ou paramètres et résumé d'une action groupée)
+        actor_id (str): Administrateur (par défaut l'identité JWT de la requête)
+    """
+    ip = None
+    if has_request_context():
+        ip = request.remote_addr
+        if actor_id is None:
+            actor_id = get_jwt_identity()
+
+    audit_writer.add({
+        'created_at': datetime.utcnow(),
+        'actor_id': actor_id,
+        'action': action,
+        'target_type': target_type,
+        'target_id': target_id,
+        'before': _snapshot(before),
+        'after': _snapshot(after),
+        'ip': ip
+    })
@@ -0,0 +1,147 @@
+import atexit
+import threading
+import logging
+from typing import Callable, Dict, List
+from sqlalchemy.exc import IntegrityError, DataError
+from app import db
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BufferedWriter:
+    """
+    Tampon d'insertions en mémoire vidé par lots dans une seule transaction.
+    Le vidage est déclenché par la taille du tampon ou par un délai, depuis un thread
+    de fond : les appelants (requêtes, balayages) n'ajoutent qu'un append en mémoire.
+    """
+    def __init__(self, model, flush_size: int = 500, flush_interval: float = 5.0, max_buffer: int = 100000):
+        self._model = model
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._max_buffer = max_buffer
+        self._rows: List[Dict] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._app = None
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Lier le writer à l'application et démarrer le thread de vidage
+        """
+        self._app = app
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+            # Vidage garanti à l'arrêt du processus
+            atexit.register(self.flush)
+            logger.info(f"Started buffered writer for {self._model.__tablename__}")
+
+    def add(self, row: Dict):
+        """
+        Ajouter une ligne au tampon (aucun accès base de données)
+        """
+        with self._lock:
+            self._rows.append(row)
+            size = len(self._rows)
+        if size >= self._flush_size:
+            self._wakeup.set()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def pending_rows(self, predicate: Callable[[Dict], bool]) -> List[Dict]:
+        """
+        Copie des lignes en attente qui vérifient predicate (lecture sans vidage)
+        """
+        with self._lock:
+            return [row for row in self._rows if predicate(row)]
+
+    def discard(self, predicate: Callable[[Dict], bool]) -> int:
+        """
+        Retirer du tampon les lignes en attente qui vérifient predicate (lignes devenues sans objet)
+
+        Returns:
+            int: Nombre de lignes retirées
+        """
+        with self._lock:
+            kept = [row for row in self._rows if not predicate(row)]
+            discarded = len(self._rows) - len(kept)
+            self._rows = kept
+        return discarded
+
+    def flush(self) -> int:
+        """
+        Écrire toutes les lignes en attente avec un seul INSERT multi-lignes
+        Returns:
+            int: Nombre de lignes écrites
+        """
+        if self._app is None:
+            return 0
+
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return 0
+
+            try:
+                with self._app.app_context():
+                    with db.engine.begin() as conn:
+                        conn.execute(self._model.__table__.insert(), rows)
+                return len(rows)
+            except (IntegrityError, DataError) as e:
+                # Ligne invalide dans le lot (ex: clé étrangère vers une ligne supprimée) :
+                # la remettre en tampon bloquerait toutes les écritures suivantes
+                logger.error(f"Error flushing {len(rows)} rows into {self._model.__tablename__}, "
+                             f"retrying row by row: {str(e.orig)}")
+                try:
+                    return self._insert_rows_individually(rows)
+                except Exception as e:
+                    logger.error(f"Error flushing rows one by one into {self._model.__tablename__}: {str(e)}")
+                    self._requeue(rows)
+                    return 0
+            except Exception as e:
+                logger.error(f"Error flushing {len(rows)} rows into {self._model.__tablename__}: {str(e)}")
+                # Erreur transitoire (base indisponible) : réessayer au prochain vidage
+                self._requeue(rows)
+                return 0
+
+    def _requeue(self, rows: List[Dict]):
+        # Remettre les lignes en tête du tampon, dans la limite de max_buffer
+        with self._lock:
+            self._rows = rows + self._rows
+            overflow = len(self._rows) - self._max_buffer
+            if overflow > 0:
+                del self._rows[:overflow]
+                logger.error(f"Dropped {overflow} buffered rows for {self._model.__tablename__}")
+
+    def _insert_rows_individually(self, rows: List[Dict]) -> int:
+        """
+        Écrire les lignes une par une (un point de sauvegarde par ligne, un seul commit) ;
+        les lignes rejetées par la base sont journalisées et abandonnées
+        """
+        written = 0
+        with self._app.app_context():
+            with db.engine.begin() as conn:
+                for row in rows:
+                    try:
+                        with conn.begin_nested():
+                            conn.execute(self._model.__table__.insert(), row)
+                        written += 1
+                    except (IntegrityError, DataError) as e:
+                        logger.error(f"Dropped row for {self._model.__tablename__}: {row} ({str(e.orig)})")
+        return written
+
+    def _worker(self):
+        while True:
+            try:
+                self._wakeup.wait(self._flush_interval)
+                self._wakeup.clear()
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error in buffered writer worker: {str(e)}")
@@ -0,0 +1,268 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from app.models.challenge import PlanType
+from app.utils.market_data import asset_class
+
+# Définition déclarative des règles par plan.
+# Les seuils des trois règles historiques sont lus par défaut dans les colonnes du challenge
+# (max_total_loss_pct, max_daily_loss_pct, profit_target_pct) ; un paramètre 'pct' les remplace.
+# Les limites d'ordre (lots par trade, positions ouvertes) sont vérifiées avant l'exécution :
+# un ordre qui les dépasse est refusé, le challenge n'échoue pas.
+PLAN_RULES = {
+    PlanType.STARTER.value: [
+        {'rule': 'max_total_loss'},
+        {'rule': 'max_daily_loss'},
+        {'rule': 'max_lots_per_trade', 'limit': 1000, 'asset_limits': {'forex': 100000}},
+        {'rule': 'max_open_positions', 'limit': 10},
+        {'rule': 'profit_target'},
+        {'rule': 'min_trading_days', 'days': 3},
+    ],
+    PlanType.PRO.value: [
+        {'rule': 'max_total_loss'},
+        {'rule': 'max_daily_loss'},
+        {'rule': 'max_lots_per_trade', 'limit': 5000, 'asset_limits': {'forex': 500000}},
+        {'rule': 'max_open_positions', 'limit': 20},
+        {'rule': 'profit_target'},
+        {'rule': 'min_trading_days', 'days': 4},
+    ],
+    PlanType.ELITE.value: [
+        {'rule': 'max_total_loss'},
+        {'rule': 'max_daily_loss'},
+        {'rule': 'max_lots_per_trade', 'limit': 20000, 'asset_limits': {'forex': 2000000}},
+        {'rule': 'max_open_positions', 'limit': 50},
+        {'rule': 'profit_target'},
+        {'rule': 'min_trading_days', 'days': 5},
+        {'rule': 'consistency', 'max_day_share_pct': 40},
+    ],
+}
+
+DEFAULT_PLAN = PlanType.STARTER.value
+
+# Colonnes disponibles pour les prédicats (une valeur par challenge)
+RULE_COLUMNS = [
+    'initial_balance', 'daily_start_balance', 'equity',
+    'max_daily_loss_pct', 'max_total_loss_pct', 'profit_target_pct',
+    'open_positions', 'trading_days', 'best_day_profit',
+]
+
+# Un prédicat compilé reçoit les colonnes et retourne (masque, valeur observée, seuil)
+Predicate = Callable[[Dict[str, np.ndarray]], Tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+ACTIVE, PASSED, FAILED = 0, 1, 2
+
+
+def _pct_threshold(params, column):
+    pct = params.get('pct')
+
+    def threshold(cols):
+        ratio = cols[column] if pct is None else pct
+        return cols['initial_balance'] * (ratio / 100.0)
+    return threshold
+
+
+def _max_total_loss(params) -> Predicate:
+    threshold = _pct_threshold(params, 'max_total_loss_pct')
+
+    def predicate(cols):
+        value = cols['initial_balance'] - cols['equity']
+        limit = threshold(cols)
+        return value >= limit, value, limit
+    return predicate
+
+
+def _max_daily_loss(params) -> Predicate:
+    threshold = _pct_threshold(params, 'max_daily_loss_pct')
+
+    def predicate(cols):
+        value = cols['daily_start_balance'] - cols['equity']
+        limit = threshold(cols)
+        return value >= limit, value, limit
+    return predicate
+
+
+def _profit_target(params) -> Predicate:
+    threshold = _pct_threshold(params, 'profit_target_pct')
+
+    def predicate(cols):
+        value = cols['equity'] - cols['initial_balance']
+        limit = threshold(cols)
+        return value >= limit, value, limit
+    return predicate
+
+
+def _max_lots_per_trade(params):
+    # Limite d'ordre : quantité maximale par trade, éventuellement par classe d'actif
+    limit = int(params['limit'])
+    asset_limits = {name: int(value) for name, value in params.get('asset_limits', {}).items()}
+
+    def check(symbol: str, quantity: int, open_positions: int, new_positions: int) -> Optional[str]:
+        maximum = asset_limits.get(asset_class(symbol), limit)
+        if quantity > maximum:
+            return f'Quantité maximale par trade dépassée pour ce plan ({maximum})'
+        return None
+    return check
+
+
+def _max_open_positions(params):
+    # Limite d'ordre : positions ouvertes (ordres en attente compris) après exécution
+    limit = int(params['limit'])
+
+    def check(symbol: str, quantity: int, open_positions: int, new_positions: int) -> Optional[str]:
+        if open_positions + new_positions > limit:
+            return f'Nombre maximal de positions ouvertes atteint pour ce plan ({limit})'
+        return None
+    return check
+
+
+def _no_weekend_holding(params) -> Predicate:
+    def predicate(cols):
+        value = cols['open_positions']
+        return (value > 0) & cols['is_weekend'], value, np.zeros_like(value)
+    return predicate
+
+
+def _min_trading_days(params) -> Predicate:
+    days = float(params['days'])
+
+    def predicate(cols):
+        value = cols['trading_days']
+        return value >= days, value, np.full_like(value, days)
+    return predicate
+
+
+def _consistency(params) -> Predicate:
+    # La meilleure journée ne doit pas représenter plus de max_day_share_pct du profit total
+    share = float(params['max_day_share_pct']) / 100.0
+
+    def predicate(cols):
+        value = cols['best_day_profit']
+        limit = np.maximum(cols['equity'] - cols['initial_balance'], 0.0) * share
+        return value <= limit, value, limit
+    return predicate
+
+
+# Registre : nom -> (catégorie, constructeur)
+# - 'fail' : la règle fait échouer le challenge (la première règle déclarée l'emporte)
+# - 'pass' : condition nécessaire à la réussite
+# - 'order' : limite vérifiée avant l'exécution d'un ordre (refus de l'ordre)
+RULE_TYPES = {
+    'max_total_loss': ('fail', _max_total_loss),
+    'max_daily_loss': ('fail', _max_daily_loss),
+    'max_lots_per_trade': ('order', _max_lots_per_trade),
+    'max_open_positions': ('order', _max_open_positions),
+    'no_weekend_holding': ('fail', _no_weekend_holding),
+    'profit_target': ('pass', _profit_target),
+    'min_trading_days': ('pass', _min_trading_days),
+    'consistency': ('pass', _consistency),
+}
+
+# Raisons d'échec enregistrées sur le challenge (compatibles avec 'total_loss' / 'daily_loss')
+FAILED_REASONS = {
+    'max_total_loss': 'total_loss',
+    'max_daily_loss': 'daily_loss',
+    'no_weekend_holding': 'weekend_holding',
+}
+
+
+class CompiledRuleSet:
+    """
+    Jeu de règles d'un plan compilé en prédicats vectorisés.
+    Le coût d'une évaluation est proportionnel au nombre de règles, chaque règle
+    traitant tous les challenges du lot en une seule opération numpy.
+    """
+    def __init__(self, fail_rules: List[Tuple[str, Predicate]], pass_rules: List[Tuple[str, Predicate]],
+                 order_rules: List[Tuple[str, Callable]] = None):
+        self.fail_rules = fail_rules
+        self.pass_rules = pass_rules
+        self.order_rules = order_rules or []
+
+    def check_order(self, symbol: str, quantity: int, open_positions: int, new_positions: int = 1) -> Optional[str]:
+        """
+        Vérifier les limites d'ordre du plan avant exécution
+
+        Args:
+            symbol (str): Symbole de l'ordre
+            quantity (int): Quantité de l'ordre
+            open_positions (int): Positions ouvertes et ordres en attente du challenge
+            new_positions (int): Positions ajoutées par l'ordre (nombre de jambes d'un panier)
+
+        Returns:
+            str or None: Message d'erreur, None si l'ordre respecte les limites
+        """
+        for _name, check in self.order_rules:
+            error = check(symbol, quantity, open_positions, new_positions)
+            if error:
+                return error
+        return None
+
+    def evaluate(self, cols: Dict[str, np.ndarray]):
+        """
+        Returns:
+            tuple: (statuts, index de la règle d'échec ou -1, valeur observée, seuil)
+        """
+        n = len(cols['equity'])
+        status = np.full(n, ACTIVE, dtype=np.int8)
+        reason = np.full(n, -1, dtype=np.int16)
+        value = np.zeros(n)
+        threshold = np.zeros(n)
+        active = cols['initial_balance'] > 0
+
+        for index, (_name, predicate) in enumerate(self.fail_rules):
+            hit, observed, limit = predicate(cols)
+            hit = hit & active & (status == ACTIVE)
+            status[hit] = FAILED
+            reason[hit] = index
+            value[hit] = observed[hit]
+            threshold[hit] = limit[hit]
+
+        if self.pass_rules:
+            passed = active & (status == ACTIVE)
+            # La première condition de réussite (objectif de profit) fournit valeur et seuil
+            _name, predicate = self.pass_rules[0]
+            hit, observed, limit = predicate(cols)
+            passed &= hit
+            for _name, predicate in self.pass_rules[1:]:
+                passed &= predicate(cols)[0]
+            status[passed] = PASSED
+            value[passed] = observed[passed]
+            threshold[passed] = limit[passed]
+
+        return status, reason, value, threshold
+
+    def failed_reason(self, index: int) -> str:
+        name = self.fail_rules[index][0]
+        return FAILED_REASONS.get(name, name)
+
+
+def compile_rules(definitions: List[Dict]) -> CompiledRuleSet:
+    """
+    Compiler une liste de définitions de règles en prédicats vectorisés
+
+    Raises:
+        ValueError: Règle inconnue ou paramètre manquant
+    """
+    rules = {'fail': [], 'pass': [], 'order': []}
+    for definition in definitions:
+        name = definition.get('rule')
+        if name not in RULE_TYPES:
+            raise ValueError(f"Règle inconnue: {name}")
+        category, builder = RULE_TYPES[name]
+        params = {k: v for k, v in definition.items() if k != 'rule'}
+        try:
+            predicate = builder(params)
+        except KeyError as e:
+            raise ValueError(f"Paramètre manquant pour la règle {name}: {e}")
+        rules[category].append((name, predicate))
+
+    # L'objectif de profit doit rester la première condition de réussite
+    rules['pass'].sort(key=lambda rule: rule[0] != 'profit_target')
+    return CompiledRuleSet(rules['fail'], rules['pass'], rules['order'])
+
+
+@lru_cache(maxsize=None)
+def get_rule_set(plan_type: str) -> CompiledRuleSet:
+    """
+    Jeu de règles compilé d'un plan (compilé une seule fois par processus)
+    """
+    return compile_rules(PLAN_RULES.get(plan_type, PLAN_RULES[DEFAULT_PLAN]))
@@ -0,0 +1,174 @@
+import time
+import threading
+from typing import Dict, List, Optional
+from sqlalchemy import select, delete, func
+from app import db
+from app.models import EquitySnapshot
+from app.services.batch_writer import BufferedWriter
+
+# Intervalle minimal entre deux points d'un même challenge (secondes)
+EQUITY_SAMPLE_INTERVAL = 30
+
+# Sous-échantillonnage avec l'âge : (âge minimal en secondes, largeur du seau en secondes)
+# Au-delà d'un jour on garde un point par 5 minutes, au-delà d'une semaine un par heure,
+# au-delà d'un mois un par jour.
+EQUITY_RETENTION_POLICY = [
+    (86400, 300),
+    (7 * 86400, 3600),
+    (30 * 86400, 86400),
+]
+
+# Writer global : les points sont écrits par lots, jamais un commit par tick
+equity_writer = BufferedWriter(EquitySnapshot, flush_size=500, flush_interval=5.0)
+
+# Dernier point mis en tampon par challenge ; une entrée plus vieille que l'intervalle
+# ne filtre plus rien et est purgée (au plus une purge par intervalle)
+_last_sample: Dict[str, int] = {}
+_last_prune = 0
+_sample_lock = threading.Lock()
+
+
+def record_equity(challenge_id: str, equity: float, balance: float, force: bool = False) -> bool:
+    """
+    Enregistrer un point d'équité dans le tampon d'écriture
+
+    Args:
+        challenge_id (str): ID du challenge
+        equity (float): Équité actuelle (solde + P&L non réalisé)
+        balance (float): Solde réalisé
+        force (bool): Ignorer l'intervalle minimal (clôture de trade, changement de statut)
+
+    Returns:
+        bool: True si le point a été mis en tampon
+    """
+    global _last_prune
+    now = int(time.time())
+    with _sample_lock:
+        if now - _last_prune >= EQUITY_SAMPLE_INTERVAL:
+            for key in [k for k, ts in _last_sample.items() if now - ts >= EQUITY_SAMPLE_INTERVAL]:
+                del _last_sample[key]
+            _last_prune = now
+        last = _last_sample.get(challenge_id)
+        if not force and last is not None and now - last < EQUITY_SAMPLE_INTERVAL:
+            return False
+        _last_sample[challenge_id] = now
+
+    equity_writer.add({
+        'challenge_id': challenge_id,
+        'ts': now,
+        'equity': float(equity),
+        'balance': float(balance)
+    })
+    return True
+
+
+def forget_challenges(challenge_ids) -> int:
+    """
+    Oublier l'état en mémoire de challenges supprimés : points encore en tampon
+    (leur insertion échouerait sur la clé étrangère) et dernier échantillon
+
+    Returns:
+        int: Nombre de points retirés du tampon
+    """
+    ids = set(challenge_ids)
+    if not ids:
+        return 0
+    with _sample_lock:
+        for challenge_id in ids:
+            _last_sample.pop(challenge_id, None)
+    return equity_writer.discard(lambda row: row['challenge_id'] in ids)
+
+
+def compute_curve_stats(equities: List[float], initial_balance: Optional[float] = None) -> Dict:
+    """
+    Calculer le pic d'équité et le drawdown maximal en une seule passe
+
+    Args:
+        equities (list): Valeurs d'équité triées par date
+        initial_balance (float, optional): Capital initial, point de départ de la courbe
+
+    Returns:
+        dict: peak_equity, max_drawdown (montant) et max_drawdown_pct
+    """
+    peak = initial_balance if initial_balance is not None else (equities[0] if equities else 0.0)
+    max_dd = 0.0
+    max_dd_pct = 0.0
+
+    for value in equities:
+        if value > peak:
+            peak = value
+            continue
+        drawdown = peak - value
+        if drawdown > max_dd:
+            max_dd = drawdown
+            max_dd_pct = (drawdown / peak) * 100 if peak > 0 else 0.0
+
+    return {
+        'peak_equity': peak,
+        'max_drawdown': round(max_dd, 2),
+        'max_drawdown_pct': round(max_dd_pct, 2)
+    }
+
+
+def get_equity_curve(challenge, since: Optional[int] = None) -> Dict:
+    """
+    Obtenir la courbe d'équité d'un challenge avec ses statistiques précalculées
+
+    Args:
+        challenge (Challenge): Challenge concerné
+        since (int, optional): Timestamp epoch minimal
+
+    Returns:
+        dict: Points de la courbe, pic d'équité et drawdown maximal
+    """
+    query = select(EquitySnapshot.ts, EquitySnapshot.equity, EquitySnapshot.balance)\
+        .where(EquitySnapshot.challenge_id == challenge.id)
+    if since is not None:
+        query = query.where(EquitySnapshot.ts >= since)
+    points = [{'t': r.ts, 'equity': r.equity, 'balance': r.balance}
+              for r in db.session.execute(query.order_by(EquitySnapshot.ts, EquitySnapshot.id))]
+
+    # Points encore en tampon, lus en mémoire sans forcer un vidage
+    pending = equity_writer.pending_rows(
+        lambda row: row['challenge_id'] == challenge.id and (since is None or row['ts'] >= since)
+    )
+    if pending:
+        points.extend({'t': row['ts'], 'equity': row['equity'], 'balance': row['balance']} for row in pending)
+        points.sort(key=lambda point: point['t'])
+
+    stats = compute_curve_stats([p['equity'] for p in points], challenge.initial_balance)
+
+    return {
+        'challenge_id': challenge.id,
+        'points': points,
+        'count': len(points),
+        **stats
+    }
+
+
+def compact_equity_snapshots(now: Optional[int] = None) -> int:
+    """
+    Sous-échantillonner les anciens points selon EQUITY_RETENTION_POLICY.
+    Pour chaque seau (challenge, période) on ne garde que le dernier point.
+
+    Returns:
+        int: Nombre de points supprimés
+    """
+    now = now or int(time.time())
+    removed = 0
+
+    for age, width in EQUITY_RETENTION_POLICY:
+        cutoff = now - age
+        keep = select(func.max(EquitySnapshot.id))\
+            .where(EquitySnapshot.ts < cutoff)\
+            .group_by(EquitySnapshot.challenge_id, EquitySnapshot.ts // width)
+        result = db.session.execute(
+            delete(EquitySnapshot)
+            .where(EquitySnapshot.ts < cutoff)
+            .where(EquitySnapshot.id.notin_(keep))
+            .execution_options(synchronize_session=False)
+        )
+        removed += result.rowcount or 0
+
+    db.session.commit()
+    return removed
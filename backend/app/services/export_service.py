@@ -0,0 +1,101 @@
+import csv
+import io
+from datetime import datetime
+from typing import Iterator, List
+import orjson
+from sqlalchemy import select
+from app import db
+from app.models import Trade, Payment
+
+# Nombre de lignes lues par aller-retour avec le curseur serveur
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+TRADE_EXPORT_COLUMNS = [
+    Trade.id, Trade.challenge_id, Trade.user_id, Trade.symbol, Trade.trade_type, Trade.quantity,
+    Trade.entry_price, Trade.exit_price, Trade.profit_loss, Trade.is_closed, Trade.close_reason,
+    Trade.stop_loss, Trade.take_profit, Trade.timestamp,
+]
+
+PAYMENT_EXPORT_COLUMNS = [
+    Payment.id, Payment.user_id, Payment.amount, Payment.currency, Payment.method,
+    Payment.status, Payment.transaction_id, Payment.timestamp, Payment.description,
+]
+
+
+def trade_export_query(**filters):
+    """
+    Requête d'export des trades (projection de colonnes, triée par date)
+    filters: challenge_ids (sous-requête ou liste), user_id, date_from, date_to
+    """
+    stmt = select(*TRADE_EXPORT_COLUMNS)
+    if filters.get('challenge_ids') is not None:
+        stmt = stmt.where(Trade.challenge_id.in_(filters['challenge_ids']))
+    if filters.get('user_id'):
+        stmt = stmt.where(Trade.user_id == filters['user_id'])
+    if filters.get('date_from'):
+        stmt = stmt.where(Trade.timestamp >= filters['date_from'])
+    if filters.get('date_to'):
+        stmt = stmt.where(Trade.timestamp <= filters['date_to'])
+    return stmt.order_by(Trade.timestamp, Trade.id)
+
+
+def payment_export_query(**filters):
+    """
+    Requête d'export des paiements (projection de colonnes, triée par date)
+    filters: user_id, status, date_from, date_to
+    """
+    stmt = select(*PAYMENT_EXPORT_COLUMNS)
+    if filters.get('user_id'):
+        stmt = stmt.where(Payment.user_id == filters['user_id'])
+    if filters.get('status'):
+        stmt = stmt.where(Payment.status == filters['status'])
+    if filters.get('date_from'):
+        stmt = stmt.where(Payment.timestamp >= filters['date_from'])
+    if filters.get('date_to'):
+        stmt = stmt.where(Payment.timestamp <= filters['date_to'])
+    return stmt.order_by(Payment.timestamp, Payment.id)
+
+
+def _csv_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def stream_export(stmt, fmt: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Générer un export CSV ou NDJSON par blocs.
+    Les lignes sont lues avec un curseur côté serveur (yield_per) : la mémoire reste
+    constante quel que soit le nombre de lignes, et l'en-tête part avant la première lecture.
+
+    Args:
+        stmt: Requête select (colonnes exportées)
+        fmt (str): 'csv' ou 'ndjson'
+        chunk_size (int): Lignes par bloc
+
+    Yields:
+        bytes: Un bloc de l'export
+    """
+    names: List[str] = [column.name for column in stmt.selected_columns]
+
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(names)
+        yield buffer.getvalue().encode()
+
+    result = db.session.execute(stmt.execution_options(yield_per=chunk_size))
+    try:
+        for rows in result.partitions():
+            if fmt == 'csv':
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([_csv_value(v) for v in row] for row in rows)
+                yield buffer.getvalue().encode()
+            else:
+                yield b''.join(orjson.dumps(dict(zip(names, row))) + b'\n' for row in rows)
+    finally:
+        result.close()
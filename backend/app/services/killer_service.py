@@ -2,18 +2,26 @@ from app import db
 from app.models import Challenge, Trade, ChallengeStatus
 from app.utils.market_data import get_stock_quote
 from app.services.bvc_scraper import get_moroccan_stock_price
+from app.services.equity_service import record_equity
+from app.services.rule_engine import ChallengeState, evaluate_state, evaluate_in_pool, unrealized_pnl
+from app.services.unit_of_work import StatusUnitOfWork, get_unit_of_work
+from sqlalchemy import select, update, or_, func
+from collections import defaultdict
 from datetime import datetime
 
-def evaluate_killer_rules(challenge_id):
+def evaluate_killer_rules(challenge_id, unit_of_work=None):
     """
     Évalue les règles 'Killer' pour un challenge donné et met à jour son statut.
     
-    Règles à implémenter :
+    Règles de base (seuils par challenge) :
     1. Perte maximale journalière (FAIL) : Si la perte journalière ≥ 5 % du capital initial.
     2. Perte maximale totale (FAIL) : Si l’équité actuelle ≤ -10 % du capital initial.
     3. Objectif de profit (PASS) : Si l’équité actuelle ≥ +10 % du capital initial.
+    Les règles supplémentaires de chaque plan sont déclarées dans challenge_rules.PLAN_RULES.
     
     Cette fonction est appelée après chaque clôture de trade, mise à jour du P&L ou changement d'équité.
+    Elle ne valide pas la transaction : le changement de statut est enregistré dans l'unité de travail
+    (celle de la requête par défaut) et appliqué par l'appelant avec commit_unit_of_work().
     """
     challenge = Challenge.query.get(challenge_id)
     if not challenge:
@@ -39,56 +47,159 @@ def evaluate_killer_rules(challenge_id):
     
     current_equity = challenge.current_balance + total_unrealized_pnl
     
+    # Point de la courbe d'équité (mis en tampon, écrit par lots)
+    record_equity(challenge.id, current_equity, challenge.current_balance)
+    
     # 2. Vérifier et réinitialiser le solde quotidien si nécessaire
     # challenge.check_and_reset_daily_balance() met à jour daily_start_balance si on a changé de jour
     challenge.check_and_reset_daily_balance()
     
-    # 3. Paramètres de calcul
-    initial = challenge.initial_balance
-    if initial <= 0:
-        return challenge # Ne devrait pas arriver
-        
-    # Calcul des seuils
-    max_daily_loss = initial * (challenge.max_daily_loss_pct / 100.0)
-    max_total_loss = initial * (challenge.max_total_loss_pct / 100.0)
-    profit_target = initial * (challenge.profit_target_pct / 100.0)
-    
-    # 4. Évaluation des seuils (FAIL d'abord, puis PASS)
-    
-    # Règle 2 : Perte totale (FAIL)
-    # Note : "Si l'équité actuelle <= -10% du capital initial" d'après l'énoncé.
-    # Dans le contexte du trading prop firm, cela signifie que la perte totale par rapport à l'initial a atteint 10%.
-    # Donc : initial - current_equity >= max_total_loss
-    total_loss = initial - current_equity
-    
-    # Règle 1 : Perte journalière (FAIL)
-    # La perte journalière est calculée par rapport au solde de début de journée
-    current_daily_loss = challenge.daily_start_balance - current_equity
-    
-    # Règle 3 : Objectif de profit (PASS)
-    current_profit = current_equity - initial
-    
-    new_status = ChallengeStatus.ACTIVE.value
-    failed_reason = None
-    
-    if total_loss >= max_total_loss:
-        new_status = ChallengeStatus.FAILED.value
-        failed_reason = "total_loss"
-        print(f"[KILLER] Challenge {challenge_id} FAILED (Total Loss: {total_loss} >= {max_total_loss})")
-    elif current_daily_loss >= max_daily_loss:
-        new_status = ChallengeStatus.FAILED.value
-        failed_reason = "daily_loss"
-        print(f"[KILLER] Challenge {challenge_id} FAILED (Daily Loss: {current_daily_loss} >= {max_daily_loss})")
-    elif current_profit >= profit_target:
-        new_status = ChallengeStatus.PASSED.value
-        print(f"[KILLER] Challenge {challenge_id} PASSED (Profit: {current_profit} >= {profit_target})")
-    
-    # 5. Mise à jour si le statut a changé
-    if new_status != ChallengeStatus.ACTIVE.value:
-        challenge.status = new_status
-        challenge.failed_reason = failed_reason
-        challenge.completed_at = datetime.utcnow()
-        db.session.commit()
-        print(f"[KILLER] Status updated to {new_status} for challenge {challenge_id}")
+    # 3. Évaluation pure des règles du plan (FAIL d'abord, puis PASS)
+    activity = load_activity_metrics([challenge.id]).get(challenge.id, {})
+    decision = evaluate_state(challenge.to_rule_state(current_equity, open_positions=len(open_trades), **activity))
+    
+    if decision.failed_reason == 'total_loss':
+        print(f"[KILLER] Challenge {challenge_id} FAILED (Total Loss: {decision.value} >= {decision.threshold})")
+    elif decision.failed_reason == 'daily_loss':
+        print(f"[KILLER] Challenge {challenge_id} FAILED (Daily Loss: {decision.value} >= {decision.threshold})")
+    elif decision.status == ChallengeStatus.PASSED.value:
+        print(f"[KILLER] Challenge {challenge_id} PASSED (Profit: {decision.value} >= {decision.threshold})")
+    elif decision.is_transition:
+        print(f"[KILLER] Challenge {challenge_id} FAILED ({decision.failed_reason}: {decision.value} > {decision.threshold})")
+    
+    # 4. Changement de statut en attente du commit de l'appelant
+    if decision.is_transition:
+        (unit_of_work or get_unit_of_work()).record(decision, current_equity, challenge.current_balance)
     
     return challenge
+
+
+def load_activity_metrics(challenge_ids=None):
+    """
+    Agrégats d'activité utilisés par les règles des plans, calculés en SQL
+    
+    Args:
+        challenge_ids (list, optional): Challenges ciblés (par défaut : tous les challenges actifs)
+    
+    Returns:
+        dict: challenge_id -> {trading_days, best_day_profit}
+    """
+    trade_day = func.date(Trade.timestamp)
+    
+    def scoped(query):
+        if challenge_ids is not None:
+            return query.where(Trade.challenge_id.in_(challenge_ids))
+        return query.join(Challenge, Challenge.id == Trade.challenge_id)\
+            .where(Challenge.status == ChallengeStatus.ACTIVE.value)
+    
+    metrics = {}
+    activity = db.session.execute(scoped(
+        select(Trade.challenge_id, func.count(func.distinct(trade_day)))
+    ).group_by(Trade.challenge_id)).all()
+    for challenge_id, trading_days in activity:
+        metrics[challenge_id] = {
+            'trading_days': trading_days or 0,
+            'best_day_profit': 0.0
+        }
+    
+    daily = scoped(
+        select(Trade.challenge_id.label('challenge_id'), func.sum(Trade.profit_loss).label('day_pnl'))
+        .where(Trade.is_closed == True)
+    ).group_by(Trade.challenge_id, trade_day).subquery()
+    best_days = db.session.execute(
+        select(daily.c.challenge_id, func.max(daily.c.day_pnl)).group_by(daily.c.challenge_id)
+    ).all()
+    for challenge_id, best_day_profit in best_days:
+        if challenge_id in metrics:
+            metrics[challenge_id]['best_day_profit'] = float(best_day_profit or 0.0)
+    
+    return metrics
+
+
+def _get_price(symbol):
+    """Obtenir le dernier prix d'un symbole, None si indisponible"""
+    symbol_upper = symbol.upper().strip()
+    if symbol_upper.endswith('.CS'):
+        quote = get_moroccan_stock_price(symbol_upper)
+    else:
+        quote = get_stock_quote(symbol_upper)
+    return quote['price'] if quote and quote.get('price') else None
+
+
+def sweep_active_challenges(workers=None, batch_size=500):
+    """
+    Balayage global des règles 'Killer' sur tous les challenges actifs.
+    
+    - Réinitialisation des soldes journaliers en une seule requête
+    - Chargement par projection de colonnes (aucun objet ORM)
+    - Une seule cotation par symbole pour tout le balayage
+    - Agrégats d'activité (lots, jours de trading, meilleure journée) calculés en SQL
+    - Évaluation pure et vectorisée, répartie sur un pool de processus pour les gros volumes
+    - Changements de statut écrits par lots (un UPDATE multi-lignes par lot), un seul commit
+    
+    Returns:
+        list: Changements de statut appliqués (RuleDecision)
+    """
+    now = datetime.utcnow()
+    today_start = datetime(now.year, now.month, now.day)
+    
+    db.session.execute(
+        update(Challenge)
+        .where(Challenge.status == ChallengeStatus.ACTIVE.value)
+        .where(or_(Challenge.last_reset_date.is_(None), Challenge.last_reset_date < today_start))
+        .values(daily_start_balance=Challenge.current_balance, last_reset_date=now)
+        .execution_options(synchronize_session=False, admin_metrics_neutral=True)
+    )
+    
+    rows = db.session.execute(
+        select(Challenge.id, Challenge.plan_type, Challenge.initial_balance, Challenge.current_balance,
+               Challenge.daily_start_balance, Challenge.max_daily_loss_pct,
+               Challenge.max_total_loss_pct, Challenge.profit_target_pct)
+        .where(Challenge.status == ChallengeStatus.ACTIVE.value)
+    ).all()
+    
+    open_trades = db.session.execute(
+        select(Trade.challenge_id, Trade.symbol, Trade.trade_type, Trade.quantity, Trade.entry_price)
+        .join(Challenge, Challenge.id == Trade.challenge_id)
+        .where(Challenge.status == ChallengeStatus.ACTIVE.value, Trade.is_closed == False)
+    ).all()
+    
+    prices = {symbol: _get_price(symbol) for symbol in {t.symbol for t in open_trades}}
+    unrealized = defaultdict(float)
+    open_positions = defaultdict(int)
+    for t in open_trades:
+        open_positions[t.challenge_id] += 1
+        price = prices.get(t.symbol)
+        if price is not None:
+            unrealized[t.challenge_id] += unrealized_pnl(t.trade_type, t.entry_price, t.quantity, price)
+    
+    activity = load_activity_metrics()
+    
+    states = []
+    equities = {}
+    for row in rows:
+        equity = row.current_balance + unrealized.get(row.id, 0.0)
+        equities[row.id] = (equity, row.current_balance)
+        record_equity(row.id, equity, row.current_balance)
+        states.append(ChallengeState(
+            id=row.id,
+            initial_balance=row.initial_balance,
+            daily_start_balance=row.daily_start_balance or row.initial_balance,
+            equity=equity,
+            max_daily_loss_pct=row.max_daily_loss_pct,
+            max_total_loss_pct=row.max_total_loss_pct,
+            profit_target_pct=row.profit_target_pct,
+            plan_type=row.plan_type,
+            open_positions=open_positions.get(row.id, 0),
+            **activity.get(row.id, {})
+        ))
+    
+    decisions = evaluate_in_pool(states, workers=workers)
+    
+    unit_of_work = StatusUnitOfWork(batch_size=batch_size)
+    for decision in decisions:
+        unit_of_work.record(decision, *equities[decision.challenge_id])
+    unit_of_work.commit(verbose=False)
+    
+    print(f"[KILLER] Sweep: {len(states)} challenges évalués, {len(decisions)} changements de statut")
+    return decisions
@@ -0,0 +1,391 @@
+import logging
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import select, delete, func, insert
+from app import db
+from app.models import User, Challenge, Trade, MonthlyProfit, MonthlyAssetProfit, Leaderboard, ChallengeStatus
+from app.services.trade_events import register_trade_close_listener
+from app.utils.upsert import upsert
+from app.utils.market_data import asset_class
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Tolérance de comparaison entre l'agrégat matérialisé et le recalcul complet
+VERIFY_TOLERANCE = 1e-6
+
+
+def month_key(moment: datetime) -> str:
+    """Clé de mois 'YYYY-MM' d'une date"""
+    return moment.strftime('%Y-%m')
+
+
+def month_bounds(month: str):
+    """Bornes [début, fin) d'un mois 'YYYY-MM'"""
+    year, mon = (int(part) for part in month.split('-'))
+    start = datetime(year, mon, 1)
+    end = datetime(year + 1, 1, 1) if mon == 12 else datetime(year, mon + 1, 1)
+    return start, end
+
+
+def challenge_capital(initial_balance: Optional[float]) -> float:
+    """Capital de référence du pourcentage de profit (1.0 si absent ou négatif, comme le classement historique)"""
+    capital = float(initial_balance or 1.0)
+    return capital if capital > 0 else 1.0
+
+
+def _increment(table):
+    # En cas de conflit : ajouter la ligne proposée à l'agrégat existant
+    return lambda excluded: {
+        'profit_value': table.c.profit_value + excluded.profit_value,
+        'profit_pct': table.c.profit_pct + excluded.profit_pct,
+        'trade_count': table.c.trade_count + 1,
+        'updated_at': excluded.updated_at
+    }
+
+
+def record_closed_trade(trade, challenge):
+    """
+    Ajouter le P&L d'un trade clôturé aux agrégats mensuels de son challenge (upserts incrémentaux) :
+    total du mois et ventilation par classe d'actif.
+    Le pourcentage est incrémenté séparément : le capital est constant, les deux sommes restent cohérentes.
+    """
+    capital = challenge_capital(challenge.initial_balance)
+    pnl = float(trade.profit_loss or 0.0)
+    row = {
+        'challenge_id': challenge.id,
+        'month': month_key(trade.timestamp or datetime.utcnow()),
+        'user_id': challenge.user_id,
+        'capital': capital,
+        'profit_value': pnl,
+        'profit_pct': pnl / capital * 100,
+        'trade_count': 1,
+        'updated_at': datetime.utcnow()
+    }
+    bind = db.session.get_bind()
+    table = MonthlyProfit.__table__
+    db.session.execute(upsert(bind, table, row, ['challenge_id', 'month'], _increment(table)))
+    table = MonthlyAssetProfit.__table__
+    db.session.execute(upsert(
+        bind, table, dict(row, asset_class=asset_class(trade.symbol)),
+        ['challenge_id', 'month', 'asset_class'], _increment(table)
+    ))
+
+
+register_trade_close_listener(record_closed_trade)
+
+
+def compute_monthly_profits(month: str) -> List[Dict]:
+    """
+    Recalcul complet des agrégats d'un mois à partir des trades clôturés (source de vérité)
+    """
+    start, end = month_bounds(month)
+    rows = db.session.execute(
+        select(
+            Trade.challenge_id,
+            Challenge.user_id,
+            Challenge.initial_balance,
+            func.sum(Trade.profit_loss),
+            func.count(Trade.id)
+        )
+        .join(Challenge, Challenge.id == Trade.challenge_id)
+        .where(Trade.is_closed == True, Trade.timestamp >= start, Trade.timestamp < end)
+        .group_by(Trade.challenge_id, Challenge.user_id, Challenge.initial_balance)
+    ).all()
+
+    now = datetime.utcnow()
+    profits = []
+    for challenge_id, user_id, initial_balance, total, count in rows:
+        capital = challenge_capital(initial_balance)
+        profit_value = float(total or 0.0)
+        profits.append({
+            'challenge_id': challenge_id,
+            'month': month,
+            'user_id': user_id,
+            'capital': capital,
+            'profit_value': profit_value,
+            'profit_pct': profit_value / capital * 100,
+            'trade_count': count,
+            'updated_at': now
+        })
+    return profits
+
+
+def compute_monthly_asset_profits(month: str) -> List[Dict]:
+    """
+    Recalcul complet de la ventilation par classe d'actif d'un mois
+    (agrégat SQL par symbole, la classe d'actif se déduit du symbole)
+    """
+    start, end = month_bounds(month)
+    rows = db.session.execute(
+        select(
+            Trade.challenge_id,
+            Trade.symbol,
+            Challenge.user_id,
+            Challenge.initial_balance,
+            func.sum(Trade.profit_loss),
+            func.count(Trade.id)
+        )
+        .join(Challenge, Challenge.id == Trade.challenge_id)
+        .where(Trade.is_closed == True, Trade.timestamp >= start, Trade.timestamp < end)
+        .group_by(Trade.challenge_id, Trade.symbol, Challenge.user_id, Challenge.initial_balance)
+    ).all()
+
+    now = datetime.utcnow()
+    profits: Dict[tuple, Dict] = {}
+    for challenge_id, symbol, user_id, initial_balance, total, count in rows:
+        key = (challenge_id, asset_class(symbol))
+        capital = challenge_capital(initial_balance)
+        profit = profits.setdefault(key, {
+            'challenge_id': challenge_id,
+            'month': month,
+            'asset_class': key[1],
+            'user_id': user_id,
+            'capital': capital,
+            'profit_value': 0.0,
+            'profit_pct': 0.0,
+            'trade_count': 0,
+            'updated_at': now
+        })
+        profit['profit_value'] += float(total or 0.0)
+        profit['trade_count'] += count
+    for profit in profits.values():
+        profit['profit_pct'] = profit['profit_value'] / profit['capital'] * 100
+    return list(profits.values())
+
+
+def rebuild_monthly_profits(month: str) -> int:
+    """
+    Reconstruire les agrégats d'un mois (backfill ou correction d'une dérive)
+
+    Returns:
+        int: Nombre d'agrégats écrits
+    """
+    profits = compute_monthly_profits(month)
+    asset_profits = compute_monthly_asset_profits(month)
+    try:
+        db.session.execute(delete(MonthlyProfit).where(MonthlyProfit.month == month))
+        db.session.execute(delete(MonthlyAssetProfit).where(MonthlyAssetProfit.month == month))
+        if profits:
+            db.session.execute(insert(MonthlyProfit), profits)
+        if asset_profits:
+            db.session.execute(insert(MonthlyAssetProfit), asset_profits)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(profits)
+
+
+def traded_months() -> List[str]:
+    """Mois couverts par les trades clôturés, du plus ancien au plus récent"""
+    first, last = db.session.execute(
+        select(func.min(Trade.timestamp), func.max(Trade.timestamp)).where(Trade.is_closed == True)
+    ).one()
+    if not first:
+        return []
+    months, year, mon = [], first.year, first.month
+    while (year, mon) <= (last.year, last.month):
+        months.append(f'{year:04d}-{mon:02d}')
+        year, mon = (year + 1, 1) if mon == 12 else (year, mon + 1)
+    return months
+
+
+def backfill_monthly_profits() -> int:
+    """
+    Alimenter les agrégats mensuels d'une base déjà en service : tant que monthly_profits est vide,
+    tous les mois tradés sont reconstruits depuis les trades clôturés. Sans effet ensuite
+    (les clôtures tiennent les agrégats à jour ; `flask leaderboard rebuild` corrige une dérive).
+
+    Returns:
+        int: Nombre de mois reconstruits
+    """
+    if db.session.execute(select(MonthlyProfit.challenge_id).limit(1)).first() is not None:
+        return 0
+    months = traded_months()
+    for month in months:
+        rebuild_monthly_profits(month)
+    return len(months)
+
+
+def init_leaderboard(app):
+    """
+    Backfill des agrégats au démarrage (premier déploiement sur une base existante) ;
+    un échec est journalisé sans empêcher le démarrage
+    """
+    with app.app_context():
+        try:
+            months = backfill_monthly_profits()
+            if months:
+                logger.info(f"Backfilled monthly profits for {months} months")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error backfilling monthly profits: {str(e)}")
+
+
+def _compare(expected: Dict, stored: Dict) -> List[str]:
+    mismatches = []
+    for key in expected.keys() | stored.keys():
+        want, got = expected.get(key), stored.get(key)
+        label = ' '.join(key) if isinstance(key, tuple) else key
+        if want is None:
+            if got.trade_count:
+                mismatches.append(f"{label}: agrégat sans trade clôturé ({got.trade_count} trades)")
+        elif got is None:
+            mismatches.append(f"{label}: agrégat manquant ({want['trade_count']} trades)")
+        elif (got.trade_count != want['trade_count']
+              or abs(got.profit_value - want['profit_value']) > VERIFY_TOLERANCE
+              or abs(got.profit_pct - want['profit_pct']) > VERIFY_TOLERANCE):
+            mismatches.append(
+                f"{label}: {got.profit_value} ({got.trade_count} trades) "
+                f"au lieu de {want['profit_value']} ({want['trade_count']} trades)"
+            )
+    return mismatches
+
+
+def verify_monthly_profits(month: str) -> List[str]:
+    """
+    Comparer les agrégats matérialisés (total et par classe d'actif) au recalcul complet d'un mois
+
+    Returns:
+        list: Écarts détectés (vide si équivalents)
+    """
+    mismatches = _compare(
+        {row['challenge_id']: row for row in compute_monthly_profits(month)},
+        {row.challenge_id: row for row in MonthlyProfit.query.filter(MonthlyProfit.month == month).all()}
+    )
+    mismatches += _compare(
+        {(row['challenge_id'], row['asset_class']): row for row in compute_monthly_asset_profits(month)},
+        {
+            (row.challenge_id, row.asset_class): row
+            for row in MonthlyAssetProfit.query.filter(MonthlyAssetProfit.month == month).all()
+        }
+    )
+    return sorted(mismatches)
+
+
+def get_top_traders(month: Optional[str] = None, limit: int = 10) -> List[Dict]:
+    """
+    Meilleurs traders d'un mois (mois courant par défaut), lus dans l'agrégat matérialisé
+    via l'index (month, profit_pct) ; seuls les challenges actifs sont classés.
+    """
+    month = month or month_key(datetime.utcnow())
+    rows = db.session.execute(
+        select(User.username, User.country, MonthlyProfit.profit_value, MonthlyProfit.profit_pct)
+        .join(Challenge, Challenge.id == MonthlyProfit.challenge_id)
+        .join(User, User.id == MonthlyProfit.user_id)
+        .where(MonthlyProfit.month == month, Challenge.status == ChallengeStatus.ACTIVE.value)
+        .order_by(MonthlyProfit.profit_pct.desc(), MonthlyProfit.challenge_id)
+        .limit(limit)
+    ).all()
+
+    return [
+        {
+            'username': username,
+            'country': country if country and country.strip() else "Inconnu",
+            'profit': round(profit_pct, 2),
+            'profit_val': round(profit_value, 2),
+            'payout': round(max(0, profit_value), 2),
+            'rank': rank
+        }
+        for rank, (username, country, profit_value, profit_pct) in enumerate(rows, start=1)
+    ]
+
+
+def previous_month(moment: Optional[datetime] = None) -> str:
+    """Mois précédant une date (mois courant par défaut)"""
+    moment = moment or datetime.utcnow()
+    return f'{moment.year - 1:04d}-12' if moment.month == 1 else f'{moment.year:04d}-{moment.month - 1:02d}'
+
+
+def close_month(month: Optional[str] = None, force: bool = False) -> int:
+    """
+    Figer le classement final d'un mois terminé dans la table leaderboards (un seul INSERT groupé).
+    Source : agrégats mensuels matérialisés, même ordre que /top ; tous les challenges ayant tradé
+    dans le mois sont classés, quel que soit leur statut actuel (réussis ou échoués depuis compris).
+    L'archive est servie comme immuable : un mois déjà clôturé n'est remplacé qu'avec force=True.
+
+    Returns:
+        int: Nombre d'entrées archivées
+
+    Raises:
+        ValueError: Mois non terminé, ou déjà clôturé sans force
+    """
+    month = month or previous_month()
+    if month_bounds(month)[1] > datetime.utcnow():
+        raise ValueError(f"Le mois {month} n'est pas terminé")
+    if not force and db.session.execute(
+        select(Leaderboard.id).where(Leaderboard.month == month).limit(1)
+    ).first() is not None:
+        raise ValueError(f"Le mois {month} est déjà clôturé (--force pour le remplacer)")
+
+    rows = db.session.execute(
+        select(
+            MonthlyProfit.challenge_id, MonthlyProfit.user_id, User.username, User.country,
+            MonthlyProfit.profit_value, MonthlyProfit.profit_pct
+        )
+        .join(User, User.id == MonthlyProfit.user_id)
+        .where(MonthlyProfit.month == month)
+        .order_by(MonthlyProfit.profit_pct.desc(), MonthlyProfit.challenge_id)
+    ).all()
+
+    now = datetime.utcnow()
+    entries = [
+        {
+            'id': str(uuid.uuid4()),
+            'user_id': user_id,
+            'username': username,
+            'challenge_id': challenge_id,
+            'country': country if country and country.strip() else "Inconnu",
+            'profit_percentage': round(profit_pct, 2),
+            'profit_value': round(profit_value, 2),
+            'rank': rank,
+            'month': month,
+            'created_at': now
+        }
+        for rank, (challenge_id, user_id, username, country, profit_value, profit_pct) in enumerate(rows, start=1)
+    ]
+    try:
+        db.session.execute(delete(Leaderboard).where(Leaderboard.month == month))
+        if entries:
+            db.session.execute(insert(Leaderboard), entries)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(entries)
+
+
+def get_archived_leaderboard(month: str, limit: int = 100) -> List[Dict]:
+    """
+    Classement figé d'un mois clôturé (lecture de l'archive uniquement, via l'index (month, rank))
+    """
+    rows = db.session.execute(
+        select(
+            Leaderboard.username, Leaderboard.country, Leaderboard.profit_percentage,
+            Leaderboard.profit_value, Leaderboard.rank
+        )
+        .where(Leaderboard.month == month)
+        .order_by(Leaderboard.rank)
+        .limit(limit)
+    ).all()
+    return [
+        {
+            'username': username,
+            'country': country or "Inconnu",
+            'profit': profit_pct,
+            'profit_val': profit_value,
+            'payout': round(max(0, profit_value or 0), 2),
+            'rank': rank
+        }
+        for username, country, profit_pct, profit_value, rank in rows
+    ]
+
+
+def archived_months() -> List[str]:
+    """Mois disponibles dans l'archive, du plus récent au plus ancien"""
+    return list(db.session.execute(
+        select(Leaderboard.month).distinct().order_by(Leaderboard.month.desc())
+    ).scalars())
@@ -0,0 +1,247 @@
+import threading
+import logging
+from datetime import datetime
+from typing import Dict, List
+from sqlalchemy import select, update, func
+from app import db
+from app.models import Challenge, ChallengeStatus, Trade, PendingOrder, OrderStatus, OrderType
+from app.services.killer_service import evaluate_killer_rules
+from app.services.unit_of_work import commit_unit_of_work
+from app.services.challenge_rules import get_rule_set
+from app.services.price_service import register_quote_listener, quote_refresher
+from app.services.trigger_service import TriggerBook, ABOVE, BELOW, protective_engine
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def order_direction(side: str, order_type: str) -> str:
+    """
+    Sens de déclenchement d'un ordre d'entrée :
+    - BUY LIMIT / SELL STOP : exécutable quand le prix descend au niveau (BELOW)
+    - SELL LIMIT / BUY STOP : exécutable quand le prix monte au niveau (ABOVE)
+    """
+    is_buy = side.upper() == 'BUY'
+    if order_type.upper() == OrderType.LIMIT.value:
+        return BELOW if is_buy else ABOVE
+    return ABOVE if is_buy else BELOW
+
+
+class OrderBook:
+    """
+    Carnet d'ordres en attente en mémoire : un TriggerBook par symbole, trié par prix
+    puis FIFO à prix égal. Reconstruit depuis la base au démarrage.
+    """
+    def __init__(self):
+        self._books: Dict[str, TriggerBook] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.app = None
+
+    def load(self):
+        """
+        Reconstruire le carnet depuis les ordres en attente (ordre d'arrivée conservé)
+        """
+        orders = PendingOrder.query.filter_by(status=OrderStatus.PENDING.value)\
+            .order_by(PendingOrder.created_at).all()
+        with self._lock:
+            self._books = {}
+        for order in orders:
+            self.add(order)
+        self.loaded = True
+        logger.info(f"Loaded {len(orders)} pending orders")
+
+    def add(self, order):
+        with self._lock:
+            book = self._books.setdefault(order.symbol.upper().strip(), TriggerBook())
+            book.add(order.id, order.price, order_direction(order.side, order.order_type))
+
+    def cancel(self, order):
+        with self._lock:
+            book = self._books.get(order.symbol.upper().strip())
+            return book.discard(order.id) if book else False
+
+    def size(self, symbol: str) -> int:
+        book = self._books.get(symbol.upper().strip())
+        return len(book) if book else 0
+
+    def symbols(self) -> List[str]:
+        """
+        Symboles ayant au moins un ordre en attente (cotations à surveiller)
+        """
+        with self._lock:
+            return [symbol for symbol, book in self._books.items() if len(book)]
+
+    def match(self, symbol: str, price: float) -> List[str]:
+        """
+        Retirer les ordres exécutables au prix donné
+        Returns:
+            list: IDs des ordres, par priorité prix puis FIFO
+        """
+        with self._lock:
+            book = self._books.get(symbol.upper().strip())
+            if not book:
+                return []
+            return [order_id for order_id, _level in book.pop_crossed(price)]
+
+
+# Carnet global
+order_book = OrderBook()
+
+
+def committed_positions(challenge_id: str) -> int:
+    """
+    Positions ouvertes et ordres en attente d'un challenge (limite de positions du plan)
+    """
+    open_trades = select(func.count(Trade.id))\
+        .where(Trade.challenge_id == challenge_id, Trade.is_closed == False).scalar_subquery()
+    pending_orders = select(func.count(PendingOrder.id))\
+        .where(PendingOrder.challenge_id == challenge_id,
+               PendingOrder.status == OrderStatus.PENDING.value).scalar_subquery()
+    return db.session.execute(select(open_trades + pending_orders)).scalar()
+
+
+def settle_order(order_id: str, status: str, **values) -> bool:
+    """
+    Faire sortir un ordre de l'attente par un UPDATE conditionnel (status = 'pending'), sans commit :
+    une exécution et une annulation concurrentes ne peuvent pas s'écraser, la seconde ne modifie rien
+
+    Args:
+        order_id (str): ID de l'ordre
+        status (str): Nouveau statut (filled / cancelled)
+        **values: Autres colonnes à écrire (filled_at, filled_price...)
+
+    Returns:
+        bool: True si l'ordre était encore en attente
+    """
+    result = db.session.execute(
+        update(PendingOrder)
+        .where(PendingOrder.id == order_id, PendingOrder.status == OrderStatus.PENDING.value)
+        .values(status=status, **values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def fill_orders(order_ids: List[str], price: float) -> List:
+    """
+    Exécuter les ordres marketables et évaluer les règles killer une fois par challenge concerné,
+    dans une seule transaction
+
+    Args:
+        order_ids (list): IDs des ordres retournés par le carnet
+        price (float): Prix d'exécution (cotation courante)
+
+    Returns:
+        list: Trades créés
+    """
+    orders = PendingOrder.query.filter(
+        PendingOrder.id.in_(order_ids),
+        PendingOrder.status == OrderStatus.PENDING.value
+    ).all()
+    if not orders:
+        return []
+
+    # Respecter la priorité du carnet
+    position = {order_id: i for i, order_id in enumerate(order_ids)}
+    orders.sort(key=lambda o: position[o.id])
+
+    challenges = {c.id: c for c in Challenge.query.filter(
+        Challenge.id.in_({o.challenge_id for o in orders})
+    ).all()}
+
+    now = datetime.utcnow()
+    created = []
+    try:
+        for order in orders:
+            challenge = challenges.get(order.challenge_id)
+            if not challenge or challenge.status != ChallengeStatus.ACTIVE.value:
+                settle_order(order.id, OrderStatus.CANCELLED.value)
+                continue
+
+            # Limites du plan revérifiées à l'exécution (l'ordre lui-même compte encore comme en attente)
+            order_error = get_rule_set(challenge.plan_type).check_order(
+                order.symbol, order.quantity, committed_positions(order.challenge_id) - 1
+            )
+            if order_error:
+                if settle_order(order.id, OrderStatus.CANCELLED.value):
+                    logger.info(f"Cancelled pending order {order.id} at fill time: {order_error}")
+                continue
+
+            # Ordre annulé entre le chargement et l'exécution : aucun trade
+            if not settle_order(order.id, OrderStatus.FILLED.value, filled_at=now, filled_price=price):
+                continue
+
+            trade = Trade(
+                challenge_id=order.challenge_id,
+                user_id=order.user_id,
+                symbol=order.symbol,
+                trade_type=order.side,
+                quantity=order.quantity,
+                entry_price=price,
+                stop_loss=order.stop_loss,
+                take_profit=order.take_profit
+            )
+            db.session.add(trade)
+            db.session.flush()
+
+            order.trade_id = trade.id
+            created.append(trade)
+
+        # Règles killer une fois par challenge, exécutions et statuts dans le même commit
+        for challenge_id in {t.challenge_id for t in created}:
+            evaluate_killer_rules(challenge_id)
+        commit_unit_of_work()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error filling pending orders: {str(e)}")
+        # Les ordres restent en attente : les remettre dans le carnet
+        for order in PendingOrder.query.filter(PendingOrder.id.in_(order_ids),
+                                               PendingOrder.status == OrderStatus.PENDING.value).all():
+            order_book.add(order)
+        return []
+
+    for trade in created:
+        if trade.stop_loss is not None or trade.take_profit is not None:
+            protective_engine.register(trade)
+
+    logger.info(f"Filled {len(created)} pending orders at {price}")
+    return created
+
+
+def _load_pending_orders():
+    with order_book.app.app_context():
+        try:
+            order_book.load()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error loading pending orders: {str(e)}")
+
+
+def _tracked_symbols():
+    # Chargement retenté à chaque rafraîchissement tant qu'il n'a pas réussi
+    if not order_book.loaded:
+        _load_pending_orders()
+    return order_book.symbols()
+
+
+def _on_quote(symbol, price_data):
+    price = price_data['price']
+    order_ids = order_book.match(symbol, price)
+    if order_ids:
+        with order_book.app.app_context():
+            fill_orders(order_ids, price)
+
+
+def init_order_book(app):
+    """
+    Charger le carnet d'ordres et brancher le matcher sur le rafraîchissement des cotations
+    en tâche de fond (même thread que les stop loss / take profit) : les exécutions ne
+    s'exécutent jamais dans une requête. Un échec du chargement au démarrage est retenté
+    à chaque rafraîchissement.
+    """
+    order_book.app = app
+    _load_pending_orders()
+    register_quote_listener(_on_quote)
+    quote_refresher.register_symbol_source(_tracked_symbols)
@@ -71,6 +71,31 @@ class PriceCache:
 # Global price cache instance
 price_cache = PriceCache(default_ttl=30)  # 30 seconds TTL
 
+# Callbacks notified on every fresh quote: fn(symbol, price_data)
+_quote_listeners = []
+
+
+def register_quote_listener(listener):
+    """
+    Register a callback invoked with (symbol, price_data) each time the background refresher
+    fetches a fresh quote (never from a request thread)
+    """
+    if listener not in _quote_listeners:
+        _quote_listeners.append(listener)
+
+
+def _notify_quote_listeners(symbol: str, price_data: Dict):
+    """
+    Notify registered listeners of a fresh quote; listener errors never break price fetching
+    """
+    if not price_data or price_data.get('price') is None:
+        return
+    for listener in _quote_listeners:
+        try:
+            listener(symbol, price_data)
+        except Exception as e:
+            logger.error(f"Error in quote listener for {symbol}: {str(e)}")
+
 
 def get_live_prices(symbols: List[str] = None) -> Dict[str, Dict]:
     """
@@ -181,7 +206,8 @@ def refresh_cache_for_symbols(symbols: List[str]):
             if price_data:
                 # Update cache
                 price_cache.set(cache_key, price_data)
-                logger.info(f"Refreshed cache for {symbol_upper}")
+                logger.debug(f"Refreshed cache for {symbol_upper}")
+                _notify_quote_listeners(symbol_upper, price_data)
             else:
                 logger.warning(f"Could not refresh data for {symbol_upper}")
                 
@@ -189,6 +215,66 @@ def refresh_cache_for_symbols(symbols: List[str]):
             logger.error(f"Error refreshing cache for {symbol_upper}: {str(e)}")
 
 
+class QuoteRefresher:
+    """
+    Background thread refreshing the quotes of tracked symbols (open stop loss / take profit levels,
+    pending orders) and notifying quote listeners from that thread, so that triggers fire on their
+    own schedule and never inside someone else's request
+    """
+    def __init__(self):
+        self._sources = []
+        self._interval = 0
+        self._thread = None
+
+    def register_symbol_source(self, source):
+        """
+        Register a callable returning the symbols to refresh on each tick
+        """
+        if source not in self._sources:
+            self._sources.append(source)
+
+    def tracked_symbols(self) -> List[str]:
+        symbols = set()
+        for source in self._sources:
+            try:
+                symbols.update(symbol.upper().strip() for symbol in source())
+            except Exception as e:
+                logger.error(f"Error in quote symbol source: {str(e)}")
+        return sorted(symbols)
+
+    def refresh(self) -> int:
+        """
+        Refresh every tracked symbol once and notify listeners
+        Returns the number of symbols refreshed
+        """
+        symbols = self.tracked_symbols()
+        if symbols:
+            refresh_cache_for_symbols(symbols)
+        return len(symbols)
+
+    def init_app(self, app):
+        """
+        Start the refresher thread (QUOTE_REFRESH_INTERVAL seconds, 0 disables it)
+        """
+        self._interval = app.config.get('QUOTE_REFRESH_INTERVAL', 10)
+        if self._interval and self._thread is None:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+            logger.info(f"Started quote refresher every {self._interval}s")
+
+    def _worker(self):
+        while True:
+            try:
+                time.sleep(self._interval)
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Error in quote refresher: {str(e)}")
+
+
+# Global quote refresher (started by create_app)
+quote_refresher = QuoteRefresher()
+
+
 def cleanup_expired_cache():
     """
     Clean up expired cache entries
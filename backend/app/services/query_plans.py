@@ -0,0 +1,122 @@
+import json
+from datetime import datetime
+from typing import Dict, List
+from sqlalchemy import select, func, text, or_
+from app import db
+from app.models import (
+    User, Challenge, Trade, Payment, CommunityPost, ChallengeStatus, MonthlyProfit, MonthlyAssetProfit, Leaderboard
+)
+from app.services.user_search import prefix_condition
+from app.services.export_service import trade_export_query, payment_export_query
+
+# Valeurs fictives : seul le plan compte, pas le résultat
+_SAMPLE_ID = '00000000-0000-0000-0000-000000000000'
+_SAMPLE_DATE = datetime(2000, 1, 1)
+
+
+# Requêtes pour lesquelles un parcours d'index ordonné est attendu (ORDER BY ... LIMIT sans filtre)
+ORDERED_INDEX_SCANS = {'community_feed', 'admin_challenge_page', 'trade_export', 'payment_export'}
+
+
+def hot_queries() -> Dict[str, object]:
+    """
+    Requêtes critiques de l'application (même forme que dans les routes et services)
+    """
+    return {
+        'open_trades_of_challenge': select(Trade.id)
+            .where(Trade.challenge_id == _SAMPLE_ID, Trade.is_closed == False),
+        'challenge_trade_history': select(Trade.id)
+            .where(Trade.challenge_id == _SAMPLE_ID)
+            .order_by(Trade.timestamp.desc().nulls_last(), Trade.id.desc()).limit(100),
+        'user_trade_history': select(Trade.id)
+            .where(Trade.user_id == _SAMPLE_ID)
+            .order_by(Trade.timestamp.desc().nulls_last(), Trade.id.desc()).limit(100),
+        'monthly_ranking_profits': select(MonthlyProfit.challenge_id, MonthlyProfit.profit_pct)
+            .join(Challenge, Challenge.id == MonthlyProfit.challenge_id)
+            .join(User, User.id == MonthlyProfit.user_id)
+            .where(MonthlyProfit.month == '2000-01', Challenge.status == ChallengeStatus.ACTIVE.value),
+        'monthly_ranking_asset_profits': select(MonthlyAssetProfit.challenge_id, MonthlyAssetProfit.profit_pct)
+            .join(Challenge, Challenge.id == MonthlyAssetProfit.challenge_id)
+            .join(User, User.id == MonthlyAssetProfit.user_id)
+            .where(MonthlyAssetProfit.month == '2000-01', Challenge.status == ChallengeStatus.ACTIVE.value),
+        'monthly_leaderboard_top': select(MonthlyProfit.challenge_id)
+            .where(MonthlyProfit.month == '2000-01')
+            .order_by(MonthlyProfit.profit_pct.desc()).limit(10),
+        'archived_leaderboard': select(Leaderboard.username)
+            .where(Leaderboard.month == '2000-01').order_by(Leaderboard.rank).limit(100),
+        'user_payments': select(Payment.id)
+            .where(Payment.user_id == _SAMPLE_ID).order_by(Payment.timestamp.desc()),
+        'payments_by_status': select(func.count(Payment.id))
+            .where(Payment.status == 'completed'),
+        'active_challenges': select(Challenge.id)
+            .where(Challenge.status == ChallengeStatus.ACTIVE.value),
+        'admin_challenge_page': select(Challenge.id)
+            .order_by(Challenge.created_at.desc().nulls_last(), Challenge.id.desc()).limit(100),
+        'admin_challenge_page_by_status': select(Challenge.id)
+            .where(Challenge.status == ChallengeStatus.ACTIVE.value)
+            .order_by(Challenge.created_at.desc().nulls_last(), Challenge.id.desc()).limit(100),
+        'admin_user_prefix_search': select(User.id)
+            .where(or_(prefix_condition(User.username, 'abc'), prefix_condition(User.email, 'abc'))),
+        'trade_export': trade_export_query(),
+        'trade_export_by_date': trade_export_query(date_from=_SAMPLE_DATE),
+        'payment_export': payment_export_query(),
+        'community_feed': select(CommunityPost.id)
+            .order_by(CommunityPost.created_at.desc()).limit(20),
+    }
+
+
+def _sqlite_full_scans(sql: str, ordered_index_scan: bool) -> List[str]:
+    # "SEARCH t USING INDEX ..." = recherche bornée ; "SCAN t" = parcours complet de la table,
+    # "SCAN t USING INDEX ..." = parcours complet de l'index (accepté seulement si borné par LIMIT)
+    rows = db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return [row[-1] for row in rows
+            if row[-1].startswith('SCAN ') and not (ordered_index_scan and 'USING' in row[-1])]
+
+
+def _postgresql_plan_scans(plan, ordered_index_scan: bool) -> List[str]:
+    # Parcours complets d'un plan EXPLAIN (FORMAT JSON) : Seq Scan, ou index parcouru en entier
+    # sans condition de recherche (accepté seulement si borné par LIMIT)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    scans, nodes = [], [plan[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        node_type = node.get('Node Type')
+        if node_type == 'Seq Scan':
+            scans.append(f"Seq Scan on {node.get('Relation Name')}")
+        elif node_type in ('Index Scan', 'Index Only Scan') and 'Index Cond' not in node and not ordered_index_scan:
+            scans.append(f"{node_type} on {node.get('Relation Name')} (sans Index Cond)")
+        nodes.extend(node.get('Plans', []))
+    return scans
+
+
+def _postgresql_full_scans(sql: str, ordered_index_scan: bool) -> List[str]:
+    # Sans seq scan autorisé, un Seq Scan restant signifie qu'aucun index n'est utilisable
+    db.session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = db.session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    return _postgresql_plan_scans(plan, ordered_index_scan)
+
+
+def check_query_plans() -> Dict[str, List[str]]:
+    """
+    Capturer le plan d'exécution de chaque requête critique (SQLite ou PostgreSQL)
+
+    Returns:
+        dict: nom de la requête -> parcours complets de table détectés (vide si indexée)
+    """
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        explain = _sqlite_full_scans
+    elif dialect == 'postgresql':
+        explain = _postgresql_full_scans
+    else:
+        raise ValueError(f"Dialecte non supporté pour l'analyse des plans: {dialect}")
+
+    results = {}
+    try:
+        for name, stmt in hot_queries().items():
+            sql = str(stmt.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+            results[name] = explain(sql, name in ORDERED_INDEX_SCANS)
+    finally:
+        db.session.rollback()
+    return results
@@ -0,0 +1,418 @@
+import bisect
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, event
+from sqlalchemy.orm import Session
+from app import db
+from app.models import User, Challenge, MonthlyProfit, MonthlyAssetProfit, ChallengeStatus
+from app.services.trade_events import register_trade_close_listener
+from app.services.leaderboard_service import month_key, challenge_capital
+from app.utils.market_data import asset_class
+
+# Durée de vie d'un index avant reconstruction depuis les agrégats (changements de statut hors clôture,
+# clôtures traitées par un autre processus)
+RANK_INDEX_TTL = 300
+
+# Dimensions des classements segmentés
+SEGMENT_DIMENSIONS = ('country', 'plan_type', 'asset_class')
+
+
+class RankIndex:
+    """
+    Classement d'un mois en mémoire : tableau trié de clés (-profit_pct, challenge_id)
+    - rang, percentile et voisins par recherche dichotomique en O(log n)
+    - mise à jour d'une entrée par retrait puis insertion dans le tableau trié
+    L'ordre est celui du classement (profit décroissant, challenge_id pour départager).
+    """
+    def __init__(self, month: str):
+        self.month = month
+        self._keys: List[Tuple[float, str]] = []
+        self._entries: Dict[str, dict] = {}
+        self._by_user: Dict[str, set] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, challenge_id):
+        return challenge_id in self._entries
+
+    def load(self, entries):
+        """
+        Charger toutes les entrées d'un coup (un seul tri)
+        Args:
+            entries: itérable de dict (challenge_id, user_id, username, country, profit_pct, profit_value)
+        """
+        with self._lock:
+            self._entries = {entry['challenge_id']: entry for entry in entries}
+            self._keys = sorted((-entry['profit_pct'], challenge_id) for challenge_id, entry in self._entries.items())
+            self._by_user = {}
+            for challenge_id, entry in self._entries.items():
+                self._by_user.setdefault(entry['user_id'], set()).add(challenge_id)
+
+    def upsert(self, entry: dict):
+        """
+        Ajouter ou repositionner une entrée
+        """
+        with self._lock:
+            self._discard(entry['challenge_id'])
+            self._entries[entry['challenge_id']] = entry
+            self._by_user.setdefault(entry['user_id'], set()).add(entry['challenge_id'])
+            bisect.insort(self._keys, (-entry['profit_pct'], entry['challenge_id']))
+
+    def discard(self, challenge_id: str):
+        """
+        Retirer une entrée (challenge non actif)
+        """
+        with self._lock:
+            self._discard(challenge_id)
+
+    def get(self, challenge_id: str) -> Optional[dict]:
+        return self._entries.get(challenge_id)
+
+    def _discard(self, challenge_id):
+        entry = self._entries.pop(challenge_id, None)
+        if entry is None:
+            return
+        position = bisect.bisect_left(self._keys, (-entry['profit_pct'], challenge_id))
+        del self._keys[position]
+        challenges = self._by_user.get(entry['user_id'])
+        if challenges:
+            challenges.discard(challenge_id)
+            if not challenges:
+                del self._by_user[entry['user_id']]
+
+    def _position(self, challenge_id) -> Optional[int]:
+        entry = self._entries.get(challenge_id)
+        if entry is None:
+            return None
+        return bisect.bisect_left(self._keys, (-entry['profit_pct'], challenge_id))
+
+    def best_challenge(self, user_id: str) -> Optional[str]:
+        """
+        Challenge le mieux classé d'un utilisateur (un utilisateur peut en avoir plusieurs)
+        """
+        with self._lock:
+            challenges = self._by_user.get(user_id)
+            if not challenges:
+                return None
+            return min(challenges, key=lambda challenge_id: (-self._entries[challenge_id]['profit_pct'], challenge_id))
+
+    def rank(self, challenge_id: str) -> Optional[Dict]:
+        """
+        Rang (1 = premier) et percentile (part des classés au même niveau ou en dessous)
+        """
+        with self._lock:
+            position = self._position(challenge_id)
+            if position is None:
+                return None
+            total = len(self._keys)
+            return {
+                'rank': position + 1,
+                'total': total,
+                'percentile': round((total - position) / total * 100, 2)
+            }
+
+    def top(self, limit: int = 10) -> List[Dict]:
+        """
+        Premières entrées du classement en O(k)
+        """
+        with self._lock:
+            return [
+                dict(self._entries[challenge_id], rank=rank)
+                for rank, (_, challenge_id) in enumerate(self._keys[:limit], start=1)
+            ]
+
+    def neighbors(self, challenge_id: str, radius: int = 2) -> List[Dict]:
+        """
+        Entrées classées autour d'un challenge (radius au-dessus et en dessous)
+        """
+        with self._lock:
+            position = self._position(challenge_id)
+            if position is None:
+                return []
+            start = max(0, position - radius)
+            window = self._keys[start:position + radius + 1]
+            return [
+                dict(self._entries[key_challenge_id], rank=start + offset + 1)
+                for offset, (_, key_challenge_id) in enumerate(window)
+            ]
+
+
+class MonthRanking:
+    """
+    Classements d'un mois : classement global et un RankIndex par segment,
+    indexés par la clé (dimension, valeur) (ex: ('country', 'MA'), ('asset_class', 'crypto')).
+    Tous sont construits depuis les mêmes agrégats matérialisés, sans jointure sur les trades.
+    """
+    def __init__(self, month: str):
+        self.month = month
+        # Début de la construction : les clôtures validées après sont déjà dans les agrégats lus
+        self.built_at = time.monotonic()
+        self.overall = RankIndex(month)
+        self.segments: Dict[Tuple[str, str], RankIndex] = {}
+        self._lock = threading.Lock()
+
+    def segment(self, dimension: str, value: str, create: bool = False) -> Optional[RankIndex]:
+        with self._lock:
+            index = self.segments.get((dimension, value))
+            if index is None and create:
+                index = self.segments[(dimension, value)] = RankIndex(self.month)
+            return index
+
+    def segment_values(self) -> Dict[str, List[Dict]]:
+        """
+        Valeurs disponibles par dimension avec leur nombre de classés
+        """
+        values = {dimension: [] for dimension in SEGMENT_DIMENSIONS}
+        with self._lock:
+            for (dimension, value), index in sorted(self.segments.items()):
+                if len(index):
+                    values[dimension].append({'value': value, 'count': len(index)})
+        return values
+
+    def load(self, entries, asset_entries):
+        """
+        Charger le classement global, les segments pays/plan et les segments par classe d'actif
+        """
+        entries = list(entries)
+        self.overall.load(entries)
+        grouped: Dict[Tuple[str, str], List[dict]] = {}
+        for entry in entries:
+            grouped.setdefault(('country', entry['country']), []).append(entry)
+            grouped.setdefault(('plan_type', entry['plan_type']), []).append(entry)
+        for entry in asset_entries:
+            grouped.setdefault(('asset_class', entry['asset_class']), []).append(entry)
+        for key, segment_entries in grouped.items():
+            self.segment(*key, create=True).load(segment_entries)
+
+    def discard(self, challenge_id: str):
+        """
+        Retirer un challenge de tous les classements du mois
+        """
+        self.overall.discard(challenge_id)
+        with self._lock:
+            segments = list(self.segments.values())
+        for index in segments:
+            index.discard(challenge_id)
+
+
+_indexes: Dict[str, Tuple[float, MonthRanking]] = {}
+_indexes_lock = threading.Lock()
+
+
+def _entry(challenge_id, user_id, username, country, plan_type, profit_value, profit_pct, **extra) -> dict:
+    return dict({
+        'challenge_id': challenge_id,
+        'user_id': user_id,
+        'username': username,
+        'country': country if country and country.strip() else "Inconnu",
+        'plan_type': plan_type,
+        'profit_value': profit_value,
+        'profit_pct': profit_pct
+    }, **extra)
+
+
+def build_month_ranking(month: str) -> MonthRanking:
+    """
+    Construire les classements d'un mois depuis les agrégats matérialisés (challenges actifs uniquement) :
+    une requête pour le global et les segments pays/plan, une pour les classes d'actif
+    """
+    ranking = MonthRanking(month)
+    active = Challenge.status == ChallengeStatus.ACTIVE.value
+    rows = db.session.execute(
+        select(
+            MonthlyProfit.challenge_id, MonthlyProfit.user_id, User.username, User.country,
+            Challenge.plan_type, MonthlyProfit.profit_value, MonthlyProfit.profit_pct
+        )
+        .join(Challenge, Challenge.id == MonthlyProfit.challenge_id)
+        .join(User, User.id == MonthlyProfit.user_id)
+        .where(MonthlyProfit.month == month, active)
+    ).all()
+    asset_rows = db.session.execute(
+        select(
+            MonthlyAssetProfit.challenge_id, MonthlyAssetProfit.user_id, User.username, User.country,
+            Challenge.plan_type, MonthlyAssetProfit.profit_value, MonthlyAssetProfit.profit_pct,
+            MonthlyAssetProfit.asset_class
+        )
+        .join(Challenge, Challenge.id == MonthlyAssetProfit.challenge_id)
+        .join(User, User.id == MonthlyAssetProfit.user_id)
+        .where(MonthlyAssetProfit.month == month, active)
+    ).all()
+
+    ranking.load(
+        (_entry(*row) for row in rows),
+        (_entry(*row[:-1], asset_class=row[-1]) for row in asset_rows)
+    )
+    return ranking
+
+
+def get_month_ranking(month: Optional[str] = None) -> MonthRanking:
+    """
+    Classements du mois (mois courant par défaut), reconstruits à expiration du TTL
+    """
+    month = month or month_key(datetime.utcnow())
+    now = time.monotonic()
+    with _indexes_lock:
+        cached = _indexes.get(month)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    ranking = build_month_ranking(month)
+    with _indexes_lock:
+        # Les index expirés (mois consultés ponctuellement) ne restent pas en mémoire
+        for expired in [key for key, (expires_at, _) in _indexes.items() if expires_at <= now]:
+            del _indexes[expired]
+        _indexes[month] = (now + RANK_INDEX_TTL, ranking)
+    return ranking
+
+
+def invalidate_rankings():
+    """Oublier les classements chargés (reconstruits à la lecture suivante)"""
+    with _indexes_lock:
+        _indexes.clear()
+
+
+def get_rank_index(month: Optional[str] = None) -> RankIndex:
+    """
+    Classement global du mois (mois courant par défaut)
+    """
+    return get_month_ranking(month).overall
+
+
+def get_segment_top(dimension: str, value: str, month: Optional[str] = None, limit: int = 10) -> List[Dict]:
+    """
+    Meilleurs traders d'un segment (même forme que /top), servis en O(k)
+
+    Raises:
+        ValueError: Dimension inconnue
+    """
+    if dimension not in SEGMENT_DIMENSIONS:
+        raise ValueError(f"Segment inconnu: {dimension}")
+    index = get_month_ranking(month).segment(dimension, value)
+    if index is None:
+        return []
+    return [
+        {
+            'username': entry['username'],
+            'country': entry['country'],
+            'profit': round(entry['profit_pct'], 2),
+            'profit_val': round(entry['profit_value'], 2),
+            'payout': round(max(0, entry['profit_value']), 2),
+            'rank': entry['rank']
+        }
+        for entry in index.top(limit)
+    ]
+
+
+def get_user_position(user_id: str, month: Optional[str] = None, radius: int = 2) -> Optional[Dict]:
+    """
+    Rang, percentile et voisins du meilleur challenge d'un utilisateur sur un mois
+
+    Returns:
+        dict or None: None si l'utilisateur n'est pas classé
+    """
+    index = get_rank_index(month)
+    challenge_id = index.best_challenge(user_id)
+    position = index.rank(challenge_id) if challenge_id else None
+    if position is None:
+        return None
+    entry = index.get(challenge_id)
+    position.update({
+        'month': index.month,
+        'challenge_id': challenge_id,
+        'profit': round(entry['profit_pct'], 2),
+        'profit_val': round(entry['profit_value'], 2),
+        'neighbors': [
+            {
+                'rank': neighbor['rank'],
+                'username': neighbor['username'],
+                'country': neighbor['country'],
+                'profit': round(neighbor['profit_pct'], 2),
+                'is_me': neighbor['challenge_id'] == challenge_id
+            }
+            for neighbor in index.neighbors(challenge_id, radius)
+        ]
+    })
+    return position
+
+
+def _add_pnl(index: RankIndex, base: dict, pnl: float, capital: float):
+    current = index.get(base['challenge_id']) or dict(base, profit_value=0.0, profit_pct=0.0)
+    index.upsert(dict(
+        current,
+        profit_value=current['profit_value'] + pnl,
+        profit_pct=current['profit_pct'] + pnl / capital * 100
+    ))
+
+
+def apply_closed_trade(trade, challenge):
+    """
+    Mettre en attente sur la session la répercussion d'une clôture de trade sur les classements
+    du mois chargés ; appliquée au commit (global, pays, plan et classe d'actif du symbole,
+    O(log n) + insertion chacun), abandonnée si la clôture est annulée
+    """
+    month = month_key(trade.timestamp or datetime.utcnow())
+    with _indexes_lock:
+        cached = _indexes.get(month)
+    if not cached:
+        return
+
+    base = cached[1].overall.get(challenge.id)
+    if base is None:
+        user = challenge.user
+        base = _entry(challenge.id, challenge.user_id, user.username, user.country, challenge.plan_type, 0.0, 0.0)
+    db.session.info.setdefault('closed_trade_ranks', []).append((
+        month,
+        base,
+        challenge.status == ChallengeStatus.ACTIVE.value,
+        float(trade.profit_loss or 0.0),
+        challenge_capital(challenge.initial_balance),
+        asset_class(trade.symbol)
+    ))
+
+
+def _apply_rank_update(month: str, base: dict, active: bool, pnl: float, capital: float, symbol_class: str,
+                       committed_at: float):
+    with _indexes_lock:
+        cached = _indexes.get(month)
+    # Classement reconstruit depuis le commit : la clôture y figure déjà
+    if not cached or cached[1].built_at >= committed_at:
+        return
+    ranking = cached[1]
+
+    if not active:
+        ranking.discard(base['challenge_id'])
+        return
+
+    _add_pnl(ranking.overall, base, pnl, capital)
+    _add_pnl(ranking.segment('country', base['country'], create=True), base, pnl, capital)
+    _add_pnl(ranking.segment('plan_type', base['plan_type'], create=True), base, pnl, capital)
+    _add_pnl(
+        ranking.segment('asset_class', symbol_class, create=True),
+        dict(base, asset_class=symbol_class), pnl, capital
+    )
+
+
+register_trade_close_listener(apply_closed_trade)
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_on_commit(session):
+    # Libération d'un savepoint : attendre le commit de la transaction
+    if session.in_nested_transaction():
+        return
+    updates = session.info.pop('closed_trade_ranks', None)
+    if updates:
+        committed_at = time.monotonic()
+        for update in updates:
+            _apply_rank_update(*update, committed_at)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop('closed_trade_ranks', None)
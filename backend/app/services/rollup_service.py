@@ -0,0 +1,348 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, delete, insert, func, event, inspect, literal
+from sqlalchemy.orm import Session
+from app import db
+from app.models import User, Challenge, Trade, Payment, DailyRollup, ChallengeStatus, PaymentStatus
+from app.utils.upsert import upsert
+
+# Métriques journalières (dimension entre parenthèses)
+REVENUE = 'revenue'                        # paiements complétés (devise) : nombre, montant
+SIGNUPS = 'signups'                        # inscriptions
+CHALLENGES_STARTED = 'challenges_started'  # challenges créés
+CHALLENGES_PASSED = 'challenges_passed'    # challenges réussis (jour de fin : completed_at)
+CHALLENGES_FAILED = 'challenges_failed'    # challenges échoués (jour de fin : completed_at)
+TRADE_VOLUME = 'trade_volume'              # trades ouverts (symbole) : nombre, notionnel
+METRICS = (REVENUE, SIGNUPS, CHALLENGES_STARTED, CHALLENGES_PASSED, CHALLENGES_FAILED, TRADE_VOLUME)
+
+_OUTCOME_METRICS = {
+    ChallengeStatus.PASSED.value: CHALLENGES_PASSED,
+    ChallengeStatus.FAILED.value: CHALLENGES_FAILED,
+}
+
+# Clé d'un seau : (métrique, dimension, jour) -> [nombre, total]
+Deltas = Dict[Tuple[str, str, date], List[float]]
+
+
+def _day(value) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _contributions(model, get) -> List[Tuple[str, str, date, int, float]]:
+    """
+    Seaux auxquels contribue une ligne, d'après ses valeurs (get(colonne)) :
+    mêmes règles que le recalcul complet de backfill_rollups
+    """
+    if model is User:
+        return [(SIGNUPS, '', _day(get('created_at')), 1, 0.0)]
+    if model is Payment:
+        if get('status') != PaymentStatus.COMPLETED.value:
+            return []
+        return [(REVENUE, get('currency') or '', _day(get('timestamp')), 1, float(get('amount') or 0.0))]
+    if model is Challenge:
+        contributions = [(CHALLENGES_STARTED, '', _day(get('created_at')), 1, 0.0)]
+        outcome = _OUTCOME_METRICS.get(get('status'))
+        if outcome:
+            # Jour de fin : completed_at seul (posé à chaque transition terminale), jamais updated_at
+            # qui bouge encore après la fin (ajustements de solde)
+            contributions.append((outcome, '', _day(get('completed_at')), 1, 0.0))
+        return contributions
+    if model is Trade:
+        notional = float(get('quantity') or 0) * float(get('entry_price') or 0.0)
+        return [(TRADE_VOLUME, get('symbol') or '', _day(get('timestamp')), 1, notional)]
+    return []
+
+
+# Colonnes dont dépendent les contributions (une modification d'une autre colonne ne change rien)
+_TRACKED_COLUMNS = {
+    User: ('created_at',),
+    Payment: ('status', 'currency', 'timestamp', 'amount'),
+    Challenge: ('created_at', 'status', 'completed_at'),
+    Trade: ('symbol', 'timestamp', 'quantity', 'entry_price'),
+}
+
+
+
+def _add(deltas: Deltas, contributions, sign: int):
+    for metric, dimension, day, count, total in contributions:
+        if day is None:
+            continue
+        bucket = deltas[(metric, dimension, day)]
+        bucket[0] += sign * count
+        bucket[1] += sign * total
+
+
+def apply_rollup_deltas(connection, deltas: Deltas):
+    """
+    Ajouter des variations aux seaux journaliers (un upsert multi-lignes, dans la transaction courante)
+    """
+    now = datetime.utcnow()
+    rows = [
+        {'metric': metric, 'dimension': dimension, 'day': day, 'count': int(count), 'total': total, 'updated_at': now}
+        for (metric, dimension, day), (count, total) in deltas.items()
+        if count or total
+    ]
+    if not rows:
+        return
+    table = DailyRollup.__table__
+    connection.execute(upsert(
+        connection, table, rows, ['metric', 'dimension', 'day'],
+        lambda excluded: {
+            'count': table.c.count + excluded.count,
+            'total': table.c.total + excluded.total,
+            'updated_at': excluded.updated_at
+        }
+    ))
+
+
+def record_outcomes(status: str, count: int, moment: Optional[datetime] = None):
+    """
+    Compter des challenges terminés par un UPDATE groupé (invisible pour les événements de flush)
+    """
+    metric = _OUTCOME_METRICS.get(status)
+    if metric and count:
+        apply_rollup_deltas(db.session.connection(), {
+            (metric, '', _day(moment or datetime.utcnow())): [count, 0.0]
+        })
+
+
+def retract_outcomes(*criteria):
+    """
+    Retirer des seaux les challenges terminés qu'un UPDATE groupé de statut va modifier
+    (à appeler avant l'UPDATE, dans la même transaction) : un GROUP BY sur les lignes ciblées
+    """
+    ended = Challenge.completed_at
+    rows = db.session.execute(
+        select(Challenge.status, func.date(ended), func.count(Challenge.id))
+        .where(*criteria, Challenge.status.in_(list(_OUTCOME_METRICS)))
+        .group_by(Challenge.status, func.date(ended))
+    )
+    deltas = {
+        (_OUTCOME_METRICS[status], '', _day(day)): [-count, 0.0]
+        for status, day, count in rows
+        if day is not None
+    }
+    if deltas:
+        apply_rollup_deltas(db.session.connection(), deltas)
+
+
+def _has_tracked_changes(obj) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in _TRACKED_COLUMNS[type(obj)])
+
+
+@event.listens_for(Session, 'before_flush')
+def _capture_previous_values(session, flush_context, instances):
+    """
+    Lire en base, avant le flush, les valeurs des lignes modifiées ou supprimées qui comptent
+    pour les agrégats (un SELECT par modèle) : l'historique des attributs ne les connaît pas
+    quand l'objet a été expiré (après un commit) avant la modification.
+    """
+    targets: Dict[type, Dict[str, object]] = defaultdict(dict)
+    for obj in session.deleted:
+        if type(obj) in _TRACKED_COLUMNS:
+            targets[type(obj)][inspect(obj).identity[0]] = obj
+    for obj in session.dirty:
+        if type(obj) in _TRACKED_COLUMNS and _has_tracked_changes(obj):
+            targets[type(obj)][inspect(obj).identity[0]] = obj
+
+    previous = session.info.setdefault('rollup_previous', {})
+    for model, objects in targets.items():
+        table = model.__table__
+        columns = _TRACKED_COLUMNS[model]
+        rows = session.connection().execute(
+            select(table.c.id, *(table.c[key] for key in columns)).where(table.c.id.in_(list(objects)))
+        )
+        for row_id, *values in rows:
+            previous[id(objects[row_id])] = dict(zip(columns, values))
+
+
+@event.listens_for(Session, 'after_flush')
+def _rollup_flush(session, flush_context):
+    """
+    Répercuter les insertions, modifications et suppressions ORM sur les seaux journaliers :
+    contribution des anciennes valeurs retirée, contribution des nouvelles ajoutée.
+    """
+    previous = session.info.pop('rollup_previous', {})
+    deltas: Deltas = defaultdict(lambda: [0, 0.0])
+
+    for obj in session.new:
+        model = type(obj)
+        if model in _TRACKED_COLUMNS:
+            _add(deltas, _contributions(model, lambda key: getattr(obj, key)), 1)
+
+    for obj in (*session.deleted, *session.dirty):
+        old = previous.get(id(obj))
+        if old is None:
+            continue
+        model = type(obj)
+        _add(deltas, _contributions(model, old.get), -1)
+        if obj not in session.deleted:
+            _add(deltas, _contributions(model, lambda key: _new_value(obj, key)), 1)
+
+    if deltas:
+        apply_rollup_deltas(session.connection(), deltas)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_previous_values(session):
+    session.info.pop('rollup_previous', None)
+
+
+def _new_value(obj, key):
+    history = inspect(obj).attrs[key].history
+    if history.added:
+        return history.added[0]
+    return getattr(obj, key)
+
+
+def _source_queries(start: Optional[date], end: Optional[date], owners=None):
+    """
+    Requêtes du recalcul des seaux depuis les tables sources (un GROUP BY par métrique),
+    limitées à une période et, si owners (SELECT d'identifiants d'utilisateurs) est fourni,
+    aux lignes de ces utilisateurs
+    """
+    # Lignes des utilisateurs owners ; les trades leur sont rattachés par leurs challenges (comme la cascade)
+    owned = {}
+    if owners is not None:
+        owned = {
+            User: User.id.in_(owners),
+            Payment: Payment.user_id.in_(owners),
+            Challenge: Challenge.user_id.in_(owners),
+            Trade: Trade.challenge_id.in_(select(Challenge.id).where(Challenge.user_id.in_(owners))),
+        }
+
+    def bounded(query, column, model):
+        if start:
+            query = query.where(column >= datetime.combine(start, datetime.min.time()))
+        if end:
+            query = query.where(column < datetime.combine(end + timedelta(days=1), datetime.min.time()))
+        if model in owned:
+            query = query.where(owned[model])
+        return query
+
+    ended = Challenge.completed_at
+    queries = [
+        (SIGNUPS, bounded(
+            select(func.date(User.created_at), func.count(User.id), literal(0.0), literal(''))
+            .group_by(func.date(User.created_at)), User.created_at, User)),
+        (REVENUE, bounded(
+            select(func.date(Payment.timestamp), func.count(Payment.id), func.sum(Payment.amount), Payment.currency)
+            .where(Payment.status == PaymentStatus.COMPLETED.value)
+            .group_by(func.date(Payment.timestamp), Payment.currency), Payment.timestamp, Payment)),
+        (CHALLENGES_STARTED, bounded(
+            select(func.date(Challenge.created_at), func.count(Challenge.id), literal(0.0), literal(''))
+            .group_by(func.date(Challenge.created_at)), Challenge.created_at, Challenge)),
+        (TRADE_VOLUME, bounded(
+            select(func.date(Trade.timestamp), func.count(Trade.id), func.sum(Trade.quantity * Trade.entry_price), Trade.symbol)
+            .group_by(func.date(Trade.timestamp), Trade.symbol), Trade.timestamp, Trade)),
+    ]
+    for status, metric in _OUTCOME_METRICS.items():
+        queries.append((metric, bounded(
+            select(func.date(ended), func.count(Challenge.id), literal(0.0), literal(''))
+            .where(Challenge.status == status)
+            .group_by(func.date(ended)), ended, Challenge)))
+    return queries
+
+
+def _source_rows(start: Optional[date], end: Optional[date]):
+    """
+    Recalcul complet des seaux depuis les tables sources
+    """
+    now = datetime.utcnow()
+    for metric, query in _source_queries(start, end):
+        for day, count, total, dimension in db.session.execute(query):
+            if day is None:
+                continue
+            yield {
+                'metric': metric, 'dimension': dimension or '', 'day': _day(day),
+                'count': count, 'total': float(total or 0.0), 'updated_at': now
+            }
+
+
+def retract_users(owners):
+    """
+    Retirer des seaux tout ce qu'apportent des utilisateurs (inscription, challenges, paiements, trades)
+    avant leur suppression par des DELETE groupés, dans la même transaction
+
+    Args:
+        owners: SELECT des identifiants des utilisateurs supprimés
+    """
+    deltas: Deltas = defaultdict(lambda: [0, 0.0])
+    for metric, query in _source_queries(None, None, owners):
+        for day, count, total, dimension in db.session.execute(query):
+            if day is not None:
+                _add(deltas, [(metric, dimension or '', _day(day), count, float(total or 0.0))], -1)
+    if deltas:
+        apply_rollup_deltas(db.session.connection(), deltas)
+
+
+def backfill_rollups(start: Optional[date] = None, end: Optional[date] = None) -> int:
+    """
+    Reconstruire les seaux journaliers d'une période (tout l'historique par défaut)
+    depuis les tables sources, en une transaction
+
+    Returns:
+        int: Nombre de seaux écrits
+    """
+    rows = list(_source_rows(start, end))
+    query = delete(DailyRollup)
+    if start:
+        query = query.where(DailyRollup.day >= start)
+    if end:
+        query = query.where(DailyRollup.day <= end)
+    try:
+        db.session.execute(query)
+        if rows:
+            db.session.execute(insert(DailyRollup), rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(rows)
+
+
+def get_series(metric: str, start: date, end: date, dimension: Optional[str] = None) -> List[DailyRollup]:
+    """
+    Seaux d'une métrique sur une période, triés par jour (lecture de l'index (metric, day))
+    """
+    query = select(DailyRollup).where(DailyRollup.metric == metric, DailyRollup.day >= start, DailyRollup.day <= end)
+    if dimension is not None:
+        query = query.where(DailyRollup.dimension == dimension)
+    return list(db.session.execute(query.order_by(DailyRollup.day, DailyRollup.dimension)).scalars())
+
+
+def weekly_outcomes(start: date, end: date) -> List[Dict]:
+    """
+    Challenges démarrés, réussis et échoués par semaine ISO, avec le taux de réussite
+    """
+    weeks: Dict[date, Dict] = {}
+    keys = {CHALLENGES_STARTED: 'started', CHALLENGES_PASSED: 'passed', CHALLENGES_FAILED: 'failed'}
+    rows = db.session.execute(
+        select(DailyRollup.metric, DailyRollup.day, DailyRollup.count)
+        .where(DailyRollup.metric.in_(keys), DailyRollup.day >= start, DailyRollup.day <= end)
+    ).all()
+    for metric, day, count in rows:
+        week_start = day - timedelta(days=day.weekday())
+        week = weeks.setdefault(week_start, {'started': 0, 'passed': 0, 'failed': 0})
+        week[keys[metric]] += count
+
+    series = []
+    for week_start in sorted(weeks):
+        week = weeks[week_start]
+        ended = week['passed'] + week['failed']
+        iso_year, iso_week, _ = week_start.isocalendar()
+        series.append(dict(
+            week,
+            week=f'{iso_year}-W{iso_week:02d}',
+            week_start=week_start,
+            pass_rate=round(week['passed'] / ended * 100, 2) if ended else None
+        ))
+    return series
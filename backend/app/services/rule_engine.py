@@ -0,0 +1,149 @@
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from datetime import datetime
+from functools import partial
+from typing import List, Optional, Sequence
+import numpy as np
+from app.models.challenge import ChallengeStatus
+from app.services.challenge_rules import RULE_COLUMNS, DEFAULT_PLAN, PASSED, FAILED, get_rule_set
+
+# En dessous de ce nombre de challenges, le coût du pool dépasse le gain
+POOL_MIN_BATCH = 20000
+
+
+@dataclass(slots=True, frozen=True)
+class ChallengeState:
+    """
+    Vue compacte d'un challenge pour l'évaluation des règles (aucun objet ORM)
+    """
+    id: str
+    initial_balance: float
+    daily_start_balance: float
+    equity: float
+    max_daily_loss_pct: float
+    max_total_loss_pct: float
+    profit_target_pct: float
+    plan_type: str = DEFAULT_PLAN
+    open_positions: int = 0
+    trading_days: int = 0  # Nombre de jours distincts avec au moins un trade
+    best_day_profit: float = 0.0  # Meilleur P&L réalisé sur une journée
+
+
+@dataclass(slots=True, frozen=True)
+class RuleDecision:
+    """
+    Résultat de l'évaluation : nouveau statut, raison d'échec et valeur ayant déclenché la règle
+    """
+    challenge_id: str
+    status: str
+    failed_reason: Optional[str] = None
+    value: float = 0.0
+    threshold: float = 0.0
+
+    @property
+    def is_transition(self):
+        return self.status != ChallengeStatus.ACTIVE.value
+
+
+def unrealized_pnl(trade_type: str, entry_price: float, quantity: int, price: float) -> float:
+    """
+    P&L non réalisé d'une position au prix donné
+    """
+    side = trade_type.upper()
+    if side == 'BUY':
+        return (price - entry_price) * quantity
+    if side == 'SELL':
+        return (entry_price - price) * quantity
+    return 0.0
+
+
+def evaluate_state(state: ChallengeState, now: Optional[datetime] = None) -> RuleDecision:
+    """
+    Évaluer les règles du plan sur un challenge actif, sans accès à la base de données.
+    Les règles sont déclarées dans challenge_rules.PLAN_RULES (pertes maximales, objectif
+    de profit, jours de trading minimum, cohérence, lots et positions maximum, week-end).
+    """
+    decisions = evaluate_states([state], now=now, transitions_only=False)
+    return decisions[0]
+
+
+def evaluate_states(states: Sequence[ChallengeState], now: Optional[datetime] = None,
+                    transitions_only: bool = True) -> List[RuleDecision]:
+    """
+    Évaluer une liste de challenges, plan par plan, avec les prédicats vectorisés
+
+    Args:
+        states (list): Challenges à évaluer
+        now (datetime, optional): Instant de l'évaluation (règle du week-end)
+        transitions_only (bool): Ne retourner que les changements de statut
+
+    Returns:
+        list: Décisions (dans l'ordre des challenges si transitions_only est False)
+    """
+    now = now or datetime.utcnow()
+    is_weekend = now.weekday() >= 5
+
+    by_plan = defaultdict(list)
+    for index, state in enumerate(states):
+        by_plan[state.plan_type].append(index)
+
+    decisions = [None] * len(states)
+    for plan_type, indexes in by_plan.items():
+        group = [states[i] for i in indexes]
+        cols = {name: np.fromiter((getattr(s, name) for s in group), dtype=float, count=len(group))
+                for name in RULE_COLUMNS}
+        cols['is_weekend'] = np.full(len(group), is_weekend)
+
+        rule_set = get_rule_set(plan_type)
+        status, reason, value, threshold = rule_set.evaluate(cols)
+
+        positions = np.flatnonzero(status) if transitions_only else range(len(indexes))
+        for position in positions:
+            index = indexes[position]
+            code = status[position]
+            if code == FAILED:
+                decisions[index] = RuleDecision(states[index].id, ChallengeStatus.FAILED.value,
+                                                rule_set.failed_reason(reason[position]),
+                                                float(value[position]), float(threshold[position]))
+            elif code == PASSED:
+                decisions[index] = RuleDecision(states[index].id, ChallengeStatus.PASSED.value, None,
+                                                float(value[position]), float(threshold[position]))
+            elif not transitions_only:
+                decisions[index] = RuleDecision(states[index].id, ChallengeStatus.ACTIVE.value)
+
+    return [d for d in decisions if d is not None]
+
+
+def _evaluate_rows(rows: Sequence[tuple], now: datetime) -> List[tuple]:
+    # Tâche exécutée dans un processus du pool : tuples bruts en entrée et en sortie
+    # pour limiter le coût de sérialisation entre processus
+    decisions = evaluate_states([ChallengeState(*row) for row in rows], now=now)
+    return [(d.challenge_id, d.status, d.failed_reason, d.value, d.threshold) for d in decisions]
+
+
+def evaluate_in_pool(states: Sequence[ChallengeState], workers: Optional[int] = None,
+                     chunk_size: int = 5000) -> List[RuleDecision]:
+    """
+    Répartir l'évaluation sur un pool de processus pour les gros balayages
+
+    Args:
+        states (list): Challenges à évaluer
+        workers (int, optional): Nombre de processus (par défaut : nombre de CPU)
+        chunk_size (int): Nombre de challenges par tâche
+
+    Returns:
+        list: Changements de statut
+    """
+    now = datetime.utcnow()
+    if len(states) < POOL_MIN_BATCH or workers == 1:
+        return evaluate_states(states, now=now)
+
+    fields = ChallengeState.__slots__
+    rows = [tuple(getattr(state, f) for f in fields) for state in states]
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    decisions = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_results in pool.map(partial(_evaluate_rows, now=now), chunks):
+            decisions.extend(RuleDecision(*result) for result in chunk_results)
+    return decisions
@@ -0,0 +1,199 @@
+import threading
+import time
+from typing import Dict, Optional
+import numpy as np
+from sqlalchemy import select, func, case, event
+from sqlalchemy.orm import Session
+from app import db
+from app.models import Challenge, Trade
+from app.services.trade_events import register_trade_close_listener
+
+# Durée de vie des statistiques en cache (invalidées à chaque clôture de trade)
+STATS_CACHE_TTL = 300
+
+_stats_cache: Dict[tuple, tuple] = {}
+_cache_lock = threading.Lock()
+# Incrémenté à chaque invalidation : un calcul commencé avant n'est pas remis en cache
+_cache_generation = 0
+
+
+def _closed_trades_filter(challenge_id: Optional[str] = None, user_id: Optional[str] = None):
+    conditions = [Trade.is_closed == True]
+    if challenge_id:
+        conditions.append(Trade.challenge_id == challenge_id)
+    else:
+        # Trades des challenges de l'utilisateur (y compris les anciens trades sans user_id)
+        conditions.append(Trade.challenge_id.in_(select(Challenge.id).where(Challenge.user_id == user_id)))
+    return conditions
+
+
+def summarize_pnl(pnls: np.ndarray, initial_balance: Optional[float] = None) -> Dict:
+    """
+    Statistiques de ratio et de volatilité sur la série des P&L clôturés (triée par date)
+
+    Returns:
+        dict: pnl_std, sharpe_ratio (par trade), max_drawdown, max_drawdown_pct
+    """
+    if len(pnls) == 0:
+        return {'pnl_std': 0.0, 'sharpe_ratio': None, 'max_drawdown': 0.0, 'max_drawdown_pct': 0.0}
+
+    std = float(pnls.std(ddof=1)) if len(pnls) > 1 else 0.0
+    sharpe = float(pnls.mean() / std) if std > 0 else None
+
+    start = initial_balance or 0.0
+    equity = start + np.cumsum(pnls)
+    peaks = np.maximum.accumulate(np.concatenate(([start], equity)))[1:]
+    drawdowns = peaks - equity
+    worst = int(drawdowns.argmax())
+    max_dd = float(drawdowns[worst])
+    max_dd_pct = (max_dd / peaks[worst]) * 100 if peaks[worst] > 0 else 0.0
+
+    return {
+        'pnl_std': round(std, 4),
+        'sharpe_ratio': round(sharpe, 4) if sharpe is not None else None,
+        'max_drawdown': round(max_dd, 2),
+        'max_drawdown_pct': round(float(max_dd_pct), 2)
+    }
+
+
+def compute_trade_stats(challenge_id: Optional[str] = None, user_id: Optional[str] = None) -> Dict:
+    """
+    Statistiques de performance sur les trades clôturés d'un challenge ou d'un utilisateur
+    - Statistiques additives (comptes, sommes, extrêmes) : un GROUP BY symbole en SQL
+    - Écart-type, Sharpe, drawdown : calcul vectorisé sur la colonne des P&L
+
+    Returns:
+        dict: Statistiques globales et détail par symbole
+    """
+    conditions = _closed_trades_filter(challenge_id, user_id)
+    pnl = Trade.profit_loss
+
+    # Un seul passage SQL : agrégats par symbole, les totaux s'en déduisent (statistiques additives)
+    by_symbol = db.session.execute(
+        select(
+            Trade.symbol,
+            func.count(Trade.id),
+            func.sum(case((pnl > 0, 1), else_=0)),
+            func.sum(case((pnl < 0, 1), else_=0)),
+            func.sum(case((pnl > 0, pnl), else_=0.0)),
+            func.sum(case((pnl < 0, pnl), else_=0.0)),
+            func.max(pnl),
+            func.min(pnl)
+        )
+        .where(*conditions)
+        .group_by(Trade.symbol)
+    ).all()
+    count = sum(row[1] for row in by_symbol)
+    wins = sum(row[2] or 0 for row in by_symbol)
+    losses = sum(row[3] or 0 for row in by_symbol)
+    gross_profit = float(sum(row[4] or 0.0 for row in by_symbol))
+    gross_loss = float(sum(row[5] or 0.0 for row in by_symbol))
+    best = max((row[6] for row in by_symbol if row[6] is not None), default=None)
+    worst = min((row[7] for row in by_symbol if row[7] is not None), default=None)
+
+    # Série des P&L (ordre de l'index) lue par la connexion, sans chargement ORM, dans un tableau numpy
+    pnls = np.fromiter(
+        db.session.connection().execute(
+            select(pnl).where(*conditions).order_by(Trade.timestamp)
+        ).scalars(),
+        dtype=float
+    )
+
+    initial_balance = None
+    if challenge_id:
+        initial_balance = db.session.execute(
+            select(Challenge.initial_balance).where(Challenge.id == challenge_id)
+        ).scalar()
+
+    net = gross_profit + gross_loss
+    win_rate = wins / count if count else 0.0
+    avg_win = gross_profit / wins if wins else 0.0
+    avg_loss = gross_loss / losses if losses else 0.0
+
+    stats = {
+        'total_trades': count,
+        'winning_trades': wins,
+        'losing_trades': losses,
+        'win_rate': round(win_rate * 100, 2),
+        'gross_profit': round(gross_profit, 2),
+        'gross_loss': round(gross_loss, 2),
+        'net_profit': round(net, 2),
+        'average_win': round(avg_win, 2),
+        'average_loss': round(avg_loss, 2),
+        'profit_factor': round(gross_profit / abs(gross_loss), 4) if gross_loss else None,
+        'expectancy': round(net / count, 2) if count else 0.0,
+        'best_trade': best,
+        'worst_trade': worst,
+        'by_symbol': sorted((
+            {
+                'symbol': symbol,
+                'trades': n,
+                'win_rate': round((symbol_wins or 0) / n * 100, 2) if n else 0.0,
+                'net_profit': round((symbol_profit or 0.0) + (symbol_loss or 0.0), 2)
+            }
+            for symbol, n, symbol_wins, _losses, symbol_profit, symbol_loss, _best, _worst in by_symbol
+        ), key=lambda item: item['net_profit'], reverse=True)
+    }
+    stats.update(summarize_pnl(pnls, initial_balance))
+    return stats
+
+
+def get_trade_stats(challenge_id: Optional[str] = None, user_id: Optional[str] = None) -> Dict:
+    """
+    Statistiques en cache (recalculées après une clôture de trade validée ou à expiration du TTL)
+    """
+    key = ('challenge', challenge_id) if challenge_id else ('user', user_id)
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _stats_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        generation = _cache_generation
+
+    stats = compute_trade_stats(challenge_id=challenge_id, user_id=user_id)
+    with _cache_lock:
+        if generation == _cache_generation:
+            _stats_cache[key] = (now + STATS_CACHE_TTL, stats)
+    return stats
+
+
+def invalidate_trade_stats(keys):
+    """
+    Invalider des statistiques en cache
+
+    Args:
+        keys: Clés ('challenge', id) / ('user', id)
+    """
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        for key in keys:
+            _stats_cache.pop(key, None)
+
+
+def _mark_trade_stats_stale(trade, challenge):
+    # Invalidation reportée au commit : avant, une lecture concurrente remettrait en cache
+    # les statistiques sans la clôture pour toute la durée du TTL
+    db.session.info.setdefault('stale_trade_stats', set()).update(
+        {('challenge', challenge.id), ('user', challenge.user_id)}
+    )
+
+
+register_trade_close_listener(_mark_trade_stats_stale)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_on_commit(session):
+    # Libération d'un savepoint (listener de clôture) : attendre le commit de la transaction
+    if session.in_nested_transaction():
+        return
+    keys = session.info.pop('stale_trade_stats', None)
+    if keys:
+        invalidate_trade_stats(keys)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _reset_on_rollback(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop('stale_trade_stats', None)
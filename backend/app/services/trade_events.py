@@ -0,0 +1,35 @@
+import logging
+from app import db
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_trade_close_listeners = []
+
+
+def register_trade_close_listener(listener):
+    """
+    Enregistrer un callback appelé avec (trade, challenge) à chaque clôture de trade.
+    Le callback s'exécute dans la transaction de l'appelant, sous un savepoint : ses écritures
+    sont validées (ou annulées) avec la clôture.
+    """
+    if listener not in _trade_close_listeners:
+        _trade_close_listeners.append(listener)
+
+
+def notify_trade_closed(trade, challenge):
+    """
+    Notifier les listeners d'une clôture de trade, chacun sous son propre savepoint : une erreur
+    de listener n'annule que ses écritures (la transaction de la clôture reste utilisable, y compris
+    sur PostgreSQL) et est journalisée avec sa trace (les agrégats du listener divergent jusqu'à
+    leur reconstruction)
+    """
+    for listener in _trade_close_listeners:
+        try:
+            with db.session.begin_nested():
+                listener(trade, challenge)
+        except Exception:
+            logger.exception(
+                f"Error in trade close listener {getattr(listener, '__qualname__', listener)} for trade {trade.id}"
+            )
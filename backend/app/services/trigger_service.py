@@ -0,0 +1,272 @@
+import heapq
+import itertools
+import threading
+import logging
+from typing import Dict, Hashable, List, Optional, Tuple
+from app import db
+from app.models import Trade, TradeAlreadyClosedError
+from app.services.killer_service import evaluate_killer_rules
+from app.services.unit_of_work import commit_unit_of_work
+from app.services.price_service import register_quote_listener, quote_refresher
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ABOVE = 'above'  # Déclenché quand le prix monte à ou au-dessus du niveau
+BELOW = 'below'  # Déclenché quand le prix descend à ou en dessous du niveau
+
+
+class TriggerBook:
+    """
+    Niveaux de prix en attente pour un symbole, rangés dans deux tas :
+    - ABOVE : tas min, le niveau le plus bas est déclenché en premier
+    - BELOW : tas max (niveaux négatifs), le niveau le plus haut est déclenché en premier
+    À niveau égal l'ordre d'arrivée est conservé (FIFO) grâce à un compteur de séquence.
+    Les annulations sont paresseuses : l'entrée reste dans le tas et est ignorée au pop.
+    Ajout, annulation et déclenchement coûtent O(log n) par niveau.
+    """
+    def __init__(self):
+        self._above: List[Tuple[float, int, Hashable]] = []
+        self._below: List[Tuple[float, int, Hashable]] = []
+        self._live: Dict[Hashable, Tuple[int, float]] = {}
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._live)
+
+    def __contains__(self, key):
+        return key in self._live
+
+    def add(self, key: Hashable, level: float, direction: str):
+        """
+        Ajouter (ou remplacer) un niveau de déclenchement identifié par key
+        """
+        seq = next(self._seq)
+        self._live[key] = (seq, level)
+        if direction == ABOVE:
+            heapq.heappush(self._above, (level, seq, key))
+        else:
+            heapq.heappush(self._below, (-level, seq, key))
+        self._maybe_compact()
+
+    def discard(self, key: Hashable) -> bool:
+        """
+        Annuler un niveau (suppression paresseuse)
+        """
+        return self._live.pop(key, None) is not None
+
+    def pop_crossed(self, price: float) -> List[Tuple[Hashable, float]]:
+        """
+        Retirer tous les niveaux franchis par le prix
+        Returns:
+            list: (key, level) dans l'ordre de priorité prix puis FIFO
+        """
+        crossed = []
+        while self._above and self._above[0][0] <= price:
+            level, seq, key = heapq.heappop(self._above)
+            if self._is_live(key, seq):
+                del self._live[key]
+                crossed.append((key, level))
+        while self._below and -self._below[0][0] >= price:
+            neg_level, seq, key = heapq.heappop(self._below)
+            if self._is_live(key, seq):
+                del self._live[key]
+                crossed.append((key, -neg_level))
+        return crossed
+
+    def _is_live(self, key, seq) -> bool:
+        live = self._live.get(key)
+        return live is not None and live[0] == seq
+
+    def _maybe_compact(self):
+        # Reconstruire les tas quand les entrées annulées dominent
+        if len(self._above) + len(self._below) > 2 * len(self._live) + 1024:
+            self._above = [e for e in self._above if self._is_live(e[2], e[1])]
+            self._below = [e for e in self._below if self._is_live(e[2], e[1])]
+            heapq.heapify(self._above)
+            heapq.heapify(self._below)
+
+
+def validate_protective_levels(trade_type: str, price: float, stop_loss=None, take_profit=None) -> Optional[str]:
+    """
+    Vérifier la cohérence du stop loss / take profit par rapport au prix de référence
+
+    Returns:
+        str or None: Message d'erreur, None si les niveaux sont valides
+    """
+    if stop_loss is not None and stop_loss <= 0:
+        return 'Le stop loss doit être positif'
+    if take_profit is not None and take_profit <= 0:
+        return 'Le take profit doit être positif'
+
+    if trade_type.upper() == 'BUY':
+        if stop_loss is not None and stop_loss >= price:
+            return 'Le stop loss d\'un achat doit être inférieur au prix'
+        if take_profit is not None and take_profit <= price:
+            return 'Le take profit d\'un achat doit être supérieur au prix'
+    elif trade_type.upper() == 'SELL':
+        if stop_loss is not None and stop_loss <= price:
+            return 'Le stop loss d\'une vente doit être supérieur au prix'
+        if take_profit is not None and take_profit >= price:
+            return 'Le take profit d\'une vente doit être inférieur au prix'
+    return None
+
+
+class ProtectiveOrderEngine:
+    """
+    Moteur de stop loss / take profit côté serveur : un TriggerBook par symbole,
+    alimenté par les trades ouverts et consulté à chaque nouvelle cotation.
+    """
+    def __init__(self):
+        self._books: Dict[str, TriggerBook] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.app = None
+
+    def load(self):
+        """
+        Reconstruire les carnets depuis les trades ouverts ayant un SL ou un TP
+        """
+        trades = Trade.query.filter(
+            Trade.is_closed == False,
+            (Trade.stop_loss.isnot(None)) | (Trade.take_profit.isnot(None))
+        ).all()
+        with self._lock:
+            self._books = {}
+        for trade in trades:
+            self.register(trade)
+        self.loaded = True
+        logger.info(f"Loaded protective orders for {len(trades)} open trades")
+
+    def symbols(self) -> List[str]:
+        """
+        Symboles ayant au moins un niveau en attente (cotations à surveiller)
+        """
+        with self._lock:
+            return [symbol for symbol, book in self._books.items() if len(book)]
+
+    def register(self, trade):
+        """
+        Enregistrer (ou remplacer) les niveaux SL/TP d'un trade ouvert
+        """
+        symbol = trade.symbol.upper().strip()
+        is_buy = trade.trade_type.upper() == 'BUY'
+        with self._lock:
+            book = self._books.setdefault(symbol, TriggerBook())
+            book.discard((trade.id, 'stop_loss'))
+            book.discard((trade.id, 'take_profit'))
+            if trade.stop_loss is not None:
+                book.add((trade.id, 'stop_loss'), trade.stop_loss, BELOW if is_buy else ABOVE)
+            if trade.take_profit is not None:
+                book.add((trade.id, 'take_profit'), trade.take_profit, ABOVE if is_buy else BELOW)
+
+    def unregister(self, trade):
+        """
+        Retirer les niveaux d'un trade (clôture manuelle ou modification)
+        """
+        with self._lock:
+            book = self._books.get(trade.symbol.upper().strip())
+            if book:
+                book.discard((trade.id, 'stop_loss'))
+                book.discard((trade.id, 'take_profit'))
+
+    def on_quote(self, symbol: str, price: float) -> List[Tuple[str, str]]:
+        """
+        Retirer les niveaux franchis pour un symbole
+        Returns:
+            list: (trade_id, reason) des trades à clôturer
+        """
+        with self._lock:
+            book = self._books.get(symbol.upper().strip())
+            if not book:
+                return []
+            triggered = []
+            for (trade_id, reason), _level in book.pop_crossed(price):
+                # Un seul déclenchement par trade : annuler l'ordre protecteur opposé
+                book.discard((trade_id, 'take_profit' if reason == 'stop_loss' else 'stop_loss'))
+                triggered.append((trade_id, reason))
+            return triggered
+
+
+# Moteur global
+protective_engine = ProtectiveOrderEngine()
+
+
+def close_triggered_trades(triggered: List[Tuple[str, str]], price: float) -> List:
+    """
+    Clôturer les trades déclenchés et évaluer les règles killer une fois par challenge concerné,
+    dans une seule transaction
+
+    Args:
+        triggered (list): (trade_id, reason) retournés par le moteur
+        price (float): Prix d'exécution (cotation courante)
+
+    Returns:
+        list: Trades clôturés
+    """
+    reasons = dict(triggered)
+    trades = Trade.query.filter(Trade.id.in_(list(reasons)), Trade.is_closed == False).all()
+    if not trades:
+        return []
+
+    try:
+        closed = []
+        for trade in trades:
+            try:
+                trade.close_trade(price, trade.challenge, reason=reasons[trade.id])
+                closed.append(trade)
+            except TradeAlreadyClosedError:
+                # Clôturé entre-temps par une autre requête (clôture manuelle)
+                continue
+        # Règles killer une fois par challenge, clôtures et statuts dans le même commit
+        for challenge_id in {t.challenge_id for t in closed}:
+            evaluate_killer_rules(challenge_id)
+        commit_unit_of_work()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error closing triggered trades: {str(e)}")
+        # Les trades restent ouverts : remettre leurs niveaux dans le carnet
+        for trade in trades:
+            protective_engine.register(trade)
+        return []
+
+    logger.info(f"Closed {len(closed)} trades on protective orders at {price}")
+    return closed
+
+
+def _load_protective_orders():
+    with protective_engine.app.app_context():
+        try:
+            protective_engine.load()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error loading protective orders: {str(e)}")
+
+
+def _tracked_symbols():
+    # Chargement retenté à chaque rafraîchissement tant qu'il n'a pas réussi
+    if not protective_engine.loaded:
+        _load_protective_orders()
+    return protective_engine.symbols()
+
+
+def _on_quote(symbol, price_data):
+    price = price_data['price']
+    triggered = protective_engine.on_quote(symbol, price)
+    if triggered:
+        with protective_engine.app.app_context():
+            close_triggered_trades(triggered, price)
+
+
+def init_trigger_engine(app):
+    """
+    Charger les ordres protecteurs et brancher le moteur sur le rafraîchissement des cotations
+    en tâche de fond : les clôtures ne s'exécutent jamais dans une requête.
+    Un échec du chargement (base indisponible au démarrage) n'empêche pas l'application
+    de démarrer : le chargement est retenté à chaque rafraîchissement.
+    """
+    protective_engine.app = app
+    _load_protective_orders()
+    register_quote_listener(_on_quote)
+    quote_refresher.register_symbol_source(_tracked_symbols)
@@ -0,0 +1,103 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Tuple
+from flask import g
+from sqlalchemy import update
+from app import db
+from app.models import Challenge, ChallengeStatus
+from app.services.equity_service import record_equity
+from app.services.rule_engine import RuleDecision
+from app.services.rollup_service import record_outcomes
+
+
+class StatusUnitOfWork:
+    """
+    Changements de statut des challenges en attente d'écriture.
+    Les règles killer enregistrent leurs décisions ici au lieu de valider elles-mêmes ;
+    la requête (ou le balayage) applique tout avec un seul commit.
+    """
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self._pending: Dict[str, Tuple[RuleDecision, float, float]] = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def record(self, decision: RuleDecision, equity: float, balance: float):
+        """
+        Enregistrer une transition (la dernière décision d'un challenge l'emporte)
+        """
+        if decision.is_transition:
+            self._pending[decision.challenge_id] = (decision, equity, balance)
+
+    def flush(self, now: datetime = None) -> List[RuleDecision]:
+        """
+        Appliquer les transitions dans la transaction courante, sans commit :
+        un UPDATE multi-lignes par (statut, raison) et par lot de batch_size challenges.
+        Seuls les challenges encore actifs sont modifiés.
+
+        Returns:
+            list: Décisions appliquées
+        """
+        if not self._pending:
+            return []
+        now = now or datetime.utcnow()
+
+        groups = defaultdict(list)
+        for decision, _equity, _balance in self._pending.values():
+            groups[(decision.status, decision.failed_reason)].append(decision.challenge_id)
+
+        for (status, failed_reason), ids in groups.items():
+            for i in range(0, len(ids), self.batch_size):
+                result = db.session.execute(
+                    update(Challenge)
+                    .where(Challenge.id.in_(ids[i:i + self.batch_size]),
+                           Challenge.status == ChallengeStatus.ACTIVE.value)
+                    .values(status=status, failed_reason=failed_reason, completed_at=now)
+                    .execution_options(synchronize_session='evaluate')
+                )
+                # Challenges réellement terminés par ce lot (agrégats journaliers)
+                record_outcomes(status, result.rowcount, now)
+        return [decision for decision, _equity, _balance in self._pending.values()]
+
+    def commit(self, verbose: bool = True) -> List[RuleDecision]:
+        """
+        Appliquer les transitions puis valider la transaction de la session (un seul commit)
+
+        Args:
+            verbose (bool): Journaliser chaque changement de statut
+
+        Returns:
+            list: Décisions appliquées
+        """
+        try:
+            applied = self.flush()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            pending, self._pending = self._pending, {}
+
+        # Point d'équité au moment du changement de statut
+        for decision, equity, balance in pending.values():
+            record_equity(decision.challenge_id, equity, balance, force=True)
+            if verbose:
+                print(f"[KILLER] Status updated to {decision.status} for challenge {decision.challenge_id}")
+        return applied
+
+
+def get_unit_of_work() -> StatusUnitOfWork:
+    """
+    Unité de travail du contexte courant (une par requête ou par contexte applicatif)
+    """
+    if 'status_unit_of_work' not in g:
+        g.status_unit_of_work = StatusUnitOfWork()
+    return g.status_unit_of_work
+
+
+def commit_unit_of_work() -> List[RuleDecision]:
+    """
+    Valider la requête : transitions de statut en attente et modifications de la session
+    """
+    return get_unit_of_work().commit()
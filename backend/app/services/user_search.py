@@ -0,0 +1,256 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, func, case, or_, and_, text, event, literal_column
+from app import db
+from app.models import User
+
+# En dessous, un terme n'a pas de trigramme : recherche par préfixe uniquement
+MIN_TEXT_SEARCH_LENGTH = 3
+
+# Profondeur maximale de pagination d'une recherche classée
+MAX_SEARCH_OFFSET = 1000
+
+# Correspondances de sous-chaîne lues dans l'index plein texte puis classées (termes très fréquents)
+MAX_TEXT_CANDIDATES = 5000
+
+# Index plein texte par dialecte (créés avec la table users, ou par `flask admin build-search-index`)
+_SEARCH_INDEX_DDL = {
+    'sqlite': (
+        # Table FTS5 à contenu externe (pas de copie des données), tokenizer trigramme :
+        # correspondance de sous-chaîne insensible à la casse. Clé : users.search_rowid, entier stable
+        # (la clé primaire est un texte ; le rowid implicite est renuméroté par VACUUM)
+        "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+        "username, email, content='users', content_rowid='search_rowid', tokenize='trigram')",
+        # Clé posée à l'insertion (max + 1, lu dans l'index unique) puis indexation
+        "CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN "
+        "UPDATE users SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM users) "
+        "WHERE id = new.id AND search_rowid IS NULL; "
+        "INSERT INTO users_fts(rowid, username, email) "
+        "SELECT search_rowid, username, email FROM users WHERE id = new.id; END",
+        "CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users "
+        "WHEN old.search_rowid IS NOT NULL BEGIN "
+        "INSERT INTO users_fts(users_fts, rowid, username, email) "
+        "VALUES ('delete', old.search_rowid, old.username, old.email); END",
+        "CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF username, email ON users "
+        "WHEN old.search_rowid IS NOT NULL BEGIN "
+        "INSERT INTO users_fts(users_fts, rowid, username, email) "
+        "VALUES ('delete', old.search_rowid, old.username, old.email); "
+        "INSERT INTO users_fts(rowid, username, email) VALUES (new.search_rowid, new.username, new.email); END",
+    ),
+    'postgresql': (
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS idx_user_username_trgm ON users USING gin (lower(username) gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS idx_user_email_trgm ON users USING gin (lower(email) gin_trgm_ops)",
+    ),
+}
+
+# Index SQLite d'avant search_rowid (clé = rowid implicite) : supprimé puis reconstruit
+_LEGACY_SQLITE_INDEX = (
+    "DROP TRIGGER IF EXISTS users_fts_insert",
+    "DROP TRIGGER IF EXISTS users_fts_delete",
+    "DROP TRIGGER IF EXISTS users_fts_update",
+    "DROP TABLE IF EXISTS users_fts",
+)
+
+_SEARCH_INDEX_PROBE = {
+    'sqlite': "SELECT 1 FROM sqlite_master WHERE name = 'users_fts'",
+    'postgresql': "SELECT 1 FROM pg_indexes WHERE indexname = 'idx_user_email_trgm'",
+}
+
+# Présence de l'index plein texte, par moteur
+_available: Dict[str, bool] = {}
+
+# Colonnes renvoyées par la recherche
+_RESULT_COLUMNS = (
+    User.id, User.username, User.email, User.role, User.country, User.balance,
+    User.is_active, User.created_at, User.last_login
+)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def prefix_condition(column, term: str):
+    """
+    Condition « commence par term » (insensible à la casse) servie par l'index B-tree sur lower(colonne) :
+    intervalle [term, term suivant) pour la recherche d'index, LIKE pour l'exactitude
+    """
+    term = term.lower()
+    lowered = func.lower(column)
+    condition = and_(lowered >= term, lowered.like(f"{_escape_like(term)}%", escape='\\'))
+    if ord(term[-1]) < 0x10FFFF:
+        condition = and_(condition, lowered < term[:-1] + chr(ord(term[-1]) + 1))
+    return condition
+
+
+def _legacy_sqlite_index(connection) -> bool:
+    # Table FTS5 existante sans content_rowid : clé sur le rowid implicite
+    sql = connection.execute(text("SELECT sql FROM sqlite_master WHERE name = 'users_fts'")).scalar()
+    return bool(sql) and 'search_rowid' not in sql
+
+
+def install_search_index(connection) -> bool:
+    """
+    Créer l'index plein texte du dialecte s'il n'existe pas (idempotent) ; sous SQLite, un index
+    d'avant search_rowid est remplacé (à réalimenter : rebuild_search_index).
+    Un échec (FTS5 absent, extension pg_trgm non autorisée) laisse la recherche par sous-chaîne sans index.
+
+    Returns:
+        bool: Index disponible
+    """
+    statements = _SEARCH_INDEX_DDL.get(connection.dialect.name)
+    if not statements:
+        return False
+    try:
+        with connection.begin_nested():
+            if connection.dialect.name == 'sqlite' and _legacy_sqlite_index(connection):
+                for statement in _LEGACY_SQLITE_INDEX:
+                    connection.execute(text(statement))
+            for statement in statements:
+                connection.execute(text(statement))
+    except Exception as e:
+        print(f"[Search] Index plein texte indisponible: {e}")
+        _available[str(connection.engine.url)] = False
+        return False
+    _available[str(connection.engine.url)] = True
+    return True
+
+
+@event.listens_for(User.__table__, 'after_create')
+def _install_on_create(target, connection, **kw):
+    install_search_index(connection)
+
+
+def rebuild_search_index() -> bool:
+    """
+    Créer l'index plein texte d'une base existante et l'alimenter avec les utilisateurs présents
+    (sous SQLite, clés search_rowid attribuées d'abord aux utilisateurs qui n'en ont pas)
+
+    Returns:
+        bool: Index disponible
+    """
+    connection = db.session.connection()
+    if not install_search_index(connection):
+        db.session.rollback()
+        return False
+    if connection.dialect.name == 'sqlite':
+        # rowid + max : distincts entre eux (rowid unique) et des clés déjà attribuées
+        offset = connection.execute(text("SELECT coalesce(max(search_rowid), 0) FROM users")).scalar()
+        connection.execute(
+            text("UPDATE users SET search_rowid = rowid + :offset WHERE search_rowid IS NULL"),
+            {'offset': offset}
+        )
+        connection.execute(text("INSERT INTO users_fts(users_fts) VALUES ('rebuild')"))
+    db.session.commit()
+    return True
+
+
+def upgrade_search_index() -> bool:
+    """
+    Au démarrage : reconstruire un index SQLite d'avant search_rowid (ses clés, rowid implicites,
+    ne désignent plus les bons utilisateurs après un VACUUM). Sans effet sinon.
+
+    Returns:
+        bool: Index reconstruit
+    """
+    connection = db.session.connection()
+    if connection.dialect.name != 'sqlite' or not _legacy_sqlite_index(connection):
+        db.session.rollback()
+        return False
+    return rebuild_search_index()
+
+
+def text_search_available() -> bool:
+    """Index plein texte présent dans la base courante (vérifié une fois par moteur)"""
+    engine = db.engine
+    key = str(engine.url)
+    if key not in _available:
+        probe = _SEARCH_INDEX_PROBE.get(engine.dialect.name)
+        _available[key] = bool(probe and db.session.execute(text(probe)).first())
+    return _available[key]
+
+
+def _prefix_tier(column, term: str, exclude=None):
+    # Parcours ordonné de l'index sur lower(colonne) : s'arrête dès que la page est remplie
+    query = select(*_RESULT_COLUMNS).where(prefix_condition(column, term))
+    if exclude is not None:
+        query = query.where(~exclude)
+    return query.order_by(func.lower(column), User.id)
+
+
+def _substring_tier(term: str, exclude):
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        # Candidats lus dans l'index trigramme sans tri global (bm25 parcourrait toutes les correspondances),
+        # classés par proximité : correspondance dans le nom d'utilisateur d'abord, noms les plus courts ensuite
+        match = '"' + term.replace('"', '""') + '"'
+        candidates = (
+            text("SELECT rowid FROM users_fts WHERE users_fts MATCH :match LIMIT :cap")
+            .bindparams(match=match, cap=MAX_TEXT_CANDIDATES)
+            .columns(literal_column('rowid'))
+            .subquery('fts')
+        )
+        in_username = func.instr(func.lower(User.username), term.lower()) > 0
+        return (
+            select(*_RESULT_COLUMNS)
+            .select_from(User)
+            .join(candidates, candidates.c.rowid == User.search_rowid)
+            .where(~exclude)
+            .order_by(case((in_username, 0), else_=1), func.length(User.username), User.id)
+        )
+
+    # PostgreSQL : LIKE '%terme%' servi par les index GIN trigrammes, classé par similarité
+    lowered = term.lower()
+    substring = f"%{_escape_like(lowered)}%"
+    similarity = func.greatest(
+        func.similarity(func.lower(User.username), lowered),
+        func.similarity(func.lower(User.email), lowered)
+    )
+    return (
+        select(*_RESULT_COLUMNS)
+        .where(or_(
+            func.lower(User.username).like(substring, escape='\\'),
+            func.lower(User.email).like(substring, escape='\\')
+        ), ~exclude)
+        .order_by(similarity.desc(), User.id)
+    )
+
+
+def search_users(term: str, limit: int = 20, offset: int = 0) -> Tuple[List[Dict], Optional[int], str]:
+    """
+    Rechercher des utilisateurs par nom d'utilisateur ou email, résultats classés par niveau :
+    1. préfixe du nom d'utilisateur, 2. préfixe de l'email (ordre alphabétique, index sur lower(...)),
+    3. sous-chaîne via l'index plein texte (FTS5 trigramme sous SQLite, pg_trgm sous PostgreSQL),
+       à partir de MIN_TEXT_SEARCH_LENGTH caractères.
+    Chaque niveau lit au plus offset + limit + 1 lignes : le coût ne dépend pas du nombre de correspondances.
+
+    Returns:
+        tuple: (utilisateurs, offset de la page suivante ou None, mode 'prefix' / 'text')
+
+    Raises:
+        ValueError: Terme vide ou offset hors limites
+    """
+    term = (term or '').strip()
+    if not term:
+        raise ValueError('Le paramètre q est requis')
+    if offset < 0 or offset > MAX_SEARCH_OFFSET:
+        raise ValueError(f'offset doit être compris entre 0 et {MAX_SEARCH_OFFSET}')
+
+    username_prefix = prefix_condition(User.username, term)
+    email_prefix = prefix_condition(User.email, term)
+    tiers = [_prefix_tier(User.username, term), _prefix_tier(User.email, term, exclude=username_prefix)]
+    mode = 'prefix'
+    if len(term) >= MIN_TEXT_SEARCH_LENGTH and text_search_available():
+        tiers.append(_substring_tier(term, or_(username_prefix, email_prefix)))
+        mode = 'text'
+
+    # Niveaux disjoints, lus dans l'ordre jusqu'à couvrir la page demandée (et une ligne de plus)
+    window = offset + limit + 1
+    rows = []
+    for query in tiers:
+        if len(rows) >= window:
+            break
+        rows.extend(db.session.execute(query.limit(window - len(rows))).all())
+
+    next_offset = offset + limit if len(rows) == window else None
+    return [row._asdict() for row in rows[offset:offset + limit]], next_offset, mode
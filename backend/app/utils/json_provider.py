@@ -0,0 +1,51 @@
+import decimal
+import orjson
+from flask.json.provider import JSONProvider
+
+
+def _default(obj):
+    """
+    Types non gérés nativement par orjson (datetime, date, UUID, dataclasses et numpy le sont),
+    convertis comme par le fournisseur par défaut de Flask (Decimal en chaîne, sans perte de précision)
+    """
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Fournisseur JSON de l'application basé sur orjson.
+    Les datetimes sont sérialisés nativement au format ISO 8601 (identique à isoformat()),
+    les modèles n'ont donc plus à les convertir dans leurs to_dict.
+    Comme le fournisseur par défaut de Flask : clés triées, indentation en mode debug.
+    """
+    sort_keys = True
+    compact = None
+    mimetype = 'application/json'
+
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _dump_bytes(self, obj, indent=False):
+        return orjson.dumps(obj, default=_default, option=self._options(indent))
+
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj, indent=bool(kwargs.get('indent'))).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._dump_bytes(obj, indent) + b'\n', mimetype=self.mimetype)
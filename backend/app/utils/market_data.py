@@ -22,6 +22,24 @@ SYMBOL_MAPPING = {
     'SOL-USD': 'SOL-USD',
 }
 
+# Classes d'actifs (mêmes valeurs que Asset.asset_type)
+ASSET_CLASSES = ('stock', 'forex', 'crypto', 'commodity')
+
+
+def asset_class(symbol: str) -> str:
+    """
+    Classe d'actif d'un symbole tradé, déduite de son ticker Yahoo Finance
+    (=F : matière première, =X : forex, -USD : crypto, sinon action, y compris la Bourse de Casablanca)
+    """
+    ticker = SYMBOL_MAPPING.get(symbol.upper().strip(), symbol.upper().strip())
+    if ticker.endswith('=F'):
+        return 'commodity'
+    if ticker.endswith('=X'):
+        return 'forex'
+    if ticker.endswith('-USD'):
+        return 'crypto'
+    return 'stock'
+
 def get_stock_quote(symbol: str) -> Optional[Dict]:
     """
     Obtenir les dernières données de cotation
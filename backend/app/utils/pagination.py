@@ -0,0 +1,114 @@
+import base64
+from datetime import datetime
+from sqlalchemy import or_, and_
+
+# Taille de page par défaut et maximale des listes paginées
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(value, row_id):
+    """
+    Encoder la position (clé de tri, id) du dernier élément d'une page en curseur opaque
+
+    Args:
+        value (datetime or number or None): Clé de tri de l'élément (horodatage le plus souvent) ;
+            None pour une clé nulle, encodée vide
+        row_id (str): ID de l'élément (départage les clés égales)
+
+    Returns:
+        str: Curseur encodé en base64 URL-safe
+    """
+    if value is None:
+        encoded = ''
+    elif isinstance(value, datetime):
+        encoded = value.isoformat()
+    else:
+        encoded = repr(value)
+    raw = f"{encoded}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor, value_type=datetime, id_type=str):
+    """
+    Décoder un curseur produit par encode_cursor
+
+    Args:
+        value_type (type): Type de la clé de tri (datetime, float, int)
+        id_type (type): Type de l'ID (str, int)
+
+    Returns:
+        tuple: (clé de tri ou None si nulle, id)
+
+    Raises:
+        ValueError: Curseur invalide
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        value, row_id = raw.split('|', 1)
+        if value == '':
+            return None, id_type(row_id)
+        return (datetime.fromisoformat(value) if value_type is datetime else value_type(value)), id_type(row_id)
+    except Exception:
+        raise ValueError('Curseur invalide')
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """
+    Lire la taille de page demandée, bornée entre 1 et maximum
+
+    Raises:
+        ValueError: Valeur non entière
+    """
+    if value is None or value == '':
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('limit doit être un entier')
+    return max(1, min(limit, maximum))
+
+
+def keyset_page(query, ts_column, id_column, cursor=None, limit=DEFAULT_PAGE_SIZE, descending=True):
+    """
+    Page suivante d'une requête triée par (clé, id), par recherche de clé plutôt que
+    par OFFSET : le coût ne dépend pas de la profondeur de la liste
+
+    Args:
+        query: Requête SQLAlchemy (déjà filtrée) ; entités ORM ou lignes projetées
+            contenant les colonnes de tri sous leur nom
+        ts_column: Colonne de tri (horodatage le plus souvent) ; les clés nulles
+            sont placées en fin de liste, dans les deux ordres
+        id_column: Colonne d'ID
+        cursor (str, optional): Curseur retourné par la page précédente
+        limit (int): Taille de page
+        descending (bool): Ordre décroissant (par défaut) ou croissant
+
+    Returns:
+        tuple: (éléments, curseur suivant ou None)
+    """
+    if cursor:
+        cursor_value, cursor_id = decode_cursor(cursor, ts_column.type.python_type, id_column.type.python_type)
+        after_id = id_column < cursor_id if descending else id_column > cursor_id
+        if cursor_value is None:
+            # Déjà dans la queue des clés nulles : ne reste que l'ordre des IDs
+            query = query.filter(ts_column.is_(None), after_id)
+        else:
+            after_value = ts_column < cursor_value if descending else ts_column > cursor_value
+            query = query.filter(or_(
+                after_value,
+                and_(ts_column == cursor_value, after_id),
+                ts_column.is_(None)
+            ))
+
+    if descending:
+        query = query.order_by(ts_column.desc().nulls_last(), id_column.desc())
+    else:
+        query = query.order_by(ts_column.asc().nulls_last(), id_column.asc())
+    items = query.limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor(getattr(last, ts_column.key), getattr(last, id_column.key))
@@ -0,0 +1,72 @@
+import logging
+from typing import List
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Colonnes ajoutées à des tables existantes : create_all ne modifie jamais une table déjà créée,
+# elles sont donc ajoutées au démarrage (ALTER TABLE ... ADD COLUMN) sur les bases qui ne les ont pas.
+# (table, colonne, type et contraintes en SQL portable SQLite / PostgreSQL)
+ADDED_COLUMNS = [
+    ('ts_trades', 'stop_loss', 'FLOAT'),
+    ('ts_trades', 'take_profit', 'FLOAT'),
+    ('ts_trades', 'close_reason', 'VARCHAR(20)'),
+    ('challenges', 'version', 'INTEGER DEFAULT 0 NOT NULL'),
+    ('leaderboards', 'challenge_id', 'VARCHAR(36)'),
+    ('leaderboards', 'country', 'VARCHAR(100)'),
+    ('leaderboards', 'profit_value', 'FLOAT'),
+    ('users', 'search_rowid', 'INTEGER'),
+]
+
+# Données complétées une fois sur les bases existantes (requêtes idempotentes) : (table, requête)
+BACKFILLS = [
+    # Fin des challenges terminés avant que completed_at soit posé à chaque transition : jour de
+    # la dernière modification, celui qu'utilisaient jusque-là les agrégats journaliers
+    ('challenges', "UPDATE challenges SET completed_at = updated_at "
+                   "WHERE completed_at IS NULL AND status IN ('passed', 'failed')"),
+]
+
+
+def upgrade_schema(engine, metadata) -> List[str]:
+    """
+    Mettre une base existante au niveau des modèles, après create_all :
+    colonnes de ADDED_COLUMNS absentes, index déclarés sur des tables déjà créées, puis BACKFILLS.
+    Idempotent : ne modifie pas une base à jour.
+
+    Returns:
+        list: Colonnes ajoutées
+    """
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    columns = {}
+    applied = []
+
+    with engine.begin() as conn:
+        for table, column, ddl in ADDED_COLUMNS:
+            if table not in tables:
+                continue
+            if table not in columns:
+                columns[table] = {c['name'] for c in inspector.get_columns(table)}
+            if column in columns[table]:
+                continue
+            conn.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+            columns[table].add(column)
+            applied.append(f'{table}.{column}')
+
+        # Index des tables existantes (create_all ne les crée qu'avec la table) ; IF NOT EXISTS
+        # plutôt que la réflexion, qui ignore les index sur expression (lower(username))
+        for table in metadata.sorted_tables:
+            if table.name in tables:
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+
+        for table, statement in BACKFILLS:
+            if table in tables:
+                conn.execute(text(statement))
+
+    if applied:
+        logger.info(f"Schema upgraded: {', '.join(applied)}")
+    return applied
@@ -0,0 +1,29 @@
+from sqlalchemy.dialects import postgresql, sqlite, mysql
+
+
+def upsert(bind, table, rows, index_elements, update_set):
+    """
+    Construire un INSERT ... ON CONFLICT DO UPDATE propre au dialecte (PostgreSQL, SQLite, MySQL)
+
+    Args:
+        bind: Moteur ou connexion (pour le dialecte)
+        table: Table cible
+        rows (dict or list): Ligne(s) à insérer
+        index_elements (list): Colonnes de la contrainte d'unicité
+        update_set (callable): excluded -> dict des colonnes à mettre à jour en cas de conflit,
+            'excluded' désignant la ligne proposée (ex: {'n': table.c.n + excluded.n})
+
+    Returns:
+        Insert: Requête prête à exécuter
+    """
+    dialect = bind.dialect.name
+    if dialect == 'postgresql':
+        stmt = postgresql.insert(table).values(rows)
+        return stmt.on_conflict_do_update(index_elements=index_elements, set_=update_set(stmt.excluded))
+    if dialect == 'sqlite':
+        stmt = sqlite.insert(table).values(rows)
+        return stmt.on_conflict_do_update(index_elements=index_elements, set_=update_set(stmt.excluded))
+    if dialect in ('mysql', 'mariadb'):
+        stmt = mysql.insert(table).values(rows)
+        return stmt.on_duplicate_key_update(**update_set(stmt.inserted))
+    raise ValueError(f"Upsert non supporté pour le dialecte: {dialect}")
@@ -19,6 +19,10 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'une_cle_secrete_par_defaut_difficile_a_deviner'
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt_secret_par_defaut'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Intervalle (secondes) du rafraîchissement des cotations qui alimente les stop loss / take profit
+    # et les ordres en attente ; 0 désactive le thread
+    QUOTE_REFRESH_INTERVAL = float(os.environ.get('QUOTE_REFRESH_INTERVAL', 10))
     
     # Cors autorisés pour le frontend
     CORS_ORIGINS = [
@@ -61,12 +65,23 @@ class ProductionConfig(Config):
     ]
 
 
+# =================================================================
+# Configuration pour les tests (base SQLite en mémoire, une par application)
+# =================================================================
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    JWT_SECRET_KEY = 'jwt-secret-de-test-assez-long-pour-hs256'
+    QUOTE_REFRESH_INTERVAL = 0
+
+
 # =================================================================
 # Dictionnaire pour sélectionner la configuration
 # =================================================================
 config = {
     'development': DevelopmentConfig,
     'production': ProductionConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig
 }
 
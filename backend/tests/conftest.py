@@ -0,0 +1,94 @@
+import sqlite3
+import pytest
+import config as app_config
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models import User, Challenge
+from app.services.equity_service import equity_writer
+from app.services.audit_service import audit_writer
+
+
+@pytest.fixture
+def app():
+    """Application de test : base SQLite en mémoire propre à chaque test"""
+    app = create_app('testing')
+    with app.app_context():
+        yield app
+        db.session.remove()
+        # Vider les writers globaux dans la base de ce test avant de la détruire
+        equity_writer.flush()
+        audit_writer.flush()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    counter = iter(range(1, 1000000))
+
+    def factory(role='user', **kwargs):
+        n = next(counter)
+        user = User(username=kwargs.pop('username', f'user{n}'), email=kwargs.pop('email', f'user{n}@test.ma'),
+                    password_hash='x', role=role, **kwargs)
+        db.session.add(user)
+        db.session.commit()
+        return user
+    return factory
+
+
+@pytest.fixture
+def make_challenge(app):
+    def factory(user, initial_balance=10000.0, **kwargs):
+        challenge = Challenge(user_id=user.id, initial_balance=initial_balance,
+                              current_balance=kwargs.pop('current_balance', initial_balance), **kwargs)
+        db.session.add(challenge)
+        db.session.commit()
+        return challenge
+    return factory
+
+
+@pytest.fixture
+def auth_headers(app):
+    def factory(user):
+        return {'Authorization': f'Bearer {create_access_token(identity=user.id)}'}
+    return factory
+
+
+@pytest.fixture
+def quotes(app, monkeypatch):
+    """Cotations fixées par le test (aucun accès réseau) : quotes['AAPL'] = 100.0"""
+    from app.services import killer_service, price_service
+    from app.routes import trading_routes, price_routes
+
+    prices = {}
+
+    def fake_quote(symbol):
+        price = prices.get(symbol.upper().strip())
+        return {'symbol': symbol, 'price': price} if price is not None else None
+
+    for module in (killer_service, price_service, trading_routes, price_routes):
+        monkeypatch.setattr(module, 'get_stock_quote', fake_quote)
+        monkeypatch.setattr(module, 'get_moroccan_stock_price', fake_quote)
+    price_service.price_cache.clear()
+    return prices
+
+
+@pytest.fixture
+def app_on_file(tmp_path, monkeypatch):
+    """Créer une application sur un fichier SQLite préparé par le test"""
+    path = tmp_path / 'legacy.db'
+
+    def factory(script):
+        connection = sqlite3.connect(path)
+        connection.executescript(script)
+        connection.close()
+
+        class LegacyConfig(app_config.TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        monkeypatch.setitem(app_config.config, 'legacy', LegacyConfig)
+        return create_app('legacy')
+    return factory
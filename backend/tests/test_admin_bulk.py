@@ -0,0 +1,126 @@
+import pytest
+from app import db
+from app.models import User, Challenge, DailyRollup
+from app.services.rollup_service import backfill_rollups
+
+
+def _buckets():
+    return sorted((r.metric, r.dimension, r.day, r.count) for r in DailyRollup.query.all() if r.count)
+
+
+def _bulk(client, headers, target, **body):
+    return client.post(f'/api/admin/{target}/bulk', headers=headers, json=body)
+
+
+def _statuses(challenges):
+    db.session.expire_all()
+    return [db.session.get(Challenge, c.id).status for c in challenges]
+
+
+def test_set_status_on_ids_and_filter(app, client, make_user, make_challenge, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    owner = make_user()
+    mine = [make_challenge(owner) for _ in range(2)]
+    others = [make_challenge(make_user()) for _ in range(2)]
+
+    response = _bulk(client, headers, 'challenges', action='set_status', status='failed', reason='fraude',
+                     ids=[others[0].id, others[0].id])
+    assert response.status_code == 200, response.json
+    assert response.json == {'action': 'set_status', 'requested': 1, 'updated': 1}
+    assert db.session.get(Challenge, others[0].id).failed_reason == 'fraude'
+
+    response = _bulk(client, headers, 'challenges', action='set_status', status='passed',
+                     filter={'user_id': owner.id})
+    assert response.json['updated'] == 2
+    assert _statuses(mine + others) == ['passed', 'passed', 'failed', 'active']
+
+    # Déjà dans ce statut : rien n'est touché
+    response = _bulk(client, headers, 'challenges', action='set_status', status='passed',
+                     filter={'user_id': owner.id})
+    assert response.json['updated'] == 0
+
+    incremental = _buckets()
+    backfill_rollups()
+    assert incremental == _buckets()
+
+
+def test_adjust_challenges_balance(app, client, make_user, make_challenge, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    targeted = make_challenge(make_user())
+    untouched = make_challenge(make_user())
+
+    response = _bulk(client, headers, 'challenges', action='adjust_balance', amount='250.5', ids=[targeted.id])
+    assert response.json['updated'] == 1
+
+    db.session.expire_all()
+    assert db.session.get(Challenge, targeted.id).current_balance == 10250.5
+    assert db.session.get(Challenge, targeted.id).version == 1
+    assert db.session.get(Challenge, untouched.id).current_balance == 10000.0
+
+
+def test_deactivate_fails_active_challenges(app, client, make_user, make_challenge, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    user = make_user(country='Maroc')
+    bystander = make_user(country='France')
+    active, passed = make_challenge(user), make_challenge(user, status='passed')
+    other = make_challenge(bystander)
+
+    response = _bulk(client, headers, 'users', action='deactivate', fail_challenges=True, reason='chargeback',
+                     filter={'country': 'Maroc'})
+    assert response.status_code == 200, response.json
+    assert response.json['users'] == 1 and response.json['challenges_failed'] == 1
+
+    db.session.expire_all()
+    assert db.session.get(User, user.id).is_active is False
+    assert db.session.get(User, bystander.id).is_active is True
+    assert _statuses([active, passed, other]) == ['failed', 'passed', 'active']
+    assert db.session.get(Challenge, active.id).failed_reason == 'chargeback'
+
+    incremental = _buckets()
+    backfill_rollups()
+    assert incremental == _buckets()
+
+    response = _bulk(client, headers, 'users', action='activate', ids=[user.id])
+    assert response.json['users'] == 1
+
+
+def test_adjust_users_balance(app, client, make_user, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    user = make_user(balance=100.0)
+
+    response = _bulk(client, headers, 'users', action='adjust_balance', amount=-40, ids=[user.id])
+    assert response.json['users'] == 1
+    db.session.expire_all()
+    assert db.session.get(User, user.id).balance == 60.0
+
+
+@pytest.mark.parametrize('target', ['challenges', 'users'])
+@pytest.mark.parametrize('body', [
+    {'action': 'drop'},
+    {'action': 'adjust_balance', 'amount': 'nan'},
+    {'action': 'adjust_balance', 'amount': 'inf'},
+    {'action': 'adjust_balance', 'amount': '-inf'},
+    {'action': 'adjust_balance', 'amount': 'abc'},
+    {'action': 'adjust_balance', 'amount': 0},
+    {'action': 'adjust_balance'},
+])
+def test_bad_action_or_amount_is_rejected(app, client, make_user, make_challenge, auth_headers, target, body):
+    headers = auth_headers(make_user(role='admin'))
+    user = make_user(balance=100.0)
+    challenge = make_challenge(user)
+    ids = [challenge.id] if target == 'challenges' else [user.id]
+
+    response = _bulk(client, headers, target, ids=ids, **body)
+    assert response.status_code == 400
+
+    db.session.expire_all()
+    assert db.session.get(Challenge, challenge.id).current_balance == 10000.0
+    assert db.session.get(User, user.id).balance == 100.0
+
+
+def test_bad_target_is_rejected(app, client, make_user, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    assert _bulk(client, headers, 'challenges', action='set_status', status='passed').status_code == 400
+    assert _bulk(client, headers, 'challenges', action='set_status', status='passed', ids=[]).status_code == 400
+    assert _bulk(client, headers, 'users', action='activate', filter={'q': ''}).status_code == 400
+    assert _bulk(client, headers, 'challenges', action='set_status', status='won', ids=['x']).status_code == 400
@@ -0,0 +1,35 @@
+import pytest
+from app import db
+from app.models import Challenge
+
+
+def _all_pages(client, headers, **params):
+    ids, cursor = [], None
+    while True:
+        query = dict(params, **({'cursor': cursor} if cursor else {}))
+        response = client.get('/api/admin/challenges', headers=headers, query_string=query)
+        assert response.status_code == 200, response.json
+        ids += [c['id'] for c in response.json['challenges']]
+        cursor = response.json['next_cursor']
+        if not cursor:
+            return ids
+
+
+@pytest.mark.parametrize('sort', ['created_at', 'updated_at', 'current_balance'])
+@pytest.mark.parametrize('order', ['desc', 'asc'])
+def test_pages_cover_challenges_with_null_sort_keys(app, client, make_user, make_challenge, auth_headers,
+                                                    sort, order):
+    admin = make_user(role='admin')
+    challenges = [make_challenge(make_user(), current_balance=10000.0 + i) for i in range(5)]
+    # Lignes anciennes sans horodatage (colonnes nullables)
+    legacy_ids = [c.id for c in challenges[:3]]
+    db.session.query(Challenge).filter(Challenge.id.in_(legacy_ids)) \
+        .update({'created_at': None, 'updated_at': None}, synchronize_session=False)
+    db.session.commit()
+
+    ids = _all_pages(client, auth_headers(admin), sort=sort, order=order, limit=2)
+
+    assert sorted(ids) == sorted(c.id for c in challenges)
+    assert len(ids) == len(set(ids))
+    if sort != 'current_balance':
+        assert set(ids[2:]) == set(legacy_ids)
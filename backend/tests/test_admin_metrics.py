@@ -0,0 +1,38 @@
+from app import db
+from app.services import admin_metrics
+from app.services.admin_actions import set_challenges_status
+from app.models import Challenge
+
+
+def _cached():
+    return 'metrics' in admin_metrics._metrics_cache
+
+
+def test_computation_overtaken_by_invalidation_is_not_cached(app, monkeypatch):
+    compute = admin_metrics.compute_admin_metrics
+
+    def racing_compute():
+        metrics = compute()
+        admin_metrics.invalidate_admin_metrics()
+        return metrics
+
+    admin_metrics.invalidate_admin_metrics()
+    monkeypatch.setattr(admin_metrics, 'compute_admin_metrics', racing_compute)
+    admin_metrics.get_admin_metrics()
+    assert not _cached()
+
+
+def test_bulk_status_change_invalidates_but_balance_increment_does_not(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    admin_metrics.invalidate_admin_metrics()
+    assert admin_metrics.get_admin_metrics()['active_challenges'] == 1
+
+    challenge.apply_pnl(50.0)
+    db.session.commit()
+    assert _cached()
+
+    set_challenges_status(Challenge.id == challenge.id, 'failed', 'admin')
+    assert _cached()
+    db.session.commit()
+    assert not _cached()
+    assert admin_metrics.get_admin_metrics()['failed_challenges'] == 1
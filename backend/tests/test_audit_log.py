@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import event, update, delete
+from sqlalchemy.exc import DatabaseError
+from sqlalchemy.orm import Session
+from app import db
+from app.models import AuditLog, Challenge
+from app.services import audit_service
+from app.services.audit_service import audit_writer, record_admin_action
+from app.services.batch_writer import BufferedWriter
+
+
+@pytest.fixture
+def idle_writer(app, monkeypatch):
+    # Writer sans thread de vidage : toute écriture du journal serait visible dans le test
+    writer = BufferedWriter(AuditLog, flush_size=1000, flush_interval=3600)
+    writer._app = app
+    monkeypatch.setattr(audit_service, 'audit_writer', writer)
+    return writer
+
+
+def _entry(action='challenge.status', created_at=None, **row):
+    return dict({'created_at': created_at or datetime.utcnow(), 'actor_id': 'admin-1', 'action': action,
+                 'target_type': 'challenge', 'target_id': None, 'before': None, 'after': None, 'ip': None}, **row)
+
+
+def test_admin_action_is_buffered_without_insert_or_extra_commit(app, client, make_user, make_challenge,
+                                                                  auth_headers, idle_writer):
+    admin = make_user(role='admin')
+    headers = auth_headers(admin)
+    challenge = make_challenge(make_user())
+    statements, commits = [], []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    def record_commit(session):
+        commits.append(session)
+
+    event.listen(db.engine, 'before_cursor_execute', record_statement)
+    event.listen(Session, 'after_commit', record_commit)
+    try:
+        response = client.patch(f'/api/admin/challenge/{challenge.id}/status', headers=headers,
+                                json={'status': 'failed'})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record_statement)
+        event.remove(Session, 'after_commit', record_commit)
+
+    assert response.status_code == 200, response.json
+    assert not [s for s in statements if 'audit_logs' in s]
+    assert len(commits) == 1
+    [row] = idle_writer.pending_rows(lambda row: True)
+    assert (row['actor_id'], row['action'], row['target_id'], row['before'], row['after']) == \
+        (admin.id, 'challenge.status', challenge.id, {'status': 'active'}, {'status': 'failed'})
+
+    assert idle_writer.flush() == 1
+    assert AuditLog.query.one().target_id == challenge.id
+
+
+def test_failed_or_rejected_action_leaves_no_entry(app, client, make_user, make_challenge, auth_headers,
+                                                    idle_writer, monkeypatch):
+    headers = auth_headers(make_user(role='admin'))
+    challenge = make_challenge(make_user())
+
+    response = client.post('/api/admin/challenges/bulk', headers=headers,
+                           json={'action': 'adjust_balance', 'amount': 'nan', 'ids': [challenge.id]})
+    assert response.status_code == 400
+
+    def failing_commit():
+        raise RuntimeError('base indisponible')
+
+    monkeypatch.setattr(db.session, 'commit', failing_commit)
+    response = client.patch(f'/api/admin/challenge/{challenge.id}/status', headers=headers,
+                            json={'status': 'failed'})
+    monkeypatch.undo()
+
+    assert response.status_code == 500
+    assert db.session.get(Challenge, challenge.id).status == 'active'
+    assert idle_writer.pending() == 0
+
+
+def test_audit_log_is_append_only(app):
+    audit_writer.add(_entry())
+    assert audit_writer.flush() == 1
+
+    for statement in (update(AuditLog).values(action='effacé'), delete(AuditLog)):
+        with pytest.raises(DatabaseError, match='ajout seul'):
+            db.session.execute(statement)
+        db.session.rollback()
+    assert AuditLog.query.one().action == 'challenge.status'
+
+
+def _pages(client, headers, **params):
+    ids, cursor = [], None
+    while True:
+        query = dict(params, **({'cursor': cursor} if cursor else {}))
+        response = client.get('/api/admin/audit', headers=headers, query_string=query)
+        assert response.status_code == 200, response.json
+        ids += [entry['id'] for entry in response.json['entries']]
+        cursor = response.json['next_cursor']
+        if not cursor:
+            return ids
+
+
+def test_audit_pages_and_filters(app, client, make_user, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    start = datetime(2024, 3, 1)
+    for i in range(7):
+        # Deux entrées par horodatage : départagées par id
+        audit_writer.add(_entry('user.delete' if i % 3 == 0 else 'challenge.status',
+                                created_at=start + timedelta(days=i // 2), actor_id=f'admin-{i % 2}',
+                                target_id=f'c{i}'))
+    audit_writer.flush()
+    # Entrée encore en tampon : lue par la route sans attendre le vidage
+    record_admin_action('setting.update', 'setting', 'paypal', actor_id='admin-9')
+    response = client.get('/api/admin/audit', headers=headers, query_string={'limit': 1})
+    assert response.json['entries'][0]['action'] == 'setting.update'
+
+    expected = [e.id for e in AuditLog.query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())]
+    assert len(expected) == 8
+    assert _pages(client, headers, limit=3) == expected
+
+    def ids(**params):
+        return _pages(client, headers, limit=2, **params)
+
+    def targets(entry_ids):
+        return sorted(db.session.get(AuditLog, i).target_id for i in entry_ids)
+
+    assert targets(ids(action='user.delete')) == ['c0', 'c3', 'c6']
+    assert targets(ids(actor_id='admin-1')) == ['c1', 'c3', 'c5']
+    assert targets(ids(target_type='challenge', target_id='c4')) == ['c4']
+    assert targets(ids(**{'from': '2024-03-02', 'to': '2024-03-03T00:00:00'})) == ['c2', 'c3', 'c4', 'c5']
+
+
+@pytest.mark.parametrize('params', [{'cursor': 'pas-un-curseur'}, {'from': 'hier'}, {'to': '2024-13-01'},
+                                    {'limit': 'beaucoup'}])
+def test_bad_audit_parameters_are_rejected(app, client, make_user, auth_headers, params):
+    response = client.get('/api/admin/audit', headers=auth_headers(make_user(role='admin')), query_string=params)
+    assert response.status_code == 400
+
+
+def test_audit_log_requires_admin(app, client, make_user, auth_headers):
+    assert client.get('/api/admin/audit', headers=auth_headers(make_user())).status_code == 403
@@ -0,0 +1,83 @@
+import time
+from sqlalchemy import select, func
+from app import db
+from app.models import EquitySnapshot
+from app.services import equity_service
+from app.services.batch_writer import BufferedWriter
+from app.services.equity_service import get_equity_curve, record_equity
+
+
+def _writer(app):
+    # Writer lié à l'application sans thread de vidage : les tests vident explicitement
+    writer = BufferedWriter(EquitySnapshot, flush_size=1000, flush_interval=3600)
+    writer._app = app
+    return writer
+
+
+def _snapshot(challenge_id, ts, equity=10000.0):
+    return {'challenge_id': challenge_id, 'ts': ts, 'equity': equity, 'balance': equity}
+
+
+def _count():
+    return db.session.execute(select(func.count(EquitySnapshot.id))).scalar()
+
+
+def test_flush_writes_batch(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    writer = _writer(app)
+    for ts in range(10):
+        writer.add(_snapshot(challenge.id, ts))
+
+    assert writer.flush() == 10
+    assert writer.pending() == 0
+    assert _count() == 10
+
+
+def test_invalid_row_is_dropped_without_blocking_the_batch(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    writer = _writer(app)
+    writer.add(_snapshot(challenge.id, 1))
+    writer.add({'challenge_id': challenge.id, 'ts': 2, 'equity': None, 'balance': 1.0})  # NOT NULL violé
+    writer.add(_snapshot(challenge.id, 3))
+
+    assert writer.flush() == 2
+    assert writer.pending() == 0
+    assert _count() == 2
+
+    # Les lots suivants ne sont pas bloqués
+    writer.add(_snapshot(challenge.id, 4))
+    assert writer.flush() == 1
+    assert _count() == 3
+
+
+def test_equity_curve_includes_buffered_points_without_flushing(app, make_user, make_challenge, monkeypatch):
+    challenge = make_challenge(make_user())
+    writer = _writer(app)
+    monkeypatch.setattr(equity_service, 'equity_writer', writer)
+    writer.add(_snapshot(challenge.id, 100, 10100.0))
+    writer.flush()
+    writer.add(_snapshot(challenge.id, 200, 9900.0))
+    writer.add(_snapshot('autre-challenge', 150, 1.0))
+
+    curve = get_equity_curve(challenge)
+
+    assert [p['t'] for p in curve['points']] == [100, 200]
+    assert curve['max_drawdown'] == 200.0
+    assert writer.pending() == 2
+    assert get_equity_curve(challenge, since=150)['count'] == 1
+
+
+def test_sampling_state_is_pruned(app, monkeypatch):
+    monkeypatch.setattr(equity_service, 'equity_writer', _writer(app))
+    monkeypatch.setattr(equity_service, '_last_sample', {})
+    now = int(time.time())
+    monkeypatch.setattr(equity_service, '_last_prune', now)
+
+    for i in range(50):
+        record_equity(f'c{i}', 1.0, 1.0)
+    assert len(equity_service._last_sample) == 50
+
+    # Un intervalle plus tard, les entrées périmées sont purgées au prochain point
+    monkeypatch.setattr(time, 'time', lambda: now + equity_service.EQUITY_SAMPLE_INTERVAL)
+    record_equity('c0', 1.0, 1.0)
+    assert list(equity_service._last_sample) == ['c0']
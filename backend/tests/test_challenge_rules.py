@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+from app import db
+from app.models import Trade, PendingOrder, ChallengeStatus
+from app.services.killer_service import sweep_active_challenges
+
+
+def _trade(challenge, quantity=1, days_ago=0, closed=False, profit_loss=0.0, symbol='AAPL'):
+    trade = Trade(challenge_id=challenge.id, user_id=challenge.user_id, symbol=symbol, trade_type='BUY',
+                  quantity=quantity, entry_price=100.0, is_closed=closed, profit_loss=profit_loss,
+                  timestamp=datetime.utcnow() - timedelta(days=days_ago))
+    if closed:
+        trade.exit_price = 100.0
+    db.session.add(trade)
+    db.session.commit()
+    return trade
+
+
+def _execute(client, headers, challenge, **order):
+    payload = {'challenge_id': challenge.id, 'symbol': 'AAPL', 'type': 'BUY', 'quantity': 1, **order}
+    return client.post('/api/trading/execute', json=payload, headers=headers)
+
+
+def test_oversized_order_is_rejected_without_failing_the_challenge(app, client, make_user, make_challenge,
+                                                                  quotes, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)  # plan starter : 1000 par trade, 100 000 en forex
+    headers = auth_headers(user)
+    quotes.update({'AAPL': 100.0, 'EURUSD=X': 1.1})
+
+    response = _execute(client, headers, challenge, quantity=1001)
+    assert response.status_code == 400
+    assert '1000' in response.json['error']
+    assert Trade.query.count() == 0
+
+    assert _execute(client, headers, challenge, symbol='EURUSD=X', quantity=50000).status_code == 201
+    db.session.refresh(challenge)
+    assert challenge.status == ChallengeStatus.ACTIVE.value
+
+
+def test_open_positions_limit_applies_to_every_entry_path(app, client, make_user, make_challenge,
+                                                          quotes, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)  # plan starter : 10 positions
+    headers = auth_headers(user)
+    quotes['AAPL'] = 100.0
+    for _ in range(9):
+        _trade(challenge)
+
+    batch = {'challenge_id': challenge.id, 'orders': [{'symbol': 'AAPL', 'type': 'BUY', 'quantity': 1}] * 2}
+    assert client.post('/api/trading/execute/batch', json=batch, headers=headers).status_code == 400
+    response = client.post('/api/trading/execute/batch', json={**batch, 'mode': 'best_effort'}, headers=headers)
+    assert response.status_code == 201
+    assert len(response.json['trades']) == 1 and response.json['rejected'][0]['index'] == 1
+
+    assert _execute(client, headers, challenge).status_code == 400
+    order = {'challenge_id': challenge.id, 'symbol': 'AAPL', 'type': 'BUY', 'order_type': 'LIMIT',
+             'quantity': 1, 'price': 90.0}
+    assert client.post('/api/trading/orders', json=order, headers=headers).status_code == 400
+    assert PendingOrder.query.count() == 0
+
+    db.session.refresh(challenge)
+    assert challenge.status == ChallengeStatus.ACTIVE.value
+
+
+def test_sweep_does_not_fail_existing_large_positions(app, make_user, make_challenge, quotes):
+    challenge = make_challenge(make_user())
+    quotes['AAPL'] = 100.0
+    _trade(challenge, quantity=5000)
+    for _ in range(12):
+        _trade(challenge)
+
+    assert sweep_active_challenges() == []
+    db.session.refresh(challenge)
+    assert challenge.status == ChallengeStatus.ACTIVE.value
+
+
+def test_update_status_passes_with_enough_trading_days(app, make_user, make_challenge):
+    user = make_user()
+    one_day = make_challenge(user, current_balance=11000.0)
+    three_days = make_challenge(user, current_balance=11000.0)
+    _trade(one_day, closed=True, profit_loss=1000.0)
+    for day in range(3):
+        _trade(three_days, days_ago=day, closed=True, profit_loss=1000.0 / 3)
+
+    one_day.update_status()
+    three_days.update_status()
+
+    assert one_day.status == ChallengeStatus.ACTIVE.value
+    assert three_days.status == ChallengeStatus.PASSED.value
@@ -0,0 +1,92 @@
+import threading
+from app import db
+from app.models import Challenge, Trade, TradeAlreadyClosedError
+
+
+THREADS = 8
+CLOSES_PER_THREAD = 25
+
+
+def _setup(app):
+    from app.models import User
+    with app.app_context():
+        user = User(username='stress', email='stress@test.ma', password_hash='x')
+        db.session.add(user)
+        db.session.flush()
+        challenge = Challenge(user_id=user.id, initial_balance=10000.0, current_balance=10000.0)
+        db.session.add(challenge)
+        db.session.flush()
+        trades = [Trade(challenge_id=challenge.id, user_id=user.id, symbol='AAPL', trade_type='BUY',
+                        quantity=1, entry_price=100.0) for _ in range(THREADS * CLOSES_PER_THREAD)]
+        db.session.add_all(trades)
+        db.session.commit()
+        return challenge.id, [t.id for t in trades]
+
+
+def _run_threads(target, count):
+    errors = []
+    barrier = threading.Barrier(count)
+
+    def runner(index):
+        try:
+            barrier.wait()
+            target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=runner, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+
+
+def test_concurrent_closes_lose_no_balance_update(app_on_file):
+    """Plusieurs threads clôturent des trades du même challenge : aucun incrément de solde perdu"""
+    app = app_on_file('')
+    challenge_id, trade_ids = _setup(app)
+
+    def close_slice(index):
+        with app.app_context():
+            for trade_id in trade_ids[index::THREADS]:
+                trade = db.session.get(Trade, trade_id)
+                # Chaque thread lit un solde qui devient aussitôt périmé
+                challenge = db.session.get(Challenge, challenge_id)
+                trade.close_trade(101.0, challenge)
+                db.session.commit()
+
+    _run_threads(close_slice, THREADS)
+
+    with app.app_context():
+        challenge = db.session.get(Challenge, challenge_id)
+        assert challenge.current_balance == 10000.0 + len(trade_ids)
+        assert challenge.version == len(trade_ids)
+        assert Trade.query.filter_by(is_closed=True).count() == len(trade_ids)
+
+
+def test_same_trade_is_closed_once(app_on_file):
+    """Stop loss et clôture manuelle simultanés : une seule clôture est appliquée"""
+    app = app_on_file('')
+    challenge_id, trade_ids = _setup(app)
+    outcomes = []
+
+    def close_same(index):
+        with app.app_context():
+            trade = db.session.get(Trade, trade_ids[0])
+            try:
+                trade.close_trade(90.0 + index, db.session.get(Challenge, challenge_id))
+                db.session.commit()
+                outcomes.append('closed')
+            except TradeAlreadyClosedError:
+                db.session.rollback()
+                outcomes.append('already_closed')
+
+    _run_threads(close_same, THREADS)
+
+    assert outcomes.count('closed') == 1
+    with app.app_context():
+        challenge = db.session.get(Challenge, challenge_id)
+        trade = db.session.get(Trade, trade_ids[0])
+        assert challenge.current_balance == 10000.0 + trade.profit_loss
+        assert challenge.version == 1
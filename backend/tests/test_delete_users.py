@@ -0,0 +1,147 @@
+import pytest
+from sqlalchemy import select, func
+from app import db
+from app.models import (
+    User, Challenge, Trade, Payment, EquitySnapshot, PendingOrder, MonthlyProfit, MonthlyAssetProfit,
+    Leaderboard, CommunityPost, CommunityLike, TradingAccount, OriginalTrade
+)
+from app.services import equity_service
+from app.services.admin_actions import delete_users
+from app.services.batch_writer import BufferedWriter
+from app.services.equity_service import record_equity
+from app.services.order_book_service import order_book
+from app.services.trigger_service import protective_engine
+
+MODELS = (User, Challenge, Trade, Payment, EquitySnapshot, PendingOrder, MonthlyProfit, MonthlyAssetProfit,
+          Leaderboard, CommunityPost, CommunityLike, TradingAccount, OriginalTrade)
+
+
+@pytest.fixture
+def equity_writer(app, monkeypatch):
+    # Writer sans thread de vidage : le tampon ne se vide pas pendant le test
+    writer = BufferedWriter(EquitySnapshot, flush_size=1000, flush_interval=3600)
+    writer._app = app
+    monkeypatch.setattr(equity_service, 'equity_writer', writer)
+    return writer
+
+
+def _buffered(writer, challenge_id):
+    return writer.pending_rows(lambda row: row['challenge_id'] == challenge_id)
+
+
+def _rows(model):
+    return set(db.session.execute(select(*model.__table__.primary_key.columns)).all())
+
+
+def _trader(make_user, make_challenge, name, symbol):
+    """Utilisateur avec toutes les données que la suppression doit couvrir"""
+    user = make_user(username=name)
+    challenge = make_challenge(user)
+    closed = Trade(challenge_id=challenge.id, user_id=user.id, symbol=symbol, trade_type='BUY',
+                   quantity=1, entry_price=100.0)
+    protected = Trade(challenge_id=challenge.id, user_id=user.id, symbol=symbol, trade_type='BUY',
+                      quantity=1, entry_price=100.0, stop_loss=90.0)
+    order = PendingOrder(challenge_id=challenge.id, user_id=user.id, symbol=symbol, side='BUY',
+                         order_type='LIMIT', quantity=1, price=95.0)
+    account = TradingAccount(user_id=user.id, account_number=f'ACC-{name}')
+    db.session.add_all([
+        closed, protected, order, account,
+        EquitySnapshot(challenge_id=challenge.id, ts=1, equity=10000.0, balance=10000.0),
+        Payment(user_id=user.id, amount=100.0, method='CMI'),
+        Leaderboard(user_id=user.id, username=name, rank=1, month='2024-01'),
+        CommunityPost(user_id=user.id, content=f'post de {name}'),
+    ])
+    db.session.flush()
+    db.session.add(OriginalTrade(user_id=user.id, trading_account_id=account.id, trade_type='buy', symbol=symbol,
+                                 quantity=1, entry_price=100.0))
+    closed.close_trade(110.0, challenge)
+    db.session.commit()
+    order_book.add(order)
+    protective_engine.register(protected)
+    return user, challenge
+
+
+def test_delete_removes_exactly_the_documented_rows(app, make_user, make_challenge, equity_writer):
+    victim, victim_challenge = _trader(make_user, make_challenge, 'victim', 'TSLA')
+    other, other_challenge = _trader(make_user, make_challenge, 'other', 'AAPL')
+    victim_post = CommunityPost.query.filter_by(user_id=victim.id).one()
+    other_post = CommunityPost.query.filter_by(user_id=other.id).one()
+    db.session.add_all([
+        CommunityLike(post_id=other_post.id, user_id=victim.id),  # like de l'utilisateur supprimé
+        CommunityLike(post_id=victim_post.id, user_id=other.id),  # like d'un autre sur sa publication
+        CommunityLike(post_id=other_post.id, user_id=other.id),
+    ])
+    # Données d'un autre utilisateur sur le compte de trading supprimé
+    victim_account = TradingAccount.query.filter_by(user_id=victim.id).one()
+    db.session.add(OriginalTrade(user_id=other.id, trading_account_id=victim_account.id, trade_type='sell',
+                                 symbol='TSLA', quantity=1, entry_price=100.0))
+    db.session.commit()
+    victim_challenge_id, other_challenge_id = victim_challenge.id, other_challenge.id
+    record_equity(victim_challenge_id, 10100.0, 10000.0, force=True)
+    record_equity(other_challenge_id, 9900.0, 10000.0, force=True)
+
+    # Lignes qui doivent rester : celles de l'autre utilisateur, hors données rattachées à la victime
+    kept = {}
+    for model in MODELS:
+        query = select(*model.__table__.primary_key.columns)
+        if model is CommunityLike:
+            query = query.where(CommunityLike.user_id == other.id, CommunityLike.post_id == other_post.id)
+        elif model is OriginalTrade:
+            query = query.where(OriginalTrade.user_id == other.id, OriginalTrade.trading_account_id != victim_account.id)
+        elif model is User:
+            query = query.where(User.id == other.id)
+        elif hasattr(model, 'user_id'):
+            query = query.where(model.user_id == other.id)
+        else:
+            query = query.where(model.challenge_id == other_challenge_id)
+        kept[model] = set(db.session.execute(query).all())
+    before = {model: _rows(model) for model in MODELS}
+
+    deleted = delete_users(User.id == victim.id)
+    db.session.commit()
+
+    for model in MODELS:
+        assert _rows(model) == kept[model], model.__tablename__
+        assert deleted[model.__tablename__] == len(before[model] - kept[model]), model.__tablename__
+    assert deleted[Trade.__tablename__] == 2
+    assert deleted[CommunityLike.__tablename__] == 2 and deleted[OriginalTrade.__tablename__] == 2
+
+    # État en mémoire purgé pour la victime seulement
+    assert _buffered(equity_writer, victim_challenge_id) == []
+    assert victim_challenge_id not in equity_service._last_sample
+    assert len(_buffered(equity_writer, other_challenge_id)) == 1
+    assert other_challenge_id in equity_service._last_sample
+    assert order_book.symbols() == ['AAPL']
+    assert protective_engine.symbols() == ['AAPL']
+    assert equity_writer.flush() == 1
+
+
+def test_delete_route_purges_in_memory_state(app, client, make_user, make_challenge, auth_headers,
+                                             equity_writer):
+    admin = make_user(role='superadmin')
+    victim, challenge = _trader(make_user, make_challenge, 'victim', 'TSLA')
+    challenge_id = challenge.id
+    record_equity(challenge_id, 10100.0, 10000.0, force=True)
+
+    response = client.delete(f'/api/admin/user/{victim.id}', headers=auth_headers(admin))
+    assert response.status_code == 200, response.json
+    assert response.json['deleted']['challenges'] == 1
+
+    assert _buffered(equity_writer, challenge_id) == []
+    assert 'TSLA' not in order_book.symbols()
+    assert 'TSLA' not in protective_engine.symbols()
+
+
+def test_rolled_back_delete_keeps_in_memory_state(app, make_user, make_challenge, equity_writer):
+    user, challenge = _trader(make_user, make_challenge, 'victim', 'TSLA')
+    record_equity(challenge.id, 10100.0, 10000.0, force=True)
+
+    delete_users(User.id == user.id)
+    db.session.rollback()
+    db.session.commit()
+
+    assert db.session.get(User, user.id) is not None
+    assert len(_buffered(equity_writer, challenge.id)) == 1
+    assert challenge.id in equity_service._last_sample
+    assert order_book.symbols() == ['TSLA']
+    assert protective_engine.symbols() == ['TSLA']
@@ -0,0 +1,42 @@
+from app.models import Trade
+
+
+def _batch(client, headers, challenge, orders, mode='all_or_nothing'):
+    return client.post('/api/trading/execute/batch', headers=headers,
+                       json={'challenge_id': challenge.id, 'mode': mode, 'orders': orders})
+
+
+def test_invalid_leg_types_are_rejected_with_400(app, client, make_user, make_challenge, quotes, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)
+    headers = auth_headers(user)
+    quotes['AAPL'] = 100.0
+
+    for leg in ({'symbol': 123, 'type': 'BUY', 'quantity': 1},
+                {'symbol': ['AAPL'], 'type': 'BUY', 'quantity': 1},
+                {'symbol': 'AAPL', 'type': 1, 'quantity': 1},
+                {'symbol': 'AAPL', 'type': 'BUY', 'quantity': 1.5},
+                {'symbol': 'AAPL', 'type': 'BUY', 'quantity': True}):
+        response = _batch(client, headers, challenge, [leg])
+        assert response.status_code == 400, leg
+        assert response.json['rejected'][0]['index'] == 0
+
+    assert client.post('/api/trading/execute/batch', headers=headers, json=['AAPL']).status_code == 400
+    assert Trade.query.count() == 0
+
+
+def test_best_effort_skips_invalid_legs_and_stores_normalized_symbol(app, client, make_user, make_challenge,
+                                                                      quotes, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)
+    quotes['AAPL'] = 100.0
+
+    response = _batch(client, auth_headers(user), challenge, [
+        {'symbol': ' aapl ', 'type': 'buy', 'quantity': 2},
+        {'symbol': 42, 'type': 'BUY', 'quantity': 1},
+    ], mode='best_effort')
+
+    assert response.status_code == 201
+    assert [r['index'] for r in response.json['rejected']] == [1]
+    assert [t['symbol'] for t in response.json['trades']] == ['AAPL']
+    assert Trade.query.one().symbol == 'AAPL'
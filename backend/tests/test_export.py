@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+import pytest
+from app import db
+from app.models import Trade, Payment
+from app.services.export_service import TRADE_EXPORT_COLUMNS, PAYMENT_EXPORT_COLUMNS
+
+
+def _trades(challenge, count, user_id='owner', start=datetime(2024, 1, 1)):
+    db.session.add_all(Trade(challenge_id=challenge.id, user_id=challenge.user_id if user_id == 'owner' else user_id,
+                             symbol='AAPL', trade_type='BUY', quantity=1, entry_price=100.0,
+                             timestamp=start + timedelta(hours=i))
+                       for i in range(count))
+    db.session.commit()
+
+
+def _payments(user, count, status='completed', start=datetime(2024, 1, 1)):
+    db.session.add_all(Payment(user_id=user.id, amount=10.0 * (i + 1), method='CMI', status=status,
+                               timestamp=start + timedelta(days=i))
+                       for i in range(count))
+    db.session.commit()
+
+
+def _csv(response):
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.is_streamed
+    assert response.mimetype == 'text/csv'
+    assert 'attachment; filename=' in response.headers['Content-Disposition']
+    return list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+
+
+def _ndjson(response):
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.mimetype == 'application/x-ndjson'
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_trade_export_streams_only_the_users_trades(app, client, make_user, make_challenge, auth_headers):
+    user, other = make_user(), make_user()
+    first, second = make_challenge(user), make_challenge(user)
+    _trades(first, 2100)  # plus d'un bloc lu par le curseur serveur
+    _trades(second, 5)
+    _trades(second, 1, user_id=None)  # ancien trade sans user_id, rattaché par le challenge
+    _trades(make_challenge(other), 7)
+    headers = auth_headers(user)
+
+    rows = _csv(client.get('/api/export/trades', headers=headers))
+    assert rows[0] == [column.name for column in TRADE_EXPORT_COLUMNS]
+    assert len(rows) == 1 + 2106
+    assert {row[1] for row in rows[1:]} == {first.id, second.id}
+    timestamps = [row[-1] for row in rows[1:] if row[1] == first.id]
+    assert timestamps == sorted(timestamps) and timestamps[0] == '2024-01-01T00:00:00'
+
+    rows = _csv(client.get('/api/export/trades', headers=headers, query_string={'challenge_id': second.id}))
+    assert len(rows) == 1 + 6
+
+    entries = _ndjson(client.get('/api/export/trades', headers=headers, query_string={
+        'format': 'ndjson', 'challenge_id': first.id, 'from': '2024-01-02T00:00:00', 'to': '2024-01-02T05:00:00'
+    }))
+    assert [entry['timestamp'] for entry in entries] == [f'2024-01-02T0{h}:00:00' for h in range(6)]
+    assert set(entries[0]) == {column.name for column in TRADE_EXPORT_COLUMNS}
+
+    # Challenge d'un autre utilisateur : rien
+    assert _csv(client.get('/api/export/trades', headers=auth_headers(other),
+                           query_string={'challenge_id': first.id})) == [rows[0]]
+
+
+def test_payment_export_streams_only_the_users_payments(app, client, make_user, auth_headers):
+    user, other = make_user(), make_user()
+    _payments(user, 4)
+    _payments(other, 3)
+
+    rows = _csv(client.get('/api/export/payments', headers=auth_headers(user)))
+    assert rows[0] == [column.name for column in PAYMENT_EXPORT_COLUMNS]
+    assert {row[1] for row in rows[1:]} == {user.id} and len(rows) == 5
+
+    entries = _ndjson(client.get('/api/export/payments', headers=auth_headers(user),
+                                 query_string={'format': 'ndjson', 'from': '2024-01-03'}))
+    assert [entry['amount'] for entry in entries] == [30.0, 40.0]
+
+
+def test_admin_exports(app, client, make_user, make_challenge, auth_headers):
+    admin = make_user(role='admin')
+    user, other = make_user(), make_user()
+    challenge = make_challenge(user)
+    _trades(challenge, 3)
+    _trades(make_challenge(other), 2)
+    _payments(user, 2)
+    _payments(other, 1, status='failed')
+    headers = auth_headers(admin)
+
+    assert len(_csv(client.get('/api/export/admin/trades', headers=headers))) == 1 + 5
+    assert len(_csv(client.get('/api/export/admin/trades', headers=headers,
+                               query_string={'user_id': other.id}))) == 1 + 2
+    assert len(_ndjson(client.get('/api/export/admin/trades', headers=headers,
+                                  query_string={'format': 'ndjson', 'challenge_id': challenge.id}))) == 3
+    entries = _ndjson(client.get('/api/export/admin/payments', headers=headers,
+                                 query_string={'format': 'ndjson', 'status': 'failed'}))
+    assert [entry['user_id'] for entry in entries] == [other.id]
+
+
+@pytest.mark.parametrize('url', ['/api/export/admin/trades', '/api/export/admin/payments'])
+def test_admin_exports_are_forbidden_to_users(app, client, make_user, auth_headers, url):
+    assert client.get(url, headers=auth_headers(make_user())).status_code == 403
+
+
+@pytest.mark.parametrize('params', [{'format': 'xlsx'}, {'from': 'hier'}, {'to': '2024-02-30'}])
+def test_bad_export_parameters_are_rejected(app, client, make_user, auth_headers, params):
+    response = client.get('/api/export/trades', headers=auth_headers(make_user()), query_string=params)
+    assert response.status_code == 400
@@ -0,0 +1,119 @@
+import decimal
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from app import db
+from app.models import Trade, Challenge, User, Leaderboard, CommunityPost, Payment
+from app.utils.json_provider import OrjsonProvider
+
+
+def _roundtrip(app, obj):
+    return json.loads(app.json.dumps(obj))
+
+
+@pytest.mark.parametrize('moment', [
+    datetime(2024, 3, 5, 14, 7, 9, 123456),
+    datetime(2024, 3, 5, 14, 7, 9),
+    datetime(2024, 3, 5, 14, 7, 9, 120, tzinfo=timezone.utc),
+    datetime(2024, 3, 5, 14, 7, 9, tzinfo=timezone(timedelta(hours=1))),
+], ids=['naive', 'naive_no_microseconds', 'utc', 'offset'])
+def test_datetimes_serialize_like_isoformat(app, moment):
+    trade = Trade(challenge_id='c1', symbol='AAPL', trade_type='BUY', quantity=1, entry_price=100.0,
+                  timestamp=moment, created_at=moment, updated_at=None, is_closed=False)
+    data = _roundtrip(app, trade.to_dict())
+    assert data['timestamp'] == data['created_at'] == moment.isoformat()
+    assert data['updated_at'] is None
+    assert _roundtrip(app, {'day': moment.date()}) == {'day': moment.date().isoformat()}
+
+
+def test_stored_models_serialize_like_isoformat(app, make_user, make_challenge):
+    user = make_user()
+    challenge = make_challenge(user)
+    payment = Payment(user_id=user.id, amount=100.0, currency='MAD', method='CMI', status='completed')
+    db.session.add(payment)
+    db.session.commit()
+
+    checked = 0
+    for obj in (user, challenge, payment):
+        data = _roundtrip(app, obj.to_dict())
+        for key, value in obj.to_dict().items():
+            if isinstance(value, datetime):
+                assert data[key] == value.isoformat(), key
+                checked += 1
+    assert checked >= 5
+
+
+def test_other_types_match_the_default_provider(app):
+    payload = {'b': decimal.Decimal('12.50'), 'a': [1, 2.5, None, True], 'c': {'z': 'é', 'y': ''}}
+    assert app.json.dumps(payload) == json.dumps(json.loads(app.json.dumps(payload)), sort_keys=True,
+                                                 ensure_ascii=False, separators=(',', ':'))
+    assert json.loads(app.json.dumps(payload)) == json.loads(DefaultJSONProvider(app).dumps(payload))
+    assert list(json.loads(app.json.dumps(payload))) == ['a', 'b', 'c']
+    with pytest.raises(TypeError):
+        app.json.dumps({'x': object()})
+
+
+def test_debug_responses_are_indented(app):
+    with app.test_request_context():
+        assert app.json.response({'b': 1, 'a': [1]}).get_data(as_text=True) == '{"a":[1],"b":1}\n'
+        app.debug = True
+        try:
+            body = app.json.response({'b': 1, 'a': [1]}).get_data(as_text=True)
+        finally:
+            app.debug = False
+    assert body == '{\n  "a": [\n    1\n  ],\n  "b": 1\n}\n'
+    assert app.json.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def _payloads(app):
+    rng = random.Random(11)
+    user = User(username='bench', email='bench@test.ma', password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    challenge = Challenge(user_id=user.id, initial_balance=10000.0, current_balance=10000.0)
+    db.session.add(challenge)
+    db.session.flush()
+    start = datetime(2024, 1, 1)
+    db.session.add_all(Trade(challenge_id=challenge.id, user_id=user.id, symbol=rng.choice(['AAPL', 'BTC-USD']),
+                             trade_type='BUY', quantity=rng.randint(1, 50), entry_price=rng.uniform(50, 150),
+                             exit_price=rng.uniform(50, 150), profit_loss=rng.uniform(-500, 500), is_closed=True,
+                             timestamp=start + timedelta(seconds=i * 37, microseconds=i))
+                       for i in range(5000))
+    db.session.add_all(Leaderboard(user_id=user.id, username=f'trader{i}', profit_percentage=rng.uniform(-10, 30),
+                                   rank=i + 1, month='2024-01') for i in range(1000))
+    db.session.add_all(CommunityPost(user_id=user.id, content='Analyse du marché ' * 20,
+                                     created_at=start + timedelta(minutes=i)) for i in range(1000))
+    db.session.commit()
+    return {
+        'history': {'trades': [t.to_dict() for t in Trade.query.all()], 'next_cursor': None},
+        'leaderboard': [entry.to_dict() for entry in Leaderboard.query.all()],
+        'community': [post.to_dict(user.id) for post in CommunityPost.query.all()],
+    }
+
+
+def _best_of(dumps, payload, runs=5):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        dumps(payload)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.bench
+def test_orjson_is_faster_than_the_stdlib_provider(app):
+    """Banc d'essai : python -m pytest -m bench -s"""
+    stdlib = DefaultJSONProvider(app)
+    for name, payload in _payloads(app).items():
+        # Avant : to_dict renvoyait les dates déjà converties par isoformat()
+        legacy = json.loads(app.json.dumps(payload))
+        assert json.loads(stdlib.dumps(legacy)) == legacy
+
+        before = _best_of(stdlib.dumps, legacy)
+        after = _best_of(app.json.dumps, payload)
+        size = len(app.json.dumps(payload)) / 1e6
+        print(f"\n{name} ({size:.1f} Mo) : stdlib {before * 1000:.1f} ms, orjson {after * 1000:.1f} ms")
+        assert after < before
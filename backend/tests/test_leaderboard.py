@@ -0,0 +1,165 @@
+import os
+import random
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+import pytest
+from sqlalchemy import event, insert
+from app import db
+from app.models import Trade, MonthlyProfit, MonthlyAssetProfit, User, Leaderboard
+from app.services import leaderboard_service
+
+DATABASE_SQL = os.path.join(os.path.dirname(__file__), '..', '..', 'database.sql')
+
+
+def _close_trades(challenge, legs):
+    # Clôtures par le chemin applicatif : agrégats tenus par le listener incrémental
+    for symbol, timestamp, entry, exit_price in legs:
+        trade = Trade(challenge_id=challenge.id, user_id=challenge.user_id, symbol=symbol, trade_type='BUY',
+                      quantity=2, entry_price=entry, timestamp=timestamp)
+        db.session.add(trade)
+        db.session.flush()
+        trade.close_trade(exit_price, challenge)
+    db.session.commit()
+
+
+def _legacy_ranking(month):
+    # Classement recalculé depuis les trades clôturés (calcul d'avant la matérialisation)
+    usernames = {u.id: u.username for u in User.query.all()}
+    profits = sorted(leaderboard_service.compute_monthly_profits(month),
+                     key=lambda p: (-p['profit_pct'], p['challenge_id']))
+    return [(usernames[p['user_id']], round(p['profit_pct'], 2)) for p in profits]
+
+
+def test_materialized_leaderboard_matches_full_recomputation(app, make_user, make_challenge):
+    january, february = datetime(2024, 1, 15), datetime(2024, 2, 3)
+    first = make_challenge(make_user(), initial_balance=10000.0)
+    second = make_challenge(make_user(), initial_balance=50000.0)
+    third = make_challenge(make_user(), initial_balance=0.0)
+    _close_trades(first, [('AAPL', january, 100.0, 130.0), ('EURUSD=X', january, 1.1, 1.0),
+                          ('BTC-USD', february, 40000.0, 41000.0)])
+    _close_trades(second, [('AAPL', january, 100.0, 90.0), ('AAPL', february, 100.0, 180.0)])
+    _close_trades(third, [('XAUUSD', january, 2000.0, 2001.0)])
+
+    for month in ('2024-01', '2024-02'):
+        assert leaderboard_service.verify_monthly_profits(month) == [], month
+        top = leaderboard_service.get_top_traders(month)
+        assert [(entry['username'], entry['profit']) for entry in top] == _legacy_ranking(month), month
+
+
+def test_backfill_fills_empty_aggregates_once(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    _close_trades(challenge, [('AAPL', datetime(2024, 1, 15), 100.0, 110.0),
+                              ('AAPL', datetime(2024, 3, 2), 100.0, 95.0)])
+    # Base antérieure aux agrégats : trades clôturés, tables d'agrégats vides
+    MonthlyProfit.query.delete()
+    MonthlyAssetProfit.query.delete()
+    db.session.commit()
+
+    assert leaderboard_service.backfill_monthly_profits() == 3
+    for month in ('2024-01', '2024-02', '2024-03'):
+        assert leaderboard_service.verify_monthly_profits(month) == []
+    assert leaderboard_service.backfill_monthly_profits() == 0
+
+
+def test_startup_backfills_an_existing_database(app_on_file):
+    with open(DATABASE_SQL) as f:
+        app = app_on_file(f.read())
+
+    with app.app_context():
+        months = leaderboard_service.traded_months()
+        assert months and MonthlyProfit.query.count() > 0
+        for month in months:
+            assert leaderboard_service.verify_monthly_profits(month) == [], month
+
+
+def test_close_month_ranks_every_challenge_of_the_month(app, make_user, make_challenge):
+    january = datetime(2024, 1, 15)
+    active = make_challenge(make_user())
+    passed = make_challenge(make_user())
+    failed = make_challenge(make_user())
+    _close_trades(active, [('AAPL', january, 100.0, 105.0)])
+    _close_trades(passed, [('AAPL', january, 100.0, 150.0)])
+    _close_trades(failed, [('AAPL', january, 100.0, 50.0)])
+    passed.status, failed.status = 'passed', 'failed'
+    db.session.commit()
+
+    assert leaderboard_service.close_month('2024-01') == 3
+    archived = Leaderboard.query.filter_by(month='2024-01').order_by(Leaderboard.rank).all()
+    assert [entry.challenge_id for entry in archived] == [passed.id, active.id, failed.id]
+
+
+def test_closed_month_is_not_rewritten_without_force(app, make_user, make_challenge):
+    january = datetime(2024, 1, 15)
+    challenge = make_challenge(make_user())
+    _close_trades(challenge, [('AAPL', january, 100.0, 105.0)])
+    leaderboard_service.close_month('2024-01')
+    frozen = [(e.id, e.profit_value) for e in Leaderboard.query.filter_by(month='2024-01')]
+
+    late = make_challenge(make_user())
+    _close_trades(late, [('AAPL', january, 100.0, 200.0)])
+    with pytest.raises(ValueError):
+        leaderboard_service.close_month('2024-01')
+    assert [(e.id, e.profit_value) for e in Leaderboard.query.filter_by(month='2024-01')] == frozen
+
+    assert leaderboard_service.close_month('2024-01', force=True) == 2
+
+
+@contextmanager
+def _count_statements():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def _insert_entries(user, month, count, rng):
+    # Profits arrondis : beaucoup d'égalités, départagées par id
+    rows = [{'id': f'{month}-{i:06d}', 'user_id': user.id, 'username': user.username,
+             'profit_percentage': round(rng.uniform(-5, 5), 1), 'rank': 0, 'month': month}
+            for i in rng.sample(range(count), count)]
+    db.session.execute(insert(Leaderboard), rows)
+    db.session.commit()
+    return rows
+
+
+@pytest.mark.parametrize('sqlite_version', [sqlite3.sqlite_version_info, (3, 32, 0)],
+                         ids=['update_from', 'executemany'])
+def test_recalculated_ranks_match_a_python_sort(app, make_user, monkeypatch, sqlite_version):
+    monkeypatch.setattr(sqlite3, 'sqlite_version_info', sqlite_version)
+    rng = random.Random(3)
+    user = make_user()
+    rows = _insert_entries(user, '2024-05', 300, rng)
+    _insert_entries(user, '2024-06', 10, rng)
+
+    Leaderboard.recalculate_monthly_rankings(2024, 5)
+
+    expected = [row['id'] for row in sorted(rows, key=lambda r: (-r['profit_percentage'], r['id']))]
+    ranked = Leaderboard.query.filter_by(month='2024-05').order_by(Leaderboard.rank).all()
+    assert [entry.id for entry in ranked] == expected
+    assert [entry.rank for entry in ranked] == list(range(1, 301))
+    # Les autres mois ne sont pas touchés
+    assert {entry.rank for entry in Leaderboard.query.filter_by(month='2024-06')} == {0}
+
+
+@pytest.mark.bench
+def test_recalculate_100k_ranks_in_one_statement(app, make_user):
+    """Banc d'essai : python -m pytest -m bench -s"""
+    count = 100000
+    _insert_entries(make_user(), '2024-05', count, random.Random(5))
+
+    with _count_statements() as statements:
+        start = time.perf_counter()
+        Leaderboard.recalculate_monthly_rankings(2024, 5)
+        elapsed = time.perf_counter() - start
+
+    print(f"\n{count} entrées : rangs recalculés en {elapsed:.2f}s, {len(statements)} requête(s)")
+    assert len(statements) == 1
+    assert Leaderboard.query.filter_by(month='2024-05', rank=count).count() == 1
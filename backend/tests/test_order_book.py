@@ -0,0 +1,118 @@
+from sqlalchemy import update
+from app import db
+from app.models import Trade, PendingOrder, OrderStatus
+from app.services import order_book_service
+from app.services.order_book_service import order_book, init_order_book, fill_orders
+from app.services.price_service import quote_refresher
+
+
+def _place(client, headers, challenge, **order):
+    payload = {'challenge_id': challenge.id, 'symbol': 'AAPL', 'type': 'BUY', 'order_type': 'LIMIT',
+               'quantity': 5, 'price': 95.0, **order}
+    response = client.post('/api/trading/orders', json=payload, headers=headers)
+    assert response.status_code == 201, response.json
+    return response.json['order']['id']
+
+
+def test_limit_order_fills_from_background_refresh(app, client, make_user, make_challenge, quotes, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)
+    order_id = _place(client, auth_headers(user), challenge, take_profit=110.0)
+    assert 'AAPL' in quote_refresher.tracked_symbols()
+
+    # Le prix public ne déclenche rien, même marketable
+    quotes['AAPL'] = 94.0
+    client.get('/api/trading/price/AAPL')
+    db.session.expire_all()
+    assert db.session.get(PendingOrder, order_id).status == OrderStatus.PENDING.value
+
+    quote_refresher.refresh()
+
+    db.session.expire_all()
+    order = db.session.get(PendingOrder, order_id)
+    assert order.status == OrderStatus.FILLED.value
+    trade = db.session.get(Trade, order.trade_id)
+    assert trade.entry_price == 94.0 and trade.take_profit == 110.0
+    assert 'AAPL' not in order_book.symbols()
+
+
+def test_failed_startup_load_is_retried(app, monkeypatch):
+    load = order_book.load
+    calls = []
+
+    def flaky_load():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError('base indisponible')
+        load()
+
+    monkeypatch.setattr(order_book, 'load', flaky_load)
+    monkeypatch.setattr(order_book, 'loaded', False)
+    db.session.add(PendingOrder(challenge_id='c1', user_id='u1', symbol='MSFT', side='SELL',
+                                order_type='LIMIT', quantity=1, price=500.0))
+    db.session.commit()
+
+    init_order_book(app)
+    assert not order_book.loaded
+
+    assert quote_refresher.tracked_symbols() == ['MSFT']
+    assert order_book.loaded
+
+
+def test_cancel_committed_before_fill_wins(app, client, make_user, make_challenge, quotes, auth_headers,
+                                           monkeypatch):
+    user = make_user()
+    challenge = make_challenge(user)
+    order_id = _place(client, auth_headers(user), challenge)
+    count = order_book_service.committed_positions
+
+    def cancel_then_count(challenge_id):
+        # Annulation validée entre le chargement de l'ordre et son exécution
+        db.session.execute(update(PendingOrder).where(PendingOrder.id == order_id)
+                           .values(status=OrderStatus.CANCELLED.value))
+        return count(challenge_id)
+
+    monkeypatch.setattr(order_book_service, 'committed_positions', cancel_then_count)
+    assert fill_orders([order_id], 94.0) == []
+
+    db.session.expire_all()
+    assert db.session.get(PendingOrder, order_id).status == OrderStatus.CANCELLED.value
+    assert Trade.query.count() == 0
+
+
+def test_cancel_after_fill_returns_conflict(app, client, make_user, make_challenge, quotes, auth_headers,
+                                            monkeypatch):
+    user = make_user()
+    challenge = make_challenge(user)
+    headers = auth_headers(user)
+    order_id = _place(client, headers, challenge)
+
+    def filled_meanwhile(order):
+        # Exécution validée entre le chargement de l'ordre et l'annulation
+        fill_orders([order_id], 94.0)
+        return True
+
+    monkeypatch.setattr(PendingOrder, 'is_pending', filled_meanwhile)
+    response = client.delete(f'/api/trading/orders/{order_id}', headers=headers)
+    assert response.status_code == 409
+
+    db.session.expire_all()
+    order = db.session.get(PendingOrder, order_id)
+    assert order.status == OrderStatus.FILLED.value
+    assert db.session.get(Trade, order.trade_id) is not None
+
+
+def test_fill_rechecks_plan_position_limit(app, client, make_user, make_challenge, quotes, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)
+    order_id = _place(client, auth_headers(user), challenge)
+    # Positions ouvertes entre-temps jusqu'à la limite du plan starter (10)
+    db.session.add_all([Trade(challenge_id=challenge.id, user_id=user.id, symbol='MSFT', trade_type='BUY',
+                              quantity=1, entry_price=100.0) for _ in range(10)])
+    db.session.commit()
+
+    assert fill_orders([order_id], 94.0) == []
+
+    db.session.expire_all()
+    assert db.session.get(PendingOrder, order_id).status == OrderStatus.CANCELLED.value
+    assert Trade.query.filter_by(symbol='AAPL').count() == 0
@@ -0,0 +1,36 @@
+import pytest
+from app.services.query_plans import check_query_plans, hot_queries, _postgresql_plan_scans
+
+
+def test_exports_are_served_by_the_timestamp_id_index(app):
+    plans = check_query_plans()
+    for name in ('trade_export', 'trade_export_by_date', 'payment_export'):
+        assert plans[name] == [], name
+
+
+@pytest.mark.parametrize('name', sorted(hot_queries()))
+def test_hot_queries_use_an_index_on_sqlite(app, name):
+    assert check_query_plans()[name] == []
+
+
+def test_leaderboard_queries_read_the_materialized_aggregates():
+    # Le chemin chaud du classement lit monthly_profits, plus les trades
+    queries = hot_queries()
+    assert 'monthly_leaderboard_trades' not in queries
+    for name in ('monthly_ranking_profits', 'monthly_ranking_asset_profits', 'monthly_leaderboard_top'):
+        assert 'ts_trades' not in str(queries[name]), name
+
+
+def test_postgresql_plan_walker_reports_full_scans():
+    # Plans EXPLAIN (FORMAT JSON) tels que renvoyés par PostgreSQL (pas de serveur dans les tests)
+    plan = [{'Plan': {'Node Type': 'Limit', 'Plans': [
+        {'Node Type': 'Nested Loop', 'Plans': [
+            {'Node Type': 'Index Scan', 'Relation Name': 'monthly_profits', 'Index Cond': "(month = '2000-01')"},
+            {'Node Type': 'Seq Scan', 'Relation Name': 'challenges'},
+        ]},
+    ]}}]
+    assert _postgresql_plan_scans(plan, False) == ['Seq Scan on challenges']
+
+    ordered = '[{"Plan": {"Node Type": "Limit", "Plans": [{"Node Type": "Index Scan", "Relation Name": "community_posts"}]}}]'
+    assert _postgresql_plan_scans(ordered, True) == []
+    assert _postgresql_plan_scans(ordered, False) == ['Index Scan on community_posts (sans Index Cond)']
@@ -0,0 +1,188 @@
+import random
+from datetime import datetime
+import pytest
+from app import db
+from app.models import Trade
+from app.services.leaderboard_service import month_key
+from app.services.rank_index import (
+    RankIndex, get_rank_index, get_month_ranking, build_month_ranking, invalidate_rankings
+)
+from app.utils.market_data import asset_class
+
+
+@pytest.fixture(autouse=True)
+def fresh_rankings(app):
+    # Classements globaux au module : ne pas réutiliser ceux d'un test précédent
+    invalidate_rankings()
+    yield
+    invalidate_rankings()
+
+
+def _entry(challenge_id, profit_pct, user_id=None):
+    return {'challenge_id': challenge_id, 'user_id': user_id or f'u-{challenge_id}', 'username': challenge_id,
+            'country': 'MA', 'plan_type': 'starter', 'profit_value': profit_pct * 100, 'profit_pct': profit_pct}
+
+
+def _index():
+    index = RankIndex('2024-05')
+    index.load([_entry('d', -1.0), _entry('c', 5.0), _entry('a', 10.0), _entry('b', 5.0, user_id='u-a')])
+    return index
+
+
+def test_rank_and_percentile_at_the_edges():
+    index = _index()
+    assert index.rank('a') == {'rank': 1, 'total': 4, 'percentile': 100.0}
+    assert index.rank('d') == {'rank': 4, 'total': 4, 'percentile': 25.0}
+    # Égalité départagée par challenge_id
+    assert [index.rank(c)['rank'] for c in ('b', 'c')] == [2, 3]
+    assert index.rank('missing') is None
+    assert index.best_challenge('u-a') == 'a'
+    assert index.best_challenge('nobody') is None
+
+
+def test_neighbors_stop_at_the_ends():
+    index = _index()
+    assert [(n['challenge_id'], n['rank']) for n in index.neighbors('a', radius=2)] == [('a', 1), ('b', 2), ('c', 3)]
+    assert [n['challenge_id'] for n in index.neighbors('d', radius=10)] == ['a', 'b', 'c', 'd']
+    assert [n['challenge_id'] for n in index.neighbors('c', radius=0)] == ['c']
+    assert index.neighbors('missing') == []
+
+
+def test_upsert_and_discard_keep_the_order():
+    index = _index()
+    index.upsert(_entry('d', 7.0))
+    assert [n['challenge_id'] for n in index.top(10)] == ['a', 'd', 'b', 'c']
+    index.discard('a')
+    assert index.rank('d') == {'rank': 1, 'total': 3, 'percentile': 100.0}
+    assert index.best_challenge('u-a') == 'b'
+
+
+def _open(challenge, symbol='AAPL', entry_price=100.0):
+    trade = Trade(challenge_id=challenge.id, user_id=challenge.user_id, symbol=symbol, trade_type='BUY',
+                  quantity=1, entry_price=entry_price)
+    db.session.add(trade)
+    db.session.commit()
+    return trade
+
+
+def _keys(index):
+    return [(challenge_id, round(-pct, 6)) for pct, challenge_id in index._keys]
+
+
+def _random_closes(make_user, make_challenge, count=200):
+    rng = random.Random(7)
+    users = [make_user(country=rng.choice(['MA', 'FR', None])) for _ in range(15)]
+    challenges = [make_challenge(rng.choice(users), initial_balance=rng.choice([5000.0, 10000.0]),
+                                 plan_type=rng.choice(['starter', 'pro']))
+                  for _ in range(25)]
+    for i in range(count):
+        challenge = rng.choice(challenges)
+        if i == 120:
+            # Challenge échoué en cours de mois : retiré du classement à sa clôture suivante
+            challenge.status = 'failed'
+            db.session.commit()
+        trade = _open(challenge, symbol=rng.choice(['AAPL', 'BTC-USD', 'EURUSD=X']))
+        trade.close_trade(round(rng.uniform(80, 120), 2), challenge)
+        db.session.commit()
+
+
+def test_incremental_ranks_match_a_rebuild_after_200_closes(app, make_user, make_challenge):
+    index = get_rank_index()
+    _random_closes(make_user, make_challenge)
+
+    assert get_rank_index() is index
+    assert _keys(index) == _keys(build_month_ranking(month_key(datetime.utcnow())).overall)
+
+
+def test_rolled_back_close_leaves_ranks_untouched(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    trade = _open(challenge)
+    trade.close_trade(110.0, challenge)
+    db.session.commit()
+    index = get_rank_index()
+    before = index.rank(challenge.id)
+
+    trade = _open(challenge)
+    trade.close_trade(150.0, challenge)
+    # Avant le commit, le classement partagé ne bouge pas
+    assert index.get(challenge.id)['profit_value'] == 10.0
+    db.session.rollback()
+    db.session.commit()
+
+    assert index.rank(challenge.id) == before
+    assert index.get(challenge.id)['profit_value'] == 10.0
+
+
+def test_me_endpoint(app, client, make_user, make_challenge, auth_headers):
+    leader, runner_up, unranked = make_user(), make_user(), make_user()
+    for user, price in ((leader, 130.0), (runner_up, 110.0)):
+        challenge = make_challenge(user)
+        _open(challenge).close_trade(price, challenge)
+        db.session.commit()
+
+    response = client.get('/api/leaderboard/me', headers=auth_headers(runner_up), query_string={'radius': 50})
+    assert response.status_code == 200, response.json
+    assert response.json['rank'] == 2 and response.json['total'] == 2 and response.json['percentile'] == 50.0
+    assert [(n['username'], n['is_me']) for n in response.json['neighbors']] == \
+        [(leader.username, False), (runner_up.username, True)]
+
+    assert client.get('/api/leaderboard/me', headers=auth_headers(unranked)).status_code == 404
+    assert client.get('/api/leaderboard/me', headers=auth_headers(leader),
+                      query_string={'month': '2024-13'}).status_code == 400
+    assert client.get('/api/leaderboard/me', headers=auth_headers(leader),
+                      query_string={'month': '2020-01'}).status_code == 404
+
+
+def _segments(ranking):
+    return {key: _keys(index) for key, index in ranking.segments.items() if len(index)}
+
+
+def test_incremental_segments_match_a_rebuild(app, make_user, make_challenge):
+    ranking = get_month_ranking()
+    _random_closes(make_user, make_challenge)
+
+    rebuilt = build_month_ranking(ranking.month)
+    assert get_month_ranking() is ranking
+    assert {dimension for dimension, _ in _segments(ranking)} == {'country', 'plan_type', 'asset_class'}
+    assert _segments(ranking) == _segments(rebuilt)
+
+
+def test_country_and_plan_segments_are_filtered_global_rankings(app, make_user, make_challenge):
+    _random_closes(make_user, make_challenge, count=60)
+    ranking = get_month_ranking()
+    overall = ranking.overall.top(len(ranking.overall))
+
+    for (dimension, value), index in ranking.segments.items():
+        if dimension == 'asset_class':
+            continue
+        expected = [entry['challenge_id'] for entry in overall if entry[dimension] == value]
+        assert [entry['challenge_id'] for entry in index.top(len(index))] == expected, (dimension, value)
+        assert [entry['rank'] for entry in index.top(len(index))] == list(range(1, len(expected) + 1))
+
+
+@pytest.mark.parametrize('symbol, expected', [
+    ('AAPL', 'stock'), ('IAM.CS', 'stock'),
+    ('XAUUSD', 'commodity'), ('GC=F', 'commodity'),
+    ('EURUSD', 'forex'), ('usdjpy', 'forex'), ('GBPUSD=X', 'forex'),
+    ('BTCUSD', 'crypto'), (' eth-usd ', 'crypto'), ('DOGE-USD', 'crypto'),
+])
+def test_asset_class_mapping(symbol, expected):
+    assert asset_class(symbol) == expected
+
+
+def test_segment_endpoints(app, client, make_user, make_challenge):
+    leader, other = make_user(country='MA'), make_user(country='FR')
+    for user, symbol, price in ((leader, 'BTCUSD', 130.0), (other, 'AAPL', 110.0)):
+        challenge = make_challenge(user)
+        _open(challenge, symbol=symbol).close_trade(price, challenge)
+        db.session.commit()
+
+    response = client.get('/api/leaderboard/segments')
+    assert response.status_code == 200
+    assert response.json['segments']['asset_class'] == [{'value': 'crypto', 'count': 1}, {'value': 'stock', 'count': 1}]
+
+    response = client.get('/api/leaderboard/segments/country/FR')
+    assert [(e['username'], e['rank'], e['profit']) for e in response.json] == [(other.username, 1, 0.1)]
+    assert client.get('/api/leaderboard/segments/asset_class/forex').json == []
+    assert client.get('/api/leaderboard/segments/sector/tech').status_code == 400
+    assert client.get('/api/leaderboard/segments', query_string={'month': '2024'}).status_code == 400
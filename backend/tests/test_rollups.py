@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+from app import db
+from app.models import Challenge, DailyRollup
+from app.services.rollup_service import backfill_rollups
+
+
+def _buckets():
+    return sorted((r.metric, r.dimension, r.day, r.count) for r in DailyRollup.query.all() if r.count)
+
+
+def test_outcomes_match_backfill_after_late_balance_update(app, client, make_user, make_challenge, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    challenge = make_challenge(make_user())
+
+    assert client.put(f'/api/admin/challenge/{challenge.id}/pass', headers=headers).status_code == 200
+    assert challenge.completed_at is not None
+
+    # Ajustement de solde trois jours plus tard : updated_at bouge, pas la fin du challenge
+    challenge.current_balance += 100.0
+    challenge.updated_at = datetime.utcnow() + timedelta(days=3)
+    db.session.commit()
+
+    assert client.put(f'/api/admin/challenge/{challenge.id}/fail', headers=headers).status_code == 200
+
+    incremental = _buckets()
+    backfill_rollups()
+    assert incremental == _buckets()
+    assert [b[0] for b in incremental if b[0].startswith('challenges_') and b[0] != 'challenges_started'] \
+        == ['challenges_failed']
+
+
+def test_status_changes_stamp_completed_at(app, client, make_user, make_challenge, auth_headers):
+    headers = auth_headers(make_user(role='admin'))
+    challenge = make_challenge(make_user())
+    url = f'/api/admin/challenge/{challenge.id}/status'
+
+    assert client.patch(url, headers=headers, json={'status': 'failed'}).status_code == 200
+    db.session.refresh(challenge)
+    assert challenge.completed_at is not None
+
+    assert client.patch(url, headers=headers, json={'status': 'active'}).status_code == 200
+    db.session.refresh(challenge)
+    assert challenge.completed_at is None
+
+    # Valeur explicite conservée
+    ended = datetime(2024, 5, 1, 12, 0)
+    challenge.status, challenge.completed_at = 'passed', ended
+    db.session.commit()
+    db.session.refresh(challenge)
+    assert challenge.completed_at == ended
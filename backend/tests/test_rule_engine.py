@@ -0,0 +1,95 @@
+import random
+import time
+from datetime import datetime
+import pytest
+from app import db
+from app.models import Challenge, Trade, ChallengeStatus
+from app.services import rule_engine
+from app.services.killer_service import evaluate_killer_rules, sweep_active_challenges
+from app.services.rule_engine import ChallengeState, evaluate_state, evaluate_states, evaluate_in_pool
+from app.services.unit_of_work import commit_unit_of_work
+
+
+def _state(**kwargs):
+    values = dict(id='c1', initial_balance=10000.0, daily_start_balance=10000.0, equity=10000.0,
+                  max_daily_loss_pct=5.0, max_total_loss_pct=10.0, profit_target_pct=10.0)
+    values.update(kwargs)
+    return ChallengeState(**values)
+
+
+def test_daily_loss_is_measured_against_initial_balance():
+    # Journée commencée à 12 000 pour un capital de 10 000 : la limite est 5 % de 10 000 = 500,
+    # pas 5 % de 12 000 = 600 (ancienne définition de Challenge.update_status)
+    decision = evaluate_state(_state(daily_start_balance=12000.0, equity=11450.0))
+    assert decision.status == ChallengeStatus.FAILED.value
+    assert decision.failed_reason == 'daily_loss'
+    assert (decision.value, decision.threshold) == (550.0, 500.0)
+
+    assert not evaluate_state(_state(daily_start_balance=12000.0, equity=11550.0)).is_transition
+
+
+def test_total_loss_takes_precedence_over_daily_loss():
+    decision = evaluate_state(_state(equity=8900.0))
+    assert decision.failed_reason == 'total_loss'
+    assert (decision.value, decision.threshold) == (1100.0, 1000.0)
+
+
+def test_update_status_and_killer_rules_agree_on_daily_loss(app, make_user, make_challenge, quotes):
+    user = make_user()
+    now = datetime.utcnow()
+    by_model = make_challenge(user, current_balance=11450.0, daily_start_balance=12000.0, last_reset_date=now)
+    by_killer = make_challenge(user, current_balance=11450.0, daily_start_balance=12000.0, last_reset_date=now)
+
+    by_model.update_status()
+    db.session.commit()
+    evaluate_killer_rules(by_killer.id)
+    commit_unit_of_work()
+
+    for challenge in (by_model, by_killer):
+        db.session.refresh(challenge)
+        assert (challenge.status, challenge.failed_reason) == (ChallengeStatus.FAILED.value, 'daily_loss')
+        assert challenge.completed_at is not None
+
+
+def test_pool_matches_inline_evaluation(monkeypatch):
+    rng = random.Random(7)
+    states = [_state(id=f'c{i}', daily_start_balance=rng.uniform(9000, 12000), equity=rng.uniform(8500, 11500),
+                     plan_type=rng.choice(['starter', 'pro', 'elite']), trading_days=rng.randint(0, 6),
+                     open_positions=rng.randint(0, 60))
+              for i in range(3000)]
+    monkeypatch.setattr(rule_engine, 'POOL_MIN_BATCH', 0)
+
+    inline = evaluate_states(states)
+    pooled = evaluate_in_pool(states, workers=2, chunk_size=500)
+
+    assert inline
+    assert sorted(pooled, key=lambda d: d.challenge_id) == sorted(inline, key=lambda d: d.challenge_id)
+
+
+@pytest.mark.bench
+def test_sweep_is_faster_than_per_challenge_evaluation(app, make_user, quotes):
+    """Banc d'essai : python -m pytest -m bench -s"""
+    count = 1000
+    quotes['AAPL'] = 100.0
+    user = make_user()
+    challenges = [Challenge(user_id=user.id, initial_balance=10000.0, current_balance=10000.0)
+                  for _ in range(count)]
+    db.session.add_all(challenges)
+    db.session.flush()
+    db.session.add_all(Trade(challenge_id=c.id, user_id=user.id, symbol='AAPL', trade_type='BUY',
+                             quantity=1, entry_price=100.0) for c in challenges)
+    db.session.commit()
+    ids = [c.id for c in challenges]
+
+    start = time.perf_counter()
+    for challenge_id in ids:
+        evaluate_killer_rules(challenge_id)
+    commit_unit_of_work()
+    per_challenge = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sweep_active_challenges()
+    sweep = time.perf_counter() - start
+
+    print(f"\n{count} challenges : évaluation par challenge {per_challenge:.2f}s, balayage {sweep:.2f}s")
+    assert sweep * 3 < per_challenge
@@ -0,0 +1,103 @@
+import os
+import sqlite3
+from sqlalchemy import inspect, text
+from app import db
+from app.models import Trade, Challenge
+from app.utils.schema import upgrade_schema
+from app.services.trigger_service import protective_engine
+
+DATABASE_SQL = os.path.join(os.path.dirname(__file__), '..', '..', 'database.sql')
+
+
+def _columns(table):
+    return {c['name'] for c in inspect(db.engine).get_columns(table)}
+
+
+def test_app_starts_on_shipped_database_sql(app_on_file):
+    with open(DATABASE_SQL) as f:
+        app = app_on_file(f.read())
+
+    with app.app_context():
+        assert {'stop_loss', 'take_profit', 'close_reason'} <= _columns('ts_trades')
+        assert Trade.query.count() > 0
+        assert {c.version for c in Challenge.query.all()} == {0}
+        protective_engine.load()
+        assert protective_engine.loaded
+
+
+def test_upgrade_adds_missing_trade_columns(app_on_file):
+    app = app_on_file("""
+        CREATE TABLE ts_trades (
+            id VARCHAR(36) NOT NULL, challenge_id VARCHAR(36) NOT NULL, symbol VARCHAR(10) NOT NULL,
+            trade_type VARCHAR(10) NOT NULL, quantity INTEGER NOT NULL, entry_price FLOAT NOT NULL,
+            exit_price FLOAT, profit_loss FLOAT, timestamp DATETIME, is_closed BOOLEAN,
+            user_id VARCHAR(36), created_at DATETIME, updated_at DATETIME, PRIMARY KEY (id)
+        );
+        INSERT INTO ts_trades VALUES ('t1', 'c1', 'AAPL', 'BUY', 1, 100.0, NULL, 0.0,
+                                      '2026-01-11 16:15:59', 0, NULL, NULL, NULL);
+    """)
+
+    with app.app_context():
+        assert {'stop_loss', 'take_profit', 'close_reason'} <= _columns('ts_trades')
+        indexes = {i['name'] for i in inspect(db.engine).get_indexes('ts_trades')}
+        assert 'idx_trade_challenge_closed' in indexes
+        assert db.session.get(Trade, 't1').stop_loss is None
+
+        # Idempotent : une base à jour n'est pas modifiée
+        assert upgrade_schema(db.engine, db.metadata) == []
+
+
+def test_upgrade_adds_challenge_version_with_default(app_on_file):
+    app = app_on_file("""
+        CREATE TABLE challenges (
+            id VARCHAR(36) NOT NULL, user_id VARCHAR(36) NOT NULL, plan_type VARCHAR(20) NOT NULL,
+            initial_balance FLOAT NOT NULL, current_balance FLOAT NOT NULL, status VARCHAR(20) NOT NULL,
+            max_daily_loss_pct FLOAT, max_total_loss_pct FLOAT, profit_target_pct FLOAT,
+            start_date DATETIME, end_date DATETIME, payment_status VARCHAR(20), payment_method VARCHAR(20),
+            created_at DATETIME, updated_at DATETIME, daily_start_balance FLOAT DEFAULT 0.0,
+            last_reset_date DATETIME, failed_reason TEXT, completed_at TEXT, PRIMARY KEY (id)
+        );
+        INSERT INTO challenges (id, user_id, plan_type, initial_balance, current_balance, status)
+        VALUES ('c1', 'u1', 'starter', 10000.0, 10000.0, 'active');
+    """)
+
+    with app.app_context():
+        assert 'version' in _columns('challenges')
+        challenge = db.session.get(Challenge, 'c1')
+        assert challenge.version == 0
+        assert challenge.apply_pnl(50.0) == 10050.0
+        assert challenge.version == 1
+
+
+def test_upgrade_adds_archive_columns_to_legacy_leaderboards(app_on_file):
+    app = app_on_file("""
+        CREATE TABLE leaderboards (
+            id VARCHAR(36) NOT NULL, user_id VARCHAR(36) NOT NULL, username VARCHAR(80) NOT NULL,
+            profit_percentage FLOAT NOT NULL, rank INTEGER NOT NULL, month VARCHAR(7) NOT NULL,
+            created_at DATETIME, PRIMARY KEY (id)
+        );
+    """)
+
+    with app.app_context():
+        assert {'challenge_id', 'country', 'profit_value'} <= _columns('leaderboards')
+        assert 'idx_leaderboard_month_rank' in {i['name'] for i in inspect(db.engine).get_indexes('leaderboards')}
+
+
+def test_shipped_database_sql_matches_the_models(app):
+    # Tables des fonctionnalités de la série, colonne pour colonne avec les modèles
+    dump = sqlite3.connect(':memory:')
+    with open(DATABASE_SQL) as f:
+        dump.executescript(f.read())
+    for table in ('equity_snapshots', 'pending_orders', 'leaderboards', 'ts_trades', 'challenges', 'users'):
+        columns = {row[1] for row in dump.execute(f'PRAGMA table_info("{table}")')}
+        assert columns == {c.name for c in db.metadata.tables[table].columns}, table
+
+
+def test_upgrade_backfills_completed_at_of_finished_challenges(app_on_file):
+    with open(DATABASE_SQL) as f:
+        app = app_on_file(f.read())
+
+    with app.app_context():
+        finished = Challenge.query.filter(Challenge.status.in_(['passed', 'failed'])).all()
+        assert all(c.completed_at is not None for c in finished)
+        assert Challenge.query.filter(Challenge.status == 'active', Challenge.completed_at.isnot(None)).count() == 0
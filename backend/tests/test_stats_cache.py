@@ -0,0 +1,100 @@
+import logging
+from sqlalchemy import update, text
+from app import db
+from app.models import Trade, Challenge, MonthlyProfit
+from app.services import stats_service
+from app.services.trade_events import register_trade_close_listener, notify_trade_closed, _trade_close_listeners
+
+
+def _open_trade(challenge):
+    trade = Trade(challenge_id=challenge.id, user_id=challenge.user_id, symbol='AAPL', trade_type='BUY',
+                  quantity=1, entry_price=100.0)
+    db.session.add(trade)
+    db.session.commit()
+    return trade
+
+
+def test_stats_are_invalidated_after_commit_only(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    trade = _open_trade(challenge)
+    assert stats_service.get_trade_stats(challenge_id=challenge.id)['total_trades'] == 0
+
+    trade.close_trade(110.0, challenge)
+    # Lecture concurrente avant le commit : le cache n'a pas été vidé, rien de périmé n'est réinséré
+    assert ('challenge', challenge.id) in stats_service._stats_cache
+    db.session.commit()
+
+    assert ('challenge', challenge.id) not in stats_service._stats_cache
+    assert stats_service.get_trade_stats(challenge_id=challenge.id)['total_trades'] == 1
+
+
+def test_rolled_back_close_keeps_the_cache(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    trade = _open_trade(challenge)
+    stats_service.get_trade_stats(challenge_id=challenge.id)
+
+    trade.close_trade(110.0, challenge)
+    db.session.rollback()
+    db.session.commit()
+
+    assert ('challenge', challenge.id) in stats_service._stats_cache
+
+
+def test_computation_overtaken_by_invalidation_is_not_cached(app, make_user, make_challenge, monkeypatch):
+    challenge = make_challenge(make_user())
+    compute = stats_service.compute_trade_stats
+
+    def racing_compute(**kwargs):
+        stats = compute(**kwargs)
+        stats_service.invalidate_trade_stats([('challenge', challenge.id)])
+        return stats
+
+    monkeypatch.setattr(stats_service, 'compute_trade_stats', racing_compute)
+    stats_service.get_trade_stats(challenge_id=challenge.id)
+    assert ('challenge', challenge.id) not in stats_service._stats_cache
+
+
+def test_failing_listener_is_logged(app, make_user, make_challenge, caplog):
+    challenge = make_challenge(make_user())
+    trade = _open_trade(challenge)
+
+    def broken_listener(trade, challenge):
+        raise RuntimeError('agrégat indisponible')
+
+    register_trade_close_listener(broken_listener)
+    try:
+        with caplog.at_level(logging.ERROR, logger='app.services.trade_events'):
+            notify_trade_closed(trade, challenge)
+    finally:
+        _trade_close_listeners.remove(broken_listener)
+
+    record = next(r for r in caplog.records if 'broken_listener' in r.getMessage())
+    assert record.exc_info is not None
+
+
+def test_failing_listener_rolls_back_only_its_writes(app, make_user, make_challenge):
+    challenge = make_challenge(make_user())
+    trade = _open_trade(challenge)
+    stats_service.get_trade_stats(challenge_id=challenge.id)
+
+    def half_written_listener(trade, challenge):
+        db.session.execute(update(Challenge).where(Challenge.id == challenge.id)
+                           .values(failed_reason='écriture partielle'))
+        # Erreur SQL : sur PostgreSQL, la transaction entière serait avortée sans savepoint
+        db.session.execute(text('SELECT * FROM missing_aggregate'))
+
+    register_trade_close_listener(half_written_listener)
+    try:
+        trade.close_trade(110.0, challenge)
+        db.session.commit()
+    finally:
+        _trade_close_listeners.remove(half_written_listener)
+
+    db.session.expire_all()
+    assert db.session.get(Trade, trade.id).is_closed
+    assert db.session.get(Challenge, challenge.id).current_balance == 10010.0
+    assert db.session.get(Challenge, challenge.id).failed_reason is None
+    # Les autres listeners ont écrit leurs agrégats ; le rollback du savepoint n'a pas effacé
+    # l'invalidation différée du cache
+    assert ('challenge', challenge.id) not in stats_service._stats_cache
+    assert MonthlyProfit.query.filter_by(challenge_id=challenge.id).one().profit_value == 10.0
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+from app import db
+from app.models import Trade
+
+
+def _add_trades(challenge, count, symbol='AAPL', **kwargs):
+    start = datetime(2024, 1, 1)
+    trades = [Trade(challenge_id=challenge.id, user_id=challenge.user_id, symbol=symbol, trade_type='BUY',
+                    quantity=1, entry_price=100.0, timestamp=start + timedelta(minutes=i), **kwargs)
+              for i in range(count)]
+    db.session.add_all(trades)
+    db.session.commit()
+    return trades
+
+
+def _all_pages(client, url, headers, **params):
+    ids, cursor = [], None
+    while True:
+        query = dict(params, **({'cursor': cursor} if cursor else {}))
+        response = client.get(url, headers=headers, query_string=query)
+        assert response.status_code == 200, response.json
+        ids += [t['id'] for t in response.json['trades']]
+        cursor = response.json['next_cursor']
+        if not cursor:
+            return ids
+
+
+def test_pages_cover_trades_with_null_timestamp(app, client, make_user, make_challenge, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)
+    trades = _add_trades(challenge, 5, is_closed=True)
+    null_ids = {t.id for t in trades[:3]}
+    # Lignes héritées sans horodatage (colonne nullable)
+    db.session.query(Trade).filter(Trade.id.in_(null_ids)).update({'timestamp': None}, synchronize_session=False)
+    db.session.commit()
+
+    url = f'/api/trading/challenge/{challenge.id}/trades'
+    ids = _all_pages(client, url, auth_headers(user), limit=2)
+
+    assert sorted(ids) == sorted(t.id for t in trades)
+    assert len(ids) == len(set(ids))
+    # Clés nulles en fin de liste
+    assert set(ids[2:]) == null_ids
+
+
+def test_open_positions_are_not_hidden_by_recent_closed_trades(app, client, make_user, make_challenge,
+                                                               auth_headers, quotes):
+    user = make_user()
+    challenge = make_challenge(user)
+    quotes['AAPL'] = 100.0
+    old_open = _add_trades(challenge, 1)[0]
+    old_open.timestamp = datetime(2023, 1, 1)
+    _add_trades(challenge, 3, is_closed=True)
+
+    url = f'/api/trading/challenge/{challenge.id}/trades'
+    ids = _all_pages(client, url, auth_headers(user), status='open', limit=1)
+    assert ids == [old_open.id]
+
+
+def test_symbol_filter_matches_legacy_raw_symbols(app, client, make_user, make_challenge, auth_headers):
+    user = make_user()
+    challenge = make_challenge(user)
+    legacy = _add_trades(challenge, 1, symbol='aapl')[0]
+    current = _add_trades(challenge, 1, symbol='AAPL')[0]
+    _add_trades(challenge, 1, symbol='TSLA')
+
+    response = client.get('/api/trading/history', headers=auth_headers(user), query_string={'symbol': ' Aapl'})
+    assert response.status_code == 200
+    assert {t['id'] for t in response.json['trades']} == {legacy.id, current.id}
+
+
+def test_execute_stores_normalized_symbol(app, client, make_user, make_challenge, auth_headers, quotes):
+    user = make_user()
+    challenge = make_challenge(user)
+    quotes['AAPL'] = 100.0
+
+    response = client.post('/api/trading/execute', headers=auth_headers(user),
+                           json={'challenge_id': challenge.id, 'symbol': ' aapl ', 'type': 'BUY', 'quantity': 1})
+    assert response.status_code in (200, 201), response.json
+    assert Trade.query.one().symbol == 'AAPL'
+
+    response = client.post('/api/trading/execute', headers=auth_headers(user),
+                           json={'challenge_id': challenge.id, 'symbol': 42, 'type': 'BUY', 'quantity': 1})
+    assert response.status_code == 400
@@ -0,0 +1,57 @@
+from app import db
+from app.models import Trade, ChallengeStatus
+from app.services.price_service import quote_refresher
+from app.services.trigger_service import protective_engine
+
+
+def _open_trade(challenge, **kwargs):
+    trade = Trade(challenge_id=challenge.id, user_id=challenge.user_id, symbol='AAPL', trade_type='BUY',
+                  quantity=10, entry_price=100.0, **kwargs)
+    db.session.add(trade)
+    db.session.commit()
+    protective_engine.register(trade)
+    return trade
+
+
+def test_stop_loss_fires_from_background_refresh(app, make_user, make_challenge, quotes):
+    challenge = make_challenge(make_user())
+    trade = _open_trade(challenge, stop_loss=95.0, take_profit=120.0)
+    assert 'AAPL' in quote_refresher.tracked_symbols()
+
+    quotes['AAPL'] = 94.0
+    quote_refresher.refresh()
+
+    db.session.expire_all()
+    trade = db.session.get(Trade, trade.id)
+    assert trade.is_closed and trade.close_reason == 'stop_loss'
+    assert trade.profit_loss == -60.0
+    assert challenge.current_balance == 9940.0
+    assert 'AAPL' not in protective_engine.symbols()
+
+
+def test_public_price_endpoint_never_closes_trades(app, client, make_user, make_challenge, quotes):
+    challenge = make_challenge(make_user())
+    trade = _open_trade(challenge, stop_loss=95.0)
+
+    quotes['AAPL'] = 90.0
+    assert client.get('/api/trading/price/AAPL').status_code == 200
+    assert client.get('/api/trading/prices/live?symbols=AAPL').status_code == 200
+
+    db.session.expire_all()
+    assert not db.session.get(Trade, trade.id).is_closed
+    assert challenge.status == ChallengeStatus.ACTIVE.value
+
+
+def test_protection_is_validated_against_current_price(app, client, make_user, make_challenge, quotes, auth_headers):
+    user = make_user()
+    trade = _open_trade(make_challenge(user))
+    headers = auth_headers(user)
+
+    # Entrée à 100, prix courant à 90 : un stop à 92 serait déjà franchi
+    quotes['AAPL'] = 90.0
+    response = client.patch(f'/api/trading/trade/{trade.id}/protection', json={'stop_loss': 92.0}, headers=headers)
+    assert response.status_code == 400
+
+    response = client.patch(f'/api/trading/trade/{trade.id}/protection', json={'stop_loss': 85.0}, headers=headers)
+    assert response.status_code == 200
+    assert response.json['trade']['stop_loss'] == 85.0
@@ -0,0 +1,83 @@
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+from app import db
+from app.models import Challenge, Trade, DailyRollup
+from app.services.killer_service import evaluate_killer_rules
+from app.services.unit_of_work import commit_unit_of_work
+
+
+@contextmanager
+def _count_commits():
+    commits = []
+
+    def record(session):
+        # Les libérations de savepoint (listeners de clôture) ne sont pas des commits
+        if not session.in_nested_transaction():
+            commits.append(session)
+
+    event.listen(Session, 'after_commit', record)
+    try:
+        yield commits
+    finally:
+        event.remove(Session, 'after_commit', record)
+
+
+def _open(challenge, quantity=1):
+    trade = Trade(challenge_id=challenge.id, user_id=challenge.user_id, symbol='AAPL', trade_type='BUY',
+                  quantity=quantity, entry_price=100.0)
+    db.session.add(trade)
+    db.session.commit()
+    return trade
+
+
+ROUTES = {
+    'execute': lambda c, t, p: ('post', '/api/trading/execute',
+                             {'challenge_id': c, 'symbol': 'AAPL', 'type': 'BUY', 'quantity': 1}),
+    'batch': lambda c, t, p: ('post', '/api/trading/execute/batch', {'challenge_id': c, 'orders': [
+        {'symbol': 'AAPL', 'type': 'BUY', 'quantity': 1}, {'symbol': 'AAPL', 'type': 'SELL', 'quantity': 1}]}),
+    'close': lambda c, t, p: ('put', f'/api/trading/close-trade/{t}', {'exit_price': p}),
+    'status': lambda c, t, p: ('get', f'/api/trading/challenge/{c}/status', None),
+    'sync': lambda c, t, p: ('post', f'/api/trading/challenge/{c}/sync', None),
+}
+
+
+@pytest.mark.parametrize('route', list(ROUTES))
+@pytest.mark.parametrize('price', [100.0, 50.0], ids=['no_transition', 'killer_transition'])
+def test_trading_routes_commit_once(app, client, make_user, make_challenge, quotes, auth_headers, route, price):
+    user = make_user()
+    challenge = make_challenge(user)
+    quotes['AAPL'] = 100.0
+    trade = _open(challenge, quantity=30)
+    _open(challenge, quantity=30)
+    # À 50 la perte totale dépasse la limite : la requête fait échouer le challenge
+    quotes['AAPL'] = price
+    method, url, body = ROUTES[route](challenge.id, trade.id, price)
+
+    with _count_commits() as commits:
+        response = getattr(client, method)(url, headers=auth_headers(user), json=body)
+
+    assert response.status_code < 400, response.json
+    assert len(commits) == 1
+    db.session.expire_all()
+    assert db.session.get(Challenge, challenge.id).status == ('failed' if price == 50.0 else 'active')
+
+
+def test_pending_transition_does_not_overwrite_a_concurrent_outcome(app, make_user, make_challenge, quotes):
+    challenge = make_challenge(make_user())
+    quotes['AAPL'] = 100.0
+    _open(challenge, quantity=30)
+    quotes['AAPL'] = 50.0
+
+    evaluate_killer_rules(challenge.id)
+    # Un autre processus valide le challenge avant le commit de la transition en attente
+    db.session.execute(update(Challenge).where(Challenge.id == challenge.id)
+                       .values(status='passed', failed_reason=None)
+                       .execution_options(synchronize_session=False))
+    commit_unit_of_work()
+
+    db.session.expire_all()
+    stored = db.session.get(Challenge, challenge.id)
+    assert (stored.status, stored.failed_reason) == ('passed', None)
+    assert not DailyRollup.query.filter_by(metric='challenges_failed').filter(DailyRollup.count > 0).count()
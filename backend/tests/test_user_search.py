@@ -0,0 +1,62 @@
+from sqlalchemy import text
+from app import db
+from app.models import User
+from app.services.user_search import search_users
+
+
+def _usernames(term):
+    users, _next, mode = search_users(term)
+    assert mode == 'text'
+    return [u['username'] for u in users]
+
+
+def test_text_search_survives_rowid_renumbering(app, make_user):
+    for name in ('alpha', 'bravo', 'charlie', 'delta', 'echo'):
+        make_user(username=f'xx_{name}', email=f'{name}@test.ma')
+    db.session.delete(User.query.filter_by(username='xx_bravo').one())
+    db.session.commit()
+
+    # Rowid implicites renumérotés sous l'index, comme peut le faire VACUUM sur une table
+    # sans INTEGER PRIMARY KEY (ou un rechargement de dump)
+    db.session.execute(text("UPDATE users SET rowid = rowid + 100"))
+    db.session.execute(text("UPDATE users SET rowid = 106 - rowid"))
+    db.session.commit()
+
+    assert _usernames('elta') == ['xx_delta']
+    assert _usernames('cho') == ['xx_echo']
+    assert _usernames('ravo') == []
+
+
+def test_renamed_and_new_users_are_indexed(app, make_user):
+    user = make_user(username='xx_first', email='first@test.ma')
+    user.username = 'xx_renamed'
+    db.session.commit()
+    make_user(username='xx_second', email='second@test.ma')
+
+    assert _usernames('enamed') == ['xx_renamed']
+    assert _usernames('xx_fir') == []
+    assert _usernames('econd') == ['xx_second']
+
+
+def test_startup_rebuilds_a_rowid_keyed_index(app_on_file):
+    app = app_on_file("""
+        CREATE TABLE users (
+            id VARCHAR(36) NOT NULL, username VARCHAR(80) NOT NULL, email VARCHAR(120) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL, role VARCHAR(20), balance FLOAT NOT NULL,
+            created_at DATETIME, last_login DATETIME, is_active BOOLEAN, country TEXT,
+            PRIMARY KEY (id), UNIQUE (username), UNIQUE (email)
+        );
+        CREATE VIRTUAL TABLE users_fts USING fts5(username, email, content='users', tokenize='trigram');
+        CREATE TRIGGER users_fts_insert AFTER INSERT ON users BEGIN
+            INSERT INTO users_fts(rowid, username, email) VALUES (new.rowid, new.username, new.email); END;
+        INSERT INTO users VALUES ('u1', 'xx_gone', 'gone@test.ma', 'x', 'user', 0, NULL, NULL, 1, NULL);
+        INSERT INTO users VALUES ('u2', 'xx_kept', 'kept@test.ma', 'x', 'user', 0, NULL, NULL, 1, NULL);
+        DELETE FROM users WHERE id = 'u1';
+        VACUUM;
+    """)
+
+    with app.app_context():
+        sql = db.session.execute(text("SELECT sql FROM sqlite_master WHERE name = 'users_fts'")).scalar()
+        assert 'search_rowid' in sql
+        assert _usernames('kept') == ['xx_kept']
+        assert _usernames('gone') == []
@@ -14,6 +14,18 @@ CREATE TABLE assets (
 	PRIMARY KEY (id), 
 	UNIQUE (symbol)
 );
+CREATE TABLE audit_logs (
+	id INTEGER NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	actor_id VARCHAR(36), 
+	action VARCHAR(50) NOT NULL, 
+	target_type VARCHAR(30) NOT NULL, 
+	target_id VARCHAR(36), 
+	"before" JSON, 
+	"after" JSON, 
+	ip VARCHAR(45), 
+	PRIMARY KEY (id)
+);
 CREATE TABLE challenges (
 	id VARCHAR(36) NOT NULL, 
 	user_id VARCHAR(36) NOT NULL, 
@@ -29,78 +41,126 @@ CREATE TABLE challenges (
 	payment_status VARCHAR(20), 
 	payment_method VARCHAR(20), 
 	created_at DATETIME, 
-	updated_at DATETIME, daily_start_balance FLOAT DEFAULT 0.0, last_reset_date DATETIME, failed_reason TEXT, completed_at TEXT, 
+	updated_at DATETIME, daily_start_balance FLOAT DEFAULT 0.0, last_reset_date DATETIME, failed_reason TEXT, completed_at TEXT, version INTEGER DEFAULT 0 NOT NULL, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(user_id) REFERENCES users (id)
 );
-INSERT INTO "challenges" VALUES('ebd3e658-aee1-4f88-95b8-a56033d75b58','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:15:01.336979','2026-02-10 12:15:01.336979','completed','CMI','2026-01-11 12:15:01.339584','2026-01-11 22:31:00.674486',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('997665e3-dc9d-45d0-874c-c58f4ccc8b05','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:15:23.530518','2026-02-10 12:15:23.530518','completed','CMI','2026-01-11 12:15:23.531292','2026-01-11 22:31:02.494684',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('dd979976-eb37-425d-ad22-6df852e5f5b9','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:19:54.703465','2026-02-10 12:19:54.703465','completed','CMI','2026-01-11 12:19:54.705510','2026-01-11 22:31:05.023276',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('3b4728ef-234b-4675-81f2-0462c7adeb84','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:22:27.651298','2026-02-10 12:22:27.651298','completed','CMI','2026-01-11 12:22:27.651984','2026-01-11 22:31:06.643507',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('5f7848cd-8824-4f9e-b51e-3f78115714c0','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:29:10.606675','2026-02-10 12:29:10.606675','completed','CMI','2026-01-11 12:29:10.607386','2026-01-11 22:31:08.171982',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('e9a5bd21-35d5-48bf-9e18-0a8df69c8680','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:35:52.309950','2026-02-10 12:35:52.309950','completed','CMI','2026-01-11 12:35:52.312644','2026-01-11 22:31:09.679150',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('c5efdfcb-5fa0-4b07-83fc-e49d4f7ecaca','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:44:37.898058','2026-02-10 12:44:37.898058','completed','CMI','2026-01-11 12:44:37.898649','2026-01-11 23:23:50.060199',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('6119750c-c1c6-496e-9590-22274dc7bf1a','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:49:25.687139','2026-02-10 12:49:25.687139','completed','CMI','2026-01-11 12:49:25.687843','2026-01-11 23:23:53.416521',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('e468e28b-1981-4799-b48f-b733f933eee4','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 13:02:00.987675','2026-02-10 13:02:00.987675','completed','CMI','2026-01-11 13:02:00.988237','2026-01-11 23:24:12.204492',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('a040e286-03ac-44a7-8191-d07b8ccab4b1','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'failed',5.0,10.0,10.0,'2026-01-11 13:13:47.150063','2026-02-10 13:13:47.150063','completed','CMI','2026-01-11 13:13:47.150720','2026-01-12 19:13:52.231546',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('ce27a5ad-76c9-4ad3-a434-bab3fe103de1','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 13:22:04.372935','2026-02-10 13:22:04.372935','completed','CMI','2026-01-11 13:22:04.373574','2026-01-11 13:22:04.373579',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('c3ec4e3d-03bc-4901-9f83-a172035c26da','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','starter',5000.0,5000.0,'active',5.0,10.0,10.0,'2026-01-11 13:23:11.482714','2026-02-10 13:23:11.482714','completed','CMI','2026-01-11 13:23:11.485253','2026-01-11 13:23:11.485286',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('9a78af0c-ec58-4b11-85ae-e579fcfa4ac1','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 13:28:49.884706','2026-02-10 13:28:49.884706','completed','CMI','2026-01-11 13:28:49.885676','2026-01-11 13:28:49.885721',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('1e4d0e13-3593-474a-9520-ad040f374eca','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 13:53:05.031032','2026-02-10 13:53:05.031032','completed','CMI','2026-01-11 13:53:05.034857','2026-01-14 23:42:46.939841',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('0e812591-f265-492f-9878-e798229653af','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 13:56:10.736289','2026-02-10 13:56:10.736289','completed','CMI','2026-01-11 13:56:10.738357','2026-01-11 13:56:10.738373',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('b1f59380-65a9-4a8e-8394-f7ae228aba99','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:01:52.300078','2026-02-10 14:01:52.300078','completed','CMI','2026-01-11 14:01:52.300727','2026-01-11 14:01:52.300733',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('e1c3b2b0-8f8f-4270-853a-31afe026ea0c','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:09:24.981082','2026-02-10 14:09:24.981082','completed','CMI','2026-01-11 14:09:24.982018','2026-01-11 14:09:24.982155',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('4ce2ba19-8b94-48cb-a72a-af5e0832f5f9','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:29:15.347389','2026-02-10 14:29:15.347389','completed','CMI','2026-01-11 14:29:15.350196','2026-01-11 14:29:15.350207',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('a46f33e8-b571-4582-98bb-d561c207ddb7','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:37:04.292325','2026-02-10 14:37:04.292325','completed','CMI','2026-01-11 14:37:04.297838','2026-01-11 14:37:04.297855',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('612b917f-f80b-4940-b7ac-f9904f9c7b3f','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:37:59.176734','2026-02-10 14:37:59.176734','completed','CMI','2026-01-11 14:37:59.177524','2026-01-11 14:37:59.177529',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('95a0d294-a299-4754-8a2a-e5760cfdab37','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:50:32.721137','2026-02-10 14:50:32.721137','completed','CMI','2026-01-11 14:50:32.721780','2026-01-11 14:50:32.721784',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('f8564861-f6a6-4998-9a2b-ef01824e452f','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:50:59.986809','2026-02-10 14:50:59.986809','completed','CMI','2026-01-11 14:50:59.987556','2026-01-11 14:50:59.987564',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('d69788f5-b84b-4ae4-a0b4-ac5b0f6cc91d','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:06:22.289345','2026-02-10 15:06:22.289345','completed','CMI','2026-01-11 15:06:22.289753','2026-01-11 15:06:22.289756',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('e906eb7c-f555-4282-9d7f-0be0e14ffcbf','d9a2d33b-cb4d-460d-843c-3d512596d939','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:10:14.741709','2026-02-10 15:10:14.741709','completed','CMI','2026-01-11 15:10:14.742461','2026-01-11 15:10:14.742466',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('417c5f62-c5c1-4336-8bed-273e5faf25b2','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:21:55.020489','2026-02-10 15:21:55.020489','completed','CMI','2026-01-11 15:21:55.022529','2026-01-11 15:21:55.022544',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('e3416faa-335f-42a0-adc4-c66d2fa9bef2','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:34:24.951002','2026-02-10 15:34:24.951002','completed','CMI','2026-01-11 15:34:24.952574','2026-01-11 15:34:24.952579',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('b3826987-67c6-4b73-8b9d-12c329a42d93','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:01:29.081603','2026-02-10 16:01:29.081603','completed','CMI','2026-01-11 16:01:29.082577','2026-01-11 16:01:29.082587',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('eaacc1f6-6583-4b1c-9026-6281d8334020','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:24:42.118402','2026-02-10 16:24:42.118402','completed','CMI','2026-01-11 16:24:42.124284','2026-01-11 16:24:42.124301',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('b2a9dad8-8228-483f-b192-554e6cb58db3','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:28:28.981026','2026-02-10 16:28:28.981026','completed','CMI','2026-01-11 16:28:28.981779','2026-01-11 16:28:28.981785',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('ef42c206-9df4-431f-bd1c-9bebc25f8973','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:35:09.070095','2026-02-10 16:35:09.070095','completed','CMI','2026-01-11 16:35:09.075446','2026-01-11 16:35:09.075462',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('6b2e605d-b22b-407b-8421-e05ade1df94e','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 17:16:50.801680','2026-02-10 17:16:50.801680','completed','CMI','2026-01-11 17:16:50.803533','2026-01-11 17:16:50.803539',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('b610cab6-8438-4336-b44b-4018e888b0cc','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 17:43:09.933853','2026-02-10 17:43:09.933853','completed','CMI','2026-01-11 17:43:09.938296','2026-01-11 17:43:09.938313',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('5a5c19cf-efc7-433c-9169-2a0be7f25d0b','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 17:48:53.565099','2026-02-10 17:48:53.565099','completed','CMI','2026-01-11 17:48:53.566230','2026-01-11 23:24:40.202125',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('d98d0a12-93f1-4809-97f6-a61b5ba9ff72','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 18:13:08.911042','2026-02-10 18:13:08.911042','completed','CMI','2026-01-11 18:13:08.915149','2026-01-11 23:24:34.970711',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('b79037c7-2272-40e4-bda4-02a7ab3c342c','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 18:21:49.166189','2026-02-10 18:21:49.166189','completed','CMI','2026-01-11 18:21:49.168181','2026-01-11 23:24:16.252951',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('3672e9b0-0379-4d37-b999-67333cc6dbda','d2165363-dd69-4d09-b916-19769de142dc','pro',15000.0,15000.0,'failed',5.0,10.0,10.0,'2026-01-11 18:54:32.607283','2026-02-10 18:54:32.607283','completed','CMI','2026-01-11 18:54:32.610716','2026-01-11 22:31:36.938648',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('aedabed9-218f-4d00-b9ca-d5f526df022b','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0,'failed',5.0,10.0,10.0,'2026-01-11 19:46:48.647720','2026-02-10 19:46:48.647720','completed','CMI','2026-01-11 19:46:48.650817','2026-01-11 22:31:33.105307',0.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('45c61183-a445-44b0-a349-564c606a4b51','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,14994.64,'failed',5.0,10.0,10.0,'2026-01-11 20:30:01.553737','2026-02-10 20:30:01.553737','completed','CMI','2026-01-11 20:30:01.557397','2026-01-11 22:31:28.784701',15000.0,NULL,NULL,NULL);
-INSERT INTO "challenges" VALUES('44a11978-78e7-4d5e-ad5a-025098629bb5','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0002,'failed',5.0,10.0,10.0,'2026-01-11 22:35:26.404494','2026-02-10 22:35:26.404494','completed','CMI','2026-01-11 22:35:26.407020','2026-01-11 23:00:09.115296',15000.0,'2026-01-11 22:35:26.407032',NULL,NULL);
-INSERT INTO "challenges" VALUES('8d91810f-5d78-4604-8c79-45a61026b791','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,1.682007999999997264e+04,'passed',5.0,10.0,10.0,'2026-01-11 22:59:52.774593','2026-02-10 22:59:52.774593','completed','CMI','2026-01-11 22:59:52.776099','2026-01-11 23:23:22.954283',15000.0,'2026-01-11 22:59:52.776120',NULL,NULL);
-INSERT INTO "challenges" VALUES('63d18366-3a85-4190-acaa-d665d421be36','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elite',50000.0,49999.9,'active',5.0,10.0,10.0,'2026-01-11 23:25:23.226852','2026-02-10 23:25:23.226852','completed','CMI','2026-01-11 23:25:23.230730','2026-01-11 23:38:23.834932',50000.0,'2026-01-11 23:25:23.230753',NULL,NULL);
-INSERT INTO "challenges" VALUES('73ffd6a8-01d5-403e-a561-48a593b0fb3b','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 23:38:50.005779','2026-02-10 23:38:50.005779','completed','CMI','2026-01-11 23:38:50.007857','2026-01-11 23:38:50.007864',15000.0,'2026-01-11 23:38:50.007869',NULL,NULL);
-INSERT INTO "challenges" VALUES('49a2a479-319b-43a2-9355-a6fa68c2c48f','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elite',50000.0,50000.0,'active',5.0,10.0,10.0,'2026-01-12 00:13:48.079017','2026-02-11 00:13:48.079017','completed','CMI','2026-01-12 00:13:48.079859','2026-01-14 21:47:57.100186',50000.0,'2026-01-14 21:47:57.099412',NULL,NULL);
-INSERT INTO "challenges" VALUES('a310c663-02a3-418c-a89d-8e2df21b404c','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-12 00:14:13.655093','2026-02-11 00:14:13.655093','completed','CMI','2026-01-12 00:14:13.657319','2026-01-12 22:52:58.371865',15000.0,'2026-01-12 00:14:13.657362',NULL,NULL);
-INSERT INTO "challenges" VALUES('2a6eaf23-736e-4b05-9863-469b34ac177d','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elite',50000.0,50000.0,'passed',5.0,10.0,10.0,'2026-01-12 13:43:42.980078','2026-02-11 13:43:42.980078','completed','PayPal','2026-01-12 13:43:42.985073','2026-01-12 22:52:51.201760',50000.0,'2026-01-12 13:43:42.985085',NULL,NULL);
-INSERT INTO "challenges" VALUES('69beedeb-e81c-4120-8d2f-3a4f93b78d27','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,4.939080000000023574e+03,'failed',5.0,10.0,10.0,'2026-01-12 19:11:04.400397','2026-02-11 19:11:04.400397','completed','Crypto','2026-01-12 19:11:04.402748','2026-01-12 19:14:04.572662',5000.0,'2026-01-12 19:11:04.402761',NULL,NULL);
-INSERT INTO "challenges" VALUES('b52c51fc-b25d-41eb-b893-f9d27cc5b552','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,5.494932000000003609e+04,'failed',5.0,10.0,10.0,'2026-01-12 19:19:07.838678','2026-02-11 19:19:07.838678','completed','PayPal','2026-01-12 19:19:07.840847','2026-01-14 21:57:43.379014',5000.0,'2026-01-12 19:19:07.840872','daily_loss','2026-01-12 22:21:17.914298');
-INSERT INTO "challenges" VALUES('test-challenge-uuid','test-user-uuid','starter',5000.0,5000.0,'failed',5.0,10.0,10.0,'2026-01-12 20:31:14.379844','2026-02-11 20:31:14.379844','pending',NULL,'2026-01-12 20:31:14.398158','2026-01-12 20:31:14.867174',5000.0,'2026-01-12 20:31:14.398181',NULL,'2026-01-12 20:31:14.780726');
-INSERT INTO "challenges" VALUES('bd4feab8-5978-4377-a302-9ebdb37897b2','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,5000.0,'passed',5.0,10.0,10.0,'2026-01-12 22:26:41.071254','2026-02-11 22:26:41.071254','completed','CMI','2026-01-12 22:26:41.073091','2026-01-12 22:52:41.671980',5000.0,'2026-01-12 22:26:41.073102',NULL,NULL);
-INSERT INTO "challenges" VALUES('1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','253502a9-2bc4-4726-900c-7c052f44bb30','pro',15000.0,1.476933999999992193e+04,'failed',5.0,10.0,10.0,'2026-01-12 22:28:26.026397','2026-02-11 22:28:26.026397','completed','PayPal','2026-01-12 22:28:26.027327','2026-01-12 22:36:16.485441',15000.0,'2026-01-12 22:28:26.027345','daily_loss','2026-01-12 22:36:16.484760');
-INSERT INTO "challenges" VALUES('cf97835b-e6e8-49c8-b161-d180aca8bf5a','7f0413b5-88dd-4571-90bb-c5d942279760','starter',5000.0,5000.0,'passed',5.0,10.0,10.0,'2026-01-12 22:43:47.953575','2026-02-11 22:43:47.953575','completed','Crypto','2026-01-12 22:43:47.954122','2026-01-12 22:52:46.866608',5000.0,'2026-01-12 22:43:47.954129',NULL,NULL);
-INSERT INTO "challenges" VALUES('4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','7f0413b5-88dd-4571-90bb-c5d942279760','pro',15000.0,1.498739999999999781e+04,'failed',5.0,10.0,10.0,'2026-01-13 20:40:03.493725','2026-02-12 20:40:03.493725','completed','CMI','2026-01-13 20:40:03.496564','2026-01-14 20:28:18.640357',15000.0,'2026-01-14 19:53:08.609367','total_loss','2026-01-14 20:28:18.639740');
-INSERT INTO "challenges" VALUES('f7664151-e63e-4c8d-b422-769aea2c5dc1','7f0413b5-88dd-4571-90bb-c5d942279760','pro',15000.0,15004.2,'active',5.0,10.0,10.0,'2026-01-14 20:28:49.873203','2026-02-13 20:28:49.873203','completed','CMI','2026-01-14 20:28:49.874643','2026-01-14 21:54:07.203483',15000.0,'2026-01-14 20:28:49.874652',NULL,NULL);
-INSERT INTO "challenges" VALUES('79a0121a-c657-46d2-a7f8-a6a6b5c8873c','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','starter',5000.0,5.010339999999996508e+03,'active',5.0,10.0,10.0,'2026-01-14 21:49:17.035960','2026-02-13 21:49:17.035960','completed','CMI','2026-01-14 21:49:17.038245','2026-01-15 20:55:19.483701',5.010339999999996508e+03,'2026-01-15 20:55:19.482909',NULL,NULL);
-INSERT INTO "challenges" VALUES('74c37915-40b7-4c86-b15d-d229ec3dd9ed','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-14 21:56:02.017993','2026-02-13 21:56:02.017993','completed','CMI','2026-01-14 21:56:02.019143','2026-01-15 12:40:42.302667',15000.0,'2026-01-15 12:40:42.301829',NULL,NULL);
-INSERT INTO "challenges" VALUES('1ab575f8-e36f-4d7f-949e-c7d6a0b73454','aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','starter',5000.0,5015.12,'active',5.0,10.0,10.0,'2026-01-14 23:35:32.490683','2026-02-13 23:35:32.490683','completed','PayPal','2026-01-14 23:35:32.495905','2026-01-15 12:28:05.681252',5015.0,'2026-01-15 11:13:08.985785',NULL,NULL);
-INSERT INTO "challenges" VALUES('3f618324-d216-447c-90d4-9d67868ec740','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,5.019759999999878345e+03,'passed',5.0,10.0,10.0,'2026-01-15 12:41:33.004353','2026-02-14 12:41:33.004353','completed','CMI','2026-01-15 12:41:33.006695','2026-01-15 13:59:45.671889',5000.0,'2026-01-15 12:41:33.006709',NULL,NULL);
+INSERT INTO "challenges" VALUES('ebd3e658-aee1-4f88-95b8-a56033d75b58','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:15:01.336979','2026-02-10 12:15:01.336979','completed','CMI','2026-01-11 12:15:01.339584','2026-01-11 22:31:00.674486',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('997665e3-dc9d-45d0-874c-c58f4ccc8b05','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:15:23.530518','2026-02-10 12:15:23.530518','completed','CMI','2026-01-11 12:15:23.531292','2026-01-11 22:31:02.494684',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('dd979976-eb37-425d-ad22-6df852e5f5b9','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:19:54.703465','2026-02-10 12:19:54.703465','completed','CMI','2026-01-11 12:19:54.705510','2026-01-11 22:31:05.023276',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('3b4728ef-234b-4675-81f2-0462c7adeb84','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:22:27.651298','2026-02-10 12:22:27.651298','completed','CMI','2026-01-11 12:22:27.651984','2026-01-11 22:31:06.643507',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('5f7848cd-8824-4f9e-b51e-3f78115714c0','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:29:10.606675','2026-02-10 12:29:10.606675','completed','CMI','2026-01-11 12:29:10.607386','2026-01-11 22:31:08.171982',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('e9a5bd21-35d5-48bf-9e18-0a8df69c8680','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:35:52.309950','2026-02-10 12:35:52.309950','completed','CMI','2026-01-11 12:35:52.312644','2026-01-11 22:31:09.679150',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('c5efdfcb-5fa0-4b07-83fc-e49d4f7ecaca','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:44:37.898058','2026-02-10 12:44:37.898058','completed','CMI','2026-01-11 12:44:37.898649','2026-01-11 23:23:50.060199',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('6119750c-c1c6-496e-9590-22274dc7bf1a','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 12:49:25.687139','2026-02-10 12:49:25.687139','completed','CMI','2026-01-11 12:49:25.687843','2026-01-11 23:23:53.416521',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('e468e28b-1981-4799-b48f-b733f933eee4','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 13:02:00.987675','2026-02-10 13:02:00.987675','completed','CMI','2026-01-11 13:02:00.988237','2026-01-11 23:24:12.204492',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('a040e286-03ac-44a7-8191-d07b8ccab4b1','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'failed',5.0,10.0,10.0,'2026-01-11 13:13:47.150063','2026-02-10 13:13:47.150063','completed','CMI','2026-01-11 13:13:47.150720','2026-01-12 19:13:52.231546',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('ce27a5ad-76c9-4ad3-a434-bab3fe103de1','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 13:22:04.372935','2026-02-10 13:22:04.372935','completed','CMI','2026-01-11 13:22:04.373574','2026-01-11 13:22:04.373579',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('c3ec4e3d-03bc-4901-9f83-a172035c26da','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','starter',5000.0,5000.0,'active',5.0,10.0,10.0,'2026-01-11 13:23:11.482714','2026-02-10 13:23:11.482714','completed','CMI','2026-01-11 13:23:11.485253','2026-01-11 13:23:11.485286',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('9a78af0c-ec58-4b11-85ae-e579fcfa4ac1','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 13:28:49.884706','2026-02-10 13:28:49.884706','completed','CMI','2026-01-11 13:28:49.885676','2026-01-11 13:28:49.885721',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('1e4d0e13-3593-474a-9520-ad040f374eca','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 13:53:05.031032','2026-02-10 13:53:05.031032','completed','CMI','2026-01-11 13:53:05.034857','2026-01-14 23:42:46.939841',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('0e812591-f265-492f-9878-e798229653af','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 13:56:10.736289','2026-02-10 13:56:10.736289','completed','CMI','2026-01-11 13:56:10.738357','2026-01-11 13:56:10.738373',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('b1f59380-65a9-4a8e-8394-f7ae228aba99','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:01:52.300078','2026-02-10 14:01:52.300078','completed','CMI','2026-01-11 14:01:52.300727','2026-01-11 14:01:52.300733',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('e1c3b2b0-8f8f-4270-853a-31afe026ea0c','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:09:24.981082','2026-02-10 14:09:24.981082','completed','CMI','2026-01-11 14:09:24.982018','2026-01-11 14:09:24.982155',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('4ce2ba19-8b94-48cb-a72a-af5e0832f5f9','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:29:15.347389','2026-02-10 14:29:15.347389','completed','CMI','2026-01-11 14:29:15.350196','2026-01-11 14:29:15.350207',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('a46f33e8-b571-4582-98bb-d561c207ddb7','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:37:04.292325','2026-02-10 14:37:04.292325','completed','CMI','2026-01-11 14:37:04.297838','2026-01-11 14:37:04.297855',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('612b917f-f80b-4940-b7ac-f9904f9c7b3f','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:37:59.176734','2026-02-10 14:37:59.176734','completed','CMI','2026-01-11 14:37:59.177524','2026-01-11 14:37:59.177529',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('95a0d294-a299-4754-8a2a-e5760cfdab37','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:50:32.721137','2026-02-10 14:50:32.721137','completed','CMI','2026-01-11 14:50:32.721780','2026-01-11 14:50:32.721784',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('f8564861-f6a6-4998-9a2b-ef01824e452f','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 14:50:59.986809','2026-02-10 14:50:59.986809','completed','CMI','2026-01-11 14:50:59.987556','2026-01-11 14:50:59.987564',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('d69788f5-b84b-4ae4-a0b4-ac5b0f6cc91d','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:06:22.289345','2026-02-10 15:06:22.289345','completed','CMI','2026-01-11 15:06:22.289753','2026-01-11 15:06:22.289756',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('e906eb7c-f555-4282-9d7f-0be0e14ffcbf','d9a2d33b-cb4d-460d-843c-3d512596d939','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:10:14.741709','2026-02-10 15:10:14.741709','completed','CMI','2026-01-11 15:10:14.742461','2026-01-11 15:10:14.742466',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('417c5f62-c5c1-4336-8bed-273e5faf25b2','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:21:55.020489','2026-02-10 15:21:55.020489','completed','CMI','2026-01-11 15:21:55.022529','2026-01-11 15:21:55.022544',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('e3416faa-335f-42a0-adc4-c66d2fa9bef2','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 15:34:24.951002','2026-02-10 15:34:24.951002','completed','CMI','2026-01-11 15:34:24.952574','2026-01-11 15:34:24.952579',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('b3826987-67c6-4b73-8b9d-12c329a42d93','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:01:29.081603','2026-02-10 16:01:29.081603','completed','CMI','2026-01-11 16:01:29.082577','2026-01-11 16:01:29.082587',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('eaacc1f6-6583-4b1c-9026-6281d8334020','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:24:42.118402','2026-02-10 16:24:42.118402','completed','CMI','2026-01-11 16:24:42.124284','2026-01-11 16:24:42.124301',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('b2a9dad8-8228-483f-b192-554e6cb58db3','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:28:28.981026','2026-02-10 16:28:28.981026','completed','CMI','2026-01-11 16:28:28.981779','2026-01-11 16:28:28.981785',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('ef42c206-9df4-431f-bd1c-9bebc25f8973','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 16:35:09.070095','2026-02-10 16:35:09.070095','completed','CMI','2026-01-11 16:35:09.075446','2026-01-11 16:35:09.075462',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('6b2e605d-b22b-407b-8421-e05ade1df94e','2ef8157c-0ff5-4a34-855b-7c04d7ea041e','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 17:16:50.801680','2026-02-10 17:16:50.801680','completed','CMI','2026-01-11 17:16:50.803533','2026-01-11 17:16:50.803539',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('b610cab6-8438-4336-b44b-4018e888b0cc','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 17:43:09.933853','2026-02-10 17:43:09.933853','completed','CMI','2026-01-11 17:43:09.938296','2026-01-11 17:43:09.938313',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('5a5c19cf-efc7-433c-9169-2a0be7f25d0b','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 17:48:53.565099','2026-02-10 17:48:53.565099','completed','CMI','2026-01-11 17:48:53.566230','2026-01-11 23:24:40.202125',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('d98d0a12-93f1-4809-97f6-a61b5ba9ff72','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 18:13:08.911042','2026-02-10 18:13:08.911042','completed','CMI','2026-01-11 18:13:08.915149','2026-01-11 23:24:34.970711',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('b79037c7-2272-40e4-bda4-02a7ab3c342c','78697822-6498-4fd1-8e39-33cad20161b8','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-11 18:21:49.166189','2026-02-10 18:21:49.166189','completed','CMI','2026-01-11 18:21:49.168181','2026-01-11 23:24:16.252951',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('3672e9b0-0379-4d37-b999-67333cc6dbda','d2165363-dd69-4d09-b916-19769de142dc','pro',15000.0,15000.0,'failed',5.0,10.0,10.0,'2026-01-11 18:54:32.607283','2026-02-10 18:54:32.607283','completed','CMI','2026-01-11 18:54:32.610716','2026-01-11 22:31:36.938648',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('aedabed9-218f-4d00-b9ca-d5f526df022b','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0,'failed',5.0,10.0,10.0,'2026-01-11 19:46:48.647720','2026-02-10 19:46:48.647720','completed','CMI','2026-01-11 19:46:48.650817','2026-01-11 22:31:33.105307',0.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('45c61183-a445-44b0-a349-564c606a4b51','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,14994.64,'failed',5.0,10.0,10.0,'2026-01-11 20:30:01.553737','2026-02-10 20:30:01.553737','completed','CMI','2026-01-11 20:30:01.557397','2026-01-11 22:31:28.784701',15000.0,NULL,NULL,NULL,0);
+INSERT INTO "challenges" VALUES('44a11978-78e7-4d5e-ad5a-025098629bb5','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0002,'failed',5.0,10.0,10.0,'2026-01-11 22:35:26.404494','2026-02-10 22:35:26.404494','completed','CMI','2026-01-11 22:35:26.407020','2026-01-11 23:00:09.115296',15000.0,'2026-01-11 22:35:26.407032',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('8d91810f-5d78-4604-8c79-45a61026b791','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,1.682007999999997264e+04,'passed',5.0,10.0,10.0,'2026-01-11 22:59:52.774593','2026-02-10 22:59:52.774593','completed','CMI','2026-01-11 22:59:52.776099','2026-01-11 23:23:22.954283',15000.0,'2026-01-11 22:59:52.776120',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('63d18366-3a85-4190-acaa-d665d421be36','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elite',50000.0,49999.9,'active',5.0,10.0,10.0,'2026-01-11 23:25:23.226852','2026-02-10 23:25:23.226852','completed','CMI','2026-01-11 23:25:23.230730','2026-01-11 23:38:23.834932',50000.0,'2026-01-11 23:25:23.230753',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('73ffd6a8-01d5-403e-a561-48a593b0fb3b','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-11 23:38:50.005779','2026-02-10 23:38:50.005779','completed','CMI','2026-01-11 23:38:50.007857','2026-01-11 23:38:50.007864',15000.0,'2026-01-11 23:38:50.007869',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('49a2a479-319b-43a2-9355-a6fa68c2c48f','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elite',50000.0,50000.0,'active',5.0,10.0,10.0,'2026-01-12 00:13:48.079017','2026-02-11 00:13:48.079017','completed','CMI','2026-01-12 00:13:48.079859','2026-01-14 21:47:57.100186',50000.0,'2026-01-14 21:47:57.099412',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('a310c663-02a3-418c-a89d-8e2df21b404c','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','pro',15000.0,15000.0,'passed',5.0,10.0,10.0,'2026-01-12 00:14:13.655093','2026-02-11 00:14:13.655093','completed','CMI','2026-01-12 00:14:13.657319','2026-01-12 22:52:58.371865',15000.0,'2026-01-12 00:14:13.657362',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('2a6eaf23-736e-4b05-9863-469b34ac177d','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elite',50000.0,50000.0,'passed',5.0,10.0,10.0,'2026-01-12 13:43:42.980078','2026-02-11 13:43:42.980078','completed','PayPal','2026-01-12 13:43:42.985073','2026-01-12 22:52:51.201760',50000.0,'2026-01-12 13:43:42.985085',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('69beedeb-e81c-4120-8d2f-3a4f93b78d27','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,4.939080000000023574e+03,'failed',5.0,10.0,10.0,'2026-01-12 19:11:04.400397','2026-02-11 19:11:04.400397','completed','Crypto','2026-01-12 19:11:04.402748','2026-01-12 19:14:04.572662',5000.0,'2026-01-12 19:11:04.402761',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('b52c51fc-b25d-41eb-b893-f9d27cc5b552','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,5.494932000000003609e+04,'failed',5.0,10.0,10.0,'2026-01-12 19:19:07.838678','2026-02-11 19:19:07.838678','completed','PayPal','2026-01-12 19:19:07.840847','2026-01-14 21:57:43.379014',5000.0,'2026-01-12 19:19:07.840872','daily_loss','2026-01-12 22:21:17.914298',0);
+INSERT INTO "challenges" VALUES('test-challenge-uuid','test-user-uuid','starter',5000.0,5000.0,'failed',5.0,10.0,10.0,'2026-01-12 20:31:14.379844','2026-02-11 20:31:14.379844','pending',NULL,'2026-01-12 20:31:14.398158','2026-01-12 20:31:14.867174',5000.0,'2026-01-12 20:31:14.398181',NULL,'2026-01-12 20:31:14.780726',0);
+INSERT INTO "challenges" VALUES('bd4feab8-5978-4377-a302-9ebdb37897b2','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,5000.0,'passed',5.0,10.0,10.0,'2026-01-12 22:26:41.071254','2026-02-11 22:26:41.071254','completed','CMI','2026-01-12 22:26:41.073091','2026-01-12 22:52:41.671980',5000.0,'2026-01-12 22:26:41.073102',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','253502a9-2bc4-4726-900c-7c052f44bb30','pro',15000.0,1.476933999999992193e+04,'failed',5.0,10.0,10.0,'2026-01-12 22:28:26.026397','2026-02-11 22:28:26.026397','completed','PayPal','2026-01-12 22:28:26.027327','2026-01-12 22:36:16.485441',15000.0,'2026-01-12 22:28:26.027345','daily_loss','2026-01-12 22:36:16.484760',0);
+INSERT INTO "challenges" VALUES('cf97835b-e6e8-49c8-b161-d180aca8bf5a','7f0413b5-88dd-4571-90bb-c5d942279760','starter',5000.0,5000.0,'passed',5.0,10.0,10.0,'2026-01-12 22:43:47.953575','2026-02-11 22:43:47.953575','completed','Crypto','2026-01-12 22:43:47.954122','2026-01-12 22:52:46.866608',5000.0,'2026-01-12 22:43:47.954129',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','7f0413b5-88dd-4571-90bb-c5d942279760','pro',15000.0,1.498739999999999781e+04,'failed',5.0,10.0,10.0,'2026-01-13 20:40:03.493725','2026-02-12 20:40:03.493725','completed','CMI','2026-01-13 20:40:03.496564','2026-01-14 20:28:18.640357',15000.0,'2026-01-14 19:53:08.609367','total_loss','2026-01-14 20:28:18.639740',0);
+INSERT INTO "challenges" VALUES('f7664151-e63e-4c8d-b422-769aea2c5dc1','7f0413b5-88dd-4571-90bb-c5d942279760','pro',15000.0,15004.2,'active',5.0,10.0,10.0,'2026-01-14 20:28:49.873203','2026-02-13 20:28:49.873203','completed','CMI','2026-01-14 20:28:49.874643','2026-01-14 21:54:07.203483',15000.0,'2026-01-14 20:28:49.874652',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('79a0121a-c657-46d2-a7f8-a6a6b5c8873c','a56d92e4-7ab5-4c64-aa94-52f0a35aa568','starter',5000.0,5.010339999999996508e+03,'active',5.0,10.0,10.0,'2026-01-14 21:49:17.035960','2026-02-13 21:49:17.035960','completed','CMI','2026-01-14 21:49:17.038245','2026-01-15 20:55:19.483701',5.010339999999996508e+03,'2026-01-15 20:55:19.482909',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('74c37915-40b7-4c86-b15d-d229ec3dd9ed','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','pro',15000.0,15000.0,'active',5.0,10.0,10.0,'2026-01-14 21:56:02.017993','2026-02-13 21:56:02.017993','completed','CMI','2026-01-14 21:56:02.019143','2026-01-15 12:40:42.302667',15000.0,'2026-01-15 12:40:42.301829',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('1ab575f8-e36f-4d7f-949e-c7d6a0b73454','aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','starter',5000.0,5015.12,'active',5.0,10.0,10.0,'2026-01-14 23:35:32.490683','2026-02-13 23:35:32.490683','completed','PayPal','2026-01-14 23:35:32.495905','2026-01-15 12:28:05.681252',5015.0,'2026-01-15 11:13:08.985785',NULL,NULL,0);
+INSERT INTO "challenges" VALUES('3f618324-d216-447c-90d4-9d67868ec740','40f5beb0-3484-4fd2-9a2c-6621db2f6d99','starter',5000.0,5.019759999999878345e+03,'passed',5.0,10.0,10.0,'2026-01-15 12:41:33.004353','2026-02-14 12:41:33.004353','completed','CMI','2026-01-15 12:41:33.006695','2026-01-15 13:59:45.671889',5000.0,'2026-01-15 12:41:33.006709',NULL,NULL,0);
+CREATE TABLE daily_rollups (
+	metric VARCHAR(30) NOT NULL, 
+	dimension VARCHAR(30) NOT NULL, 
+	day DATE NOT NULL, 
+	count INTEGER NOT NULL, 
+	total FLOAT NOT NULL, 
+	updated_at DATETIME, 
+	PRIMARY KEY (metric, dimension, day)
+);
+CREATE TABLE equity_snapshots (
+	id INTEGER NOT NULL, 
+	challenge_id VARCHAR(36) NOT NULL, 
+	ts INTEGER NOT NULL, 
+	equity FLOAT NOT NULL, 
+	balance FLOAT NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(challenge_id) REFERENCES challenges (id) ON DELETE CASCADE
+);
 CREATE TABLE leaderboards (
 	id VARCHAR(36) NOT NULL, 
 	user_id VARCHAR(36) NOT NULL, 
 	username VARCHAR(80) NOT NULL, 
+	challenge_id VARCHAR(36), 
+	country VARCHAR(100), 
 	profit_percentage FLOAT NOT NULL, 
+	profit_value FLOAT, 
 	rank INTEGER NOT NULL, 
 	month VARCHAR(7) NOT NULL, 
 	created_at DATETIME, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(user_id) REFERENCES users (id)
 );
+CREATE TABLE monthly_asset_profits (
+	challenge_id VARCHAR(36) NOT NULL, 
+	month VARCHAR(7) NOT NULL, 
+	asset_class VARCHAR(20) NOT NULL, 
+	user_id VARCHAR(36) NOT NULL, 
+	capital FLOAT NOT NULL, 
+	profit_value FLOAT NOT NULL, 
+	profit_pct FLOAT NOT NULL, 
+	trade_count INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	PRIMARY KEY (challenge_id, month, asset_class), 
+	FOREIGN KEY(challenge_id) REFERENCES challenges (id) ON DELETE CASCADE, 
+	FOREIGN KEY(user_id) REFERENCES users (id)
+);
+CREATE TABLE monthly_profits (
+	challenge_id VARCHAR(36) NOT NULL, 
+	month VARCHAR(7) NOT NULL, 
+	user_id VARCHAR(36) NOT NULL, 
+	capital FLOAT NOT NULL, 
+	profit_value FLOAT NOT NULL, 
+	profit_pct FLOAT NOT NULL, 
+	trade_count INTEGER NOT NULL, 
+	updated_at DATETIME, 
+	PRIMARY KEY (challenge_id, month), 
+	FOREIGN KEY(challenge_id) REFERENCES challenges (id) ON DELETE CASCADE, 
+	FOREIGN KEY(user_id) REFERENCES users (id)
+);
 CREATE TABLE payments (
 	id VARCHAR(36) NOT NULL, 
 	user_id VARCHAR(36) NOT NULL, 
@@ -171,6 +231,27 @@ INSERT INTO "payments" VALUES('bc731d61-510d-4c75-94af-31eb17b2b83e','a56d92e4-7
 INSERT INTO "payments" VALUES('51b6a692-dc30-431b-b32c-4ed6d7abad63','40f5beb0-3484-4fd2-9a2c-6621db2f6d99',500.0,'DH','CMI','completed',NULL,'2026-01-14 21:56:01.992482','Paiement pour le plan Pro');
 INSERT INTO "payments" VALUES('0b1ab4c7-3481-4d15-8463-4d061982830c','aa12a74d-d6ac-4de4-aab9-6c4dc1b72258',200.0,'DH','PayPal','completed',NULL,'2026-01-14 23:35:32.484360','Paiement pour le plan Starter');
 INSERT INTO "payments" VALUES('2fcab640-d203-4dea-b657-2b4167bf26b5','40f5beb0-3484-4fd2-9a2c-6621db2f6d99',200.0,'DH','CMI','completed',NULL,'2026-01-15 12:41:32.951156','Paiement pour le plan Starter');
+CREATE TABLE pending_orders (
+	id VARCHAR(36) NOT NULL, 
+	challenge_id VARCHAR(36) NOT NULL, 
+	user_id VARCHAR(36) NOT NULL, 
+	symbol VARCHAR(10) NOT NULL, 
+	side VARCHAR(10) NOT NULL, 
+	order_type VARCHAR(10) NOT NULL, 
+	quantity INTEGER NOT NULL, 
+	price FLOAT NOT NULL, 
+	stop_loss FLOAT, 
+	take_profit FLOAT, 
+	status VARCHAR(20) NOT NULL, 
+	created_at DATETIME, 
+	filled_at DATETIME, 
+	filled_price FLOAT, 
+	trade_id VARCHAR(36), 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(challenge_id) REFERENCES challenges (id) ON DELETE CASCADE, 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(trade_id) REFERENCES ts_trades (id)
+);
 CREATE TABLE trades (
 	id VARCHAR(36) NOT NULL, 
 	trade_type VARCHAR(10) NOT NULL, 
@@ -217,107 +298,107 @@ CREATE TABLE ts_trades (
 	exit_price FLOAT, 
 	profit_loss FLOAT, 
 	timestamp DATETIME, 
-	is_closed BOOLEAN, user_id VARCHAR(36), created_at DATETIME, updated_at DATETIME, 
+	is_closed BOOLEAN, user_id VARCHAR(36), created_at DATETIME, updated_at DATETIME, stop_loss FLOAT, take_profit FLOAT, close_reason VARCHAR(20), 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(challenge_id) REFERENCES challenges (id)
 );
-INSERT INTO "ts_trades" VALUES('e4d630d8-ee70-433a-88d8-33d1ef2ac97a','b3826987-67c6-4b73-8b9d-12c329a42d93','XAUUSD','BUY',1,2024.13,NULL,0.0,'2026-01-11 16:15:59.604810',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('99b99333-36ec-467d-98ef-5ccd1081affa','b3826987-67c6-4b73-8b9d-12c329a42d93','XAUUSD','SELL',1,2024.53,NULL,0.0,'2026-01-11 16:17:36.848872',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('b241765f-cd9f-4195-91e1-fa5426338621','b3826987-67c6-4b73-8b9d-12c329a42d93','XAUUSD','BUY',1,2024.36,NULL,0.0,'2026-01-11 16:17:55.341542',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('d7a2c3e0-f4e0-4459-8fa5-e407bd6e2dd2','b2a9dad8-8228-483f-b192-554e6cb58db3','BTCUSD','BUY',1,90871.02,NULL,0.0,'2026-01-11 16:29:16.417743',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('d4abee7f-6ea4-4852-9f8f-675e3f258395','ef42c206-9df4-431f-bd1c-9bebc25f8973','BTCUSD','BUY',1,91147.37,NULL,0.0,'2026-01-11 16:35:38.545310',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('01de7e07-8076-4dc8-8227-c4d56bc947cb','ef42c206-9df4-431f-bd1c-9bebc25f8973','EURUSD','BUY',1,1.1658,NULL,0.0,'2026-01-11 16:36:14.369024',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('3a9473ea-c229-42d2-88d3-995ce87d3d7b','ef42c206-9df4-431f-bd1c-9bebc25f8973','BTCUSD','SELL',1,91147.37,NULL,0.0,'2026-01-11 16:36:24.998053',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('38a0ede6-0a69-44fc-97b5-6cdfafb64bab','6b2e605d-b22b-407b-8421-e05ade1df94e','IAM.CS','BUY',1,120.76,NULL,0.0,'2026-01-11 17:22:27.571238',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('b86ac04c-5a92-4d4d-b566-64facbffe599','6b2e605d-b22b-407b-8421-e05ade1df94e','TSLA','BUY',1,445.01,NULL,0.0,'2026-01-11 17:22:48.519346',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('339a18fb-841d-4543-b2f6-150941fa6019','6b2e605d-b22b-407b-8421-e05ade1df94e','EURUSD=X','SELL',1,1.1658,NULL,0.0,'2026-01-11 17:23:55.862473',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('c236be0f-ae5d-44e1-ad77-17a5c24bfffd','6b2e605d-b22b-407b-8421-e05ade1df94e','AFMA.CS','SELL',1,1449.72,NULL,0.0,'2026-01-11 17:24:30.234715',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('a5ba1692-9d69-47ec-a597-365f9aa4cbd4','b610cab6-8438-4336-b44b-4018e888b0cc','NVDA','BUY',1,184.86,NULL,0.0,'2026-01-11 17:43:55.932419',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('0f672ed5-30bb-494d-b26c-0b5a51db0273','d98d0a12-93f1-4809-97f6-a61b5ba9ff72','XAUUSD','BUY',1,2027.3,NULL,0.0,'2026-01-11 18:14:53.212162',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('c669b136-9f6f-4bb2-86cb-cbb2095b5512','d98d0a12-93f1-4809-97f6-a61b5ba9ff72','SOL-USD','SELL',1,139.11,NULL,0.0,'2026-01-11 18:15:57.349914',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('5fea0ae2-7d27-4390-bbf8-518b6797331a','b79037c7-2272-40e4-bda4-02a7ab3c342c','IAM.CS','BUY',1,112.81,NULL,0.0,'2026-01-11 18:30:36.193181',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('c00d2ba5-62b7-40df-9631-f827adc1f8d0','3672e9b0-0379-4d37-b999-67333cc6dbda','ATW.CS','BUY',1,485.06,NULL,0.0,'2026-01-11 18:54:49.300691',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('6f2c22c5-c958-4922-a710-a276cc46a9f1','3672e9b0-0379-4d37-b999-67333cc6dbda','EURUSD=X','BUY',1,1.1637,NULL,0.0,'2026-01-11 18:55:38.310646',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('7841e1ae-d2c9-41b8-bdab-0acfb68b1da8','3672e9b0-0379-4d37-b999-67333cc6dbda','AAPL','SELL',1,259.37,NULL,0.0,'2026-01-11 18:56:01.236556',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('c8b53984-9cee-4971-92f0-2d8889b046b3','aedabed9-218f-4d00-b9ca-d5f526df022b','IAM.CS','BUY',1,112.56,NULL,0.0,'2026-01-11 19:56:55.326437',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('28f6ce99-4b48-4520-8d8f-bd68668dad72','aedabed9-218f-4d00-b9ca-d5f526df022b','IAM.CS','BUY',1,112.42,NULL,0.0,'2026-01-11 20:02:48.025836',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('121f10d9-8577-4062-9beb-a056d3efb742','aedabed9-218f-4d00-b9ca-d5f526df022b','XAUUSD','BUY',1,2021.39,NULL,0.0,'2026-01-11 20:02:55.078906',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('86788a0a-1215-44e7-a022-c432e9bc8f6b','aedabed9-218f-4d00-b9ca-d5f526df022b','GBPUSD=X','SELL',1,1.3409,NULL,0.0,'2026-01-11 20:03:01.965205',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('6955fa4f-a6b7-4987-ad6a-61718b837963','aedabed9-218f-4d00-b9ca-d5f526df022b','GBPUSD=X','SELL',2,1.3409,NULL,0.0,'2026-01-11 20:19:26.478899',0,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('a9e3ebdb-b4b1-43e4-9046-0be45a47c286','45c61183-a445-44b0-a349-564c606a4b51','XAUUSD','BUY',1,2028.97,2029.53,5.599999999999454303e-01,'2026-01-11 20:30:19.114087',1,NULL,NULL,NULL);
-INSERT INTO "ts_trades" VALUES('6ec415ee-cb25-48ee-82af-66e135b5784d','45c61183-a445-44b0-a349-564c606a4b51','IAM.CS','BUY',1,112.65,112.88,2.299999999999897681e-01,'2026-01-11 20:30:41.739627',1,NULL,NULL,'2026-01-11 21:54:53.485108');
-INSERT INTO "ts_trades" VALUES('2079c655-e1fc-4895-9940-7c56c2a7b336','45c61183-a445-44b0-a349-564c606a4b51','XAUUSD','BUY',1,2029.62,2022.32,-7.299999999999954526e+00,'2026-01-11 20:59:37.140301',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 20:59:37.140318','2026-01-11 21:54:51.240030');
-INSERT INTO "ts_trades" VALUES('548ed099-b70e-4d44-8637-0f9447e7a10c','45c61183-a445-44b0-a349-564c606a4b51','NVDA','SELL',1,184.86,184.86,0.0,'2026-01-11 21:00:25.982017',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 21:00:25.982030','2026-01-11 21:18:14.412312');
-INSERT INTO "ts_trades" VALUES('688d39c7-14ac-4002-b878-d3ed9838c69a','45c61183-a445-44b0-a349-564c606a4b51','XAUUSD','BUY',1,2024.41,2025.56,1.149999999999863575e+00,'2026-01-11 21:10:12.179535',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 21:10:12.179544','2026-01-11 21:18:09.491946');
-INSERT INTO "ts_trades" VALUES('4e77fb7b-87b2-439f-bde4-78212a869d0f','44a11978-78e7-4d5e-ad5a-025098629bb5','EURUSD=X','BUY',1,1.1633,1.1635,1.999999999999779732e-04,'2026-01-11 22:36:15.445731',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 22:36:15.445738','2026-01-11 23:00:09.117397');
-INSERT INTO "ts_trades" VALUES('e743260c-2093-48f4-846a-d05c1af34693','8d91810f-5d78-4604-8c79-45a61026b791','XAUUSD','BUY',1,4500.9,4537.3,3.64000000000005457e+01,'2026-01-11 23:15:39.428833',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:15:39.428841','2026-01-11 23:23:19.306837');
-INSERT INTO "ts_trades" VALUES('a22a9acd-15f4-46de-a3b3-d1e25010a426','8d91810f-5d78-4604-8c79-45a61026b791','NVDA','SELL',1,184.86,184.86,0.0,'2026-01-11 23:15:46.783972',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:15:46.783978','2026-01-11 23:23:17.126764');
-INSERT INTO "ts_trades" VALUES('372518ab-4d4a-46b8-a884-246e639bd6af','8d91810f-5d78-4604-8c79-45a61026b791','BTC-USD','BUY',4,90451.63,90888.45,1.747279999999969733e+03,'2026-01-11 23:15:55.849632',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:15:55.849639','2026-01-11 23:23:15.065920');
-INSERT INTO "ts_trades" VALUES('a3a7455e-a8bf-485e-8996-ff166e8f8ab3','63d18366-3a85-4190-acaa-d665d421be36','XAUUSD','BUY',1,4545.0,4544.9,-1.000000000003637979e-01,'2026-01-11 23:38:22.130693',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:38:22.130708','2026-01-11 23:38:23.860781');
-INSERT INTO "ts_trades" VALUES('cd2c6959-b510-4547-80d7-cea94d3f0309','63d18366-3a85-4190-acaa-d665d421be36','XAUUSD','BUY',1,4544.4,NULL,0.0,'2026-01-11 23:38:27.212999',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:38:27.213004','2026-01-11 23:38:27.213008');
-INSERT INTO "ts_trades" VALUES('d060645a-1bfc-4aa2-b5b5-dc2d29d8a2a5','a310c663-02a3-418c-a89d-8e2df21b404c','IAM.CS','BUY',3,112.86,NULL,0.0,'2026-01-12 13:42:02.444690',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:42:02.444702','2026-01-12 13:42:02.444709');
-INSERT INTO "ts_trades" VALUES('26dfca55-a343-4ebb-b4b1-3daa9ea284cb','2a6eaf23-736e-4b05-9863-469b34ac177d','XAUUSD','BUY',1,4617.6,NULL,0.0,'2026-01-12 13:44:09.604748',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:44:09.604767','2026-01-12 13:44:09.604787');
-INSERT INTO "ts_trades" VALUES('1edaac8f-1615-42d4-8c6b-55b4e8040894','2a6eaf23-736e-4b05-9863-469b34ac177d','EURUSD=X','BUY',4,1.1696,NULL,0.0,'2026-01-12 13:44:34.395420',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:44:34.395438','2026-01-12 13:44:34.395448');
-INSERT INTO "ts_trades" VALUES('83b145a0-4d7d-49a9-b0d7-a3f41cc2d429','2a6eaf23-736e-4b05-9863-469b34ac177d','TSLA','BUY',3,445.01,NULL,0.0,'2026-01-12 13:45:03.789760',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:45:03.789771','2026-01-12 13:45:03.789779');
-INSERT INTO "ts_trades" VALUES('1edb31ae-3f3e-41b8-a272-e45f7471be98','2a6eaf23-736e-4b05-9863-469b34ac177d','ETH-USD','SELL',3,3108.28,NULL,0.0,'2026-01-12 13:45:20.856525',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:45:20.856542','2026-01-12 13:45:20.856553');
-INSERT INTO "ts_trades" VALUES('bc4f3711-c892-40de-818e-ab9bed729324','2a6eaf23-736e-4b05-9863-469b34ac177d','XAUUSD','BUY',1,4608.3,NULL,0.0,'2026-01-12 14:47:45.673926',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:47:45.673937','2026-01-12 14:47:45.673943');
-INSERT INTO "ts_trades" VALUES('3b916f20-68ce-4939-afa2-9c0b8d960f0d','2a6eaf23-736e-4b05-9863-469b34ac177d','IAM.CS','BUY',5,112.41,NULL,0.0,'2026-01-12 14:47:54.215417',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:47:54.215426','2026-01-12 14:47:54.215431');
-INSERT INTO "ts_trades" VALUES('5c8f77e9-d3b5-44ef-8ea8-ca283f1babe7','2a6eaf23-736e-4b05-9863-469b34ac177d','AFMA.CS','BUY',2,1449.95,NULL,0.0,'2026-01-12 14:48:01.042473',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:48:01.042490','2026-01-12 14:48:01.042500');
-INSERT INTO "ts_trades" VALUES('ba259027-12d5-4983-8406-63cd787f4ac4','2a6eaf23-736e-4b05-9863-469b34ac177d','BCI.CS','BUY',1,290.27,NULL,0.0,'2026-01-12 14:48:09.766914',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:48:09.766929','2026-01-12 14:48:09.766936');
-INSERT INTO "ts_trades" VALUES('e7cbb2e7-8615-47a6-a52c-db0f46eb8314','2a6eaf23-736e-4b05-9863-469b34ac177d','NVDA','BUY',3,184.12,NULL,0.0,'2026-01-12 15:36:10.519274',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 15:36:10.519283','2026-01-12 15:36:10.519289');
-INSERT INTO "ts_trades" VALUES('d6104567-7fd6-4a13-a2a0-f3926b29dfcd','2a6eaf23-736e-4b05-9863-469b34ac177d','BTC-USD','BUY',11,91290.81,NULL,0.0,'2026-01-12 15:36:20.219195',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 15:36:20.219210','2026-01-12 15:36:20.219220');
-INSERT INTO "ts_trades" VALUES('0f86a07e-b9d4-4019-acda-d5c05ad81017','2a6eaf23-736e-4b05-9863-469b34ac177d','BTC-USD','BUY',1,92079.81,NULL,0.0,'2026-01-12 16:38:40.633299',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 16:38:40.633308','2026-01-12 16:38:40.633313');
-INSERT INTO "ts_trades" VALUES('b49c933f-8f20-4ef3-878e-857aed221ca3','69beedeb-e81c-4120-8d2f-3a4f93b78d27','XAUUSD','SELL',6,4619.9,4619.4,3.0,'2026-01-12 19:11:36.030059',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:11:36.030068','2026-01-12 19:13:04.910943');
-INSERT INTO "ts_trades" VALUES('9c9d78e0-c374-4f0e-98f9-7e64de8b9c49','69beedeb-e81c-4120-8d2f-3a4f93b78d27','TSLA','SELL',2,450.66,450.86,-3.999999999999772627e-01,'2026-01-12 19:11:46.089954',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:11:46.089972','2026-01-12 19:13:01.503053');
-INSERT INTO "ts_trades" VALUES('a5fe25a4-a3e6-46fd-95fd-bbe65c31165c','69beedeb-e81c-4120-8d2f-3a4f93b78d27','BTC-USD','SELL',2,91596.32,91625.87,-5.909999999997671693e+01,'2026-01-12 19:11:54.429565',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:11:54.429574','2026-01-12 19:12:59.812080');
-INSERT INTO "ts_trades" VALUES('636ae231-e2ea-4fd3-8969-24e05d888226','69beedeb-e81c-4120-8d2f-3a4f93b78d27','SOL-USD','SELL',17,140.97,141.23,-4.419999999999845385e+00,'2026-01-12 19:12:06.259413',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:06.259432','2026-01-12 19:12:55.067883');
-INSERT INTO "ts_trades" VALUES('cdb92282-6325-4a80-8b99-2f6d9b580ba9','69beedeb-e81c-4120-8d2f-3a4f93b78d27','IAM.CS','SELL',17,112.35,112.35,0.0,'2026-01-12 19:12:15.836489',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:15.836505','2026-01-12 19:12:53.204756');
-INSERT INTO "ts_trades" VALUES('333a336e-6983-48ec-a258-3bf01e35c322','69beedeb-e81c-4120-8d2f-3a4f93b78d27','ATW.CS','SELL',17,484.73,484.73,0.0,'2026-01-12 19:12:20.600707',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:20.600721','2026-01-12 19:12:50.247261');
-INSERT INTO "ts_trades" VALUES('6d633379-1fc7-45a4-967e-4b2e29b58a6d','69beedeb-e81c-4120-8d2f-3a4f93b78d27','BCI.CS','SELL',17,289.54,289.54,0.0,'2026-01-12 19:12:31.016544',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:31.016557','2026-01-12 19:12:48.049251');
-INSERT INTO "ts_trades" VALUES('e5330a6f-6009-4ab1-8753-ba42154b3604','69beedeb-e81c-4120-8d2f-3a4f93b78d27','AFMA.CS','SELL',11,1450.02,1450.02,0.0,'2026-01-12 19:12:42.793830',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:42.793846','2026-01-12 19:12:45.540327');
-INSERT INTO "ts_trades" VALUES('38a97ec7-f8c7-40ee-9a81-90921e28a948','b52c51fc-b25d-41eb-b893-f9d27cc5b552','XAUUSD','SELL',1,4623.2,4623.4,-1.999999999998181011e-01,'2026-01-12 19:21:02.799291',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:02.799306','2026-01-12 19:21:50.855129');
-INSERT INTO "ts_trades" VALUES('b1bdc24f-f311-4060-b5e9-ca5aa7f98988','b52c51fc-b25d-41eb-b893-f9d27cc5b552','ETH-USD','SELL',10,3111.67,3100.91,1.076000000000021828e+02,'2026-01-12 19:21:13.010886',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:13.010897','2026-01-12 20:48:07.742012');
-INSERT INTO "ts_trades" VALUES('07992fa1-7842-4f23-85bb-7e3a1abe3182','b52c51fc-b25d-41eb-b893-f9d27cc5b552','IAM.CS','SELL',10,112.88,112.82,6.000000000000227373e-01,'2026-01-12 19:21:21.766692',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:21.766699','2026-01-12 20:38:54.246098');
-INSERT INTO "ts_trades" VALUES('3ad5dc41-323a-4f11-9464-fb1c9587d479','b52c51fc-b25d-41eb-b893-f9d27cc5b552','MNG.CS','SELL',10,2450.32,2449.96,3.600000000001273293e+00,'2026-01-12 19:21:26.819734',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:26.819746','2026-01-12 20:37:26.190800');
-INSERT INTO "ts_trades" VALUES('f56948b9-2a7e-4eb0-b34f-1812dfb11257','b52c51fc-b25d-41eb-b893-f9d27cc5b552','BTC-USD','BUY',10,91729.78,91712.44,-1.733999999999650755e+02,'2026-01-12 19:23:12.928968',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:23:12.928978','2026-01-12 19:31:29.443779');
-INSERT INTO "ts_trades" VALUES('42a162e2-26b8-48b6-83d8-591c978f17da','b52c51fc-b25d-41eb-b893-f9d27cc5b552','EURUSD=X','BUY',1,1.1671,1.1671,0.0,'2026-01-12 20:48:01.340155',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 20:48:01.340174','2026-01-12 20:48:42.755186');
-INSERT INTO "ts_trades" VALUES('9cda4578-1818-4ce0-95ce-59d5c100dd6f','b52c51fc-b25d-41eb-b893-f9d27cc5b552','CIM.CS','BUY',6,1800.31,1800.17,-0.839999999999236,'2026-01-12 20:48:36.161435',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 20:48:36.161448','2026-01-12 21:47:42.683382');
-INSERT INTO "ts_trades" VALUES('759f5280-47f0-42f7-8ddd-413133682522','b52c51fc-b25d-41eb-b893-f9d27cc5b552','MNG.CS','BUY',7,2449.52,NULL,0.0,'2026-01-12 22:01:03.567176',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:01:03.567182','2026-01-12 22:01:03.567184');
-INSERT INTO "ts_trades" VALUES('2e5b1cda-c45e-4e79-b7f0-4d077f83dda7','b52c51fc-b25d-41eb-b893-f9d27cc5b552','GBPUSD=X','SELL',7,1.3466,NULL,0.0,'2026-01-12 22:01:19.421394',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:01:19.421404','2026-01-12 22:01:19.421411');
-INSERT INTO "ts_trades" VALUES('d67dd8ed-5299-4f2d-a399-d9130168904a','b52c51fc-b25d-41eb-b893-f9d27cc5b552','SOL-USD','BUY',3,138.44,NULL,0.0,'2026-01-12 22:01:28.992026',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:01:28.992032','2026-01-12 22:01:28.992035');
-INSERT INTO "ts_trades" VALUES('d56b0330-2d65-4bf6-b150-85b61feee97a','b52c51fc-b25d-41eb-b893-f9d27cc5b552','BTC-USD','BUY',8,91261.3,97486.97,4.980535999999998604e+04,'2026-01-12 22:21:03.735902',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:21:03.735914','2026-01-14 21:57:43.381854');
-INSERT INTO "ts_trades" VALUES('3b74e0c2-d449-47af-8941-dfde5be49620','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','XAUUSD','BUY',21,4608.8,4608.8,0.0,'2026-01-12 22:28:41.723318',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:28:41.723330','2026-01-12 22:31:07.914170');
-INSERT INTO "ts_trades" VALUES('8b16a81a-edcb-4885-b748-1a86ac4a4560','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','BTC-USD','BUY',34,91257.46,91251.52,-2.019600000000791624e+02,'2026-01-12 22:29:05.943187',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:29:05.943194','2026-01-12 22:31:04.938434');
-INSERT INTO "ts_trades" VALUES('9270359c-d245-4012-bcaf-6f02104010e7','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','IAM.CS','BUY',10,112.87,112.1,-7.700000000000102319e+00,'2026-01-12 22:29:36.540553',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:29:36.540560','2026-01-12 22:31:01.614714');
-INSERT INTO "ts_trades" VALUES('fb7ec776-5b6b-4ddc-b9a3-894e27b2ab58','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','BCI.CS','BUY',100,290.01,289.8,-2.099999999999795364e+01,'2026-01-12 22:29:46.083054',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:29:46.083060','2026-01-12 22:30:58.743377');
-INSERT INTO "ts_trades" VALUES('cb370f17-dba3-41b3-a21a-9441be184374','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','TSLA','BUY',300,448.96,448.96,0.0,'2026-01-12 22:33:37.052885',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:33:37.052893','2026-01-12 22:35:40.584500');
-INSERT INTO "ts_trades" VALUES('aa7d2be5-eaef-4bff-82b1-810a784a23b3','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','BTC-USD','BUY',300,91206.31,NULL,0.0,'2026-01-12 22:35:56.368792',0,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:35:56.368801','2026-01-12 22:35:56.368805');
-INSERT INTO "ts_trades" VALUES('0ac1b652-6e8d-47f0-8967-8536355988a4','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','ETH-USD','BUY',700,3099.05,NULL,0.0,'2026-01-12 22:36:08.393613',0,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:36:08.393624','2026-01-12 22:36:08.393629');
-INSERT INTO "ts_trades" VALUES('17e67cc3-bc6e-4e21-8137-e64d9a874d7f','cf97835b-e6e8-49c8-b161-d180aca8bf5a','XAUUSD','BUY',8,4608.8,NULL,0.0,'2026-01-12 22:50:22.359981',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-12 22:50:22.359989','2026-01-12 22:50:22.359993');
-INSERT INTO "ts_trades" VALUES('246a53df-d24a-4014-a936-3c13f0d1a927','cf97835b-e6e8-49c8-b161-d180aca8bf5a','BTC-USD','BUY',5,91169.66,NULL,0.0,'2026-01-12 22:50:37.770461',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-12 22:50:37.770467','2026-01-12 22:50:37.770470');
-INSERT INTO "ts_trades" VALUES('ccab8140-d974-44c4-b8c3-cad62e4c5933','cf97835b-e6e8-49c8-b161-d180aca8bf5a','USDJPY=X','BUY',1,158.07,NULL,0.0,'2026-01-12 22:51:43.174625',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-12 22:51:43.174637','2026-01-12 22:51:43.174644');
-INSERT INTO "ts_trades" VALUES('860af702-96ed-43f0-9f9d-570aa6779241','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','BUY',1,4596.0,NULL,0.0,'2026-01-13 20:40:59.399937',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 20:40:59.399952','2026-01-13 20:40:59.399961');
-INSERT INTO "ts_trades" VALUES('2bd3a482-3d6e-4d7c-bda7-4f864c9465dd','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','IAM.CS','BUY',1,112.04,NULL,0.0,'2026-01-13 20:45:45.874971',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 20:45:45.874985','2026-01-13 20:45:45.874992');
-INSERT INTO "ts_trades" VALUES('002a0af9-0a67-4f3b-bbd5-2359a94ddc22','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','TSLA','BUY',6,447.2,NULL,0.0,'2026-01-13 21:20:35.323046',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 21:20:35.323056','2026-01-13 21:20:35.323061');
-INSERT INTO "ts_trades" VALUES('3a940a54-e84e-46c4-bfb7-5a859aebd63d','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','AAPL','SELL',4,261.05,NULL,0.0,'2026-01-13 21:20:56.675281',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 21:20:56.675293','2026-01-13 21:20:56.675301');
-INSERT INTO "ts_trades" VALUES('08b4fd13-48d5-450d-ac36-7af9095fd5a2','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','BUY',5,4644.2,NULL,0.0,'2026-01-14 20:23:06.426330',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:23:06.426338','2026-01-14 20:23:06.426342');
-INSERT INTO "ts_trades" VALUES('5c51dcd8-5622-407d-ba21-fb53a5f82a5d','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','SELL',7,4642.9,4644.4,-10.5,'2026-01-14 20:23:44.641820',1,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:23:44.641824','2026-01-14 20:25:22.239824');
-INSERT INTO "ts_trades" VALUES('710601c9-5dfb-4bf6-a450-0df7826ae6f9','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','SELL',7,4642.9,4644.7,-1.260000000000127329e+01,'2026-01-14 20:24:02.173752',1,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:24:02.173759','2026-01-14 20:25:26.624975');
-INSERT INTO "ts_trades" VALUES('a96db6c9-bf80-4a64-94e2-d60ea6be34f7','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','BUY',12,4642.7,NULL,0.0,'2026-01-14 20:26:58.447677',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:26:58.447683','2026-01-14 20:26:58.447687');
-INSERT INTO "ts_trades" VALUES('63b65c08-0a43-4a2e-a3eb-b237ea517e83','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','EURUSD=X','SELL',12,1.1647,NULL,0.0,'2026-01-14 20:27:25.485621',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:27:25.485630','2026-01-14 20:27:25.485636');
-INSERT INTO "ts_trades" VALUES('f1352495-10b9-405a-800c-78bb896c3de5','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','BTC-USD','BUY',12,97551.88,NULL,0.0,'2026-01-14 20:27:43.560281',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:27:43.560291','2026-01-14 20:27:43.560298');
-INSERT INTO "ts_trades" VALUES('9a68f4da-a6e8-4be7-9609-81ac700efcef','79a0121a-c657-46d2-a7f8-a6a6b5c8873c','BTC-USD','BUY',2,97530.38,97535.55,1.033999999999650755e+01,'2026-01-14 21:51:23.716637',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-14 21:51:23.716645','2026-01-14 21:52:27.123278');
-INSERT INTO "ts_trades" VALUES('591a3fe7-2ec3-4081-9f1c-4d9aabaa0db7','79a0121a-c657-46d2-a7f8-a6a6b5c8873c','XAUUSD','BUY',2,4626.7,NULL,0.0,'2026-01-14 21:51:41.517345',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-14 21:51:41.517360','2026-01-14 21:51:41.517370');
-INSERT INTO "ts_trades" VALUES('2be00c91-c38c-475d-b42f-1345cd44ea3f','f7664151-e63e-4c8d-b422-769aea2c5dc1','XAUUSD','BUY',3,4624.9,4626.3,4.20000000000163709e+00,'2026-01-14 21:53:28.607939',1,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 21:53:28.607951','2026-01-14 21:54:07.206484');
-INSERT INTO "ts_trades" VALUES('2094c59f-6119-4610-96e2-6b535f459936','f7664151-e63e-4c8d-b422-769aea2c5dc1','BTC-USD','BUY',3,97594.02,NULL,0.0,'2026-01-14 21:53:38.193866',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 21:53:38.193873','2026-01-14 21:53:38.193877');
-INSERT INTO "ts_trades" VALUES('54047d07-501a-4851-b839-0c773e289bbd','1ab575f8-e36f-4d7f-949e-c7d6a0b73454','XAUUSD','BUY',3,4612.3,4612.8,1.5,'2026-01-14 23:36:06.627044',1,'aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','2026-01-14 23:36:06.627050','2026-01-14 23:37:35.779202');
-INSERT INTO "ts_trades" VALUES('2ac9cd4e-6997-4529-9bae-5079cb763369','1ab575f8-e36f-4d7f-949e-c7d6a0b73454','BTC-USD','BUY',2,96937.34,96944.09,13.5,'2026-01-14 23:36:16.869654',1,'aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','2026-01-14 23:36:16.869659','2026-01-14 23:37:30.353689');
-INSERT INTO "ts_trades" VALUES('29ff280a-3ccc-4d21-86b5-1c76ad6f81bb','1ab575f8-e36f-4d7f-949e-c7d6a0b73454','BCP.CS','SELL',2,294.69,294.63,1.200000000000045475e-01,'2026-01-14 23:37:23.682239',1,'aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','2026-01-14 23:37:23.682247','2026-01-15 12:28:05.685438');
-INSERT INTO "ts_trades" VALUES('8cab402e-3819-4bdc-bbd9-9842abb2ccc9','3f618324-d216-447c-90d4-9d67868ec740','XAUUSD','SELL',19,4620.3,NULL,0.0,'2026-01-15 12:41:48.378593',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:41:48.378602','2026-01-15 12:41:48.378608');
-INSERT INTO "ts_trades" VALUES('ba72dfd2-8ae0-4dd5-a49b-ac713f4afb46','3f618324-d216-447c-90d4-9d67868ec740','AAPL','SELL',19,259.96,259.96,0.0,'2026-01-15 12:41:55.096380',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:41:55.096389','2026-01-15 12:43:11.969342');
-INSERT INTO "ts_trades" VALUES('ff694f72-47b7-4d38-b9fa-ab8e3ca7c786','3f618324-d216-447c-90d4-9d67868ec740','BTC-USD','SELL',19,96623.76,96622.72,1.975999999987834599e+01,'2026-01-15 12:42:01.222545',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:42:01.222564','2026-01-15 12:43:10.033678');
-INSERT INTO "ts_trades" VALUES('62bc6b0d-a5b5-4f53-a678-9c8ec119432b','3f618324-d216-447c-90d4-9d67868ec740','XAUUSD','BUY',33,4620.5,NULL,0.0,'2026-01-15 12:42:47.027845',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:42:47.027853','2026-01-15 12:42:47.027857');
-INSERT INTO "ts_trades" VALUES('e2f7cf64-0057-44b4-b9fc-2181ff9a4a29','3f618324-d216-447c-90d4-9d67868ec740','XAUUSD','BUY',330,4620.5,NULL,0.0,'2026-01-15 12:42:51.447692',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:42:51.447702','2026-01-15 12:42:51.447709');
+INSERT INTO "ts_trades" VALUES('e4d630d8-ee70-433a-88d8-33d1ef2ac97a','b3826987-67c6-4b73-8b9d-12c329a42d93','XAUUSD','BUY',1,2024.13,NULL,0.0,'2026-01-11 16:15:59.604810',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('99b99333-36ec-467d-98ef-5ccd1081affa','b3826987-67c6-4b73-8b9d-12c329a42d93','XAUUSD','SELL',1,2024.53,NULL,0.0,'2026-01-11 16:17:36.848872',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('b241765f-cd9f-4195-91e1-fa5426338621','b3826987-67c6-4b73-8b9d-12c329a42d93','XAUUSD','BUY',1,2024.36,NULL,0.0,'2026-01-11 16:17:55.341542',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('d7a2c3e0-f4e0-4459-8fa5-e407bd6e2dd2','b2a9dad8-8228-483f-b192-554e6cb58db3','BTCUSD','BUY',1,90871.02,NULL,0.0,'2026-01-11 16:29:16.417743',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('d4abee7f-6ea4-4852-9f8f-675e3f258395','ef42c206-9df4-431f-bd1c-9bebc25f8973','BTCUSD','BUY',1,91147.37,NULL,0.0,'2026-01-11 16:35:38.545310',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('01de7e07-8076-4dc8-8227-c4d56bc947cb','ef42c206-9df4-431f-bd1c-9bebc25f8973','EURUSD','BUY',1,1.1658,NULL,0.0,'2026-01-11 16:36:14.369024',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('3a9473ea-c229-42d2-88d3-995ce87d3d7b','ef42c206-9df4-431f-bd1c-9bebc25f8973','BTCUSD','SELL',1,91147.37,NULL,0.0,'2026-01-11 16:36:24.998053',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('38a0ede6-0a69-44fc-97b5-6cdfafb64bab','6b2e605d-b22b-407b-8421-e05ade1df94e','IAM.CS','BUY',1,120.76,NULL,0.0,'2026-01-11 17:22:27.571238',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('b86ac04c-5a92-4d4d-b566-64facbffe599','6b2e605d-b22b-407b-8421-e05ade1df94e','TSLA','BUY',1,445.01,NULL,0.0,'2026-01-11 17:22:48.519346',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('339a18fb-841d-4543-b2f6-150941fa6019','6b2e605d-b22b-407b-8421-e05ade1df94e','EURUSD=X','SELL',1,1.1658,NULL,0.0,'2026-01-11 17:23:55.862473',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('c236be0f-ae5d-44e1-ad77-17a5c24bfffd','6b2e605d-b22b-407b-8421-e05ade1df94e','AFMA.CS','SELL',1,1449.72,NULL,0.0,'2026-01-11 17:24:30.234715',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('a5ba1692-9d69-47ec-a597-365f9aa4cbd4','b610cab6-8438-4336-b44b-4018e888b0cc','NVDA','BUY',1,184.86,NULL,0.0,'2026-01-11 17:43:55.932419',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('0f672ed5-30bb-494d-b26c-0b5a51db0273','d98d0a12-93f1-4809-97f6-a61b5ba9ff72','XAUUSD','BUY',1,2027.3,NULL,0.0,'2026-01-11 18:14:53.212162',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('c669b136-9f6f-4bb2-86cb-cbb2095b5512','d98d0a12-93f1-4809-97f6-a61b5ba9ff72','SOL-USD','SELL',1,139.11,NULL,0.0,'2026-01-11 18:15:57.349914',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('5fea0ae2-7d27-4390-bbf8-518b6797331a','b79037c7-2272-40e4-bda4-02a7ab3c342c','IAM.CS','BUY',1,112.81,NULL,0.0,'2026-01-11 18:30:36.193181',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('c00d2ba5-62b7-40df-9631-f827adc1f8d0','3672e9b0-0379-4d37-b999-67333cc6dbda','ATW.CS','BUY',1,485.06,NULL,0.0,'2026-01-11 18:54:49.300691',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('6f2c22c5-c958-4922-a710-a276cc46a9f1','3672e9b0-0379-4d37-b999-67333cc6dbda','EURUSD=X','BUY',1,1.1637,NULL,0.0,'2026-01-11 18:55:38.310646',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('7841e1ae-d2c9-41b8-bdab-0acfb68b1da8','3672e9b0-0379-4d37-b999-67333cc6dbda','AAPL','SELL',1,259.37,NULL,0.0,'2026-01-11 18:56:01.236556',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('c8b53984-9cee-4971-92f0-2d8889b046b3','aedabed9-218f-4d00-b9ca-d5f526df022b','IAM.CS','BUY',1,112.56,NULL,0.0,'2026-01-11 19:56:55.326437',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('28f6ce99-4b48-4520-8d8f-bd68668dad72','aedabed9-218f-4d00-b9ca-d5f526df022b','IAM.CS','BUY',1,112.42,NULL,0.0,'2026-01-11 20:02:48.025836',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('121f10d9-8577-4062-9beb-a056d3efb742','aedabed9-218f-4d00-b9ca-d5f526df022b','XAUUSD','BUY',1,2021.39,NULL,0.0,'2026-01-11 20:02:55.078906',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('86788a0a-1215-44e7-a022-c432e9bc8f6b','aedabed9-218f-4d00-b9ca-d5f526df022b','GBPUSD=X','SELL',1,1.3409,NULL,0.0,'2026-01-11 20:03:01.965205',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('6955fa4f-a6b7-4987-ad6a-61718b837963','aedabed9-218f-4d00-b9ca-d5f526df022b','GBPUSD=X','SELL',2,1.3409,NULL,0.0,'2026-01-11 20:19:26.478899',0,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('a9e3ebdb-b4b1-43e4-9046-0be45a47c286','45c61183-a445-44b0-a349-564c606a4b51','XAUUSD','BUY',1,2028.97,2029.53,5.599999999999454303e-01,'2026-01-11 20:30:19.114087',1,NULL,NULL,NULL,NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('6ec415ee-cb25-48ee-82af-66e135b5784d','45c61183-a445-44b0-a349-564c606a4b51','IAM.CS','BUY',1,112.65,112.88,2.299999999999897681e-01,'2026-01-11 20:30:41.739627',1,NULL,NULL,'2026-01-11 21:54:53.485108',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('2079c655-e1fc-4895-9940-7c56c2a7b336','45c61183-a445-44b0-a349-564c606a4b51','XAUUSD','BUY',1,2029.62,2022.32,-7.299999999999954526e+00,'2026-01-11 20:59:37.140301',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 20:59:37.140318','2026-01-11 21:54:51.240030',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('548ed099-b70e-4d44-8637-0f9447e7a10c','45c61183-a445-44b0-a349-564c606a4b51','NVDA','SELL',1,184.86,184.86,0.0,'2026-01-11 21:00:25.982017',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 21:00:25.982030','2026-01-11 21:18:14.412312',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('688d39c7-14ac-4002-b878-d3ed9838c69a','45c61183-a445-44b0-a349-564c606a4b51','XAUUSD','BUY',1,2024.41,2025.56,1.149999999999863575e+00,'2026-01-11 21:10:12.179535',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 21:10:12.179544','2026-01-11 21:18:09.491946',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('4e77fb7b-87b2-439f-bde4-78212a869d0f','44a11978-78e7-4d5e-ad5a-025098629bb5','EURUSD=X','BUY',1,1.1633,1.1635,1.999999999999779732e-04,'2026-01-11 22:36:15.445731',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 22:36:15.445738','2026-01-11 23:00:09.117397',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('e743260c-2093-48f4-846a-d05c1af34693','8d91810f-5d78-4604-8c79-45a61026b791','XAUUSD','BUY',1,4500.9,4537.3,3.64000000000005457e+01,'2026-01-11 23:15:39.428833',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:15:39.428841','2026-01-11 23:23:19.306837',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('a22a9acd-15f4-46de-a3b3-d1e25010a426','8d91810f-5d78-4604-8c79-45a61026b791','NVDA','SELL',1,184.86,184.86,0.0,'2026-01-11 23:15:46.783972',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:15:46.783978','2026-01-11 23:23:17.126764',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('372518ab-4d4a-46b8-a884-246e639bd6af','8d91810f-5d78-4604-8c79-45a61026b791','BTC-USD','BUY',4,90451.63,90888.45,1.747279999999969733e+03,'2026-01-11 23:15:55.849632',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:15:55.849639','2026-01-11 23:23:15.065920',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('a3a7455e-a8bf-485e-8996-ff166e8f8ab3','63d18366-3a85-4190-acaa-d665d421be36','XAUUSD','BUY',1,4545.0,4544.9,-1.000000000003637979e-01,'2026-01-11 23:38:22.130693',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:38:22.130708','2026-01-11 23:38:23.860781',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('cd2c6959-b510-4547-80d7-cea94d3f0309','63d18366-3a85-4190-acaa-d665d421be36','XAUUSD','BUY',1,4544.4,NULL,0.0,'2026-01-11 23:38:27.212999',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-11 23:38:27.213004','2026-01-11 23:38:27.213008',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('d060645a-1bfc-4aa2-b5b5-dc2d29d8a2a5','a310c663-02a3-418c-a89d-8e2df21b404c','IAM.CS','BUY',3,112.86,NULL,0.0,'2026-01-12 13:42:02.444690',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:42:02.444702','2026-01-12 13:42:02.444709',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('26dfca55-a343-4ebb-b4b1-3daa9ea284cb','2a6eaf23-736e-4b05-9863-469b34ac177d','XAUUSD','BUY',1,4617.6,NULL,0.0,'2026-01-12 13:44:09.604748',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:44:09.604767','2026-01-12 13:44:09.604787',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('1edaac8f-1615-42d4-8c6b-55b4e8040894','2a6eaf23-736e-4b05-9863-469b34ac177d','EURUSD=X','BUY',4,1.1696,NULL,0.0,'2026-01-12 13:44:34.395420',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:44:34.395438','2026-01-12 13:44:34.395448',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('83b145a0-4d7d-49a9-b0d7-a3f41cc2d429','2a6eaf23-736e-4b05-9863-469b34ac177d','TSLA','BUY',3,445.01,NULL,0.0,'2026-01-12 13:45:03.789760',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:45:03.789771','2026-01-12 13:45:03.789779',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('1edb31ae-3f3e-41b8-a272-e45f7471be98','2a6eaf23-736e-4b05-9863-469b34ac177d','ETH-USD','SELL',3,3108.28,NULL,0.0,'2026-01-12 13:45:20.856525',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 13:45:20.856542','2026-01-12 13:45:20.856553',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('bc4f3711-c892-40de-818e-ab9bed729324','2a6eaf23-736e-4b05-9863-469b34ac177d','XAUUSD','BUY',1,4608.3,NULL,0.0,'2026-01-12 14:47:45.673926',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:47:45.673937','2026-01-12 14:47:45.673943',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('3b916f20-68ce-4939-afa2-9c0b8d960f0d','2a6eaf23-736e-4b05-9863-469b34ac177d','IAM.CS','BUY',5,112.41,NULL,0.0,'2026-01-12 14:47:54.215417',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:47:54.215426','2026-01-12 14:47:54.215431',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('5c8f77e9-d3b5-44ef-8ea8-ca283f1babe7','2a6eaf23-736e-4b05-9863-469b34ac177d','AFMA.CS','BUY',2,1449.95,NULL,0.0,'2026-01-12 14:48:01.042473',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:48:01.042490','2026-01-12 14:48:01.042500',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('ba259027-12d5-4983-8406-63cd787f4ac4','2a6eaf23-736e-4b05-9863-469b34ac177d','BCI.CS','BUY',1,290.27,NULL,0.0,'2026-01-12 14:48:09.766914',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 14:48:09.766929','2026-01-12 14:48:09.766936',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('e7cbb2e7-8615-47a6-a52c-db0f46eb8314','2a6eaf23-736e-4b05-9863-469b34ac177d','NVDA','BUY',3,184.12,NULL,0.0,'2026-01-12 15:36:10.519274',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 15:36:10.519283','2026-01-12 15:36:10.519289',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('d6104567-7fd6-4a13-a2a0-f3926b29dfcd','2a6eaf23-736e-4b05-9863-469b34ac177d','BTC-USD','BUY',11,91290.81,NULL,0.0,'2026-01-12 15:36:20.219195',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 15:36:20.219210','2026-01-12 15:36:20.219220',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('0f86a07e-b9d4-4019-acda-d5c05ad81017','2a6eaf23-736e-4b05-9863-469b34ac177d','BTC-USD','BUY',1,92079.81,NULL,0.0,'2026-01-12 16:38:40.633299',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-12 16:38:40.633308','2026-01-12 16:38:40.633313',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('b49c933f-8f20-4ef3-878e-857aed221ca3','69beedeb-e81c-4120-8d2f-3a4f93b78d27','XAUUSD','SELL',6,4619.9,4619.4,3.0,'2026-01-12 19:11:36.030059',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:11:36.030068','2026-01-12 19:13:04.910943',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('9c9d78e0-c374-4f0e-98f9-7e64de8b9c49','69beedeb-e81c-4120-8d2f-3a4f93b78d27','TSLA','SELL',2,450.66,450.86,-3.999999999999772627e-01,'2026-01-12 19:11:46.089954',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:11:46.089972','2026-01-12 19:13:01.503053',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('a5fe25a4-a3e6-46fd-95fd-bbe65c31165c','69beedeb-e81c-4120-8d2f-3a4f93b78d27','BTC-USD','SELL',2,91596.32,91625.87,-5.909999999997671693e+01,'2026-01-12 19:11:54.429565',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:11:54.429574','2026-01-12 19:12:59.812080',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('636ae231-e2ea-4fd3-8969-24e05d888226','69beedeb-e81c-4120-8d2f-3a4f93b78d27','SOL-USD','SELL',17,140.97,141.23,-4.419999999999845385e+00,'2026-01-12 19:12:06.259413',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:06.259432','2026-01-12 19:12:55.067883',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('cdb92282-6325-4a80-8b99-2f6d9b580ba9','69beedeb-e81c-4120-8d2f-3a4f93b78d27','IAM.CS','SELL',17,112.35,112.35,0.0,'2026-01-12 19:12:15.836489',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:15.836505','2026-01-12 19:12:53.204756',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('333a336e-6983-48ec-a258-3bf01e35c322','69beedeb-e81c-4120-8d2f-3a4f93b78d27','ATW.CS','SELL',17,484.73,484.73,0.0,'2026-01-12 19:12:20.600707',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:20.600721','2026-01-12 19:12:50.247261',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('6d633379-1fc7-45a4-967e-4b2e29b58a6d','69beedeb-e81c-4120-8d2f-3a4f93b78d27','BCI.CS','SELL',17,289.54,289.54,0.0,'2026-01-12 19:12:31.016544',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:31.016557','2026-01-12 19:12:48.049251',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('e5330a6f-6009-4ab1-8753-ba42154b3604','69beedeb-e81c-4120-8d2f-3a4f93b78d27','AFMA.CS','SELL',11,1450.02,1450.02,0.0,'2026-01-12 19:12:42.793830',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:12:42.793846','2026-01-12 19:12:45.540327',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('38a97ec7-f8c7-40ee-9a81-90921e28a948','b52c51fc-b25d-41eb-b893-f9d27cc5b552','XAUUSD','SELL',1,4623.2,4623.4,-1.999999999998181011e-01,'2026-01-12 19:21:02.799291',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:02.799306','2026-01-12 19:21:50.855129',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('b1bdc24f-f311-4060-b5e9-ca5aa7f98988','b52c51fc-b25d-41eb-b893-f9d27cc5b552','ETH-USD','SELL',10,3111.67,3100.91,1.076000000000021828e+02,'2026-01-12 19:21:13.010886',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:13.010897','2026-01-12 20:48:07.742012',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('07992fa1-7842-4f23-85bb-7e3a1abe3182','b52c51fc-b25d-41eb-b893-f9d27cc5b552','IAM.CS','SELL',10,112.88,112.82,6.000000000000227373e-01,'2026-01-12 19:21:21.766692',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:21.766699','2026-01-12 20:38:54.246098',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('3ad5dc41-323a-4f11-9464-fb1c9587d479','b52c51fc-b25d-41eb-b893-f9d27cc5b552','MNG.CS','SELL',10,2450.32,2449.96,3.600000000001273293e+00,'2026-01-12 19:21:26.819734',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:21:26.819746','2026-01-12 20:37:26.190800',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('f56948b9-2a7e-4eb0-b34f-1812dfb11257','b52c51fc-b25d-41eb-b893-f9d27cc5b552','BTC-USD','BUY',10,91729.78,91712.44,-1.733999999999650755e+02,'2026-01-12 19:23:12.928968',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 19:23:12.928978','2026-01-12 19:31:29.443779',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('42a162e2-26b8-48b6-83d8-591c978f17da','b52c51fc-b25d-41eb-b893-f9d27cc5b552','EURUSD=X','BUY',1,1.1671,1.1671,0.0,'2026-01-12 20:48:01.340155',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 20:48:01.340174','2026-01-12 20:48:42.755186',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('9cda4578-1818-4ce0-95ce-59d5c100dd6f','b52c51fc-b25d-41eb-b893-f9d27cc5b552','CIM.CS','BUY',6,1800.31,1800.17,-0.839999999999236,'2026-01-12 20:48:36.161435',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 20:48:36.161448','2026-01-12 21:47:42.683382',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('759f5280-47f0-42f7-8ddd-413133682522','b52c51fc-b25d-41eb-b893-f9d27cc5b552','MNG.CS','BUY',7,2449.52,NULL,0.0,'2026-01-12 22:01:03.567176',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:01:03.567182','2026-01-12 22:01:03.567184',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('2e5b1cda-c45e-4e79-b7f0-4d077f83dda7','b52c51fc-b25d-41eb-b893-f9d27cc5b552','GBPUSD=X','SELL',7,1.3466,NULL,0.0,'2026-01-12 22:01:19.421394',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:01:19.421404','2026-01-12 22:01:19.421411',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('d67dd8ed-5299-4f2d-a399-d9130168904a','b52c51fc-b25d-41eb-b893-f9d27cc5b552','SOL-USD','BUY',3,138.44,NULL,0.0,'2026-01-12 22:01:28.992026',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:01:28.992032','2026-01-12 22:01:28.992035',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('d56b0330-2d65-4bf6-b150-85b61feee97a','b52c51fc-b25d-41eb-b893-f9d27cc5b552','BTC-USD','BUY',8,91261.3,97486.97,4.980535999999998604e+04,'2026-01-12 22:21:03.735902',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-12 22:21:03.735914','2026-01-14 21:57:43.381854',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('3b74e0c2-d449-47af-8941-dfde5be49620','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','XAUUSD','BUY',21,4608.8,4608.8,0.0,'2026-01-12 22:28:41.723318',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:28:41.723330','2026-01-12 22:31:07.914170',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('8b16a81a-edcb-4885-b748-1a86ac4a4560','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','BTC-USD','BUY',34,91257.46,91251.52,-2.019600000000791624e+02,'2026-01-12 22:29:05.943187',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:29:05.943194','2026-01-12 22:31:04.938434',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('9270359c-d245-4012-bcaf-6f02104010e7','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','IAM.CS','BUY',10,112.87,112.1,-7.700000000000102319e+00,'2026-01-12 22:29:36.540553',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:29:36.540560','2026-01-12 22:31:01.614714',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('fb7ec776-5b6b-4ddc-b9a3-894e27b2ab58','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','BCI.CS','BUY',100,290.01,289.8,-2.099999999999795364e+01,'2026-01-12 22:29:46.083054',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:29:46.083060','2026-01-12 22:30:58.743377',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('cb370f17-dba3-41b3-a21a-9441be184374','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','TSLA','BUY',300,448.96,448.96,0.0,'2026-01-12 22:33:37.052885',1,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:33:37.052893','2026-01-12 22:35:40.584500',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('aa7d2be5-eaef-4bff-82b1-810a784a23b3','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','BTC-USD','BUY',300,91206.31,NULL,0.0,'2026-01-12 22:35:56.368792',0,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:35:56.368801','2026-01-12 22:35:56.368805',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('0ac1b652-6e8d-47f0-8967-8536355988a4','1ec89b60-e9b1-47fa-8ba1-cb83b1f6e64c','ETH-USD','BUY',700,3099.05,NULL,0.0,'2026-01-12 22:36:08.393613',0,'253502a9-2bc4-4726-900c-7c052f44bb30','2026-01-12 22:36:08.393624','2026-01-12 22:36:08.393629',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('17e67cc3-bc6e-4e21-8137-e64d9a874d7f','cf97835b-e6e8-49c8-b161-d180aca8bf5a','XAUUSD','BUY',8,4608.8,NULL,0.0,'2026-01-12 22:50:22.359981',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-12 22:50:22.359989','2026-01-12 22:50:22.359993',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('246a53df-d24a-4014-a936-3c13f0d1a927','cf97835b-e6e8-49c8-b161-d180aca8bf5a','BTC-USD','BUY',5,91169.66,NULL,0.0,'2026-01-12 22:50:37.770461',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-12 22:50:37.770467','2026-01-12 22:50:37.770470',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('ccab8140-d974-44c4-b8c3-cad62e4c5933','cf97835b-e6e8-49c8-b161-d180aca8bf5a','USDJPY=X','BUY',1,158.07,NULL,0.0,'2026-01-12 22:51:43.174625',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-12 22:51:43.174637','2026-01-12 22:51:43.174644',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('860af702-96ed-43f0-9f9d-570aa6779241','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','BUY',1,4596.0,NULL,0.0,'2026-01-13 20:40:59.399937',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 20:40:59.399952','2026-01-13 20:40:59.399961',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('2bd3a482-3d6e-4d7c-bda7-4f864c9465dd','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','IAM.CS','BUY',1,112.04,NULL,0.0,'2026-01-13 20:45:45.874971',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 20:45:45.874985','2026-01-13 20:45:45.874992',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('002a0af9-0a67-4f3b-bbd5-2359a94ddc22','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','TSLA','BUY',6,447.2,NULL,0.0,'2026-01-13 21:20:35.323046',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 21:20:35.323056','2026-01-13 21:20:35.323061',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('3a940a54-e84e-46c4-bfb7-5a859aebd63d','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','AAPL','SELL',4,261.05,NULL,0.0,'2026-01-13 21:20:56.675281',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-13 21:20:56.675293','2026-01-13 21:20:56.675301',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('08b4fd13-48d5-450d-ac36-7af9095fd5a2','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','BUY',5,4644.2,NULL,0.0,'2026-01-14 20:23:06.426330',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:23:06.426338','2026-01-14 20:23:06.426342',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('5c51dcd8-5622-407d-ba21-fb53a5f82a5d','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','SELL',7,4642.9,4644.4,-10.5,'2026-01-14 20:23:44.641820',1,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:23:44.641824','2026-01-14 20:25:22.239824',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('710601c9-5dfb-4bf6-a450-0df7826ae6f9','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','SELL',7,4642.9,4644.7,-1.260000000000127329e+01,'2026-01-14 20:24:02.173752',1,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:24:02.173759','2026-01-14 20:25:26.624975',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('a96db6c9-bf80-4a64-94e2-d60ea6be34f7','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','XAUUSD','BUY',12,4642.7,NULL,0.0,'2026-01-14 20:26:58.447677',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:26:58.447683','2026-01-14 20:26:58.447687',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('63b65c08-0a43-4a2e-a3eb-b237ea517e83','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','EURUSD=X','SELL',12,1.1647,NULL,0.0,'2026-01-14 20:27:25.485621',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:27:25.485630','2026-01-14 20:27:25.485636',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('f1352495-10b9-405a-800c-78bb896c3de5','4ba260b4-a5ae-4ee9-ab14-9d3b094b1b58','BTC-USD','BUY',12,97551.88,NULL,0.0,'2026-01-14 20:27:43.560281',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 20:27:43.560291','2026-01-14 20:27:43.560298',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('9a68f4da-a6e8-4be7-9609-81ac700efcef','79a0121a-c657-46d2-a7f8-a6a6b5c8873c','BTC-USD','BUY',2,97530.38,97535.55,1.033999999999650755e+01,'2026-01-14 21:51:23.716637',1,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-14 21:51:23.716645','2026-01-14 21:52:27.123278',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('591a3fe7-2ec3-4081-9f1c-4d9aabaa0db7','79a0121a-c657-46d2-a7f8-a6a6b5c8873c','XAUUSD','BUY',2,4626.7,NULL,0.0,'2026-01-14 21:51:41.517345',0,'a56d92e4-7ab5-4c64-aa94-52f0a35aa568','2026-01-14 21:51:41.517360','2026-01-14 21:51:41.517370',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('2be00c91-c38c-475d-b42f-1345cd44ea3f','f7664151-e63e-4c8d-b422-769aea2c5dc1','XAUUSD','BUY',3,4624.9,4626.3,4.20000000000163709e+00,'2026-01-14 21:53:28.607939',1,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 21:53:28.607951','2026-01-14 21:54:07.206484',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('2094c59f-6119-4610-96e2-6b535f459936','f7664151-e63e-4c8d-b422-769aea2c5dc1','BTC-USD','BUY',3,97594.02,NULL,0.0,'2026-01-14 21:53:38.193866',0,'7f0413b5-88dd-4571-90bb-c5d942279760','2026-01-14 21:53:38.193873','2026-01-14 21:53:38.193877',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('54047d07-501a-4851-b839-0c773e289bbd','1ab575f8-e36f-4d7f-949e-c7d6a0b73454','XAUUSD','BUY',3,4612.3,4612.8,1.5,'2026-01-14 23:36:06.627044',1,'aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','2026-01-14 23:36:06.627050','2026-01-14 23:37:35.779202',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('2ac9cd4e-6997-4529-9bae-5079cb763369','1ab575f8-e36f-4d7f-949e-c7d6a0b73454','BTC-USD','BUY',2,96937.34,96944.09,13.5,'2026-01-14 23:36:16.869654',1,'aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','2026-01-14 23:36:16.869659','2026-01-14 23:37:30.353689',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('29ff280a-3ccc-4d21-86b5-1c76ad6f81bb','1ab575f8-e36f-4d7f-949e-c7d6a0b73454','BCP.CS','SELL',2,294.69,294.63,1.200000000000045475e-01,'2026-01-14 23:37:23.682239',1,'aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','2026-01-14 23:37:23.682247','2026-01-15 12:28:05.685438',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('8cab402e-3819-4bdc-bbd9-9842abb2ccc9','3f618324-d216-447c-90d4-9d67868ec740','XAUUSD','SELL',19,4620.3,NULL,0.0,'2026-01-15 12:41:48.378593',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:41:48.378602','2026-01-15 12:41:48.378608',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('ba72dfd2-8ae0-4dd5-a49b-ac713f4afb46','3f618324-d216-447c-90d4-9d67868ec740','AAPL','SELL',19,259.96,259.96,0.0,'2026-01-15 12:41:55.096380',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:41:55.096389','2026-01-15 12:43:11.969342',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('ff694f72-47b7-4d38-b9fa-ab8e3ca7c786','3f618324-d216-447c-90d4-9d67868ec740','BTC-USD','SELL',19,96623.76,96622.72,1.975999999987834599e+01,'2026-01-15 12:42:01.222545',1,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:42:01.222564','2026-01-15 12:43:10.033678',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('62bc6b0d-a5b5-4f53-a678-9c8ec119432b','3f618324-d216-447c-90d4-9d67868ec740','XAUUSD','BUY',33,4620.5,NULL,0.0,'2026-01-15 12:42:47.027845',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:42:47.027853','2026-01-15 12:42:47.027857',NULL,NULL,NULL);
+INSERT INTO "ts_trades" VALUES('e2f7cf64-0057-44b4-b9fc-2181ff9a4a29','3f618324-d216-447c-90d4-9d67868ec740','XAUUSD','BUY',330,4620.5,NULL,0.0,'2026-01-15 12:42:51.447692',0,'40f5beb0-3484-4fd2-9a2c-6621db2f6d99','2026-01-15 12:42:51.447702','2026-01-15 12:42:51.447709',NULL,NULL,NULL);
 CREATE TABLE users (
 	id VARCHAR(36) NOT NULL, 
 	username VARCHAR(80) NOT NULL, 
@@ -327,26 +408,56 @@ CREATE TABLE users (
 	balance FLOAT NOT NULL, 
 	created_at DATETIME, 
 	last_login DATETIME, 
-	is_active BOOLEAN, country TEXT, 
+	is_active BOOLEAN, country TEXT, search_rowid INTEGER, 
 	PRIMARY KEY (id), 
 	UNIQUE (username), 
 	UNIQUE (email)
 );
-INSERT INTO "users" VALUES('ca4b000b-de11-4637-852c-3efa4b9ac6f6','abc','bvc@gmail.com','scrypt:32768:8:1$fHf82wjIaTE8fSZB$9a616d9ad9ba8593180b24b7a07e3168ea69a18cd99d29dcd7a93c63697b9efacab81a1a43a926f3fab974dcdde7b024700744c477e07712915ca011f10ea206','user',0.0,'2026-01-11 00:02:35.524733',NULL,1,NULL);
-INSERT INTO "users" VALUES('239ec8d5-d649-45db-8881-cb7bf016d40e','testagent','testagent@test.com','scrypt:32768:8:1$7PyTYivInfD2aAhy$3592f9612eb423735704a90829794bbac6e9c1cdc0231ecc83c702d4a5ad1f0d5f628f25e50b987eb62342e4cb83b395fd63963ee965be004c3747d7a1115798','user',0.0,'2026-01-11 11:50:18.679067',NULL,1,NULL);
-INSERT INTO "users" VALUES('2ef8157c-0ff5-4a34-855b-7c04d7ea041e','dodo','dodo@gmail.com','scrypt:32768:8:1$zYBJkEVdtB5Q016R$81efd13e371af00f4669efc3c4a95fc93789308eefd78fab641989fdd68ad88cabf41e20c295389da0d92fb457f83655d89c1c2934533f419b4b46cabb5096e7','user',0.0,'2026-01-11 11:59:23.975082','2026-01-11 17:34:37.891756',1,NULL);
-INSERT INTO "users" VALUES('d9a2d33b-cb4d-460d-843c-3d512596d939','efg','efg@gmail.com','scrypt:32768:8:1$H7FVQktExqdsvU37$2c7b98294f0c6172665704db9968589ae286f28ce13d67132b22f50e62c253e202a0efcbd32792ba130f99924f5ff5c2bf8dd9e8693ec24db7910311d8ef9244','user',0.0,'2026-01-11 15:09:38.145692','2026-01-11 15:09:58.793951',1,NULL);
-INSERT INTO "users" VALUES('fa6479b0-a666-484b-b7d8-3eb126168dbb','abc do','abc@gmail.com','scrypt:32768:8:1$iE2HIaWg8Qo8rODX$911a5e98a54f4d156e8ce30ee380484f18ee7dc19fa0721f5e07c4e3608ade4cdfe931113bb3585502fbb82607b895d916894b076aff411f6a63ead2337665cc','user',0.0,'2026-01-11 17:33:23.793321','2026-01-11 17:34:21.973372',1,NULL);
-INSERT INTO "users" VALUES('78697822-6498-4fd1-8e39-33cad20161b8','ah ma','aa@gmail.com','scrypt:32768:8:1$Gv922HEvhdm7HF6j$c4168d3b54012b496da4b7fcb610a98f30ebe448cbdcdf73cfff245c61a1478c80fd27ec448f3233741e641e556d17c09a751dd77620ffa2d0d70b3ab1f612db','user',0.0,'2026-01-11 17:36:30.547682','2026-01-11 18:30:14.576286',1,NULL);
-INSERT INTO "users" VALUES('d2165363-dd69-4d09-b916-19769de142dc','dah ro','mnb@gmail.com','scrypt:32768:8:1$tZyIbNKp3dId99ab$8c6d8812858f954f229a9e8820f3a8d71976160ed388203211e45f4c995cf7bf60bf3fe095818e1587cfd9dcc133921092840c1922138bcde7beb8928e536e72','user',0.0,'2026-01-11 18:53:49.448342','2026-01-11 18:54:22.119529',1,NULL);
-INSERT INTO "users" VALUES('a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elo ch','chochi1@gmail.com','scrypt:32768:8:1$lQjCRbUW9l5h2Xkx$a569b1082929ac024c2cd68a19d250b46cb38605154b55e48832567f3281cbe8fcaa3b8e4465a2ef2877469a733e06ddc47ede64f51d671abd7d2a5f7b7a752d','user',0.0,'2026-01-11 19:46:10.068255','2026-01-15 20:55:13.187836',1,NULL);
-INSERT INTO "users" VALUES('ea091cec-0616-4e31-8230-5217fe080b32','Admin','admin@tradesense.com','scrypt:32768:8:1$9o5vNlJMWwwnBMBX$69ad70c7eaf1f348a2530e08fe3f5699a20324aec98aa1afe1147d3d31639c5cf0723b45cf032cb3fd5228fc743de47681f9903587b1d0fdbde9417c2eb50489','admin',0.0,'2026-01-11 22:22:03.010235','2026-01-15 14:04:35.982009',1,NULL);
-INSERT INTO "users" VALUES('40f5beb0-3484-4fd2-9a2c-6621db2f6d99','lay ll','lay@gmail.com','scrypt:32768:8:1$iVWd4aO6094dwIfG$11b1d93e654451876f31ea17939b7da3a422b80d6cc7f1415dcb3233def4b1b07bead0522de80bf148c7a6a50292a96abdbff65bba884c3707094ea5887953b1','user',0.0,'2026-01-12 19:10:16.592398','2026-01-15 12:40:42.159012',1,NULL);
-INSERT INTO "users" VALUES('test-user-uuid','test_killer','killer@test.com','dummy','user',5000.0,'2026-01-12 20:31:14.392858',NULL,1,NULL);
-INSERT INTO "users" VALUES('253502a9-2bc4-4726-900c-7c052f44bb30','siham sal','siham@gmail.com','scrypt:32768:8:1$1lDkucYfQlRPOlXs$e1f6b02e40a7eb077baeca7a3e48bf7e1379f08b834d292ecdad60ee42e5d5da52a388b14bbfe683922aa38604620f5acbea0890c5eec699b895f922282b6578','user',0.0,'2026-01-12 22:27:49.328916','2026-01-12 22:28:14.450623',1,NULL);
-INSERT INTO "users" VALUES('7f0413b5-88dd-4571-90bb-c5d942279760','cc vb','cc1@gmail.co','scrypt:32768:8:1$73fAHSoX5dyQffA3$096b4d117e1d97f2cd4959538766681e5f834bd2ee7460c95f615c1f8fdd34e6579228d2794b10b1e4d1e3b63e3e7245dcc6d33b37c8044132410de082f66183','user',0.0,'2026-01-12 22:42:13.575742','2026-01-14 21:53:08.892815',1,NULL);
-INSERT INTO "users" VALUES('aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','ahmad','ahmad@gmail.com','scrypt:32768:8:1$JDroUBJN4gVK80Zg$55b1f18c0fef9c62a04782d273edc566ea09ea47151aac261dea2e68e954f65cc95117cc39f6165a5d2e68a565e0ab36d77163d41796a171683b3b7c17b9dc0b','user',0.0,'2026-01-14 23:34:54.078139','2026-01-15 19:07:12.967378',1,NULL);
+INSERT INTO "users" VALUES('ca4b000b-de11-4637-852c-3efa4b9ac6f6','abc','bvc@gmail.com','scrypt:32768:8:1$fHf82wjIaTE8fSZB$9a616d9ad9ba8593180b24b7a07e3168ea69a18cd99d29dcd7a93c63697b9efacab81a1a43a926f3fab974dcdde7b024700744c477e07712915ca011f10ea206','user',0.0,'2026-01-11 00:02:35.524733',NULL,1,NULL,NULL);
+INSERT INTO "users" VALUES('239ec8d5-d649-45db-8881-cb7bf016d40e','testagent','testagent@test.com','scrypt:32768:8:1$7PyTYivInfD2aAhy$3592f9612eb423735704a90829794bbac6e9c1cdc0231ecc83c702d4a5ad1f0d5f628f25e50b987eb62342e4cb83b395fd63963ee965be004c3747d7a1115798','user',0.0,'2026-01-11 11:50:18.679067',NULL,1,NULL,NULL);
+INSERT INTO "users" VALUES('2ef8157c-0ff5-4a34-855b-7c04d7ea041e','dodo','dodo@gmail.com','scrypt:32768:8:1$zYBJkEVdtB5Q016R$81efd13e371af00f4669efc3c4a95fc93789308eefd78fab641989fdd68ad88cabf41e20c295389da0d92fb457f83655d89c1c2934533f419b4b46cabb5096e7','user',0.0,'2026-01-11 11:59:23.975082','2026-01-11 17:34:37.891756',1,NULL,NULL);
+INSERT INTO "users" VALUES('d9a2d33b-cb4d-460d-843c-3d512596d939','efg','efg@gmail.com','scrypt:32768:8:1$H7FVQktExqdsvU37$2c7b98294f0c6172665704db9968589ae286f28ce13d67132b22f50e62c253e202a0efcbd32792ba130f99924f5ff5c2bf8dd9e8693ec24db7910311d8ef9244','user',0.0,'2026-01-11 15:09:38.145692','2026-01-11 15:09:58.793951',1,NULL,NULL);
+INSERT INTO "users" VALUES('fa6479b0-a666-484b-b7d8-3eb126168dbb','abc do','abc@gmail.com','scrypt:32768:8:1$iE2HIaWg8Qo8rODX$911a5e98a54f4d156e8ce30ee380484f18ee7dc19fa0721f5e07c4e3608ade4cdfe931113bb3585502fbb82607b895d916894b076aff411f6a63ead2337665cc','user',0.0,'2026-01-11 17:33:23.793321','2026-01-11 17:34:21.973372',1,NULL,NULL);
+INSERT INTO "users" VALUES('78697822-6498-4fd1-8e39-33cad20161b8','ah ma','aa@gmail.com','scrypt:32768:8:1$Gv922HEvhdm7HF6j$c4168d3b54012b496da4b7fcb610a98f30ebe448cbdcdf73cfff245c61a1478c80fd27ec448f3233741e641e556d17c09a751dd77620ffa2d0d70b3ab1f612db','user',0.0,'2026-01-11 17:36:30.547682','2026-01-11 18:30:14.576286',1,NULL,NULL);
+INSERT INTO "users" VALUES('d2165363-dd69-4d09-b916-19769de142dc','dah ro','mnb@gmail.com','scrypt:32768:8:1$tZyIbNKp3dId99ab$8c6d8812858f954f229a9e8820f3a8d71976160ed388203211e45f4c995cf7bf60bf3fe095818e1587cfd9dcc133921092840c1922138bcde7beb8928e536e72','user',0.0,'2026-01-11 18:53:49.448342','2026-01-11 18:54:22.119529',1,NULL,NULL);
+INSERT INTO "users" VALUES('a56d92e4-7ab5-4c64-aa94-52f0a35aa568','elo ch','chochi1@gmail.com','scrypt:32768:8:1$lQjCRbUW9l5h2Xkx$a569b1082929ac024c2cd68a19d250b46cb38605154b55e48832567f3281cbe8fcaa3b8e4465a2ef2877469a733e06ddc47ede64f51d671abd7d2a5f7b7a752d','user',0.0,'2026-01-11 19:46:10.068255','2026-01-15 20:55:13.187836',1,NULL,NULL);
+INSERT INTO "users" VALUES('ea091cec-0616-4e31-8230-5217fe080b32','Admin','admin@tradesense.com','scrypt:32768:8:1$9o5vNlJMWwwnBMBX$69ad70c7eaf1f348a2530e08fe3f5699a20324aec98aa1afe1147d3d31639c5cf0723b45cf032cb3fd5228fc743de47681f9903587b1d0fdbde9417c2eb50489','admin',0.0,'2026-01-11 22:22:03.010235','2026-01-15 14:04:35.982009',1,NULL,NULL);
+INSERT INTO "users" VALUES('40f5beb0-3484-4fd2-9a2c-6621db2f6d99','lay ll','lay@gmail.com','scrypt:32768:8:1$iVWd4aO6094dwIfG$11b1d93e654451876f31ea17939b7da3a422b80d6cc7f1415dcb3233def4b1b07bead0522de80bf148c7a6a50292a96abdbff65bba884c3707094ea5887953b1','user',0.0,'2026-01-12 19:10:16.592398','2026-01-15 12:40:42.159012',1,NULL,NULL);
+INSERT INTO "users" VALUES('test-user-uuid','test_killer','killer@test.com','dummy','user',5000.0,'2026-01-12 20:31:14.392858',NULL,1,NULL,NULL);
+INSERT INTO "users" VALUES('253502a9-2bc4-4726-900c-7c052f44bb30','siham sal','siham@gmail.com','scrypt:32768:8:1$1lDkucYfQlRPOlXs$e1f6b02e40a7eb077baeca7a3e48bf7e1379f08b834d292ecdad60ee42e5d5da52a388b14bbfe683922aa38604620f5acbea0890c5eec699b895f922282b6578','user',0.0,'2026-01-12 22:27:49.328916','2026-01-12 22:28:14.450623',1,NULL,NULL);
+INSERT INTO "users" VALUES('7f0413b5-88dd-4571-90bb-c5d942279760','cc vb','cc1@gmail.co','scrypt:32768:8:1$73fAHSoX5dyQffA3$096b4d117e1d97f2cd4959538766681e5f834bd2ee7460c95f615c1f8fdd34e6579228d2794b10b1e4d1e3b63e3e7245dcc6d33b37c8044132410de082f66183','user',0.0,'2026-01-12 22:42:13.575742','2026-01-14 21:53:08.892815',1,NULL,NULL);
+INSERT INTO "users" VALUES('aa12a74d-d6ac-4de4-aab9-6c4dc1b72258','ahmad','ahmad@gmail.com','scrypt:32768:8:1$JDroUBJN4gVK80Zg$55b1f18c0fef9c62a04782d273edc566ea09ea47151aac261dea2e68e954f65cc95117cc39f6165a5d2e68a565e0ab36d77163d41796a171683b3b7c17b9dc0b','user',0.0,'2026-01-14 23:34:54.078139','2026-01-15 19:07:12.967378',1,NULL,NULL);
 CREATE INDEX idx_challenge_user ON challenges(user_id);
 CREATE INDEX idx_trade_challenge ON ts_trades(challenge_id);
 CREATE INDEX idx_trade_user ON ts_trades(user_id);
+CREATE INDEX idx_challenge_status ON challenges(status, created_at);
+CREATE INDEX idx_challenge_created ON challenges(created_at);
+CREATE INDEX idx_trade_challenge_closed ON ts_trades(challenge_id, is_closed, timestamp);
+CREATE INDEX idx_trade_challenge_ts ON ts_trades(challenge_id, timestamp);
+CREATE INDEX idx_trade_user_ts ON ts_trades(user_id, timestamp);
+CREATE INDEX idx_trade_closed_ts ON ts_trades(is_closed, timestamp);
+CREATE INDEX idx_trade_ts_id ON ts_trades(timestamp, id);
+CREATE INDEX idx_payment_user_ts ON payments(user_id, timestamp);
+CREATE INDEX idx_payment_status ON payments(status);
+CREATE INDEX idx_payment_ts_id ON payments(timestamp, id);
+CREATE INDEX idx_leaderboard_month_profit ON leaderboards(month, profit_percentage);
+CREATE INDEX idx_leaderboard_month_rank ON leaderboards(month, rank);
+CREATE INDEX idx_monthly_profit_rank ON monthly_profits(month, profit_pct);
+CREATE INDEX idx_monthly_asset_profit_rank ON monthly_asset_profits(month, asset_class, profit_pct);
+CREATE INDEX idx_rollup_metric_day ON daily_rollups(metric, day);
+CREATE INDEX idx_user_username_lower ON users(lower(username));
+CREATE INDEX idx_user_email_lower ON users(lower(email));
+CREATE UNIQUE INDEX idx_user_search_rowid ON users(search_rowid);
+CREATE INDEX idx_leaderboard_user ON leaderboards(user_id);
+CREATE INDEX idx_trading_account_user ON trading_accounts(user_id);
+CREATE INDEX idx_original_trade_user ON trades(user_id);
+CREATE INDEX idx_audit_created ON audit_logs(created_at);
+CREATE INDEX idx_audit_actor ON audit_logs(actor_id, created_at);
+CREATE INDEX idx_audit_target ON audit_logs(target_type, target_id, created_at);
+CREATE INDEX idx_audit_action ON audit_logs(action, created_at);
+CREATE TRIGGER audit_logs_no_update BEFORE UPDATE ON audit_logs BEGIN SELECT RAISE(ABORT, 'audit_logs est en ajout seul'); END;
+CREATE TRIGGER audit_logs_no_delete BEFORE DELETE ON audit_logs BEGIN SELECT RAISE(ABORT, 'audit_logs est en ajout seul'); END;
+CREATE INDEX idx_equity_challenge_ts ON equity_snapshots(challenge_id, ts);
+CREATE INDEX idx_pending_order_challenge ON pending_orders(challenge_id);
+CREATE INDEX idx_pending_order_status_symbol ON pending_orders(status, symbol);
 COMMIT;
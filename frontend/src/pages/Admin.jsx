@@ -576,17 +576,29 @@ const Admin = () => {
         checkAdminAccess();
     }, [navigate, t]);
 
+    // Liste complète des challenges, page par page (pagination par curseur : next_cursor)
+    const fetchAllChallenges = async () => {
+        const all = [];
+        let cursor = null;
+        do {
+            const res = await api.get('/api/admin/challenges', { params: { limit: 500, ...(cursor ? { cursor } : {}) } });
+            all.push(...(res.data.challenges || []));
+            cursor = res.data.next_cursor;
+        } while (cursor);
+        return all;
+    };
+
     const fetchAllData = async () => {
         setLoading(true);
         try {
-            const [usersRes, challengesRes, statsRes] = await Promise.all([
+            const [usersRes, allChallenges, statsRes] = await Promise.all([
                 api.get('/api/admin/users'),
-                api.get('/api/admin/challenges'),
+                fetchAllChallenges(),
                 api.get('/api/admin/stats')
             ]);
 
             setUsers(usersRes.data.users || []);
-            setChallenges(challengesRes.data.challenges || []);
+            setChallenges(allChallenges);
             setStats(statsRes.data.metrics || {});
             setError(null);
         } catch (err) {
@@ -72,6 +72,18 @@ const Dashboard = () => {
     const [activeView, setActiveView] = useState('TRADING');
     const [isSidebarOpen, setIsSidebarOpen] = useState(false);
 
+    // Toutes les pages d'une liste paginée par curseur (next_cursor)
+    const fetchAllTrades = async (url, params) => {
+        const all = [];
+        let cursor = null;
+        do {
+            const res = await api.get(url, { params: { ...params, limit: 500, ...(cursor ? { cursor } : {}) } });
+            all.push(...(res.data.trades || []));
+            cursor = res.data.next_cursor;
+        } while (cursor);
+        return all;
+    };
+
     const fetchData = async () => {
         if (authLoading || !user) return;
 
@@ -88,14 +100,17 @@ const Dashboard = () => {
                 ? '/api/trading/history'
                 : `/api/trading/challenge/${currentChallenge.id}/trades`;
 
-            const [marketsRes, tradesRes, statusRes] = await Promise.all([
+            // Positions ouvertes au complet (toutes les pages), trades clôturés : page la plus récente
+            const [marketsRes, openTrades, closedRes, statusRes] = await Promise.all([
                 api.get('/api/trading/markets').catch(e => ({ data: { markets: [] } })),
-                api.get(tradesUrl).catch(e => ({ data: { trades: [] } })),
+                fetchAllTrades(tradesUrl, { status: 'open' }).catch(e => []),
+                api.get(tradesUrl, { params: { status: 'closed' } }).catch(e => ({ data: { trades: [] } })),
                 api.get(`/api/trading/challenge/${currentChallenge.id}/status`).catch(e => ({ data: { challenge: currentChallenge } }))
             ]);
 
             const marketsList = marketsRes.data.markets || [];
-            const fetchedTrades = tradesRes.data.trades || [];
+            const fetchedTrades = [...openTrades, ...(closedRes.data.trades || [])]
+                .sort((a, b) => (b.timestamp || '').localeCompare(a.timestamp || ''));
             const updatedChallenge = statusRes.data.challenge;
 
             if (updatedChallenge) setChallenge(updatedChallenge);